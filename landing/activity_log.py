@@ -0,0 +1,241 @@
+"""
+Buffered writer for the audit and activity logs (AuditLog, SignatoryActivityLog,
+BusinessManagerActivityLog).
+
+Views call record_activity() instead of Model.objects.create(). The row is built
+and validated at once, then buffered in this process and written with one
+bulk_create per model when the buffer reaches ACTIVITY_LOG_BUFFER_SIZE, when its
+oldest row is ACTIVITY_LOG_FLUSH_SECONDS old, after each request has been sent
+(request_finished), and at process exit. Inside a transaction the row is only
+buffered once the transaction commits, as a row created in it would have been.
+
+Every buffered row is also appended to a journal file of this process under
+ACTIVITY_LOG_JOURNAL_DIR and the journal is emptied after each successful flush,
+so rows of a process that dies, or that cannot reach the database, stay on disk;
+`python manage.py replay_activity_journal` writes them out. Rows keep the ids
+given at record time, so replaying rows that were in fact written is harmless.
+
+With ACTIVITY_LOG_SYNC (tests, debugging) rows are written immediately.
+
+    record_activity(AuditLog, user=request.user, action_type='clearance_print', description=...)
+"""
+
+import atexit
+import glob
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+BUFFER_SIZE = getattr(settings, 'ACTIVITY_LOG_BUFFER_SIZE', 200)
+FLUSH_SECONDS = getattr(settings, 'ACTIVITY_LOG_FLUSH_SECONDS', 5)
+JOURNAL_DIR = getattr(settings, 'ACTIVITY_LOG_JOURNAL_DIR', os.path.join(settings.BASE_DIR, 'logs', 'activity_journal'))
+
+# Journals of this process are named activity-<pid>.jsonl; journals that could not be
+# written to the database are renamed activity-<pid>-<time>.failed.jsonl
+JOURNAL_PATTERN = 'activity-*.jsonl'
+
+
+def record_activity(model, **fields):
+    """Log one AuditLog/SignatoryActivityLog/BusinessManagerActivityLog row without waiting for the INSERT"""
+    obj = model(**fields)
+    if getattr(settings, 'ACTIVITY_LOG_SYNC', False):
+        obj.save(force_insert=True)
+        return obj
+    transaction.on_commit(lambda: ActivityLogBuffer.add(obj))
+    return obj
+
+
+class ActivityLogBuffer:
+    """Rows waiting to be written by this process, mirrored to its journal file"""
+
+    _lock = threading.RLock()
+    _rows: List = []
+    _oldest = None
+    _journal = None
+    _journal_pid = None
+
+    @staticmethod
+    def add(obj):
+        with ActivityLogBuffer._lock:
+            ActivityLogBuffer._append_to_journal(obj)
+            ActivityLogBuffer._rows.append(obj)
+            if ActivityLogBuffer._oldest is None:
+                ActivityLogBuffer._oldest = time.monotonic()
+            due = (
+                len(ActivityLogBuffer._rows) >= BUFFER_SIZE
+                or time.monotonic() - ActivityLogBuffer._oldest >= FLUSH_SECONDS
+            )
+        if due:
+            ActivityLogBuffer.flush()
+
+    @staticmethod
+    def pending() -> int:
+        with ActivityLogBuffer._lock:
+            return len(ActivityLogBuffer._rows)
+
+    @staticmethod
+    def flush() -> int:
+        """Write every buffered row (one INSERT per model); returns rows written"""
+        with ActivityLogBuffer._lock:
+            rows = ActivityLogBuffer._rows
+            if not rows:
+                return 0
+            ActivityLogBuffer._rows, ActivityLogBuffer._oldest = [], None
+            try:
+                write_rows(rows)
+            except Exception as e:
+                # The rows stay in the journal, set aside for replay_activity_journal
+                logger.error(f"Could not write {len(rows)} activity log rows, kept in the journal: {e}")
+                ActivityLogBuffer._set_journal_aside()
+                return 0
+            ActivityLogBuffer._truncate_journal()
+            return len(rows)
+
+    @staticmethod
+    def close():
+        """Flush at process exit and remove the journal if nothing is left in it"""
+        ActivityLogBuffer.flush()
+        with ActivityLogBuffer._lock:
+            journal = ActivityLogBuffer._journal
+            if journal is None or ActivityLogBuffer._journal_pid != os.getpid():
+                return
+            journal.close()
+            ActivityLogBuffer._journal = None
+            path = ActivityLogBuffer._journal_path(os.getpid())
+            try:
+                if os.path.getsize(path) == 0:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _journal_path(pid: int) -> str:
+        return os.path.join(JOURNAL_DIR, f'activity-{pid}.jsonl')
+
+    @staticmethod
+    def _append_to_journal(obj):
+        try:
+            pid = os.getpid()
+            if ActivityLogBuffer._journal is None or ActivityLogBuffer._journal_pid != pid:
+                # First row of this process (or of a worker forked after the parent logged)
+                os.makedirs(JOURNAL_DIR, exist_ok=True)
+                ActivityLogBuffer._journal = open(ActivityLogBuffer._journal_path(pid), 'a', encoding='utf-8')
+                ActivityLogBuffer._journal_pid = pid
+            ActivityLogBuffer._journal.write(json.dumps(serialize_row(obj)) + '\n')
+            ActivityLogBuffer._journal.flush()
+        except OSError as e:
+            # The row is still written from memory; only the crash fallback is lost
+            logger.warning(f"Could not journal activity log row: {e}")
+
+    @staticmethod
+    def _truncate_journal():
+        if ActivityLogBuffer._journal is not None and ActivityLogBuffer._journal_pid == os.getpid():
+            try:
+                ActivityLogBuffer._journal.truncate(0)
+                ActivityLogBuffer._journal.seek(0)
+            except OSError as e:
+                logger.warning(f"Could not truncate activity journal: {e}")
+
+    @staticmethod
+    def _set_journal_aside():
+        if ActivityLogBuffer._journal is None or ActivityLogBuffer._journal_pid != os.getpid():
+            return
+        ActivityLogBuffer._journal.close()
+        ActivityLogBuffer._journal = None
+        path = ActivityLogBuffer._journal_path(os.getpid())
+        try:
+            os.replace(path, path[:-len('.jsonl')] + f'-{int(time.time() * 1000)}.failed.jsonl')
+        except OSError as e:
+            logger.error(f"Could not set aside activity journal {path}: {e}")
+
+
+def serialize_row(obj) -> Dict:
+    """JSON-ready journal entry; datetimes keep their microseconds (DjangoJSONEncoder drops them)"""
+    fields = {}
+    for field in obj._meta.concrete_fields:
+        value = field.value_from_object(obj)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        fields[field.attname] = value
+    return {'model': obj._meta.label, 'fields': fields}
+
+
+def deserialize_row(data: Dict):
+    model = apps.get_model(data['model'])
+    values = {}
+    for field in model._meta.concrete_fields:
+        if field.attname in data['fields']:
+            value = data['fields'][field.attname]
+            values[field.attname] = value if field.get_internal_type() == 'JSONField' else field.to_python(value)
+    return model(**values)
+
+
+def write_rows(rows: List, ignore_conflicts: bool = False):
+    """bulk_create rows grouped by model, in one transaction"""
+    by_model = defaultdict(list)
+    for obj in rows:
+        by_model[type(obj)].append(obj)
+    with transaction.atomic():
+        for model, objs in by_model.items():
+            model.objects.bulk_create(objs, batch_size=500, ignore_conflicts=ignore_conflicts)
+
+
+def replay_journals(include_running: bool = False) -> Dict[str, int]:
+    """
+    Write the rows of set-aside journals and of journals left by processes that are no
+    longer running, then delete them. Returns {path: rows written}.
+    """
+    written = {}
+    for path in sorted(glob.glob(os.path.join(JOURNAL_DIR, JOURNAL_PATTERN))):
+        name = os.path.basename(path)
+        if not name.endswith('.failed.jsonl'):
+            pid = int(name[len('activity-'):-len('.jsonl')])
+            if pid == os.getpid() or (not include_running and _process_running(pid)):
+                continue
+        with open(path, encoding='utf-8') as journal:
+            rows = [deserialize_row(json.loads(line)) for line in journal if line.strip()]
+        # Rows that did reach the database before the process died keep their ids and are skipped
+        write_rows(rows, ignore_conflicts=True)
+        os.remove(path)
+        written[path] = len(rows)
+    return written
+
+
+def _process_running(pid: int) -> bool:
+    if os.name == 'nt':
+        # os.kill() would terminate the process there; only set-aside journals are replayed
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _flush_after_request(**kwargs):
+    ActivityLogBuffer.flush()
+
+
+# request_finished is sent once the response has been delivered, so the INSERT does not delay it
+request_finished.connect(_flush_after_request, dispatch_uid='activity_log_flush')
+atexit.register(ActivityLogBuffer.close)
@@ -0,0 +1,145 @@
+"""
+Daily rollups of the activity and audit logs.
+
+ActivityRollup holds one row per local day, actor, form type and action type with the
+number of SignatoryActivityLog / BusinessManagerActivityLog / AuditLog rows behind it.
+`python manage.py rollup_activity` (cron, e.g. hourly) rebuilds every day from the
+last run's day minus ACTIVITY_ROLLUP_REOPEN_DAYS up to today, so it picks up where it
+left off and still counts rows that reached the database late (log rows are buffered,
+see landing/activity_log.py, and journals can be replayed after a crash). A day is
+rebuilt as a whole - delete and re-insert - from indexed created_at ranges.
+
+Reports read the rollups:
+
+    rows = ActivityRollupService.window(start_date, end_date, source='signatory', actor=user)
+    ActivityRollupService.totals(rows, total=Q(), approvals=Q(action_type='approve'))
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import (
+    ActivityRollup, AuditLog, BusinessManagerActivityLog, ReportScheduler,
+    SignatoryActivityLog
+)
+
+REOPEN_DAYS = getattr(settings, 'ACTIVITY_ROLLUP_REOPEN_DAYS', 2)
+
+SCHEDULER_TASK = 'activity_rollup'
+
+
+def local_day_range(first_day: date, last_day: date) -> Tuple[datetime, datetime]:
+    """
+    [start, end) datetimes covering first_day..last_day in the current time zone, for
+    created_at__gte/__lt filters that can use the created_at indexes (__date cannot)
+    """
+    start = datetime.combine(first_day, datetime.min.time())
+    end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+    if settings.USE_TZ:
+        start, end = timezone.make_aware(start), timezone.make_aware(end)
+    return start, end
+
+
+class ActivityRollupService:
+    """Builds and reads the ActivityRollup table"""
+
+    # source -> (log model, timestamp field, actor field, form type field or None)
+    SOURCES = {
+        'signatory': (SignatoryActivityLog, 'created_at', 'signatory', 'form_type'),
+        'business_manager': (BusinessManagerActivityLog, 'created_at', 'business_manager', 'form_type'),
+        'audit': (AuditLog, 'timestamp', 'user', None),
+    }
+
+    @staticmethod
+    def update(since: Optional[date] = None) -> Dict[str, int]:
+        """
+        Rebuild the days the last run may have missed (or every day from `since`) up to
+        today. Returns {'days': days rebuilt, 'rows': rollup rows written}.
+        """
+        today = timezone.localdate()
+        with transaction.atomic():
+            # The locked scheduler row keeps two runs from rebuilding the same days at once
+            ReportScheduler.objects.get_or_create(task_name=SCHEDULER_TASK, defaults={'is_enabled': True})
+            scheduler = ReportScheduler.objects.select_for_update().get(task_name=SCHEDULER_TASK)
+
+            first_day = since
+            if first_day is None and scheduler.last_run_date:
+                first_day = scheduler.last_run_date - timedelta(days=REOPEN_DAYS)
+            if first_day is None:
+                first_day = ActivityRollupService._first_logged_day() or today
+
+            rows = 0
+            day = first_day
+            while day <= today:
+                rows += ActivityRollupService.rebuild_day(day)
+                day += timedelta(days=1)
+
+            scheduler.last_run_date = today
+            scheduler.last_run_time = timezone.now()
+            scheduler.save(update_fields=['last_run_date', 'last_run_time', 'updated_at'])
+        return {'days': max((today - first_day).days + 1, 0), 'rows': rows}
+
+    @staticmethod
+    def rebuild_day(day: date) -> int:
+        """Replace the rollup rows of one local day; returns the rows written"""
+        start, end = local_day_range(day, day)
+        rollups = []
+        for source, (model, time_field, actor_field, form_type_field) in ActivityRollupService.SOURCES.items():
+            group_by = [actor_field, 'action_type'] + ([form_type_field] if form_type_field else [])
+            groups = (
+                model.objects
+                .filter(**{f'{time_field}__gte': start, f'{time_field}__lt': end})
+                .order_by()
+                .values(*group_by)
+                .annotate(rows=Count('pk'))
+            )
+            for group in groups:
+                rollups.append(ActivityRollup(
+                    day=day,
+                    source=source,
+                    actor_id=group[actor_field],
+                    form_type=group[form_type_field] if form_type_field else '',
+                    action_type=group['action_type'],
+                    count=group['rows'],
+                ))
+        with transaction.atomic():
+            ActivityRollup.objects.filter(day=day).delete()
+            ActivityRollup.objects.bulk_create(rollups, batch_size=1000)
+        return len(rollups)
+
+    @staticmethod
+    def _first_logged_day() -> Optional[date]:
+        firsts = [
+            model.objects.aggregate(first=Min(time_field))['first']
+            for model, time_field, _, _ in ActivityRollupService.SOURCES.values()
+        ]
+        firsts = [first for first in firsts if first is not None]
+        if not firsts:
+            return None
+        first = min(firsts)
+        return timezone.localtime(first).date() if settings.USE_TZ else first.date()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    @staticmethod
+    def window(first_day: date, last_day: date, source: Optional[str] = None, **filters):
+        """Rollup rows of first_day..last_day (inclusive), optionally of one source"""
+        rows = ActivityRollup.objects.filter(day__gte=first_day, day__lte=last_day, **filters)
+        if source:
+            rows = rows.filter(source=source)
+        return rows
+
+    @staticmethod
+    def totals(rows, **conditions) -> Dict[str, int]:
+        """One aggregate over rollup rows: {name: number of log rows matching its Q}"""
+        return rows.aggregate(**{
+            name: Coalesce(Sum('count', filter=condition), 0)
+            for name, condition in conditions.items()
+        })
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import AuditLog, CalendarEvent
+from .models import AuditLog, CalendarEvent, SlowRequestLog
 
 # Register your models here.
 
@@ -35,3 +35,18 @@ class CalendarEventAdmin(admin.ModelAdmin):
         if not change:  # Only set created_by for new objects
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
+
+@admin.register(SlowRequestLog)
+class SlowRequestLogAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'reason', 'view_name', 'method', 'path', 'status_code', 'duration_ms', 'sql_count', 'sql_ms')
+    list_filter = ('reason', 'method', 'status_code', 'created_at')
+    search_fields = ('view_name', 'path', 'user__full_name')
+    date_hierarchy = 'created_at'
+    ordering = ('-created_at',)
+    list_select_related = ('user',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -12,6 +12,7 @@ from .models import (
     User, ClearanceForm, ClearanceSignatory, EnrollmentForm, 
     GraduationForm, SignatoryProfile
 )
+from .dashboard_stats import DashboardStatsService
 from .serializers import (
     UserSerializer, UserProfileSerializer, ClearanceFormSerializer,
     ClearanceSignatorySerializer, EnrollmentFormSerializer, 
@@ -366,32 +367,15 @@ def dashboard_stats(request):
     
     if user.user_type in ['student', 'alumni']:
         # Student/Alumni stats
-        total_clearances = ClearanceForm.objects.filter(student=user).count()
-        approved_clearances = ClearanceForm.objects.filter(student=user, status='approved').count()
-        pending_clearances = ClearanceForm.objects.filter(student=user, status='pending').count()
-        
-        stats = {
-            'total_clearances': total_clearances,
-            'approved_clearances': approved_clearances,
-            'pending_clearances': pending_clearances,
-            'enrollment_forms': EnrollmentForm.objects.filter(student=user).count(),
-            'graduation_forms': GraduationForm.objects.filter(student=user).count(),
-        }
+        stats = DashboardStatsService.build_student_stats(user)
     
     elif user.user_type == 'signatory' and hasattr(user, 'signatory_profile'):
-        # Signatory stats
-        signatory_type = user.signatory_profile.signatory_type
-        stats = {
-            'pending_approvals': ClearanceSignatory.objects.filter(
-                signatory_type=signatory_type, status='pending'
-            ).count(),
-            'total_approved': ClearanceSignatory.objects.filter(
-                signatory_type=signatory_type, status='approved'
-            ).count(),
-            'total_disapproved': ClearanceSignatory.objects.filter(
-                signatory_type=signatory_type, status='disapproved'
-            ).count(),
-        }
+        # Signatory stats (cached per signatory type)
+        stats = DashboardStatsService.get_signatory_stats(user.signatory_profile.signatory_type)
+    
+    elif user.user_type in ['admin', 'registrar']:
+        # Registrar/admin stats (cached)
+        stats = DashboardStatsService.get_institution_stats()['statistics']
     
     return Response({
         'success': True,
@@ -6,4 +6,5 @@ class LandingConfig(AppConfig):
     name = 'landing'
 
     def ready(self):
-        import landing.signals  # triggers signal registration
\ No newline at end of file
+        import landing.signals  # triggers signal registration
+        import landing.activity_log  # flushes buffered log rows after each request
@@ -0,0 +1,248 @@
+"""
+Set-based bulk approval of clearance, enrollment and graduation forms.
+A bulk action costs a fixed number of queries whatever the number of forms:
+load forms, load the actor's existing signatory rows, upsert the rows, find
+newly completed forms with one aggregate, flip them with one UPDATE, then fan
+out notifications in one batch after the transaction commits.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .activity_log import record_activity
+from .cache import DASHBOARD_STATS, FILTER_OPTIONS, FORM_DATA
+from .db_utils import bulk_upsert
+from .event_stream import EventStream
+from .models import (
+    ClearanceForm, ClearanceSignatory, ClearanceStatusMatrix, EnrollmentForm,
+    EnrollmentSignatory, GraduationForm, GraduationSignatory, PendingCounter, User
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BulkDecisionService:
+    """Approve many forms for one signatory in a single transaction"""
+
+    FORM_CONFIG = {
+        'clearance': {
+            'form_model': ClearanceForm,
+            'signatory_model': ClearanceSignatory,
+            'form_field': 'clearance',
+            'student_field': 'student',
+            # Clearances complete when every existing signatory row is approved
+            'required_roles': None,
+        },
+        'enrollment': {
+            'form_model': EnrollmentForm,
+            'signatory_model': EnrollmentSignatory,
+            'form_field': 'enrollment',
+            'student_field': 'user',
+            'required_roles': {'business_manager', 'registrar', 'dean'},
+        },
+        'graduation': {
+            'form_model': GraduationForm,
+            'signatory_model': GraduationSignatory,
+            'form_field': 'graduation',
+            'student_field': 'user',
+            'required_roles': {'dean', 'business_manager', 'registrar', 'president'},
+        },
+    }
+
+    @staticmethod
+    def _valid_ids(form_ids: Iterable[Any]) -> List[str]:
+        valid = []
+        for form_id in form_ids:
+            try:
+                valid.append(str(uuid.UUID(str(form_id))))
+            except ValueError:
+                continue
+        return valid
+
+    @staticmethod
+    def approve(
+        form_type: str,
+        form_ids: Iterable[Any],
+        signatory_user: User,
+        role: str,
+        remarks: str = '',
+        ip_address: Optional[str] = None,
+        skip_statuses: Iterable[str] = ('approved',),
+        notify: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Record signatory_user's approval (as role) on every form in form_ids.
+
+        Forms whose existing record for this signatory is in skip_statuses are left alone.
+        Returns {'results': {form_id: 'approved'|'completed'|'skipped'|'not_found'},
+                 'approved': [forms], 'completed': [forms], 'approved_count': int}.
+        """
+        config = BulkDecisionService.FORM_CONFIG[form_type]
+        form_model = config['form_model']
+        signatory_model = config['signatory_model']
+        form_field = config['form_field']
+        required_roles = config['required_roles']
+        skip_statuses = set(skip_statuses)
+
+        form_ids = [str(form_id) for form_id in form_ids]
+        results = {form_id: 'not_found' for form_id in form_ids}
+        now = timezone.now()
+
+        with transaction.atomic():
+            forms = {
+                str(form.id): form
+                for form in form_model.objects.filter(
+                    id__in=BulkDecisionService._valid_ids(form_ids)
+                ).select_related(config['student_field'])
+            }
+
+            # The actor's existing rows on these forms (enrollment/graduation rows are per role)
+            own_rows = signatory_model.objects.filter(
+                **{f'{form_field}_id__in': list(forms)}, signatory=signatory_user
+            )
+            if required_roles is not None:
+                own_rows = own_rows.filter(role=role)
+            existing_status = {}
+            for form_id, status in own_rows.values_list(f'{form_field}_id', 'status'):
+                # With duplicate rows, one approved row is enough to skip
+                form_id = str(form_id)
+                if existing_status.get(form_id) != 'approved':
+                    existing_status[form_id] = status
+
+            approved_forms = []
+            for form_id, form in forms.items():
+                if existing_status.get(form_id) in skip_statuses:
+                    results[form_id] = 'skipped'
+                else:
+                    approved_forms.append(form)
+                    results[form_id] = 'approved'
+            approved_ids = [form.id for form in approved_forms]
+            # Records leaving 'pending' on a still-pending form, for the actor's PendingCounter
+            cleared_count = sum(
+                1 for form in approved_forms
+                if existing_status.get(str(form.id)) == 'pending' and form.status == 'pending'
+            )
+
+            if form_type == 'clearance':
+                # (clearance, signatory) is unique, so one upsert covers new and existing rows
+                bulk_upsert(
+                    ClearanceSignatory,
+                    [
+                        ClearanceSignatory(
+                            clearance=form,
+                            signatory=signatory_user,
+                            status='approved',
+                            role=role,
+                            remarks=remarks,
+                            comment=remarks,
+                            ip_address=ip_address,
+                            seen_by_signatory=True,
+                            updated_at=now
+                        )
+                        for form in approved_forms
+                    ],
+                    unique_fields=['clearance', 'signatory'],
+                    update_fields=['status', 'role', 'remarks', 'comment', 'ip_address', 'seen_by_signatory', 'updated_at']
+                )
+                ClearanceStatusMatrix.refresh_for_clearances(approved_ids)
+            else:
+                # No unique constraint on these tables: update the rows we found, insert the rest
+                update_ids = [form.id for form in approved_forms if str(form.id) in existing_status]
+                if update_ids:
+                    own_rows.filter(**{f'{form_field}_id__in': update_ids}).update(
+                        status='approved', remarks=remarks, ip_address=ip_address, updated_at=now
+                    )
+                signatory_model.objects.bulk_create([
+                    signatory_model(**{
+                        form_field: form,
+                        'signatory': signatory_user,
+                        'role': role,
+                        'status': 'approved',
+                        'remarks': remarks,
+                        'ip_address': ip_address,
+                    })
+                    for form in approved_forms if str(form.id) not in existing_status
+                ])
+
+            # One aggregate query to find forms that now have every approval they need
+            completion = signatory_model.objects.filter(
+                **{f'{form_field}_id__in': approved_ids}
+            ).values(f'{form_field}_id').annotate(
+                total=Count('id'),
+                approved=Count('id', filter=Q(status='approved')),
+            )
+            if required_roles is not None:
+                completion = completion.annotate(
+                    approved_roles=Count('role', filter=Q(status='approved', role__in=required_roles), distinct=True)
+                )
+            completed_ids = set()
+            for row in completion:
+                if not row['total'] or row['total'] != row['approved']:
+                    continue
+                if required_roles is not None and row['approved_roles'] < len(required_roles):
+                    continue
+                completed_ids.add(str(row[f'{form_field}_id']))
+
+            completed_forms = [
+                form for form in approved_forms
+                if str(form.id) in completed_ids and form.status != 'approved'
+            ]
+            if completed_forms:
+                status_update = {'status': 'approved'}
+                if any(field.name == 'updated_at' for field in form_model._meta.concrete_fields):
+                    status_update['updated_at'] = now
+                form_model.objects.filter(id__in=[form.id for form in completed_forms]).update(**status_update)
+                for form in completed_forms:
+                    form.status = 'approved'
+                    results[str(form.id)] = 'completed'
+
+            # Set-based writes skip model signals, so update the counters and caches explicitly
+            PendingCounter.adjust({(signatory_user.id, form_type): -cleared_count})
+            if approved_forms:
+                transaction.on_commit(DASHBOARD_STATS.invalidate)
+                transaction.on_commit(FILTER_OPTIONS.invalidate)
+                transaction.on_commit(FORM_DATA[form_type].invalidate)
+                EventStream.publish(
+                    'dashboard_stale',
+                    {'form_type': form_type, 'count': len(approved_forms)},
+                    users=[signatory_user.id] + [getattr(form, f"{config['student_field']}_id") for form in approved_forms],
+                    audiences=['admin', 'business_manager'],
+                )
+
+        if notify and approved_forms:
+            try:
+                from .notification_service import NotificationService
+                NotificationService.notify_forms_approved(approved_forms, form_type, signatory_user, remarks)
+                NotificationService.notify_forms_completed(completed_forms, form_type)
+            except Exception as e:
+                logger.error(f"Error sending bulk approval notifications: {str(e)}")
+
+        return {
+            'results': results,
+            'approved': approved_forms,
+            'completed': completed_forms,
+            'approved_count': len(approved_forms),
+        }
+
+    @staticmethod
+    def student_of(form, form_type: str) -> User:
+        return getattr(form, BulkDecisionService.FORM_CONFIG[form_type]['student_field'])
+
+    @staticmethod
+    def log_activity(log_model, actor_field: str, actor: User, form_type: str, forms, ip_address=None, user_agent: str = ''):
+        """Log one SignatoryActivityLog/BusinessManagerActivityLog row per approved form (buffered, one INSERT)"""
+        for form in forms:
+            record_activity(log_model, **{
+                actor_field: actor,
+                'action_type': 'approve',
+                'form_type': form_type,
+                'form_id': form.id,
+                'student_name': BulkDecisionService.student_of(form, form_type).full_name,
+                'ip_address': ip_address,
+                'user_agent': user_agent,
+            })
@@ -0,0 +1,222 @@
+"""
+Project-wide caching layer on top of Django's cache framework.
+
+Cached data lives in namespaces. Each namespace has a version number stored in
+the cache; every key embeds it, so bumping the version invalidates the whole
+namespace at once without deleting keys one by one. A namespace can be bound to
+models, in which case any post_save/post_delete of those models bumps it.
+
+    FILTER_OPTIONS = CacheNamespace('filter_options', timeout=300, models=[ClearanceForm])
+    data = FILTER_OPTIONS.get_or_set(['signatory', user.id], build_options)
+
+Hit/miss counters are kept per namespace in this process; see cache_stats().
+
+Namespace versions also validate HTTP responses: conditional_get() gives a
+polled JSON view an ETag built from the versions it depends on and answers
+304 Not Modified without running the view while they have not moved.
+
+    @login_required
+    @conditional_get(CLEARANCE_DATA)
+    def clearance_data_api(request): ...
+"""
+
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .models import (
+    AcademicProgram, AcademicSemester, AcademicSubject, AcademicYearLevel, AlumniProfile,
+    CalendarEvent, ClearanceForm, ClearanceSignatory, DocumentRequest, EnrollmentForm,
+    EnrollmentSignatory, GraduationForm, GraduationSignatory, StudentProfile
+)
+
+_MISSING = object()
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {'hits': 0, 'misses': 0, 'invalidations': 0})
+_namespaces: Dict[str, 'CacheNamespace'] = {}
+
+
+def _record(namespace: str, counter: str):
+    with _stats_lock:
+        _stats[namespace][counter] += 1
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss/invalidation counters per namespace (since this process started)"""
+    with _stats_lock:
+        result = {}
+        for namespace, counters in _stats.items():
+            lookups = counters['hits'] + counters['misses']
+            result[namespace] = dict(counters, hit_rate=round(counters['hits'] / lookups, 3) if lookups else None)
+        return result
+
+
+def get_namespace(name: str) -> 'CacheNamespace':
+    return _namespaces[name]
+
+
+class CacheNamespace:
+    """A group of cache entries that share a timeout and are invalidated together"""
+
+    def __init__(self, name: str, timeout: Optional[int] = 300, models: Iterable = ()):
+        if name in _namespaces:
+            raise ValueError(f"Cache namespace '{name}' is already registered")
+        self.name = name
+        self.timeout = timeout
+        self.version_key = f'ns:{name}:version'
+        _namespaces[name] = self
+        for model in models:
+            self.invalidate_on(model)
+
+    def invalidate_on(self, model):
+        """Invalidate this namespace whenever an instance of model is saved or deleted"""
+        uid = f'landing.cache:{self.name}:{model._meta.label}'
+        post_save.connect(self._invalidate_receiver, sender=model, weak=False, dispatch_uid=f'{uid}:save')
+        post_delete.connect(self._invalidate_receiver, sender=model, weak=False, dispatch_uid=f'{uid}:delete')
+
+    def _invalidate_receiver(self, sender, **kwargs):
+        # Wait for the commit so no process can re-cache data from before the change
+        transaction.on_commit(self.invalidate)
+
+    @property
+    def version(self) -> int:
+        version = cache.get(self.version_key)
+        if version is None:
+            version = time.time_ns()
+            cache.set(self.version_key, version, None)
+        return version
+
+    def invalidate(self):
+        """Drop every entry of the namespace by moving to a new version"""
+        # A timestamp rather than incr() so a lost version key can never roll back to an old version
+        cache.set(self.version_key, time.time_ns(), None)
+        _record(self.name, 'invalidations')
+
+    def make_key(self, parts: Iterable[Any] = ()) -> str:
+        raw = ':'.join(str(part) for part in parts)
+        if len(raw) > 150 or any(ch.isspace() for ch in raw):
+            raw = hashlib.md5(raw.encode()).hexdigest()
+        return f'ns:{self.name}:{self.version}:{raw}'
+
+    def get(self, parts: Iterable[Any] = (), default: Any = None) -> Any:
+        value = cache.get(self.make_key(parts), _MISSING)
+        if value is _MISSING:
+            _record(self.name, 'misses')
+            return default
+        _record(self.name, 'hits')
+        return value
+
+    def set(self, parts: Iterable[Any], value: Any, timeout: Optional[int] = _MISSING):
+        cache.set(self.make_key(parts), value, self.timeout if timeout is _MISSING else timeout)
+
+    def get_or_set(self, parts: Iterable[Any], builder: Callable[[], Any], timeout: Optional[int] = _MISSING) -> Any:
+        """Return the cached value for parts, building and storing it on a miss"""
+        key = self.make_key(parts)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            _record(self.name, 'hits')
+            return value
+        _record(self.name, 'misses')
+        value = builder()
+        cache.set(key, value, self.timeout if timeout is _MISSING else timeout)
+        return value
+
+
+# ----------------------------------------------------------------------
+# Namespaces
+# ----------------------------------------------------------------------
+
+# Curriculum lookups (programs, year levels, semesters, subjects) rarely change
+CURRICULUM = CacheNamespace(
+    'curriculum',
+    timeout=3600,
+    models=[AcademicProgram, AcademicYearLevel, AcademicSemester, AcademicSubject]
+)
+
+# Course/year/section dropdown options built from clearance data
+FILTER_OPTIONS = CacheNamespace(
+    'filter_options',
+    timeout=300,
+    models=[ClearanceForm, ClearanceSignatory, StudentProfile]
+)
+
+# Dashboard counters and charts (see landing/dashboard_stats.py)
+DASHBOARD_STATS = CacheNamespace(
+    'dashboard_stats',
+    timeout=getattr(settings, 'DASHBOARD_STATS_CACHE_TTL', 60),
+    models=[ClearanceForm, ClearanceSignatory, EnrollmentForm, GraduationForm, DocumentRequest]
+)
+
+# Version-only namespaces: nothing is stored under them; their versions validate the
+# ETags of the polled data APIs (see conditional_get)
+CLEARANCE_DATA = CacheNamespace('clearance_data', models=[ClearanceForm, ClearanceSignatory, StudentProfile])
+ENROLLMENT_DATA = CacheNamespace('enrollment_data', models=[EnrollmentForm, EnrollmentSignatory, StudentProfile])
+GRADUATION_DATA = CacheNamespace(
+    'graduation_data',
+    models=[GraduationForm, GraduationSignatory, EnrollmentForm, StudentProfile]
+)
+DOCUMENT_DATA = CacheNamespace('document_data', models=[DocumentRequest, EnrollmentForm, StudentProfile, AlumniProfile])
+CALENDAR = CacheNamespace('calendar', models=[CalendarEvent])
+
+# Namespaces to invalidate after set-based writes to a form type's tables
+FORM_DATA = {
+    'clearance': CLEARANCE_DATA,
+    'enrollment': ENROLLMENT_DATA,
+    'graduation': GRADUATION_DATA,
+}
+
+
+# ----------------------------------------------------------------------
+# Conditional GET
+# ----------------------------------------------------------------------
+
+# ETags also roll over every this many seconds, so writes that skip model signals
+# (queryset.update(), raw SQL) and time-relative fields are never stale for longer
+CONDITIONAL_GET_MAX_AGE = getattr(settings, 'CONDITIONAL_GET_MAX_AGE', 600)
+
+
+def conditional_get(*namespaces: CacheNamespace, validator: Optional[Callable] = None, per_user: bool = True):
+    """
+    View decorator: ETag = hash of the path, query string, user, namespace versions,
+    validator(request) if given (a cheap query such as a count plus max updated_at) and
+    the current CONDITIONAL_GET_MAX_AGE window. A matching If-None-Match gets 304 before
+    the view runs. Responses are marked private/no-cache so browsers always revalidate.
+    Put it under @login_required so anonymous requests are redirected first.
+    """
+    def etag_func(request, *args, **kwargs):
+        parts = [
+            request.path,
+            sorted(request.GET.lists()),
+            [namespace.version for namespace in namespaces],
+            int(time.time() // CONDITIONAL_GET_MAX_AGE),
+        ]
+        if per_user:
+            parts.append(request.user.pk)
+        if validator is not None:
+            parts.append(validator(request))
+        return hashlib.md5(repr(parts).encode()).hexdigest()
+
+    def decorator(view):
+        conditional_view = condition(etag_func=etag_func)(view)
+
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                if response.status_code not in (200, 304):
+                    # An error must not be revalidated into a 304 while the data stays the same
+                    del response['ETag']
+                patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,209 @@
+"""
+Shared clearance grid layer for the registrar, signatory and business manager
+clearance tables. Handles filtering, server-side sorting, keyset (cursor)
+pagination and total counts on top of ClearanceStatusMatrix, so every page
+costs the same handful of queries regardless of table size.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from django.db.models import F, Q, OuterRef, Subquery, Value, CharField, IntegerField
+from django.db.models.functions import Coalesce
+
+from .models import ClearanceForm, ClearanceStatusMatrix, EnrollmentForm
+from .student_search import DEFAULT_FIELDS, search_students
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+class ClearanceGridService:
+    """Builds filtered, sorted and keyset-paginated clearance grid pages"""
+
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 500
+
+    # Placeholder values sent by the dropdowns when no filter is chosen
+    FILTER_PLACEHOLDERS = {'', 'Filter by Course', 'Filter by Year', 'Filter by Section', 'Filter by Status'}
+
+    # sort key -> (ORM lookup, value kind). Nullable columns are coalesced so the
+    # keyset comparison never has to deal with NULLs.
+    SORT_FIELDS = {
+        'submitted_at': ('submitted_at', 'datetime'),
+        'student_name': ('student__full_name', 'str'),
+        'student_number': ('student__profile__student_number', 'str'),
+        'program': ('student__profile__program', 'str'),
+        'year_level': ('student__profile__year_level', 'int'),
+        'section': ('section', 'str'),
+        'clearance_type': ('clearance_type', 'str'),
+        'status': ('status_matrix__overall_status', 'str'),
+        'approved_count': ('status_matrix__approved_count', 'int'),
+    }
+    # Aliases used by the existing frontends
+    SORT_ALIASES = {
+        'created_at': 'submitted_at',
+        'date_submitted': 'submitted_at',
+        'id_number': 'student_number',
+        'course': 'program',
+        'year': 'year_level',
+    }
+    # Every signatory column is sortable as well, e.g. ?sort=cashier
+    for _signatory_type in ClearanceStatusMatrix.SIGNATORY_TYPES:
+        SORT_FIELDS[_signatory_type] = (f'status_matrix__{_signatory_type}_status', 'str')
+    del _signatory_type
+
+    @staticmethod
+    def base_queryset():
+        """Clearance forms with student, profile, status matrix and latest enrollment section in one query"""
+        latest_section = EnrollmentForm.objects.filter(user=OuterRef('student')).values('section')[:1]
+        return ClearanceForm.objects.select_related(
+            'student', 'student__profile', 'status_matrix'
+        ).annotate(enrollment_section=Subquery(latest_section))
+
+    @staticmethod
+    def apply_filters(queryset, params, section_source: str = 'clearance', search_program: bool = False):
+        """
+        Apply the course/year/section/status/search filters shared by all clearance grids.
+        section_source is 'clearance' (ClearanceForm.section) or 'enrollment' (student's enrollment forms).
+        """
+        placeholders = ClearanceGridService.FILTER_PLACEHOLDERS
+
+        course_filter = params.get('course', '')
+        year_filter = params.get('year', '')
+        section_filter = params.get('section', '')
+        status_filter = params.get('status', '')
+        search_query = params.get('search', '')
+
+        if course_filter not in placeholders:
+            queryset = queryset.filter(student__profile__program__icontains=course_filter)
+
+        if year_filter not in placeholders:
+            queryset = queryset.filter(student__profile__year_level=year_filter)
+
+        if section_filter not in placeholders:
+            if section_source == 'enrollment':
+                queryset = queryset.filter(
+                    id__in=ClearanceForm.objects.filter(
+                        student__enrollment_forms__section=section_filter
+                    ).values('id')
+                )
+            else:
+                queryset = queryset.filter(section__icontains=section_filter)
+
+        if status_filter not in placeholders:
+            status_filter = status_filter.lower()
+            if status_filter in ('completed', 'cleared'):
+                queryset = queryset.filter(status_matrix__overall_status='completed')
+            elif status_filter == 'pending':
+                # Anything not completed, including forms without a matrix row yet
+                queryset = queryset.exclude(status_matrix__overall_status='completed')
+            elif status_filter == 'disapproved':
+                disapproved = Q()
+                for signatory_type in ClearanceStatusMatrix.SIGNATORY_TYPES:
+                    disapproved |= Q(**{f'status_matrix__{signatory_type}_status': 'disapproved'})
+                queryset = queryset.filter(disapproved)
+
+        if search_query:
+            fields = DEFAULT_FIELDS + ('program',) if search_program else DEFAULT_FIELDS
+            queryset = queryset.filter(student_id__in=search_students(search_query, fields))
+
+        return queryset
+
+    @staticmethod
+    def _encode_cursor(sort_key: str, order: str, value: Any, form_id) -> str:
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps([sort_key, order, value, str(form_id)])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_key: str, order: str):
+        try:
+            cursor_sort, cursor_order, value, form_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError):
+            raise InvalidCursor('Malformed cursor')
+        if cursor_sort != sort_key or cursor_order != order:
+            raise InvalidCursor('Cursor does not match the requested sort order')
+
+        kind = ClearanceGridService.SORT_FIELDS[sort_key][1]
+        try:
+            if kind == 'datetime':
+                value = datetime.fromisoformat(value)
+            elif kind == 'int':
+                value = int(value)
+            else:
+                value = str(value)
+        except (ValueError, TypeError):
+            raise InvalidCursor('Malformed cursor value')
+        return value, form_id
+
+    @staticmethod
+    def paginate(queryset, params) -> Dict[str, Any]:
+        """
+        Sort and keyset-paginate a filtered queryset.
+
+        Query parameters: sort (any SORT_FIELDS key or alias), order (asc|desc),
+        limit (page size) and cursor (opaque value from a previous next_cursor).
+        Returns {'rows': [...forms], 'pagination': {...}}.
+        """
+        sort_key = params.get('sort') or 'submitted_at'
+        sort_key = ClearanceGridService.SORT_ALIASES.get(sort_key, sort_key)
+        if sort_key not in ClearanceGridService.SORT_FIELDS:
+            sort_key = 'submitted_at'
+        order = 'asc' if (params.get('order') or '').lower() == 'asc' else 'desc'
+
+        try:
+            limit = int(params.get('limit') or params.get('page_size') or ClearanceGridService.DEFAULT_LIMIT)
+        except ValueError:
+            limit = ClearanceGridService.DEFAULT_LIMIT
+        limit = max(1, min(limit, ClearanceGridService.MAX_LIMIT))
+
+        lookup, kind = ClearanceGridService.SORT_FIELDS[sort_key]
+        if kind == 'datetime':
+            sort_expression = F(lookup)
+        elif kind == 'int':
+            sort_expression = Coalesce(F(lookup), Value(0), output_field=IntegerField())
+        else:
+            sort_expression = Coalesce(F(lookup), Value(''), output_field=CharField())
+
+        total_count = queryset.count()
+
+        queryset = queryset.annotate(grid_sort_value=sort_expression)
+        if order == 'asc':
+            queryset = queryset.order_by('grid_sort_value', 'id')
+        else:
+            queryset = queryset.order_by('-grid_sort_value', '-id')
+
+        cursor = params.get('cursor')
+        if cursor:
+            value, form_id = ClearanceGridService._decode_cursor(cursor, sort_key, order)
+            if order == 'asc':
+                queryset = queryset.filter(Q(grid_sort_value__gt=value) | Q(grid_sort_value=value, id__gt=form_id))
+            else:
+                queryset = queryset.filter(Q(grid_sort_value__lt=value) | Q(grid_sort_value=value, id__lt=form_id))
+
+        # Fetch one extra row to know whether another page exists
+        rows: List[ClearanceForm] = list(queryset[:limit + 1])
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor: Optional[str] = None
+        if has_next:
+            last = rows[-1]
+            next_cursor = ClearanceGridService._encode_cursor(sort_key, order, last.grid_sort_value, last.id)
+
+        return {
+            'rows': rows,
+            'pagination': {
+                'total': total_count,
+                'limit': limit,
+                'sort': sort_key,
+                'order': order,
+                'next_cursor': next_cursor,
+                'has_next': has_next,
+            }
+        }
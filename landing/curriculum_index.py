@@ -0,0 +1,153 @@
+"""
+In-process curriculum index.
+The whole AcademicProgram -> AcademicYearLevel -> AcademicSemester -> AcademicSubject
+tree is loaded with a single query into an immutable snapshot, and the JSON
+bodies served by the enrollment lookup endpoints are serialized once to bytes.
+
+Each process keeps its own snapshot and rebuilds it when the CURRICULUM cache
+namespace version changes. That happens on any save/delete of the curriculum
+models (see landing/cache.py), or explicitly through CurriculumIndex.invalidate()
+after course edits and curriculum loads.
+"""
+
+import json
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import CURRICULUM
+from .models import AcademicProgram
+
+
+def _to_bytes(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload).encode()
+
+
+class CurriculumIndex:
+    """Immutable snapshot of the curriculum keyed by (program code, year number, semester number)"""
+
+    _current: Optional['CurriculumIndex'] = None
+    _lock = threading.Lock()
+
+    FIELDS = [
+        'id', 'code', 'name', 'program_type', 'duration_years', 'description', 'created_at',
+        'year_levels__year_number', 'year_levels__year_name',
+        'year_levels__semesters__semester_number', 'year_levels__semesters__semester_name',
+        'year_levels__semesters__subjects__code', 'year_levels__semesters__subjects__name',
+        'year_levels__semesters__subjects__professor', 'year_levels__semesters__subjects__units',
+    ]
+
+    def __init__(self, version, rows):
+        programs: Dict[str, Dict[str, Any]] = {}
+        year_levels: Dict[str, Dict[int, str]] = {}
+        semesters: Dict[Tuple[str, int], Dict[int, str]] = {}
+        subjects: Dict[Tuple[str, int, int], list] = {}
+
+        for (program_id, code, name, program_type, duration_years, description, created_at,
+             year_number, year_name, semester_number, semester_name,
+             subject_code, subject_name, professor, units) in rows:
+            if code not in programs:
+                programs[code] = {
+                    'id': str(program_id),
+                    'code': code,
+                    'name': name,
+                    'program_type': program_type,
+                    'duration_years': duration_years,
+                    'description': description,
+                    'created_at': created_at,
+                }
+                year_levels[code] = {}
+            if year_number is None:
+                continue
+            year_levels[code][year_number] = year_name
+            semesters.setdefault((code, year_number), {})
+            if semester_number is None:
+                continue
+            semesters[(code, year_number)][semester_number] = semester_name
+            semester_subjects = subjects.setdefault((code, year_number, semester_number), [])
+            if subject_code is not None:
+                semester_subjects.append({
+                    'code': subject_code,
+                    'name': subject_name,
+                    'professor': professor,
+                    'units': units,
+                })
+
+        for code, program in programs.items():
+            program['year_levels_count'] = len(year_levels[code])
+
+        self.version = version
+        self.programs = MappingProxyType(programs)
+        self.semesters = MappingProxyType(semesters)
+
+        # Pre-serialized response bodies
+        enrollment_programs = sorted(programs.values(), key=lambda p: (p['program_type'], p['name']))
+        self.programs_json = _to_bytes({
+            'success': True,
+            'programs': [
+                {'code': p['code'], 'name': p['name'], 'program_type': p['program_type']}
+                for p in enrollment_programs
+            ]
+        })
+        self.year_levels_json = MappingProxyType({
+            code: _to_bytes({
+                'success': True,
+                'year_levels': [
+                    {'year_number': number, 'year_name': levels[number]} for number in sorted(levels)
+                ]
+            })
+            for code, levels in year_levels.items()
+        })
+        self.subjects_json = MappingProxyType({
+            key: _to_bytes({'success': True, 'subjects': subject_list})
+            for key, subject_list in subjects.items()
+        })
+
+    @classmethod
+    def build(cls, version=None) -> 'CurriculumIndex':
+        """Load the full curriculum tree in one query"""
+        rows = AcademicProgram.objects.order_by(
+            'program_type', 'code',
+            'year_levels__year_number',
+            'year_levels__semesters__semester_number',
+            'year_levels__semesters__subjects__order',
+            'year_levels__semesters__subjects__code',
+        ).values_list(*cls.FIELDS)
+        return cls(version, list(rows))
+
+    @classmethod
+    def current(cls) -> 'CurriculumIndex':
+        """Return this process's snapshot, rebuilding it if the curriculum changed"""
+        version = CURRICULUM.version
+        index = cls._current
+        if index is None or index.version != version:
+            with cls._lock:
+                index = cls._current
+                if index is None or index.version != version:
+                    index = cls.build(version)
+                    cls._current = index
+        return index
+
+    @staticmethod
+    def invalidate():
+        """Force every process to rebuild its snapshot on the next lookup"""
+        CURRICULUM.invalidate()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def get_year_levels_json(self, program_code: str) -> Optional[bytes]:
+        return self.year_levels_json.get(program_code)
+
+    def get_subjects_json(self, program_code: str, year_number: int, semester_number: int) -> Optional[bytes]:
+        return self.subjects_json.get((program_code, year_number, semester_number))
+
+    def lookup_error(self, program_code: str, year_number: int, semester_number: int) -> Optional[str]:
+        """The error message enrollment_subjects_api reports when a lookup misses"""
+        if program_code not in self.programs:
+            return 'Program not found'
+        if (program_code, year_number) not in self.semesters:
+            return 'Year level not found'
+        if semester_number not in self.semesters[(program_code, year_number)]:
+            return 'Semester not found'
+        return None
@@ -0,0 +1,212 @@
+"""
+Aggregated dashboard statistics.
+Computes every dashboard counter and the 7-day chart series with a handful of
+grouped/conditional COUNT queries, and caches the result per role for
+DASHBOARD_STATS_CACHE_TTL seconds. The cache is invalidated whenever a form or
+signatory record changes (see the DASHBOARD_STATS namespace in landing/cache.py).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .cache import DASHBOARD_STATS
+from .models import (
+    ClearanceForm, ClearanceSignatory, DocumentRequest,
+    EnrollmentForm, GraduationForm, User
+)
+
+
+class DashboardStatsService:
+    """Single source of dashboard statistics for the registrar, signatory, business manager and REST dashboards"""
+
+    CHART_DAYS = 7
+
+    # (model, creation timestamp field, "accomplished" status, "disapproved" status)
+    FORM_MODELS = [
+        (ClearanceForm, 'submitted_at', 'approved', 'disapproved'),
+        (EnrollmentForm, 'created_at', 'approved', 'rejected'),
+        (GraduationForm, 'created_at', 'approved', 'rejected'),
+        (DocumentRequest, 'created_at', 'released', 'rejected'),
+    ]
+
+    @staticmethod
+    def invalidate():
+        """Drop every cached dashboard"""
+        DASHBOARD_STATS.invalidate()
+
+    # ------------------------------------------------------------------
+    # Builders
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _start_of_day(day) -> datetime:
+        return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+    @staticmethod
+    def build_institution_stats() -> Dict[str, Any]:
+        """Registrar/admin statistics, 7-day charts and recent activity"""
+        today = timezone.localdate()
+        today_start = DashboardStatsService._start_of_day(today)
+        last_week_start = DashboardStatsService._start_of_day(today - timedelta(days=7))
+        chart_start_day = today - timedelta(days=DashboardStatsService.CHART_DAYS - 1)
+        chart_start = DashboardStatsService._start_of_day(chart_start_day)
+
+        chart_days = [chart_start_day + timedelta(days=i) for i in range(DashboardStatsService.CHART_DAYS)]
+        day_starts = [DashboardStatsService._start_of_day(day) for day in chart_days + [today + timedelta(days=1)]]
+        day_bounds = list(zip(day_starts, day_starts[1:]))
+
+        statistics = {}
+        disapproved_total = 0
+        recently_disapproved = 0
+        accomplishment_by_day = {}
+        visitors_by_day = {}
+        documents_by_day = {}
+
+        for model, created_field, done_status, disapproved_status in DashboardStatsService.FORM_MODELS:
+            # One conditional aggregate per model for all status counters
+            counts = model.objects.aggregate(
+                total=Count('id'),
+                pending=Count('id', filter=Q(status='pending')),
+                disapproved=Count('id', filter=Q(status=disapproved_status)),
+                recently_disapproved=Count('id', filter=Q(status=disapproved_status, **{f'{created_field}__gte': last_week_start})),
+            )
+            key = {
+                ClearanceForm: 'clearance',
+                EnrollmentForm: 'enrollment',
+                GraduationForm: 'graduation',
+                DocumentRequest: 'document',
+            }[model]
+            statistics[f'total_{key}_requests'] = counts['total']
+            statistics[f'pending_{key}_requests'] = counts['pending']
+            disapproved_total += counts['disapproved']
+            if model is not DocumentRequest:
+                recently_disapproved += counts['recently_disapproved']
+
+            # One conditional aggregate per model for the 7-day chart series. The day buckets are
+            # local-time created_at ranges computed here: TruncDate would need CONVERT_TZ on MySQL,
+            # which returns NULL (every bucket empty) without the server's time zone tables.
+            buckets = {}
+            for day, (start, end) in zip(chart_days, day_bounds):
+                in_day = Q(**{f'{created_field}__gte': start, f'{created_field}__lt': end})
+                buckets[f'created_{day:%Y%m%d}'] = Count('id', filter=in_day)
+                buckets[f'done_{day:%Y%m%d}'] = Count('id', filter=in_day & Q(status=done_status))
+            daily = model.objects.filter(**{f'{created_field}__gte': chart_start}).aggregate(**buckets)
+            for day in chart_days:
+                created, done = daily[f'created_{day:%Y%m%d}'], daily[f'done_{day:%Y%m%d}']
+                visitors_by_day[day] = visitors_by_day.get(day, 0) + created
+                accomplishment_by_day[day] = accomplishment_by_day.get(day, 0) + done
+                if model is DocumentRequest:
+                    documents_by_day[day] = done
+
+        signature_counts = ClearanceSignatory.objects.filter(status='pending').aggregate(
+            pending_signatures=Count('id', filter=Q(clearance__status='pending')),
+            new_today=Count('id', filter=Q(updated_at__gte=today_start)),
+        )
+        statistics['pending_signatures_count'] = signature_counts['pending_signatures']
+        statistics['new_signatures_today'] = signature_counts['new_today']
+        statistics['disapproved_forms_count'] = disapproved_total
+        statistics['recently_disapproved'] = recently_disapproved
+
+        chart_dates = [day.strftime('%b %d') for day in chart_days]
+
+        return {
+            'statistics': statistics,
+            'charts': {
+                'accomplishment': {
+                    'categories': chart_dates,
+                    'series': [{'name': 'Accomplishment', 'data': [accomplishment_by_day.get(day, 0) for day in chart_days]}]
+                },
+                'visitors': {
+                    'categories': chart_dates,
+                    'series': [{'name': 'Visitors', 'data': [visitors_by_day.get(day, 0) for day in chart_days]}]
+                },
+                'documents': {
+                    'categories': chart_dates,
+                    'series': [{'name': 'Documents Released', 'data': [documents_by_day.get(day, 0) for day in chart_days]}]
+                }
+            },
+            'recent_activity': DashboardStatsService.build_recent_activity(),
+        }
+
+    @staticmethod
+    def build_recent_activity(limit: int = 10):
+        """Latest submissions across all form types (one query per type, users joined in)"""
+        recent_activity = []
+
+        for clearance in ClearanceForm.objects.select_related('student').order_by('-submitted_at')[:5]:
+            recent_activity.append({
+                'type': 'clearance',
+                'title': f'Clearance Form #{clearance.id}',
+                'status': clearance.status,
+                'date': clearance.submitted_at.strftime('%Y-%m-%d %H:%M'),
+                'user': clearance.student.full_name if clearance.student else 'Unknown'
+            })
+
+        for enrollment in EnrollmentForm.objects.select_related('user').order_by('-created_at')[:5]:
+            recent_activity.append({
+                'type': 'enrollment',
+                'title': f'Enrollment Form #{enrollment.id}',
+                'status': enrollment.status,
+                'date': enrollment.created_at.strftime('%Y-%m-%d %H:%M'),
+                'user': enrollment.user.full_name if enrollment.user else 'Unknown'
+            })
+
+        for graduation in GraduationForm.objects.select_related('user').order_by('-created_at')[:5]:
+            recent_activity.append({
+                'type': 'graduation',
+                'title': f'Graduation Form #{graduation.id}',
+                'status': graduation.status,
+                'date': graduation.created_at.strftime('%Y-%m-%d %H:%M'),
+                'user': graduation.user.full_name if graduation.user else 'Unknown'
+            })
+
+        for document in DocumentRequest.objects.select_related('requester').order_by('-created_at')[:5]:
+            recent_activity.append({
+                'type': 'document',
+                'title': f'Document Request: {document.document_type}',
+                'status': document.status,
+                'date': document.created_at.strftime('%Y-%m-%d %H:%M'),
+                'user': document.requester.full_name if document.requester else 'Unknown'
+            })
+
+        recent_activity.sort(key=lambda x: x['date'], reverse=True)
+        return recent_activity[:limit]
+
+    @staticmethod
+    def build_signatory_stats(signatory_type: str) -> Dict[str, int]:
+        """Clearance decision counters for one signatory type in a single query"""
+        return ClearanceSignatory.objects.filter(
+            signatory__signatory_profile__signatory_type=signatory_type
+        ).aggregate(
+            pending_approvals=Count('id', filter=Q(status='pending')),
+            total_approved=Count('id', filter=Q(status='approved')),
+            total_disapproved=Count('id', filter=Q(status='disapproved')),
+        )
+
+    @staticmethod
+    def build_student_stats(user: User) -> Dict[str, int]:
+        """Per-student counters (not cached - they are per user and cheap)"""
+        clearance_counts = ClearanceForm.objects.filter(student=user).aggregate(
+            total_clearances=Count('id'),
+            approved_clearances=Count('id', filter=Q(status='approved')),
+            pending_clearances=Count('id', filter=Q(status='pending')),
+        )
+        clearance_counts['enrollment_forms'] = EnrollmentForm.objects.filter(user=user).count()
+        clearance_counts['graduation_forms'] = GraduationForm.objects.filter(user=user).count()
+        return clearance_counts
+
+    # ------------------------------------------------------------------
+    # Cached entry points
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_institution_stats() -> Dict[str, Any]:
+        return DASHBOARD_STATS.get_or_set(['registrar'], DashboardStatsService.build_institution_stats)
+
+    @staticmethod
+    def get_signatory_stats(signatory_type: str) -> Dict[str, int]:
+        return DASHBOARD_STATS.get_or_set(
+            ['signatory', signatory_type],
+            lambda: DashboardStatsService.build_signatory_stats(signatory_type)
+        )
@@ -0,0 +1,117 @@
+"""
+Small database helpers shared by the set-based write paths.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.db import connections, models, router
+
+
+def bulk_upsert(model, objs, unique_fields, update_fields, batch_size=None):
+    """
+    INSERT ... ON CONFLICT/ON DUPLICATE KEY UPDATE for a list of unsaved instances.
+    The conflict target is only passed on backends that accept one (MySQL does not;
+    it resolves conflicts against every unique key of the table).
+    """
+    if not objs:
+        return []
+    connection = connections[router.db_for_write(model)]
+    kwargs = {}
+    if connection.features.supports_update_conflicts_with_target:
+        kwargs['unique_fields'] = unique_fields
+    return model.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        update_fields=update_fields,
+        batch_size=batch_size,
+        **kwargs
+    )
+
+
+class RowWriter:
+    """
+    Buffered multi-row INSERTs for one model without building model instances or
+    running signals; for bulk loads where bulk_create's per-value compilation is
+    the bottleneck. add() takes {attname: value}: omitted fields get their default,
+    auto_now/auto_now_add fields get `now`, and values are converted for the
+    backend once per column type. Writers listed in `after` (the parent tables) are
+    flushed first, so foreign keys that are checked immediately (MySQL) never point
+    at a row still waiting in a buffer.
+
+        forms = RowWriter(ClearanceForm, now=now)
+        signatories = RowWriter(ClearanceSignatory, now=now, after=[forms])
+        ...
+        signatories.flush()
+    """
+
+    def __init__(self, model, now=None, batch_size=5000, after=()):
+        self.model = model
+        self.batch_size = batch_size
+        self.after = list(after)
+        self.connection = connections[router.db_for_write(model)]
+        self.rows = []
+        self.count = 0
+
+        # Auto-increment keys are left to the database
+        fields = [field for field in model._meta.concrete_fields if not isinstance(field, models.AutoField)]
+        quote = self.connection.ops.quote_name
+        self.sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(model._meta.db_table),
+            ', '.join(quote(field.column) for field in fields),
+            ', '.join(['%s'] * len(fields)),
+        )
+        self.columns = [self._column(field, now) for field in fields]
+
+    def _column(self, field, now):
+        """(attname, converter or None, default, whether the default is called per row)"""
+        convert = self._converter(field)
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            default, per_row = now, False
+        elif field.has_default() and callable(field.default):
+            default, per_row = field.get_default, True
+        else:
+            default, per_row = field.get_default() if field.has_default() else None, False
+        if not per_row and convert is not None and default is not None:
+            default = convert(default)
+        return field.attname, convert, default, per_row
+
+    def _converter(self, field):
+        target = field.target_field if field.is_relation else field
+        if isinstance(target, models.UUIDField) and not self.connection.features.has_native_uuid_field:
+            return lambda value: value.hex if isinstance(value, uuid.UUID) else value
+        if isinstance(target, (models.CharField, models.TextField, models.IntegerField, models.BooleanField)):
+            return None
+        if isinstance(target, models.DateTimeField) and settings.USE_TZ and not self.connection.features.supports_timezones:
+            # What adapt_datetimefield_value does for aware values, without its per-value checks
+            tz = self.connection.timezone
+            return lambda value: str(value.astimezone(tz).replace(tzinfo=None))
+        return lambda value: target.get_db_prep_save(value, connection=self.connection)
+
+    def add(self, **values):
+        row = []
+        for attname, convert, default, per_row in self.columns:
+            if attname in values:
+                value = values[attname]
+                if convert is not None and value is not None:
+                    value = convert(value)
+            elif per_row:
+                value = default()
+                if convert is not None and value is not None:
+                    value = convert(value)
+            else:
+                value = default
+            row.append(value)
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for writer in self.after:
+            writer.flush()
+        if not self.rows:
+            return
+        with self.connection.cursor() as cursor:
+            cursor.executemany(self.sql, self.rows)
+        self.count += len(self.rows)
+        self.rows = []
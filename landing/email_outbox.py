@@ -0,0 +1,190 @@
+"""
+Email outbox built on EmailNotificationLog.
+Request handlers only enqueue 'pending' rows; a worker (the send_queued_emails
+management command or the Celery task) drains them in batches over a single
+reused SMTP connection, retrying failures with exponential backoff.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import EmailNotificationLog, Notification, User
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutbox:
+    """Queue and deliver outgoing emails"""
+
+    BATCH_SIZE = getattr(settings, 'EMAIL_OUTBOX_BATCH_SIZE', 50)
+    MAX_ATTEMPTS = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+    RETRY_BASE_SECONDS = getattr(settings, 'EMAIL_OUTBOX_RETRY_BASE_SECONDS', 60)
+    # How long a worker may hold a claimed batch before another worker can pick it up. A claim
+    # is never shorter than a whole batch of sends timing out (see claim_timeout()).
+    CLAIM_TIMEOUT_SECONDS = getattr(settings, 'EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS', 600)
+
+    @staticmethod
+    def enqueue(
+        user: User,
+        email_type: str,
+        recipient_email: str,
+        subject: str,
+        content: str,
+        notification: Optional[Notification] = None
+    ) -> EmailNotificationLog:
+        """Queue an email for delivery by the outbox worker"""
+        return EmailNotificationLog.objects.create(
+            user=user,
+            notification=notification,
+            email_type=email_type,
+            recipient_email=recipient_email,
+            subject=subject,
+            content=content,
+            status='pending',
+            next_attempt_at=timezone.now()
+        )
+
+    @staticmethod
+    def enqueue_many(messages: List[Dict]) -> List[EmailNotificationLog]:
+        """Queue many emails with a single INSERT; each message takes the enqueue() arguments"""
+        now = timezone.now()
+        return EmailNotificationLog.objects.bulk_create([
+            EmailNotificationLog(
+                user=message['user'],
+                notification=message.get('notification'),
+                email_type=message['email_type'],
+                recipient_email=message['recipient_email'],
+                subject=message['subject'],
+                content=message['content'],
+                status='pending',
+                next_attempt_at=now
+            )
+            for message in messages
+        ])
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """Exponential backoff: base, 2x base, 4x base, ... after each failed attempt"""
+        return timedelta(seconds=EmailOutbox.RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)))
+
+    @staticmethod
+    def claim_timeout(batch_size: int) -> timedelta:
+        """Claim length for a batch: every send may take up to EMAIL_TIMEOUT, plus a minute to spare"""
+        send_timeout = getattr(settings, 'EMAIL_TIMEOUT', None) or 30
+        return timedelta(seconds=max(EmailOutbox.CLAIM_TIMEOUT_SECONDS, batch_size * send_timeout + 60))
+
+    @staticmethod
+    def _claim_batch(batch_size: int) -> List[EmailNotificationLog]:
+        """Atomically move a batch of due rows to 'sending' so concurrent workers do not double-send"""
+        now = timezone.now()
+        with transaction.atomic():
+            due = EmailNotificationLog.objects.select_for_update(skip_locked=True).filter(
+                Q(status='pending') | Q(status='sending'),
+                Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now)
+            ).order_by('created_at')[:batch_size]
+            batch = list(due)
+            if batch:
+                EmailNotificationLog.objects.filter(id__in=[log.id for log in batch]).update(
+                    status='sending',
+                    next_attempt_at=now + EmailOutbox.claim_timeout(batch_size)
+                )
+        return batch
+
+    @staticmethod
+    def _build_message(email_log: EmailNotificationLog, connection) -> EmailMultiAlternatives:
+        email = EmailMultiAlternatives(
+            subject=email_log.subject,
+            body=email_log.content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email_log.recipient_email],
+            connection=connection
+        )
+        email.attach_alternative(email_log.content, "text/html")
+        return email
+
+    @staticmethod
+    def _record_failure(email_log: EmailNotificationLog, error: str):
+        attempts = email_log.attempts + 1
+        if attempts >= EmailOutbox.MAX_ATTEMPTS:
+            status, next_attempt_at = 'failed', None
+        else:
+            status, next_attempt_at = 'pending', timezone.now() + EmailOutbox.retry_delay(attempts)
+        EmailNotificationLog.objects.filter(id=email_log.id).update(
+            status=status,
+            attempts=attempts,
+            error_message=error,
+            next_attempt_at=next_attempt_at
+        )
+        return status
+
+    @staticmethod
+    def _record_sent(email_log: EmailNotificationLog):
+        now = timezone.now()
+        EmailNotificationLog.objects.filter(id=email_log.id).update(
+            status='sent',
+            sent_at=now,
+            attempts=email_log.attempts + 1,
+            error_message=None,
+            next_attempt_at=None
+        )
+        if email_log.notification_id:
+            Notification.objects.filter(id=email_log.notification_id).update(email_sent=True, email_sent_at=now)
+
+    @staticmethod
+    def deliver_batch(batch_size: Optional[int] = None) -> Dict[str, int]:
+        """Claim one batch of due emails and send it over a single SMTP connection"""
+        stats = {'claimed': 0, 'sent': 0, 'retrying': 0, 'failed': 0}
+        batch = EmailOutbox._claim_batch(batch_size or EmailOutbox.BATCH_SIZE)
+        stats['claimed'] = len(batch)
+        if not batch:
+            return stats
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            logger.error(f"Email outbox could not open mail connection: {str(e)}")
+            for email_log in batch:
+                status = EmailOutbox._record_failure(email_log, f"Connection error: {str(e)}")
+                stats['failed' if status == 'failed' else 'retrying'] += 1
+            return stats
+
+        try:
+            for email_log in batch:
+                try:
+                    connection.send_messages([EmailOutbox._build_message(email_log, connection)])
+                except Exception as e:
+                    logger.error(f"Failed to send queued email {email_log.id} to {email_log.recipient_email}: {str(e)}")
+                    status = EmailOutbox._record_failure(email_log, str(e))
+                    stats['failed' if status == 'failed' else 'retrying'] += 1
+                    continue
+                # Recorded right away, so a worker that dies mid-batch (or a claim that
+                # expires) never sends this email again
+                EmailOutbox._record_sent(email_log)
+                stats['sent'] += 1
+        finally:
+            connection.close()
+
+        logger.info(f"Email outbox batch: {stats}")
+        return stats
+
+    @staticmethod
+    def deliver_pending(batch_size: Optional[int] = None, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Drain the queue batch by batch until nothing is due (or max_batches is reached)"""
+        totals = {'claimed': 0, 'sent': 0, 'retrying': 0, 'failed': 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            stats = EmailOutbox.deliver_batch(batch_size)
+            batches += 1
+            for key, value in stats.items():
+                totals[key] += value
+            if stats['claimed'] == 0:
+                break
+        return totals
@@ -0,0 +1,249 @@
+"""
+Per-user event stream replacing the notification, message and dashboard polls.
+
+Producers call EventStream.publish() inside their transaction. The event is a
+UserEvent row (the change log, committed or rolled back with the change), and
+after the commit a version counter per user or audience is bumped in the
+Django cache (the broker: Redis or the file cache in production, locmem
+offline and in tests).
+
+Waiting clients watch those counters and query the change log only when one
+of them moves (plus a slow safety check), so an idle client costs cache reads
+instead of MySQL queries. By default clients poll: the poll endpoint answers at
+once and a client that sends back the version token of its previous answer is
+told "nothing new" from the cache alone, so an idle page costs one short
+request every EVENT_STREAM_POLL_INTERVAL_SECONDS and never holds a sync worker.
+Waiting requests (EVENT_STREAM_LONG_POLL_SECONDS > 0, or the Server-Sent Events
+endpoint with EVENT_STREAM_SSE_ENABLED) occupy a worker per open page and are
+meant for threaded or async servers. All of them resume from the last event id
+they received.
+
+    EventStream.publish('message', {'conversation_id': ...}, users=[recipient.id])
+    EventStream.publish('dashboard_stale', {'form_type': 'clearance'}, audiences=['admin'])
+"""
+
+import hashlib
+import json
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from .models import UserEvent
+
+logger = logging.getLogger(__name__)
+
+# Seconds one SSE response stays open; EventSource reconnects (with Last-Event-ID) after it ends
+STREAM_SECONDS = getattr(settings, 'EVENT_STREAM_SECONDS', 55)
+# Longest wait of one poll request; 0 answers at once (sync workers)
+LONG_POLL_SECONDS = getattr(settings, 'EVENT_STREAM_LONG_POLL_SECONDS', 0)
+# Pause between two polls of a page when the server does not wait
+POLL_INTERVAL_SECONDS = getattr(settings, 'EVENT_STREAM_POLL_INTERVAL_SECONDS', 10)
+# How often waiting clients read the version counters from the cache
+CHECK_INTERVAL_SECONDS = getattr(settings, 'EVENT_STREAM_CHECK_INTERVAL_SECONDS', 1.0)
+# Query the change log at least this often even if no counter moved (missed or evicted counters)
+DB_CHECK_SECONDS = getattr(settings, 'EVENT_STREAM_DB_CHECK_SECONDS', 30)
+RETENTION = timedelta(hours=getattr(settings, 'EVENT_STREAM_RETENTION_HOURS', 24))
+# False: the SSE endpoint answers 204 and clients fall back to long polling
+SSE_ENABLED = getattr(settings, 'EVENT_STREAM_SSE_ENABLED', False)
+
+HEARTBEAT_SECONDS = 15
+MAX_EVENTS_PER_BATCH = 100
+VERSION_PREFIX = 'events:version'
+
+
+class EventStream:
+    """Publish events to users and wait for them"""
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def publish(event_type: str, payload: Optional[Dict[str, Any]] = None, users: Iterable = (), audiences: Iterable[str] = ()):
+        """Record one event for each user id and each audience (user type)"""
+        payload = payload or {}
+        events = [UserEvent(user_id=user_id, event_type=event_type, payload=payload) for user_id in set(users) if user_id]
+        events += [UserEvent(audience=audience, event_type=event_type, payload=payload) for audience in set(audiences)]
+        EventStream._write(events)
+
+    @staticmethod
+    def publish_each(event_type: str, items: Iterable[Tuple[Any, Dict[str, Any]]]):
+        """Record (user id, payload) events, each with its own payload, in one INSERT"""
+        EventStream._write([
+            UserEvent(user_id=user_id, event_type=event_type, payload=payload)
+            for user_id, payload in items if user_id
+        ])
+
+    @staticmethod
+    def publish_notifications(notifications: Iterable):
+        """One 'notification' event per new Notification row"""
+        EventStream.publish_each('notification', [
+            (notification.user_id, {
+                'id': str(notification.id),
+                'notification_type': notification.notification_type,
+                'priority': notification.priority,
+                'title': notification.title,
+                'message': notification.message,
+                'form_type': notification.form_type,
+                'form_id': str(notification.form_id) if notification.form_id else None,
+            })
+            for notification in notifications
+        ])
+
+    @staticmethod
+    def _write(events: List[UserEvent]):
+        if not events:
+            return
+        try:
+            # A savepoint keeps a failed write from breaking the caller's transaction
+            with transaction.atomic():
+                UserEvent.objects.bulk_create(events)
+        except Exception as e:
+            # Events are hints to refresh; losing one must never fail the change itself
+            logger.error(f"Could not record {events[0].event_type} events: {e}")
+            return
+        keys = {EventStream._version_key(event.user_id, event.audience) for event in events}
+        transaction.on_commit(lambda: EventStream._bump(keys))
+
+    @staticmethod
+    def _version_key(user_id=None, audience: str = '') -> str:
+        return f'{VERSION_PREFIX}:user:{user_id}' if user_id else f'{VERSION_PREFIX}:audience:{audience}'
+
+    @staticmethod
+    def _bump(keys: Iterable[str]):
+        for key in keys:
+            try:
+                cache.add(key, 0, None)
+                cache.incr(key)
+            except Exception as e:
+                # Waiting clients still find the event on their next change log check
+                logger.debug(f"Could not bump event version {key}: {e}")
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    @staticmethod
+    def latest_id() -> int:
+        """Id of the newest event; new clients start from here instead of replaying history"""
+        return UserEvent.objects.aggregate(latest=Max('id'))['latest'] or 0
+
+    @staticmethod
+    def fetch(user, after_id: int, limit: int = MAX_EVENTS_PER_BATCH) -> List[UserEvent]:
+        """Events for user newer than after_id, oldest first"""
+        return list(
+            UserEvent.objects.filter(id__gt=after_id).filter(
+                Q(user=user) | Q(user__isnull=True, audience=user.user_type)
+            ).order_by('id')[:limit]
+        )
+
+    @staticmethod
+    def _versions(user) -> Dict[str, Any]:
+        try:
+            return cache.get_many([
+                EventStream._version_key(user_id=user.id),
+                EventStream._version_key(audience=user.user_type),
+            ])
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _watch(user, after_id: int, deadline: float) -> Iterator[List[UserEvent]]:
+        """
+        Yield a batch of new events (possibly empty) every CHECK_INTERVAL_SECONDS until deadline.
+        The change log is queried at the start, when a version counter moves, and every
+        DB_CHECK_SECONDS; the other ticks only read the cache.
+        """
+        versions = EventStream._versions(user)
+        last_db_check = None
+        while True:
+            now = time.monotonic()
+            if last_db_check is None or now - last_db_check >= DB_CHECK_SECONDS:
+                events = EventStream.fetch(user, after_id)
+                last_db_check = now
+            else:
+                current = EventStream._versions(user)
+                events = []
+                if current != versions:
+                    versions = current
+                    events = EventStream.fetch(user, after_id)
+                    last_db_check = now
+            if events:
+                after_id = events[-1].id
+                if len(events) == MAX_EVENTS_PER_BATCH:
+                    # More are waiting; fetch them on the next tick without sleeping
+                    last_db_check = None
+            yield events
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if last_db_check is not None:
+                time.sleep(min(CHECK_INTERVAL_SECONDS, remaining))
+
+    @staticmethod
+    def version_token(user) -> str:
+        """Token of the user's version counters; it stays the same until an event is published to the user"""
+        return hashlib.md5(repr(sorted(EventStream._versions(user).items())).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def poll(user, after_id: int, timeout: float, version: Optional[str] = None) -> Tuple[List[UserEvent], str]:
+        """
+        (new events, version token) for one poll request. A poll that does not wait and
+        sends the token of its previous answer is answered from the cache while it matches.
+        """
+        # Read before the change log, so an event committed after the fetch changes the next token
+        token = EventStream.version_token(user)
+        if timeout <= 0 and version and version == token:
+            return [], token
+        return EventStream.wait(user, after_id, timeout), token
+
+    @staticmethod
+    def wait(user, after_id: int, timeout: float) -> List[UserEvent]:
+        """Block until there are events newer than after_id or timeout passes"""
+        for events in EventStream._watch(user, after_id, time.monotonic() + timeout):
+            if events:
+                return events
+        return []
+
+    @staticmethod
+    def serialize(event: UserEvent) -> Dict[str, Any]:
+        return {
+            'id': event.id,
+            'type': event.event_type,
+            'data': event.payload,
+            'created_at': event.created_at.isoformat(),
+        }
+
+    @staticmethod
+    def sse_stream(user, last_event_id: Optional[int]) -> Iterator[str]:
+        """Server-Sent Events body for one connection of at most STREAM_SECONDS"""
+        # Reconnect quickly when the response ends; the browser resumes from the last id
+        yield 'retry: 2000\n\n'
+        if last_event_id is None:
+            last_event_id = EventStream.latest_id()
+            yield f'id: {last_event_id}\nevent: ready\ndata: {{}}\n\n'
+
+        next_heartbeat = time.monotonic() + HEARTBEAT_SECONDS
+        for events in EventStream._watch(user, last_event_id, time.monotonic() + STREAM_SECONDS):
+            for event in events:
+                yield f'id: {event.id}\nevent: {event.event_type}\ndata: {json.dumps(EventStream.serialize(event))}\n\n'
+            if events:
+                next_heartbeat = time.monotonic() + HEARTBEAT_SECONDS
+            elif time.monotonic() >= next_heartbeat:
+                # Comment line: keeps proxies from closing an idle connection
+                yield ': keepalive\n\n'
+                next_heartbeat = time.monotonic() + HEARTBEAT_SECONDS
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    @staticmethod
+    def prune(older_than: timedelta = RETENTION) -> int:
+        """Delete events older than the retention period; returns rows removed"""
+        deleted, _ = UserEvent.objects.filter(created_at__lt=timezone.now() - older_than).delete()
+        return deleted
@@ -0,0 +1,136 @@
+"""
+Shared grid layer for the enrollment and graduation tables of the registrar,
+signatory and business manager pages. Forms are loaded with their student and
+profile, every signatory record on screen comes from one query and is pivoted
+by role in memory, so a grid costs the same few queries however many forms
+it shows.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import pytz
+from django.db.models import OuterRef, Subquery
+
+from .models import EnrollmentForm, EnrollmentSignatory, GraduationForm, GraduationSignatory
+
+MANILA_TZ = pytz.timezone('Asia/Manila')
+TIMESTAMP_FORMAT = '%Y-%m-%d %I:%M %p'
+
+
+class FormGridRow:
+    """One form with its signatory records pivoted by role"""
+
+    def __init__(self, form, signatories: List, required_roles: Iterable[str]):
+        self.form = form
+        self.signatories = signatories
+        self.required_roles = tuple(required_roles)
+        # First record per role (lowest id), as form.signatories.filter(role=...).first() returned
+        self.by_role: Dict[str, object] = {}
+        for signatory in signatories:
+            self.by_role.setdefault(signatory.role, signatory)
+        # Reverse one-to-one cached by select_related: None without a query when missing
+        self.profile = getattr(form.user, 'profile', None)
+
+    def signatory(self, role: str):
+        return self.by_role.get(role)
+
+    def signatory_for(self, role: str, user):
+        """The record of role signed by user, or None"""
+        return next((s for s in self.signatories if s.role == role and s.signatory_id == user.id), None)
+
+    def status(self, role: str) -> str:
+        signatory = self.by_role.get(role)
+        return signatory.status if signatory else 'pending'
+
+    def remarks(self, role: str):
+        signatory = self.by_role.get(role)
+        return signatory.remarks if signatory else ''
+
+    def timestamp(self, role: str, decided_only: bool = True) -> str:
+        """Manila time of the role's last update; with decided_only, '' while it is still pending"""
+        signatory = self.by_role.get(role)
+        if not signatory or not signatory.updated_at or (decided_only and signatory.status == 'pending'):
+            return ''
+        return format_timestamp(signatory.updated_at)
+
+    def all_approved(self) -> bool:
+        """Every required role has a record and all of them are approved"""
+        statuses = {signatory.role: signatory.status for signatory in self.signatories}
+        return all(statuses.get(role) == 'approved' for role in self.required_roles)
+
+    def any_disapproved(self) -> bool:
+        return any(signatory.status == 'disapproved' for signatory in self.signatories)
+
+    def approved_at(self) -> Optional[str]:
+        """Latest approval among the required roles, formatted, or None"""
+        timestamps = [
+            self.by_role[role].updated_at for role in self.required_roles
+            if role in self.by_role and self.by_role[role].status == 'approved'
+        ]
+        return format_timestamp(max(timestamps)) if timestamps else None
+
+    def profile_value(self, field: str, default='N/A'):
+        return getattr(self.profile, field) if self.profile else default
+
+    @property
+    def enrollment_section(self):
+        """Section of the student's latest enrollment form ('N/A' without one); graduation grids only"""
+        section = getattr(self.form, 'enrollment_section', None)
+        return 'N/A' if section is None else section
+
+
+def format_timestamp(value) -> str:
+    return value.astimezone(MANILA_TZ).strftime(TIMESTAMP_FORMAT)
+
+
+class FormGridService:
+    """Builds enrollment and graduation grid rows with a constant number of queries"""
+
+    # form_type -> (form model, signatory model, name of the signatory's form foreign key)
+    FORM_TYPES = {
+        'enrollment': (EnrollmentForm, EnrollmentSignatory, 'enrollment'),
+        'graduation': (GraduationForm, GraduationSignatory, 'graduation'),
+    }
+    REQUIRED_ROLES = {
+        'enrollment': ('dean', 'business_manager', 'registrar'),
+        'graduation': ('dean', 'business_manager', 'registrar', 'president'),
+    }
+
+    @staticmethod
+    def base_queryset(form_type: str):
+        """
+        Forms with student and profile in one query, newest first. Graduation forms are
+        annotated with enrollment_section, the section of the student's latest enrollment
+        form (None when there is none).
+        """
+        form_model = FormGridService.FORM_TYPES[form_type][0]
+        queryset = form_model.objects.select_related('user', 'user__profile').order_by('-created_at')
+        if form_type == 'graduation':
+            latest_section = EnrollmentForm.objects.filter(user=OuterRef('user')).values('section')[:1]
+            queryset = queryset.annotate(enrollment_section=Subquery(latest_section))
+        return queryset
+
+    @staticmethod
+    def build_rows(form_type: str, forms: Iterable) -> List[FormGridRow]:
+        """Evaluate forms and attach their signatory records, fetched in a single query"""
+        forms = list(forms)
+        _, signatory_model, form_field = FormGridService.FORM_TYPES[form_type]
+
+        signatories_by_form = defaultdict(list)
+        if forms:
+            signatories = signatory_model.objects.filter(
+                **{f'{form_field}_id__in': [form.id for form in forms]}
+            ).order_by('id')
+            for signatory in signatories:
+                signatories_by_form[getattr(signatory, f'{form_field}_id')].append(signatory)
+
+        required_roles = FormGridService.REQUIRED_ROLES[form_type]
+        return [FormGridRow(form, signatories_by_form[form.id], required_roles) for form in forms]
+
+    @staticmethod
+    def rows(form_type: str, queryset=None) -> List[FormGridRow]:
+        """Rows for queryset (default: every form of form_type, newest first)"""
+        if queryset is None:
+            queryset = FormGridService.base_queryset(form_type)
+        return FormGridService.build_rows(form_type, queryset)
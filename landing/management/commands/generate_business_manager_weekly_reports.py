@@ -10,6 +10,8 @@ from django.template.loader import render_to_string
 from django.core.files.base import ContentFile
 import os
 from django.conf import settings
+from django.db.models import Q
+from landing.activity_rollups import ActivityRollupService, local_day_range
 
 
 class Command(BaseCommand):
@@ -53,6 +55,9 @@ class Command(BaseCommand):
         
         end_date = start_date + timedelta(days=6)  # Sunday
         
+        # Counts come from the daily rollups; bring them up to date first
+        ActivityRollupService.update()
+        
         self.stdout.write(f'Generating business manager reports for: {start_date} to {end_date}')
         
         # Generate individual reports for each business manager user
@@ -73,18 +78,25 @@ class Command(BaseCommand):
     def _generate_individual_signatory_activity_report(self, start_date, end_date, signatory_user):
         """Generate individual signatory activity summary report"""
         try:
-            # Get activities for this specific signatory only
-            activities = SignatoryActivityLog.objects.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date,
-                signatory=signatory_user  # Only this specific signatory's activities
-            ).order_by('created_at')
+            # Counts for this specific signatory only
+            counts = ActivityRollupService.totals(
+                ActivityRollupService.window(start_date, end_date, source='signatory', actor=signatory_user),
+                total=Q(),
+                approve=Q(action_type='approve'),
+                disapprove=Q(action_type='disapprove'),
+            )
+            week_start, week_end = local_day_range(start_date, end_date)
+            forms_processed = SignatoryActivityLog.objects.filter(
+                signatory=signatory_user,
+                created_at__gte=week_start,
+                created_at__lt=week_end
+            ).order_by().values('form_id').distinct().count()
             
             # Calculate stats for this specific signatory
             personal_stats = {
-                'approve': activities.filter(action_type='approve').count(),
-                'disapprove': activities.filter(action_type='disapprove').count(),
-                'forms_processed': len(set(activities.values_list('form_id', flat=True))),
+                'approve': counts['approve'],
+                'disapprove': counts['disapprove'],
+                'forms_processed': forms_processed,
                 'signatory_type': getattr(signatory_user, 'signatory_profile', None) and getattr(signatory_user.signatory_profile, 'signatory_type', 'Unknown') or 'Unknown'
             }
             
@@ -98,7 +110,7 @@ class Command(BaseCommand):
                 'period_start': start_date,
                 'period_end': end_date,
                 'signatory_stats': signatory_stats,
-                'total_activities': activities.count(),
+                'total_activities': counts['total'],
                 'generated_at': timezone.now()
             }
             
@@ -129,22 +141,24 @@ class Command(BaseCommand):
     def _generate_individual_signatory_performance_report(self, start_date, end_date, signatory_user):
         """Generate individual signatory performance metrics report"""
         try:
-            # Get activities for this specific signatory only
-            activities = SignatoryActivityLog.objects.filter(
-                signatory=signatory_user,
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
+            # Metrics for this specific signatory, in one query over the rollups
+            counts = ActivityRollupService.totals(
+                ActivityRollupService.window(start_date, end_date, source='signatory', actor=signatory_user),
+                total=Q(),
+                approve=Q(action_type='approve'),
+                disapprove=Q(action_type='disapprove'),
+                clearance=Q(form_type='clearance'),
+                enrollment=Q(form_type='enrollment'),
+                graduation=Q(form_type='graduation'),
             )
-            
-            # Calculate metrics for this specific signatory
-            total_actions = activities.count()
-            approvals = activities.filter(action_type='approve').count()
-            disapprovals = activities.filter(action_type='disapprove').count()
+            total_actions = counts['total']
+            approvals = counts['approve']
+            disapprovals = counts['disapprove']
             
             # Forms by type
-            clearance_actions = activities.filter(form_type='clearance').count()
-            enrollment_actions = activities.filter(form_type='enrollment').count()
-            graduation_actions = activities.filter(form_type='graduation').count()
+            clearance_actions = counts['clearance']
+            enrollment_actions = counts['enrollment']
+            graduation_actions = counts['graduation']
             
             performance_data = [{
                 'signatory_name': signatory_user.full_name,
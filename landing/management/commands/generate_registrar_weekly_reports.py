@@ -11,6 +11,7 @@ from django.core.files.base import ContentFile
 import os
 from django.conf import settings
 from django.db.models import Count, Q
+from landing.activity_rollups import ActivityRollupService, local_day_range
 
 
 class Command(BaseCommand):
@@ -56,6 +57,9 @@ class Command(BaseCommand):
         
         self.stdout.write(f'Generating registrar/admin reports for: {start_date} to {end_date}')
         
+        # Activity counts come from the daily rollups; bring them up to date first
+        ActivityRollupService.update()
+        
         # Generate system overview report
         self._generate_system_overview_report(start_date, end_date)
         
@@ -72,17 +76,30 @@ class Command(BaseCommand):
     def _generate_system_overview_report(self, start_date, end_date):
         """Generate comprehensive system overview report"""
         try:
-            # Get all form activities for the week
-            all_activities = SignatoryActivityLog.objects.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
+            week_start, week_end = local_day_range(start_date, end_date)
+            
+            # Every signatory activity count of the week in one query over the rollups
+            conditions = {
+                'total': Q(),
+                'approve': Q(action_type='approve'),
+                'disapprove': Q(action_type='disapprove'),
+            }
+            for form_type in ['clearance', 'enrollment', 'graduation']:
+                conditions[form_type] = Q(form_type=form_type)
+                conditions[f'{form_type}_approve'] = Q(form_type=form_type, action_type='approve')
+                conditions[f'{form_type}_disapprove'] = Q(form_type=form_type, action_type='disapprove')
+            for user_type in ['signatory', 'admin']:
+                conditions[f'by_{user_type}'] = Q(actor__user_type=user_type)
+            counts = ActivityRollupService.totals(
+                ActivityRollupService.window(start_date, end_date, source='signatory'),
+                **conditions
             )
             
             # Calculate system-wide statistics
             system_stats = {
-                'total_activities': all_activities.count(),
-                'total_approvals': all_activities.filter(action_type='approve').count(),
-                'total_disapprovals': all_activities.filter(action_type='disapprove').count(),
+                'total_activities': counts['total'],
+                'total_approvals': counts['approve'],
+                'total_disapprovals': counts['disapprove'],
                 'forms_by_type': {},
                 'user_engagement': {},
                 'processing_efficiency': {}
@@ -90,32 +107,30 @@ class Command(BaseCommand):
             
             # Forms by type
             for form_type in ['clearance', 'enrollment', 'graduation']:
-                form_activities = all_activities.filter(form_type=form_type)
                 system_stats['forms_by_type'][form_type] = {
-                    'total': form_activities.count(),
-                    'approved': form_activities.filter(action_type='approve').count(),
-                    'disapproved': form_activities.filter(action_type='disapprove').count()
+                    'total': counts[form_type],
+                    'approved': counts[f'{form_type}_approve'],
+                    'disapproved': counts[f'{form_type}_disapprove']
                 }
             
             # User type analysis
             for user_type in ['signatory', 'admin']:
-                user_activities = all_activities.filter(signatory__user_type=user_type)
-                system_stats['user_engagement'][user_type] = user_activities.count()
+                system_stats['user_engagement'][user_type] = counts[f'by_{user_type}']
             
             # New form submissions during the week
             new_clearances = ClearanceForm.objects.filter(
-                submitted_at__date__gte=start_date,
-                submitted_at__date__lte=end_date
+                submitted_at__gte=week_start,
+                submitted_at__lt=week_end
             ).count()
             
             new_enrollments = EnrollmentForm.objects.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
+                created_at__gte=week_start,
+                created_at__lt=week_end
             ).count()
             
             new_graduations = GraduationForm.objects.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
+                created_at__gte=week_start,
+                created_at__lt=week_end
             ).count()
             
             system_stats['new_submissions'] = {
@@ -130,7 +145,10 @@ class Command(BaseCommand):
                 'period_start': start_date,
                 'period_end': end_date,
                 'system_stats': system_stats,
-                'recent_activities': all_activities.order_by('-created_at')[:30],
+                'recent_activities': SignatoryActivityLog.objects.filter(
+                    created_at__gte=week_start,
+                    created_at__lt=week_end
+                ).select_related('signatory').order_by('-created_at')[:30],
                 'generated_at': timezone.now()
             }
             
@@ -234,16 +252,21 @@ class Command(BaseCommand):
     def _generate_institutional_analytics_report(self, start_date, end_date):
         """Generate institutional analytics and trends report"""
         try:
+            week_start, week_end = local_day_range(start_date, end_date)
+            
             # Get all users and their activity patterns
             total_users = User.objects.count()
-            active_users = User.objects.filter(
-                Q(activity_logs__created_at__date__gte=start_date,
-                  activity_logs__created_at__date__lte=end_date) |
-                Q(clearance_forms__submitted_at__date__gte=start_date,
-                  clearance_forms__submitted_at__date__lte=end_date) |
-                Q(enrollment_forms__created_at__date__gte=start_date,
-                  enrollment_forms__created_at__date__lte=end_date)
-            ).distinct().count()
+            active_user_ids = set(
+                ActivityRollupService.window(start_date, end_date, source='signatory')
+                .values_list('actor_id', flat=True)
+            )
+            active_user_ids.update(ClearanceForm.objects.filter(
+                submitted_at__gte=week_start, submitted_at__lt=week_end
+            ).values_list('student_id', flat=True))
+            active_user_ids.update(EnrollmentForm.objects.filter(
+                created_at__gte=week_start, created_at__lt=week_end
+            ).values_list('user_id', flat=True))
+            active_users = len(active_user_ids)
             
             # Calculate user engagement metrics
             engagement_stats = {
@@ -262,8 +285,8 @@ class Command(BaseCommand):
             
             # Identify bottlenecks (forms with high disapproval rates)
             high_disapproval_forms = ClearanceForm.objects.filter(
-                submitted_at__date__gte=start_date,
-                submitted_at__date__lte=end_date
+                submitted_at__gte=week_start,
+                submitted_at__lt=week_end
             ).annotate(
                 disapproval_count=Count('signatories', filter=Q(signatories__status='disapproved'))
             ).filter(disapproval_count__gte=2)  # Forms with 2+ disapprovals
@@ -280,15 +303,13 @@ class Command(BaseCommand):
             prev_week_start = start_date - timedelta(days=7)
             prev_week_end = start_date - timedelta(days=1)
             
-            current_week_activities = SignatoryActivityLog.objects.filter(
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
-            ).count()
-            
-            prev_week_activities = SignatoryActivityLog.objects.filter(
-                created_at__date__gte=prev_week_start,
-                created_at__date__lte=prev_week_end
-            ).count()
+            weeks = ActivityRollupService.totals(
+                ActivityRollupService.window(prev_week_start, end_date, source='signatory'),
+                current=Q(day__gte=start_date),
+                previous=Q(day__lte=prev_week_end),
+            )
+            current_week_activities = weeks['current']
+            prev_week_activities = weeks['previous']
             
             trend_change = ((current_week_activities - prev_week_activities) / prev_week_activities * 100) if prev_week_activities > 0 else 0
             
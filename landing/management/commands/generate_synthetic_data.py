@@ -0,0 +1,387 @@
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from landing.db_utils import RowWriter
+from landing.models import (
+    AuditLog, BusinessManagerActivityLog, ClearanceForm, ClearanceSignatory, ClearanceStatusMatrix,
+    Conversation, EnrollmentForm, EnrollmentSignatory, GraduationForm, GraduationSignatory, Message,
+    Notification, PendingCounter, SignatoryActivityLog, SignatoryProfile, StudentProfile, User,
+)
+from landing.student_search import StudentSearchIndex
+
+PROGRAMS = ['BET-COET', 'BET-ET', 'BET-MT', 'BSIT', 'BSBA', 'BSED', 'AMTh', 'BSHM']
+SECTIONS = ['A', 'B', 'C', 'D']
+SEMESTERS = ['First Semester', 'Second Semester']
+FIRST_NAMES = ['Juan', 'Maria', 'Jose', 'Ana', 'Mark', 'Grace', 'Paolo', 'Liza', 'Carlo', 'Joy', 'Miguel', 'Rica']
+LAST_NAMES = ['Santos', 'Reyes', 'Cruz', 'Bautista', 'Garcia', 'Mendoza', 'Torres', 'Ramos', 'Flores', 'Villanueva']
+NOTIFICATION_KINDS = [
+    ('form_submitted', 'Form submitted', 'Your form was submitted and is awaiting review.'),
+    ('form_approved', 'Form approved', 'A signatory approved your form.'),
+    ('form_disapproved', 'Form disapproved', 'A signatory disapproved your form.'),
+    ('document_ready', 'Document ready', 'Your requested document is ready for release.'),
+]
+REMARKS = {'approved': 'Cleared', 'disapproved': 'Unsettled account'}
+
+# Signatory type of the user acting in each enrollment/graduation role
+ROLE_SIGNATORY_TYPES = {
+    'dean': 'academic_dean',
+    'business_manager': 'business_manager',
+    'registrar': 'registrar',
+    'president': 'president',
+}
+ENROLLMENT_ROLES = ['dean', 'business_manager', 'registrar']
+GRADUATION_ROLES = ['dean', 'business_manager', 'registrar', 'president']
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate an institution-scale synthetic dataset (students, forms, signatory records, '
+        'activity logs, notifications, conversations) with bulk inserts, for load and benchmark runs'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--students', type=int, default=45000,
+            help='Number of students; each gets a clearance and an enrollment form (default: 45000, ~100k forms)',
+        )
+        parser.add_argument(
+            '--clearances-per-student', type=int, default=1,
+            help='Clearance forms per student (default: 1)',
+        )
+        parser.add_argument(
+            '--graduating-share', type=float, default=0.25,
+            help='Share of students with a graduation form (default: 0.25)',
+        )
+        parser.add_argument(
+            '--completed-share', type=float, default=0.4,
+            help='Share of forms every signatory has approved (default: 0.4)',
+        )
+        parser.add_argument(
+            '--disapproved-share', type=float, default=0.05,
+            help='Share of forms with a disapproval (default: 0.05)',
+        )
+        parser.add_argument(
+            '--signatories-per-type', type=int, default=2,
+            help='Signatory accounts per signatory type; forms are spread over them (default: 2)',
+        )
+        parser.add_argument(
+            '--notifications-per-student', type=int, default=3,
+            help='Notifications per student (default: 3)',
+        )
+        parser.add_argument(
+            '--conversation-share', type=float, default=0.3,
+            help='Share of students with a conversation with a signatory (default: 0.3)',
+        )
+        parser.add_argument(
+            '--messages-per-conversation', type=int, default=6,
+            help='Messages per conversation (default: 6)',
+        )
+        parser.add_argument('--days', type=int, default=365, help='Spread submissions over this many past days (default: 365)')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed; the same seed gives the same dataset (default: 42)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT batch (default: 5000)')
+        parser.add_argument('--prefix', default='synthetic', help="Username prefix of generated accounts (default: 'synthetic')")
+        parser.add_argument(
+            '--password', default='synthetic123',
+            help="Password of every generated account, for logging in during load tests (default: 'synthetic123')",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Rows are streamed into batched multi-row INSERTs (RowWriter) without building model
+        instances, so model signals do not run. The clearance status matrix is written along
+        with the signatory records; pending counters, conversation inbox state, the student
+        search index and caches are rebuilt set-based at the end.
+        Run it against a scratch database: generated accounts are not cleaned up.
+        """
+        self.options = options
+        self.random = random.Random(options['seed'])
+        self.prefix = options['prefix']
+        self.now = timezone.now()
+        self.id_prefix = random.Random(f"{options['seed']}:{self.prefix}").getrandbits(64)
+        self.last_id = 0
+
+        if options['students'] < 1:
+            raise CommandError('--students must be at least 1')
+        if User.objects.filter(username__startswith=f'{self.prefix}_').exists():
+            raise CommandError(
+                f"Accounts with prefix '{self.prefix}_' already exist; pass another --prefix or use a fresh database"
+            )
+
+        started = time.monotonic()
+        self.password = make_password(options['password'])
+        self.stdout.write(f"Generating {options['students']} students (seed {options['seed']})...")
+
+        with transaction.atomic():
+            self.open_writers()
+            self.create_signatories()
+            for number in range(1, options['students'] + 1):
+                student = self.create_student(number)
+                for _ in range(options['clearances_per_student']):
+                    self.create_clearance(student)
+                self.create_enrollment(student)
+                if self.random.random() < options['graduating_share']:
+                    self.create_graduation(student)
+                self.create_notifications(student)
+                if self.random.random() < options['conversation_share']:
+                    self.create_conversation(student)
+            for writer in self.writers.values():
+                writer.flush()
+
+        self.stdout.write(f'Inserted rows in {time.monotonic() - started:.1f}s, rebuilding derived state...')
+        PendingCounter.recount()
+        Conversation.rebuild_inbox_state(Conversation.objects.filter(initiated_by__username__startswith=f'{self.prefix}_'))
+        StudentSearchIndex.rebuild(User.objects.filter(username__startswith=f'{self.prefix}_'))
+        self.invalidate_caches()
+
+        for model, writer in self.writers.items():
+            self.stdout.write(f'  {model._meta.db_table:<36} {writer.count:>10}')
+        forms = sum(self.writers[model].count for model in (ClearanceForm, EnrollmentForm, GraduationForm))
+        accounts = sum(len(users) for users in self.signatories.values())
+        total = sum(writer.count for writer in self.writers.values()) + accounts * 2
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {forms} forms and {total} rows in {time.monotonic() - started:.1f}s'
+        ))
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def open_writers(self):
+        """One writer per table; child tables flush their parents first"""
+        def writer(model, *parents):
+            return RowWriter(model, now=self.now, batch_size=self.options['batch_size'], after=parents)
+
+        users = writer(User)
+        clearances = writer(ClearanceForm, users)
+        enrollments = writer(EnrollmentForm, users)
+        graduations = writer(GraduationForm, users)
+        conversations = writer(Conversation, users)
+        self.writers = {
+            User: users,
+            StudentProfile: writer(StudentProfile, users),
+            ClearanceForm: clearances,
+            ClearanceSignatory: writer(ClearanceSignatory, clearances),
+            ClearanceStatusMatrix: writer(ClearanceStatusMatrix, clearances),
+            EnrollmentForm: enrollments,
+            EnrollmentSignatory: writer(EnrollmentSignatory, enrollments),
+            GraduationForm: graduations,
+            GraduationSignatory: writer(GraduationSignatory, graduations),
+            SignatoryActivityLog: writer(SignatoryActivityLog),
+            BusinessManagerActivityLog: writer(BusinessManagerActivityLog),
+            AuditLog: writer(AuditLog, users),
+            Notification: writer(Notification, users),
+            Conversation: conversations,
+            Message: writer(Message, conversations),
+        }
+
+    def add(self, model, **values):
+        self.writers[model].add(**values)
+
+    def new_id(self):
+        """
+        A fixed 64-bit run prefix (from seed and prefix) followed by a counter: reproducible,
+        and ascending, so primary key inserts append to the index instead of splitting pages.
+        """
+        self.last_id += 1
+        return uuid.UUID(int=self.id_prefix << 64 | self.last_id, version=4)
+
+    def past(self, max_days=None):
+        """A random moment in the last --days days"""
+        seconds = self.random.uniform(0, (max_days or self.options['days']) * 86400)
+        return self.now - timedelta(seconds=seconds)
+
+    def decided(self, submitted_at, status):
+        """When a record was last updated: some hours after submission once decided"""
+        if status == 'pending':
+            return submitted_at
+        return min(submitted_at + timedelta(hours=self.random.uniform(1, 240)), self.now)
+
+    def decisions(self, roles):
+        """
+        Status per role in a realistic mix: completed forms are approved by everyone,
+        the rest were approved in order up to some point, occasionally with a disapproval.
+        """
+        roll = self.random.random()
+        if roll < self.options['completed_share']:
+            return {role: 'approved' for role in roles}
+        approved = self.random.randrange(len(roles))
+        statuses = {role: ('approved' if i < approved else 'pending') for i, role in enumerate(roles)}
+        if roll < self.options['completed_share'] + self.options['disapproved_share']:
+            statuses[roles[approved]] = 'disapproved'
+        return statuses
+
+    @staticmethod
+    def form_status(statuses):
+        if all(status == 'approved' for status in statuses.values()):
+            return 'approved'
+        if 'disapproved' in statuses.values():
+            return 'disapproved'
+        return 'pending'
+
+    def log_decision(self, signatory_type, signatory, status, form_type, form_id, student, when):
+        if status == 'pending':
+            return
+        fields = dict(
+            action_type='approve' if status == 'approved' else 'disapprove', form_type=form_type,
+            form_id=form_id, student_name=student.full_name, ip_address='10.0.0.1', created_at=when,
+        )
+        self.add(SignatoryActivityLog, id=self.new_id(), signatory_id=signatory.id, **fields)
+        if signatory_type == 'business_manager':
+            self.add(BusinessManagerActivityLog, id=self.new_id(), business_manager_id=signatory.id, **fields)
+
+    # ------------------------------------------------------------------
+    # Generators
+    # ------------------------------------------------------------------
+    def create_signatories(self):
+        """
+        The handful of signatory accounts go through the ORM: build_fields resolves matrix
+        columns through user.signatory_profile, which stays cached on these instances.
+        """
+        users, profiles = [], []
+        self.signatories = {}
+        for signatory_type, label in SignatoryProfile.SIGNATORY_TYPES:
+            for i in range(1, self.options['signatories_per_type'] + 1):
+                username = f'{self.prefix}_{signatory_type}_{i}'
+                user = User(
+                    id=self.new_id(), username=username, email=f'{username}@example.com',
+                    full_name=f'{label} {i}', user_type='signatory', password=self.password,
+                )
+                users.append(user)
+                profiles.append(SignatoryProfile(id=self.new_id(), user=user, signatory_type=signatory_type))
+                self.signatories.setdefault(signatory_type, []).append(user)
+        User.objects.bulk_create(users)
+        SignatoryProfile.objects.bulk_create(profiles)
+
+    def create_student(self, number):
+        student = SimpleNamespace(
+            id=self.new_id(),
+            full_name=f'{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}',
+            student_number=f'{self.prefix.upper()}-{number:07d}',
+            program=self.random.choice(PROGRAMS),
+            year_level=self.random.randint(1, 4),
+        )
+        username = f'{self.prefix}_student_{number}'
+        self.add(
+            User, id=student.id, username=username, email=f'{username}@example.com', full_name=student.full_name,
+            user_type='student', password=self.password, created_at=self.past(),
+        )
+        self.add(
+            StudentProfile, id=self.new_id(), user_id=student.id, student_number=student.student_number,
+            program=student.program, year_level=student.year_level, is_graduating=student.year_level == 4,
+        )
+        return student
+
+    def create_clearance(self, student):
+        form_id = self.new_id()
+        submitted_at = self.past()
+        statuses = self.decisions(ClearanceStatusMatrix.SIGNATORY_TYPES)
+        self.add(
+            ClearanceForm, id=form_id, student_id=student.id,
+            clearance_type=self.random.choice(['enrollment', 'graduation']),
+            semester=self.random.choice(SEMESTERS), academic_year='2025-2026',
+            section=self.random.choice(SECTIONS), status=self.form_status(statuses), submitted_at=submitted_at,
+        )
+        self.add(
+            AuditLog, id=self.new_id(), user_id=student.id, action_type='clearance_submission',
+            description=f'Submitted clearance form {form_id}', timestamp=submitted_at,
+        )
+
+        records = []
+        for signatory_type, status in statuses.items():
+            signatory = self.random.choice(self.signatories[signatory_type])
+            record = SimpleNamespace(
+                signatory=signatory, status=status, remarks=REMARKS.get(status), comment=None,
+                updated_at=self.decided(submitted_at, status),
+            )
+            self.add(
+                ClearanceSignatory, id=self.new_id(), clearance_id=form_id, signatory_id=signatory.id,
+                role=signatory_type, status=status, remarks=record.remarks, updated_at=record.updated_at,
+                seen_by_signatory=status != 'pending' or self.random.random() < 0.5,
+            )
+            records.append(record)
+            self.log_decision(signatory_type, signatory, status, 'clearance', form_id, student, record.updated_at)
+        # The row the signatory signals would have written
+        self.add(ClearanceStatusMatrix, clearance_id=form_id, **ClearanceStatusMatrix.build_fields(records))
+
+    def create_enrollment(self, student):
+        form_id = self.new_id()
+        submitted_at = self.past()
+        statuses = self.decisions(ENROLLMENT_ROLES)
+        self.add(
+            EnrollmentForm, id=form_id, user_id=student.id, enrollment_date=submitted_at.date(),
+            academic_year='2025-2026', course=student.program, year=str(student.year_level),
+            section=self.random.choice(SECTIONS), semester=self.random.choice(SEMESTERS),
+            status=self.form_status(statuses), created_at=submitted_at, updated_at=submitted_at,
+        )
+        for role, status in statuses.items():
+            signatory_type = ROLE_SIGNATORY_TYPES[role]
+            signatory = self.random.choice(self.signatories[signatory_type])
+            updated_at = self.decided(submitted_at, status)
+            self.add(
+                EnrollmentSignatory, id=self.new_id(), enrollment_id=form_id, signatory_id=signatory.id,
+                role=role, status=status, updated_at=updated_at,
+            )
+            self.log_decision(signatory_type, signatory, status, 'enrollment', form_id, student, updated_at)
+
+    def create_graduation(self, student):
+        form_id = self.new_id()
+        submitted_at = self.past(max_days=120)
+        statuses = self.decisions(GRADUATION_ROLES)
+        self.add(
+            GraduationForm, id=form_id, user_id=student.id, grad_date=date(self.now.year, 6, 15),
+            grad_appno=f'GA-{student.student_number}', place_of_birth='Manila',
+            present_address='Manila', permanent_address='Manila', status=self.form_status(statuses),
+            confirmed=True, created_at=submitted_at, updated_at=submitted_at,
+        )
+        for role, status in statuses.items():
+            signatory_type = ROLE_SIGNATORY_TYPES[role]
+            signatory = self.random.choice(self.signatories[signatory_type])
+            updated_at = self.decided(submitted_at, status)
+            self.add(
+                GraduationSignatory, id=self.new_id(), graduation_id=form_id, signatory_id=signatory.id,
+                role=role, status=status, updated_at=updated_at,
+            )
+            self.log_decision(signatory_type, signatory, status, 'graduation', form_id, student, updated_at)
+
+    def create_notifications(self, student):
+        for _ in range(self.options['notifications_per_student']):
+            notification_type, title, message = self.random.choice(NOTIFICATION_KINDS)
+            created_at = self.past(max_days=60)
+            is_read = self.random.random() < 0.7
+            self.add(
+                Notification, id=self.new_id(), user_id=student.id, notification_type=notification_type,
+                title=title, message=message, form_type=self.random.choice(['clearance', 'enrollment', 'graduation']),
+                is_read=is_read, read_at=created_at + timedelta(hours=2) if is_read else None,
+                created_at=created_at, updated_at=created_at,
+            )
+
+    def create_conversation(self, student):
+        conversation_id = self.new_id()
+        other = self.random.choice(self.random.choice(list(self.signatories.values())))
+        sent_at = self.past(max_days=90)
+        self.add(
+            Conversation, id=conversation_id, participant_1_id=student.id, participant_2_id=other.id,
+            initiated_by_id=student.id, created_at=sent_at, updated_at=sent_at,
+        )
+        count = self.options['messages_per_conversation']
+        for i in range(count):
+            sent_at = min(sent_at + timedelta(minutes=self.random.uniform(1, 600)), self.now)
+            # Only the last couple of messages can still be unread
+            is_read = i < count - 2 or self.random.random() < 0.5
+            self.add(
+                Message, id=self.new_id(), conversation_id=conversation_id,
+                sender_id=student.id if i % 2 == 0 else other.id, content=f'Synthetic message {i + 1}',
+                is_read=is_read, read_at=sent_at if is_read else None, sent_at=sent_at,
+            )
+
+    def invalidate_caches(self):
+        from landing.cache import CLEARANCE_DATA, DASHBOARD_STATS, DOCUMENT_DATA, FILTER_OPTIONS, FORM_DATA
+        for namespace in [DASHBOARD_STATS, FILTER_OPTIONS, CLEARANCE_DATA, DOCUMENT_DATA, *FORM_DATA.values()]:
+            namespace.invalidate()
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from landing.curriculum_index import CurriculumIndex
 from landing.models import AcademicProgram, AcademicYearLevel, AcademicSemester, AcademicSubject
 
 
@@ -879,6 +880,9 @@ class Command(BaseCommand):
                                 if created:
                                     subjects_created += 1
 
+        # Make every running process rebuild its curriculum index
+        CurriculumIndex.invalidate()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"Successfully loaded complete curriculum data:\n"
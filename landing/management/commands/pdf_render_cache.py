@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Show statistics of the form PDF render cache, or clear it'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete cached PDFs (all of them, or those of --form-type / --form-id)',
+        )
+        parser.add_argument(
+            '--form-type',
+            choices=['clearance', 'enrollment', 'graduation', 'doc_release'],
+            help='Limit --clear to one form type',
+        )
+        parser.add_argument(
+            '--form-id',
+            help='Limit --clear to one form (requires --form-type)',
+        )
+        parser.add_argument(
+            '--reset-stats',
+            action='store_true',
+            help='Reset the hit/miss/eviction counters',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Inspect or invalidate the PDF render cache - e.g. after changing a PDF template's includes
+        """
+        from landing.pdf_cache import PdfRenderCache
+
+        if options['form_id'] and not options['form_type']:
+            self.stderr.write(self.style.ERROR('--form-id requires --form-type'))
+            return
+
+        if options['clear']:
+            PdfRenderCache.invalidate(options['form_type'], options['form_id'])
+            target = ' '.join(filter(None, [options['form_type'], options['form_id']])) or 'all forms'
+            self.stdout.write(self.style.SUCCESS(f'Cleared cached PDFs for {target}'))
+            logger.info(f'PDF render cache cleared for {target}')
+
+        if options['reset_stats']:
+            PdfRenderCache.reset_stats()
+            self.stdout.write(self.style.SUCCESS('Reset PDF render cache counters'))
+
+        stats = PdfRenderCache.stats()
+        hit_rate = f"{stats['hit_rate']:.1%}" if stats['hit_rate'] is not None else 'n/a'
+        self.stdout.write(
+            f"Hits: {stats['hits']}, misses: {stats['misses']} (hit rate {hit_rate}), "
+            f"evictions: {stats['evictions']}"
+        )
+        self.stdout.write(
+            f"Files: {stats['files']}, size: {stats['bytes'] / 1024 / 1024:.1f} MB "
+            f"of {stats['max_bytes'] / 1024 / 1024:.0f} MB"
+        )
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Write the resized variants of uploaded profile pictures (profiles with status pending)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-items',
+            type=int,
+            default=None,
+            help='Stop after this many pictures (default: run until none are pending)',
+        )
+        parser.add_argument(
+            '--requeue',
+            action='store_true',
+            help='Process every profile picture again first, e.g. after changing PROFILE_PICTURE_VARIANTS',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll for new uploads instead of exiting when none are pending',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=5,
+            help='Seconds to sleep between polls in --loop mode (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        """Run every minute via cron, or keep it running with --loop"""
+        from landing.profile_images import ProfilePictureService
+
+        if options['requeue']:
+            self.stdout.write(f'Queued {ProfilePictureService.requeue_all()} profile pictures')
+
+        while True:
+            stats = ProfilePictureService.process_pending(max_items=options['max_items'])
+            if any(stats.values()):
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{timezone.now():%Y-%m-%d %H:%M:%S}] Resized {stats['ready']} profile pictures "
+                        f"({stats['missing']} missing, {stats['failed']} unreadable)"
+                    )
+                )
+                logger.info(f'Profile pictures processed: {stats}')
+            elif not options['loop']:
+                self.stdout.write('No pending profile pictures')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Delete request metric windows and slow request logs older than REQUEST_METRICS_RETENTION_DAYS'
+
+    def handle(self, *args, **options):
+        """Run daily via cron while REQUEST_METRICS_ENABLED is on"""
+        from landing.request_metrics import RequestMetrics
+
+        deleted = RequestMetrics.prune()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} old request metric rows'))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Delete event stream rows (UserEvent) older than EVENT_STREAM_RETENTION_HOURS'
+
+    def handle(self, *args, **options):
+        """Run daily via cron; clients only ever read events from the last few minutes"""
+        from landing.event_stream import EventStream
+
+        deleted = EventStream.prune()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} old events'))
@@ -0,0 +1,54 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from landing.models import ClearanceForm, ClearanceSignatory, ClearanceStatusMatrix
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized ClearanceStatusMatrix rows from ClearanceSignatory records'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of clearance forms processed per batch (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        self.stdout.write('Rebuilding clearance status matrix...')
+
+        clearance_ids = list(ClearanceForm.objects.order_by('id').values_list('id', flat=True))
+        completed_count = 0
+
+        for start in range(0, len(clearance_ids), batch_size):
+            batch_ids = clearance_ids[start:start + batch_size]
+
+            # One query per batch for all signatory records of these clearances
+            records_by_clearance = defaultdict(list)
+            signatory_records = ClearanceSignatory.objects.filter(
+                clearance_id__in=batch_ids
+            ).select_related('signatory', 'signatory__signatory_profile')
+            for record in signatory_records:
+                records_by_clearance[record.clearance_id].append(record)
+
+            rows = []
+            for clearance_id in batch_ids:
+                fields = ClearanceStatusMatrix.build_fields(records_by_clearance.get(clearance_id, []))
+                if fields['overall_status'] == 'completed':
+                    completed_count += 1
+                rows.append(ClearanceStatusMatrix(clearance_id=clearance_id, **fields))
+
+            with transaction.atomic():
+                ClearanceStatusMatrix.objects.filter(clearance_id__in=batch_ids).delete()
+                ClearanceStatusMatrix.objects.bulk_create(rows)
+
+            self.stdout.write(f'  Processed {min(start + batch_size, len(clearance_ids))}/{len(clearance_ids)} clearances')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Rebuilt status matrix for {len(clearance_ids)} clearances ({completed_count} completed)'
+            )
+        )
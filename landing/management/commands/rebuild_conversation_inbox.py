@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from landing.models import Conversation
+
+
+class Command(BaseCommand):
+    help = 'Recompute the denormalized last message and unread counters of every conversation'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding conversation inbox state...')
+        rows = Conversation.rebuild_inbox_state()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} conversations'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the StudentSearchTerm index behind search_students() from the users and student profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of users reindexed per batch (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        """Run after loading users without model signals (imports, raw SQL, bulk_create)"""
+        from landing.student_search import StudentSearchIndex
+
+        self.stdout.write('Rebuilding student search index...')
+        rows = StudentSearchIndex.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {rows} search terms'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from landing.models import PendingCounter
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized per-user PendingCounter rows from the signatory tables'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Recounting pending signatory records...')
+        rows = PendingCounter.recount()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} non-zero pending counters'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Write audit/activity log rows left in journals by processes that died or could not '
+        'reach the database (ACTIVITY_LOG_JOURNAL_DIR)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--include-running', action='store_true',
+            help='Also replay journals of processes that still appear to run (e.g. after a reboot reused their pids)',
+        )
+
+    def handle(self, *args, **options):
+        """Run via cron, or after a restart; rows already written are skipped"""
+        from landing.activity_log import replay_journals
+
+        written = replay_journals(include_running=options['include_running'])
+        for path, rows in written.items():
+            self.stdout.write(f'  {path}: {rows} rows')
+        self.stdout.write(self.style.SUCCESS(
+            f'Replayed {sum(written.values())} activity log rows from {len(written)} journals'
+        ))
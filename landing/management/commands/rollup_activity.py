@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Bring the daily ActivityRollup rows up to date from the activity and audit logs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            type=str,
+            help='Rebuild every day from this date (YYYY-MM-DD), e.g. after replaying old activity journals',
+        )
+
+    def handle(self, *args, **options):
+        """Run via cron (e.g. hourly); the first run rolls up the whole log history"""
+        from landing.activity_rollups import ActivityRollupService
+
+        since = None
+        if options['since']:
+            try:
+                since = datetime.strptime(options['since'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('Invalid date format. Use YYYY-MM-DD')
+
+        result = ActivityRollupService.update(since=since)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {result['days']} days of activity rollups ({result['rows']} rows)"
+        ))
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Run the PDF rendering service: a pool of warm worker processes shared by all web processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--address',
+            default=None,
+            help="'host:port' or Unix socket path to listen on (default: PDF_RENDER_SERVICE_ADDRESS)",
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of worker processes (default: PDF_RENDER_WORKERS)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Keep this running next to the web server (systemd, supervisor, an always-on task) and set
+        PDF_RENDER_SERVICE_ADDRESS to the same address; web processes then send their renders here.
+        """
+        from landing.pdf_service import PdfRenderService, PdfWorkerPool, WORKERS
+
+        address = options['address'] or getattr(settings, 'PDF_RENDER_SERVICE_ADDRESS', None)
+        if not address:
+            raise CommandError('No address: pass --address or set PDF_RENDER_SERVICE_ADDRESS')
+
+        workers = options['workers'] or WORKERS or 1
+        self.stdout.write(f'Starting {workers} PDF workers...')
+        service = PdfRenderService(address, pool=PdfWorkerPool(size=workers))
+        self.stdout.write(self.style.SUCCESS(f'PDF rendering service listening on {address}'))
+        try:
+            service.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.pool.close()
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Generate queued reports and signatory packs (GeneratedReport rows with status pending)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Stop after this many jobs (default: run until the queue is empty)',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll for new jobs instead of exiting when the queue is empty',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=5,
+            help='Seconds to sleep between polls in --loop mode (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run queued report jobs - run every minute via cron, or keep it running with --loop.
+        Several workers can run side by side; each job is claimed by exactly one of them.
+        """
+        from landing.report_jobs import ReportJobQueue
+
+        while True:
+            stats = ReportJobQueue.run_pending(max_jobs=options['max_jobs'])
+            if stats['completed'] or stats['failed']:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{timezone.now():%Y-%m-%d %H:%M:%S}] Completed {stats['completed']}, "
+                        f"failed {stats['failed']} report jobs"
+                    )
+                )
+                logger.info(f'Report jobs run: {stats}')
+            elif not options['loop']:
+                self.stdout.write('No queued report jobs')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
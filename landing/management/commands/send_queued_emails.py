@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Deliver queued notification emails from the email outbox in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Emails sent per SMTP connection (default: EMAIL_OUTBOX_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll the outbox instead of exiting when it is empty',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=10,
+            help='Seconds to sleep between polls in --loop mode (default: 10)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Drain the email outbox - run every minute via cron, or keep it running with --loop
+        """
+        from landing.email_outbox import EmailOutbox
+
+        batch_size = options['batch_size']
+
+        while True:
+            stats = EmailOutbox.deliver_pending(batch_size=batch_size)
+            if stats['claimed']:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{timezone.now():%Y-%m-%d %H:%M:%S}] Sent {stats['sent']}, "
+                        f"retrying {stats['retrying']}, failed {stats['failed']}"
+                    )
+                )
+                logger.info(f'Email outbox drained: {stats}')
+            elif not options['loop']:
+                self.stdout.write('No queued emails to send')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
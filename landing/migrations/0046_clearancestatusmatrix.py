@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0045_notificationpreference_email_on_enrollment_completed_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClearanceStatusMatrix',
+            fields=[
+                ('clearance', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='status_matrix', serialize=False, to='landing.clearanceform')),
+                ('dorm_supervisor_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('dorm_supervisor_at', models.DateTimeField(blank=True, null=True)),
+                ('canteen_concessionaire_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('canteen_concessionaire_at', models.DateTimeField(blank=True, null=True)),
+                ('library_director_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('library_director_at', models.DateTimeField(blank=True, null=True)),
+                ('scholarship_director_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('scholarship_director_at', models.DateTimeField(blank=True, null=True)),
+                ('it_director_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('it_director_at', models.DateTimeField(blank=True, null=True)),
+                ('student_affairs_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('student_affairs_at', models.DateTimeField(blank=True, null=True)),
+                ('cashier_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('cashier_at', models.DateTimeField(blank=True, null=True)),
+                ('business_manager_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('business_manager_at', models.DateTimeField(blank=True, null=True)),
+                ('registrar_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('registrar_at', models.DateTimeField(blank=True, null=True)),
+                ('academic_dean_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('approved', 'Approved'), ('disapproved', 'Disapproved')], max_length=20, null=True)),
+                ('academic_dean_at', models.DateTimeField(blank=True, null=True)),
+                ('comments', models.JSONField(blank=True, default=dict)),
+                ('approved_count', models.PositiveSmallIntegerField(default=0)),
+                ('overall_status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed')], default='pending', max_length=20)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'clearance_status_matrix',
+                'indexes': [models.Index(fields=['overall_status'], name='clearance_s_overall_7875d5_idx')],
+            },
+        ),
+    ]
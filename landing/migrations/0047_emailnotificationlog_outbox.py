@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0046_clearancestatusmatrix'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailnotificationlog',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='emailnotificationlog',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed'), ('bounced', 'Bounced')], default='pending', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='emailnotificationlog',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='email_notif_status_b16fd1_idx'),
+        ),
+    ]
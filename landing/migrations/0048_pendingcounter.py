@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:44
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_pending_counters(apps, schema_editor):
+    """PendingCounter.recount() against the historical models: pending records on pending forms"""
+    from django.db.models import Count
+
+    PendingCounter = apps.get_model('landing', 'PendingCounter')
+    sources = [
+        ('clearance', apps.get_model('landing', 'ClearanceSignatory'), 'clearance'),
+        ('enrollment', apps.get_model('landing', 'EnrollmentSignatory'), 'enrollment'),
+        ('graduation', apps.get_model('landing', 'GraduationSignatory'), 'graduation'),
+    ]
+    for form_type, signatory_model, form_field in sources:
+        counts = signatory_model.objects.filter(
+            status='pending', **{f'{form_field}__status': 'pending'}
+        ).order_by().values('signatory_id').annotate(total=Count('id'))
+        PendingCounter.objects.bulk_create(
+            [PendingCounter(user_id=row['signatory_id'], form_type=form_type, count=row['total']) for row in counts],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0047_emailnotificationlog_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingCounter',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('form_type', models.CharField(choices=[('clearance', 'Clearance'), ('enrollment', 'Enrollment'), ('graduation', 'Graduation')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'pending_counters',
+                'constraints': [models.UniqueConstraint(fields=('user', 'form_type'), name='unique_pending_counter')],
+            },
+        ),
+        migrations.RunPython(fill_pending_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0048_pendingcounter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['timestamp'], name='audit_logs_timesta_423be6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='businessmanageractivitylog',
+            index=models.Index(fields=['business_manager', 'created_at'], name='business_ma_busines_965b5f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signatoryactivitylog',
+            index=models.Index(fields=['created_at'], name='signatory_a_created_f54d39_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signatoryactivitylog',
+            index=models.Index(fields=['signatory', 'created_at'], name='signatory_a_signato_81a19d_idx'),
+        ),
+    ]
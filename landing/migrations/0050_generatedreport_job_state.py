@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0049_activity_log_time_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='generatedreport',
+            name='unique_report_per_period',
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='finished_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='parameters',
+            field=models.JSONField(blank=True, help_text='Inputs the report job was queued with', null=True),
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='progress_done',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='progress_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='generatedreport',
+            name='report_type',
+            field=models.CharField(choices=[('clearance', 'Clearance'), ('enrollment', 'Enrollment'), ('graduation', 'Graduation'), ('document_release', 'Document Release'), ('clearance_pack', 'Clearance Pack'), ('enrollment_pack', 'Enrollment Pack'), ('graduation_pack', 'Graduation Pack'), ('manual_activity', 'Activity Report'), ('signatory_activity', 'Signatory Activity Report'), ('business_manager_activity', 'Business Manager Activity Report')], db_index=True, max_length=50),
+        ),
+        migrations.AddConstraint(
+            model_name='generatedreport',
+            constraint=models.UniqueConstraint(condition=models.Q(('period_end__isnull', False), ('period_start__isnull', False), models.Q(('report_type__in', ['signatory_activity', 'business_manager_activity']), _negated=True)), fields=('report_type', 'period_start', 'period_end'), name='unique_report_per_period'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_inbox_state(apps, schema_editor):
+    from django.db.models import Count, IntegerField, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+
+    Conversation = apps.get_model('landing', 'Conversation')
+    Message = apps.get_model('landing', 'Message')
+    latest = Message.objects.filter(conversation=OuterRef('pk')).order_by('-sent_at')
+
+    def unread_from(sender_field):
+        counts = Message.objects.filter(
+            conversation=OuterRef('pk'), sender=OuterRef(sender_field), is_read=False
+        ).order_by().values('conversation').annotate(total=Count('pk')).values('total')
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    Conversation.objects.update(
+        last_message=Subquery(latest.values('pk')[:1]),
+        last_message_at=Subquery(latest.values('sent_at')[:1]),
+        participant_1_unread=unread_from('participant_2'),
+        participant_2_unread=unread_from('participant_1'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0050_generatedreport_job_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='landing.message'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='participant_1_unread',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='participant_2_unread',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_inbox_state, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0051_conversation_inbox_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('audience', models.CharField(blank=True, default='', max_length=20)),
+                ('event_type', models.CharField(choices=[('notification', 'Notification'), ('message', 'Message'), ('dashboard_stale', 'Dashboard Stale')], max_length=20)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_events',
+                'indexes': [models.Index(fields=['user', 'id'], name='user_event_user_idx'), models.Index(fields=['audience', 'id'], name='user_event_audience_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0052_userevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestMetricWindow',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('view_name', models.CharField(max_length=200)),
+                ('window_start', models.DateTimeField()),
+                ('requests', models.PositiveIntegerField()),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('flagged', models.PositiveIntegerField(default=0)),
+                ('total_ms', models.FloatField()),
+                ('max_ms', models.FloatField()),
+                ('sql_count', models.PositiveBigIntegerField()),
+                ('sql_ms', models.FloatField()),
+                ('response_bytes', models.PositiveBigIntegerField()),
+                ('histogram', models.JSONField(default=list)),
+            ],
+            options={
+                'db_table': 'request_metric_windows',
+                'indexes': [models.Index(fields=['window_start'], name='request_metric_start_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SlowRequestLog',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('reason', models.CharField(choices=[('slow', 'Slow'), ('n_plus_one', 'Suspected N+1'), ('slow_n_plus_one', 'Slow and suspected N+1')], max_length=20)),
+                ('view_name', models.CharField(max_length=200)),
+                ('method', models.CharField(max_length=10)),
+                ('path', models.CharField(max_length=500)),
+                ('status_code', models.PositiveSmallIntegerField()),
+                ('duration_ms', models.FloatField()),
+                ('sql_count', models.PositiveIntegerField()),
+                ('sql_ms', models.FloatField()),
+                ('python_ms', models.FloatField()),
+                ('response_bytes', models.PositiveIntegerField(blank=True, null=True)),
+                ('duplicate_queries', models.JSONField(blank=True, default=list)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='slow_requests', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'slow_request_logs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['view_name', 'created_at'], name='slow_request_view_idx')],
+            },
+        ),
+    ]
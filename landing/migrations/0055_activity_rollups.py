@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:45
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0054_activity_log_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('day', models.DateField()),
+                ('source', models.CharField(choices=[('signatory', 'Signatory Activity'), ('business_manager', 'Business Manager Activity'), ('audit', 'Audit Log')], max_length=20)),
+                ('form_type', models.CharField(blank=True, default='', max_length=20)),
+                ('action_type', models.CharField(max_length=100)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'activity_rollups',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='businessmanageractivitylog',
+            index=models.Index(fields=['created_at'], name='business_ma_created_147b31_idx'),
+        ),
+        migrations.AddField(
+            model_name='activityrollup',
+            name='actor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='activityrollup',
+            index=models.Index(fields=['source', 'day'], name='activity_ro_source_035345_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activityrollup',
+            index=models.Index(fields=['actor', 'day'], name='activity_ro_actor_i_f3ed06_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='activityrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'source', 'actor', 'form_type', 'action_type'), name='unique_activity_rollup'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# A copy of landing.student_search as of this migration: migrations must not import app code
+USER_FIELDS = {'name': 'full_name', 'username': 'username', 'email': 'email', 'contact_number': 'contact_number'}
+PROFILE_FIELDS = {'student_number': 'student_number', 'program': 'program'}
+PREFIX_ONLY_FIELDS = {'program'}
+MAX_TERM_LENGTH = 32
+BATCH_SIZE = 1000
+
+
+def search_words(text):
+    import re
+    import unicodedata
+
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+    return [word for word in re.split(r'[^0-9a-z]+', text) if word]
+
+
+def build_student_search(apps, schema_editor):
+    """StudentSearchIndex.rebuild() against the historical models, for the users that already exist"""
+    User = apps.get_model('landing', 'User')
+    StudentProfile = apps.get_model('landing', 'StudentProfile')
+    StudentSearchTerm = apps.get_model('landing', 'StudentSearchTerm')
+
+    user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+    for start in range(0, len(user_ids), BATCH_SIZE):
+        batch = user_ids[start:start + BATCH_SIZE]
+        sources = {
+            row['id']: {field: row[attname] for field, attname in USER_FIELDS.items()}
+            for row in User.objects.filter(id__in=batch).values('id', *USER_FIELDS.values())
+        }
+        for row in StudentProfile.objects.filter(user_id__in=batch).values('user_id', *PROFILE_FIELDS.values()):
+            sources[row['user_id']].update({field: row[attname] for field, attname in PROFILE_FIELDS.items()})
+
+        rows = set()
+        for user_id, values in sources.items():
+            for field, value in values.items():
+                for word in search_words(value):
+                    starts = [0] if field in PREFIX_ONLY_FIELDS else range(len(word))
+                    rows.update((word[i:i + MAX_TERM_LENGTH], field, user_id) for i in starts)
+        StudentSearchTerm.objects.bulk_create(
+            [StudentSearchTerm(user_id=user_id, field=field, term=term) for term, field, user_id in sorted(rows)],
+            batch_size=BATCH_SIZE,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0055_activity_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('field', models.CharField(choices=[('name', 'Name'), ('student_number', 'Student Number'), ('program', 'Program'), ('username', 'Username'), ('email', 'Email'), ('contact_number', 'Contact Number')], max_length=20)),
+                ('term', models.CharField(max_length=32)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'student_search_terms',
+                'indexes': [models.Index(fields=['term', 'field', 'user'], name='student_search_term_idx')],
+            },
+        ),
+        migrations.RunPython(build_student_search, migrations.RunPython.noop),
+    ]
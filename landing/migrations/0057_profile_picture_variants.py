@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:10
+
+from django.db import migrations, models
+
+
+def queue_existing_pictures(apps, schema_editor):
+    # process_profile_pictures resizes them, or marks them missing when the file is gone
+    for model_name in ('StudentProfile', 'AlumniProfile', 'SignatoryProfile', 'RegistrarProfile', 'BusinessManagerProfile'):
+        model = apps.get_model('landing', model_name)
+        model.objects.exclude(profile_picture='').exclude(profile_picture__isnull=True).update(
+            profile_picture_status='pending'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0056_student_search_terms'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alumniprofile',
+            name='profile_picture_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('ready', 'Ready'), ('missing', 'Missing'), ('failed', 'Failed')], db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='alumniprofile',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='businessmanagerprofile',
+            name='profile_picture_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('ready', 'Ready'), ('missing', 'Missing'), ('failed', 'Failed')], db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='businessmanagerprofile',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='registrarprofile',
+            name='profile_picture_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('ready', 'Ready'), ('missing', 'Missing'), ('failed', 'Failed')], db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='registrarprofile',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='signatoryprofile',
+            name='profile_picture_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('ready', 'Ready'), ('missing', 'Missing'), ('failed', 'Failed')], db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='signatoryprofile',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='profile_picture_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('ready', 'Ready'), ('missing', 'Missing'), ('failed', 'Failed')], db_index=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(queue_existing_pictures, migrations.RunPython.noop),
+    ]
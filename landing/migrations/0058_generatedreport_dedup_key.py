@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:22
+
+from django.db import migrations, models
+
+PER_USER_REPORT_TYPES = ['signatory_activity', 'business_manager_activity']
+
+
+def fill_dedup_keys(apps, schema_editor):
+    # Newest report of each shared period gets the key; older duplicates (possible where the
+    # previous partial constraint was not created, i.e. on MySQL) keep NULL
+    GeneratedReport = apps.get_model('landing', 'GeneratedReport')
+    seen = set()
+    reports = GeneratedReport.objects.filter(
+        period_start__isnull=False, period_end__isnull=False
+    ).exclude(report_type__in=PER_USER_REPORT_TYPES).order_by('-created_at')
+    for report in reports.only('id', 'report_type', 'period_start', 'period_end'):
+        key = f"{report.report_type}:{report.period_start}:{report.period_end}"
+        if key not in seen:
+            seen.add(key)
+            GeneratedReport.objects.filter(id=report.id).update(dedup_key=key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0057_profile_picture_variants'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='generatedreport',
+            name='unique_report_per_period',
+        ),
+        migrations.AddField(
+            model_name='generatedreport',
+            name='dedup_key',
+            field=models.CharField(blank=True, editable=False, max_length=100, null=True, unique=True),
+        ),
+        migrations.RunPython(fill_dedup_keys, migrations.RunPython.noop),
+    ]
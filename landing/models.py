@@ -2,7 +2,11 @@ from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager, Group, Permission
 from django.utils import timezone
 import uuid
+from collections import defaultdict
 from django.conf import settings
+from django.templatetags.static import static
+
+from .db_utils import bulk_upsert
 
 # --------------------
 # CUSTOM USER MANAGER
@@ -121,10 +125,73 @@ class User(AbstractBaseUser, PermissionsMixin):
         db_table = 'users'
 
 
+# --------------------
+# PROFILE PICTURES
+# --------------------
+DEFAULT_PROFILE_PICTURE = 'images/default-profile.png'  # static file
+
+
+class ProfilePictureModel(models.Model):
+    """
+    The uploaded picture of a profile and its resized variants. The variants are
+    written in the background (landing/profile_images.py); until then the URLs point
+    at the original upload. The URLs come from these fields alone, without touching
+    the file system.
+    """
+    PICTURE_STATUSES = [
+        ('pending', 'Pending'),  # uploaded, variants not written yet
+        ('ready', 'Ready'),
+        ('missing', 'Missing'),  # the uploaded file is gone
+        ('failed', 'Failed'),  # the upload is not a readable image
+    ]
+
+    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
+    profile_picture_status = models.CharField(max_length=10, choices=PICTURE_STATUSES, blank=True, default='', db_index=True)
+    # variant -> {'name': storage path, 'width': px, 'height': px}
+    profile_picture_variants = models.JSONField(default=dict, blank=True)
+
+    # Written by the resize worker with queryset updates only
+    PICTURE_STATE_FIELDS = ('profile_picture_status', 'profile_picture_variants')
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        """Leave the variant fields out of full saves of existing rows"""
+        # A profile loaded before its picture was resized would otherwise put back the
+        # variants (already deleted files) it had when it was loaded
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.PICTURE_STATE_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def profile_picture_variant_url(self, variant):
+        """URL of a resized variant, the original upload while it is being processed, or the default image"""
+        status = self.profile_picture_status
+        if not self.profile_picture or status == 'missing':
+            return static(DEFAULT_PROFILE_PICTURE)
+        stored = (self.profile_picture_variants or {}).get(variant)
+        if status == 'ready' and stored:
+            return self.profile_picture.storage.url(stored['name'])
+        return self.profile_picture.url
+
+    @property
+    def profile_picture_url(self):
+        """Profile page sized picture (the 'medium' variant)"""
+        return self.profile_picture_variant_url('medium')
+
+    @property
+    def profile_picture_thumbnail_url(self):
+        """Avatar sized picture for lists (the 'small' variant)"""
+        return self.profile_picture_variant_url('small')
+
+
 # --------------------
 # STUDENT PROFILE
 # --------------------
-class StudentProfile(models.Model):
+class StudentProfile(ProfilePictureModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     student_number = models.CharField(max_length=50, unique=True)
@@ -134,36 +201,16 @@ class StudentProfile(models.Model):
     address = models.CharField(max_length=255, null=True, blank=True)
     gender = models.CharField(max_length=10, null=True, blank=True)
     birthdate = models.DateField(null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
     emergency_contact = models.CharField(max_length=255, null=True, blank=True)
 
 
     def __str__(self):
         return self.student_number
     
-    @property
-    def profile_picture_url(self):
-        """Safely return profile picture URL or default image"""
-        if self.profile_picture and hasattr(self.profile_picture, 'url'):
-            try:
-                # Check if the file actually exists
-                import os
-                from django.conf import settings
-                file_path = os.path.join(settings.MEDIA_ROOT, str(self.profile_picture))
-                if os.path.exists(file_path):
-                    return self.profile_picture.url
-                else:
-                    # File doesn't exist, return default
-                    return '/static/images/default-profile.png'
-            except (ValueError, OSError, AttributeError):
-                # Any error, return default
-                return '/static/images/default-profile.png'
-        return '/static/images/default-profile.png'
-
     class Meta:
         db_table = 'student_profiles'
     
-class AlumniProfile(models.Model):
+class AlumniProfile(ProfilePictureModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='alumni_profile')
     alumni_id = models.CharField(max_length=50, unique=True)
@@ -172,30 +219,10 @@ class AlumniProfile(models.Model):
     address = models.CharField(max_length=255, null=True, blank=True)
     gender = models.CharField(max_length=10, null=True, blank=True)
     birthdate = models.DateField(null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
 
     def __str__(self):
         return f"{self.user.full_name} ({self.course_graduated} - {self.year_graduated})"
     
-    @property
-    def profile_picture_url(self):
-        """Safely return profile picture URL or default image"""
-        if self.profile_picture and hasattr(self.profile_picture, 'url'):
-            try:
-                # Check if the file actually exists
-                import os
-                from django.conf import settings
-                file_path = os.path.join(settings.MEDIA_ROOT, str(self.profile_picture))
-                if os.path.exists(file_path):
-                    return self.profile_picture.url
-                else:
-                    # File doesn't exist, return default
-                    return '/static/images/default-profile.png'
-            except (ValueError, OSError, AttributeError):
-                # Any error, return default
-                return '/static/images/default-profile.png'
-        return '/static/images/default-profile.png'
-
     class Meta:
         db_table = 'alumni_profiles'
 
@@ -203,7 +230,7 @@ class AlumniProfile(models.Model):
 # --------------------
 # SIGNATORY PROFILE
 # --------------------
-class SignatoryProfile(models.Model):
+class SignatoryProfile(ProfilePictureModel):
     SIGNATORY_TYPES = [
         ('dorm_supervisor', 'Dorm Supervisor'),
         ('canteen_concessionaire', 'Canteen Concessionaire'),
@@ -226,7 +253,6 @@ class SignatoryProfile(models.Model):
     address = models.CharField(max_length=255, null=True, blank=True)
     gender = models.CharField(max_length=10, null=True, blank=True)
     birthdate = models.DateField(null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
     pin = models.CharField(max_length=128, blank=True, null=True)  # Hashed PIN for security
     pin_set = models.BooleanField(default=False)  # Track if PIN has been set
     force_password_change = models.BooleanField(default=True)  # Force password change on first login
@@ -234,25 +260,6 @@ class SignatoryProfile(models.Model):
     def __str__(self):
         return f"{self.user.full_name} ({self.get_signatory_type_display()})"
     
-    @property
-    def profile_picture_url(self):
-        """Safely return profile picture URL or default image"""
-        if self.profile_picture and hasattr(self.profile_picture, 'url'):
-            try:
-                # Check if the file actually exists
-                import os
-                from django.conf import settings
-                file_path = os.path.join(settings.MEDIA_ROOT, str(self.profile_picture))
-                if os.path.exists(file_path):
-                    return self.profile_picture.url
-                else:
-                    # File doesn't exist, return default
-                    return '/static/images/default-profile.png'
-            except (ValueError, OSError, AttributeError):
-                # Any error, return default
-                return '/static/images/default-profile.png'
-        return '/static/images/default-profile.png'
-
     class Meta:
         db_table = 'signatory_profiles'
 
@@ -260,7 +267,7 @@ class SignatoryProfile(models.Model):
 # --------------------
 # REGISTRAR PROFILE
 # --------------------
-class RegistrarProfile(models.Model):
+class RegistrarProfile(ProfilePictureModel):
     GENDER_CHOICES = [
         ('male', 'Male'),
         ('female', 'Female'),
@@ -274,7 +281,6 @@ class RegistrarProfile(models.Model):
     address = models.CharField(max_length=255, null=True, blank=True)
     gender = models.CharField(max_length=10, choices=GENDER_CHOICES, null=True, blank=True)
     birthdate = models.DateField(null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
     # Security setup (mirror signatory)
     pin = models.CharField(max_length=128, blank=True, null=True)
     pin_set = models.BooleanField(default=False)
@@ -288,30 +294,11 @@ class RegistrarProfile(models.Model):
     def __str__(self):
         return f"{self.user.full_name} - {self.position or 'Registrar'}"
 
-    @property
-    def profile_picture_url(self):
-        """Safely return profile picture URL or default image"""
-        if self.profile_picture and hasattr(self.profile_picture, 'url'):
-            try:
-                # Check if the file actually exists
-                import os
-                from django.conf import settings
-                file_path = os.path.join(settings.MEDIA_ROOT, str(self.profile_picture))
-                if os.path.exists(file_path):
-                    return self.profile_picture.url
-                else:
-                    # File doesn't exist, return default
-                    return '/static/images/default-profile.png'
-            except (ValueError, OSError, AttributeError):
-                # Any error, return default
-                return '/static/images/default-profile.png'
-        return '/static/images/default-profile.png'
-
     class Meta:
         db_table = 'registrar_profiles'
 
 
-class BusinessManagerProfile(models.Model):
+class BusinessManagerProfile(ProfilePictureModel):
     GENDER_CHOICES = [
         ('male', 'Male'),
         ('female', 'Female'),
@@ -325,7 +312,6 @@ class BusinessManagerProfile(models.Model):
     address = models.CharField(max_length=255, null=True, blank=True)
     gender = models.CharField(max_length=10, choices=GENDER_CHOICES, null=True, blank=True)
     birthdate = models.DateField(null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
     # Security setup (mirror signatory)
     pin = models.CharField(max_length=128, blank=True, null=True)
     pin_set = models.BooleanField(default=False)
@@ -339,25 +325,6 @@ class BusinessManagerProfile(models.Model):
     def __str__(self):
         return f"{self.user.full_name} - {self.position or 'Business Manager'}"
 
-    @property
-    def profile_picture_url(self):
-        """Safely return profile picture URL or default image"""
-        if self.profile_picture and hasattr(self.profile_picture, 'url'):
-            try:
-                # Check if the file actually exists
-                import os
-                from django.conf import settings
-                file_path = os.path.join(settings.MEDIA_ROOT, str(self.profile_picture))
-                if os.path.exists(file_path):
-                    return self.profile_picture.url
-                else:
-                    # File doesn't exist, return default
-                    return '/static/images/default-profile.png'
-            except (ValueError, OSError, AttributeError):
-                # Any error, return default
-                return '/static/images/default-profile.png'
-        return '/static/images/default-profile.png'
-
     class Meta:
         db_table = 'business_manager_profiles'
 
@@ -510,6 +477,9 @@ class ClearanceSignatory(models.Model):
         # Save first
         super().save(*args, **kwargs)
         
+        # Keep the denormalized status matrix in step with this clearance
+        ClearanceStatusMatrix.refresh_for_clearance(self.clearance_id)
+
         # Send notification if this is a new disapproval
         if is_new_disapproval:
             try:
@@ -537,6 +507,157 @@ class ClearanceSignatory(models.Model):
         ]
 
 
+# --------------------
+# CLEARANCE STATUS MATRIX
+# --------------------
+class ClearanceStatusMatrix(models.Model):
+    """
+    One denormalized row per clearance holding the status of each of the 10 required
+    signatory types, so grids can list, filter and count clearances in a single query.
+    Rows are rebuilt from ClearanceSignatory by refresh_for_clearance().
+    """
+    SIGNATORY_TYPES = [
+        'dorm_supervisor', 'canteen_concessionaire', 'library_director',
+        'scholarship_director', 'it_director', 'student_affairs',
+        'cashier', 'business_manager', 'registrar', 'academic_dean'
+    ]
+
+    OVERALL_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('completed', 'Completed'),
+    ]
+
+    # Status priority used when several records map to the same signatory type
+    STATUS_PRIORITY = {'approved': 2, 'disapproved': 1, 'pending': 0}
+
+    clearance = models.OneToOneField(ClearanceForm, on_delete=models.CASCADE, primary_key=True, related_name='status_matrix')
+
+    # Per signatory type: status (null when no record exists yet) and last update time
+    dorm_supervisor_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    dorm_supervisor_at = models.DateTimeField(null=True, blank=True)
+    canteen_concessionaire_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    canteen_concessionaire_at = models.DateTimeField(null=True, blank=True)
+    library_director_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    library_director_at = models.DateTimeField(null=True, blank=True)
+    scholarship_director_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    scholarship_director_at = models.DateTimeField(null=True, blank=True)
+    it_director_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    it_director_at = models.DateTimeField(null=True, blank=True)
+    student_affairs_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    student_affairs_at = models.DateTimeField(null=True, blank=True)
+    cashier_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    cashier_at = models.DateTimeField(null=True, blank=True)
+    business_manager_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    business_manager_at = models.DateTimeField(null=True, blank=True)
+    registrar_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    registrar_at = models.DateTimeField(null=True, blank=True)
+    academic_dean_status = models.CharField(max_length=20, choices=ClearanceSignatory.STATUS_CHOICES, null=True, blank=True)
+    academic_dean_at = models.DateTimeField(null=True, blank=True)
+
+    comments = models.JSONField(default=dict, blank=True)  # {signatory_type: remarks/comment}
+    approved_count = models.PositiveSmallIntegerField(default=0)
+    overall_status = models.CharField(max_length=20, choices=OVERALL_STATUS_CHOICES, default='pending')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Status matrix for {self.clearance_id} - {self.overall_status}"
+
+    @staticmethod
+    def resolve_signatory_type(user):
+        """Map a signatory user to a signatory type (admins without a profile act as registrar)"""
+        profile = getattr(user, 'signatory_profile', None)
+        if profile:
+            return profile.signatory_type
+        if user.user_type == 'admin':
+            return 'registrar'
+        return None
+
+    @classmethod
+    def build_fields(cls, signatory_records):
+        """
+        Collapse ClearanceSignatory records into matrix column values.
+        When several records share a signatory type, approved beats disapproved beats pending.
+        """
+        best_records = {}
+        for record in signatory_records:
+            signatory_type = cls.resolve_signatory_type(record.signatory)
+            if signatory_type not in cls.SIGNATORY_TYPES:
+                continue
+            current = best_records.get(signatory_type)
+            if current is None or cls.STATUS_PRIORITY.get(record.status, 0) > cls.STATUS_PRIORITY.get(current.status, 0):
+                best_records[signatory_type] = record
+
+        fields = {'comments': {}}
+        for signatory_type in cls.SIGNATORY_TYPES:
+            record = best_records.get(signatory_type)
+            fields[f'{signatory_type}_status'] = record.status if record else None
+            fields[f'{signatory_type}_at'] = record.updated_at if record else None
+            if record and (record.remarks or record.comment):
+                fields['comments'][signatory_type] = record.remarks or record.comment
+
+        approved_count = sum(1 for record in best_records.values() if record.status == 'approved')
+        fields['approved_count'] = approved_count
+        fields['overall_status'] = 'completed' if approved_count == len(cls.SIGNATORY_TYPES) else 'pending'
+        return fields
+
+    @classmethod
+    def refresh_for_clearance(cls, clearance_id, create=True):
+        """
+        Recompute the matrix row for one clearance from its signatory records.
+        With create=False only an existing row is updated (used while rows are being deleted).
+        """
+        signatory_records = ClearanceSignatory.objects.filter(
+            clearance_id=clearance_id
+        ).select_related('signatory', 'signatory__signatory_profile')
+        fields = cls.build_fields(signatory_records)
+
+        if create:
+            cls.objects.update_or_create(clearance_id=clearance_id, defaults=fields)
+        else:
+            cls.objects.filter(clearance_id=clearance_id).update(updated_at=timezone.now(), **fields)
+
+    @classmethod
+    def refresh_for_clearances(cls, clearance_ids):
+        """Recompute the matrix rows for many clearances with one read and one upsert"""
+        clearance_ids = list(clearance_ids)
+        if not clearance_ids:
+            return
+        records_by_clearance = defaultdict(list)
+        signatory_records = ClearanceSignatory.objects.filter(
+            clearance_id__in=clearance_ids
+        ).select_related('signatory', 'signatory__signatory_profile')
+        for record in signatory_records:
+            records_by_clearance[record.clearance_id].append(record)
+
+        now = timezone.now()
+        rows = [
+            cls(clearance_id=clearance_id, updated_at=now, **cls.build_fields(records_by_clearance.get(clearance_id, [])))
+            for clearance_id in clearance_ids
+        ]
+        update_fields = [field.name for field in cls._meta.concrete_fields if not field.primary_key]
+        bulk_upsert(cls, rows, unique_fields=['clearance'], update_fields=update_fields)
+
+    def get_signatory_statuses(self):
+        """Return {signatory_type: {'status', 'timestamp', 'comment'}} for types that have a record"""
+        statuses = {}
+        for signatory_type in self.SIGNATORY_TYPES:
+            status = getattr(self, f'{signatory_type}_status')
+            if status is None:
+                continue
+            statuses[signatory_type] = {
+                'status': status,
+                'timestamp': getattr(self, f'{signatory_type}_at'),
+                'comment': self.comments.get(signatory_type),
+            }
+        return statuses
+
+    class Meta:
+        db_table = 'clearance_status_matrix'
+        indexes = [
+            models.Index(fields=['overall_status']),
+        ]
+
+
 # --------------------
 # DOCUMENT REQUEST
 # --------------------
@@ -640,6 +761,13 @@ class Conversation(models.Model):
     
     # Track who can start conversations (business rule enforcement)
     initiated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='initiated_conversations')
+
+    # Denormalized inbox state so the conversation list is a single query. Maintained by
+    # record_message() and mark_read(); rebuild_inbox_state() recomputes it from the messages.
+    last_message = models.ForeignKey('Message', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    last_message_at = models.DateTimeField(null=True, blank=True)
+    participant_1_unread = models.PositiveIntegerField(default=0)  # messages from participant_2 not yet read
+    participant_2_unread = models.PositiveIntegerField(default=0)  # messages from participant_1 not yet read
     
     class Meta:
         db_table = 'conversations'
@@ -650,12 +778,87 @@ class Conversation(models.Model):
         
     def get_other_participant(self, user):
         """Get the other participant in the conversation"""
-        return self.participant_2 if self.participant_1 == user else self.participant_1
+        return self.participant_2 if self.participant_1_id == user.id else self.participant_1
         
     def get_last_message(self):
         """Get the last message in this conversation"""
+        if self.last_message_id:
+            return self.last_message
         return self.messages.order_by('-sent_at').first()
 
+    def _unread_field(self, user_id):
+        return 'participant_1_unread' if self.participant_1_id == user_id else 'participant_2_unread'
+
+    def unread_count_for(self, user):
+        """Messages from the other participant that user has not read yet"""
+        return getattr(self, self._unread_field(user.id))
+
+    def record_message(self, message):
+        """
+        Update the inbox state for a newly created message: bump the recipient's unread
+        counter and move last_message forward. Call in the transaction that created it.
+        """
+        from django.db import transaction
+        from django.db.models import F, Q
+
+        recipient_field = 'participant_2_unread' if message.sender_id == self.participant_1_id else 'participant_1_unread'
+        now = timezone.now()
+        with transaction.atomic():
+            Conversation.objects.filter(pk=self.pk).update(
+                **{recipient_field: F(recipient_field) + 1}, updated_at=now
+            )
+            # Messages committed out of order must not move last_message backwards
+            Conversation.objects.filter(pk=self.pk).filter(
+                Q(last_message_at__isnull=True) | Q(last_message_at__lte=message.sent_at)
+            ).update(last_message=message, last_message_at=message.sent_at)
+        self.last_message = message
+        self.last_message_at = message.sent_at
+        self.updated_at = now
+
+    def mark_read(self, user):
+        """Mark the other participant's messages as read for user; returns how many changed"""
+        from django.db import transaction
+        from django.db.models import F
+        from django.db.models.functions import Greatest
+
+        unread_field = self._unread_field(user.id)
+        with transaction.atomic():
+            marked = self.messages.filter(is_read=False).exclude(sender_id=user.id).update(
+                is_read=True, read_at=timezone.now()
+            )
+            if marked:
+                # Subtract rather than zero: a message sent meanwhile stays counted
+                Conversation.objects.filter(pk=self.pk).update(
+                    **{unread_field: Greatest(F(unread_field) - marked, 0)}
+                )
+        if marked:
+            setattr(self, unread_field, max(getattr(self, unread_field) - marked, 0))
+        return marked
+
+    @classmethod
+    def rebuild_inbox_state(cls, queryset=None):
+        """Recompute last_message and the unread counters from the messages table (one UPDATE)"""
+        from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+        from django.db.models.functions import Coalesce
+
+        latest = Message.objects.filter(conversation=OuterRef('pk')).order_by('-sent_at')
+
+        def unread_from(sender_field):
+            # Sender and read state go in the aggregate filter: in the WHERE clause, SQLite
+            # picks the sender index, which covers every message of a busy signatory
+            counts = Message.objects.filter(conversation=OuterRef('pk')).order_by().values('conversation').annotate(
+                total=Count('pk', filter=Q(sender=OuterRef(sender_field), is_read=False))
+            ).values('total')
+            return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.update(
+            last_message=Subquery(latest.values('pk')[:1]),
+            last_message_at=Subquery(latest.values('sent_at')[:1]),
+            participant_1_unread=unread_from('participant_2'),
+            participant_2_unread=unread_from('participant_1'),
+        )
+
 class Message(models.Model):
     """Individual message in a conversation"""
     MESSAGE_TYPES = [
@@ -838,6 +1041,7 @@ class EmailNotificationLog(models.Model):
     """Log all email notifications sent"""
     STATUS_CHOICES = [
         ('pending', 'Pending'),
+        ('sending', 'Sending'),
         ('sent', 'Sent'),
         ('failed', 'Failed'),
         ('bounced', 'Bounced'),
@@ -854,6 +1058,8 @@ class EmailNotificationLog(models.Model):
     sent_at = models.DateTimeField(null=True, blank=True)
     error_message = models.TextField(null=True, blank=True)
     attempts = models.PositiveIntegerField(default=0)
+    # Outbox scheduling: when a pending row may be (re)tried, or when a 'sending' claim expires
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -862,6 +1068,7 @@ class EmailNotificationLog(models.Model):
         indexes = [
             models.Index(fields=['user', 'email_type']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'next_attempt_at']),
         ]
 
     def __str__(self):
@@ -919,7 +1126,12 @@ class GeneratedReport(models.Model):
         ('enrollment_pack', 'Enrollment Pack'),  
         ('graduation_pack', 'Graduation Pack'),
         ('manual_activity', 'Activity Report'),
+        ('signatory_activity', 'Signatory Activity Report'),
+        ('business_manager_activity', 'Business Manager Activity Report'),
     ]
+
+    # Per-user reports: several users may hold one for the same period
+    PER_USER_REPORT_TYPES = ['signatory_activity', 'business_manager_activity']
     
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -940,6 +1152,17 @@ class GeneratedReport(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='completed', db_index=True)
     notes = models.TextField(blank=True, null=True)
 
+    # Background generation state (see landing/report_jobs.py)
+    parameters = models.JSONField(null=True, blank=True, help_text="Inputs the report job was queued with")
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # One report per period for shared report types: a plain unique column (NULL for per-user
+    # and open-ended reports) because MySQL has no partial unique constraints
+    dedup_key = models.CharField(max_length=100, null=True, blank=True, unique=True, editable=False)
+
     class Meta:
         db_table = 'generated_reports'
         ordering = ['-created_at']
@@ -949,16 +1172,24 @@ class GeneratedReport(models.Model):
             models.Index(fields=['generated_by', 'created_at'], name='gr_user_created_idx'),
             models.Index(fields=['status', 'created_at'], name='gr_status_created_idx'),
         ]
-        constraints = [
-            models.UniqueConstraint(
-                fields=['report_type', 'period_start', 'period_end'],
-                name='unique_report_per_period',
-                condition=models.Q(period_start__isnull=False, period_end__isnull=False)
-            ),
-        ]
     
     def __str__(self):
         return f"{self.get_report_type_display()} - {self.period_start} to {self.period_end}"
+
+    @classmethod
+    def dedup_key_for(cls, report_type, period_start, period_end):
+        """Key of the one report a shared report type may have per period (None: no such limit)"""
+        if report_type in cls.PER_USER_REPORT_TYPES or period_start is None or period_end is None:
+            return None
+        return f"{report_type}:{period_start}:{period_end}"
+
+    def save(self, *args, **kwargs):
+        """Keep dedup_key in step with the report type and period"""
+        self.dedup_key = self.dedup_key_for(self.report_type, self.period_start, self.period_end)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'report_type', 'period_start', 'period_end'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'dedup_key'}
+        super().save(*args, **kwargs)
     
     @property
     def filename(self):
@@ -985,11 +1216,15 @@ class AuditLog(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     action_type = models.CharField(max_length=100)
     description = models.TextField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the row is built: rows are written later in batches (landing/activity_log.py)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         db_table = 'audit_logs'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['timestamp']),
+        ]
 
 # --------------------
 # CALENDAR EVENTS
@@ -1165,6 +1400,233 @@ class GraduationSignatory(models.Model):
     class Meta:
         db_table = 'graduation_signatories'
 
+
+# --------------------
+# PENDING COUNTERS
+# --------------------
+class PendingCounter(models.Model):
+    """
+    Materialized number of pending signatory records per user and form type: records
+    still 'pending' on a form that is itself 'pending'. Kept current by F() deltas from
+    the signatory/form signals (see landing/signals.py) and read when the notification
+    bell is opened, so a submission never has to visit every staff account.
+    recount() rebuilds the table from the signatory tables if it ever drifts.
+    """
+    FORM_TYPES = [
+        ('clearance', 'Clearance'),
+        ('enrollment', 'Enrollment'),
+        ('graduation', 'Graduation'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='pending_counters')
+    form_type = models.CharField(max_length=20, choices=FORM_TYPES)
+    count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'pending_counters'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'form_type'], name='unique_pending_counter')
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.form_type}: {self.count}"
+
+    @classmethod
+    def signatory_models(cls):
+        """form_type -> (signatory model, name of its form foreign key)"""
+        return {
+            'clearance': (ClearanceSignatory, 'clearance'),
+            'enrollment': (EnrollmentSignatory, 'enrollment'),
+            'graduation': (GraduationSignatory, 'graduation'),
+        }
+
+    @classmethod
+    def adjust(cls, deltas):
+        """
+        Apply {(user_id, form_type): delta} with one INSERT for missing rows and one
+        UPDATE per distinct (form_type, delta) pair. Counts never go below zero.
+        """
+        from django.db.models import Case, F, When
+
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        cls.objects.bulk_create(
+            [cls(user_id=user_id, form_type=form_type) for user_id, form_type in deltas],
+            ignore_conflicts=True
+        )
+        user_ids_by_change = defaultdict(list)
+        for (user_id, form_type), delta in deltas.items():
+            user_ids_by_change[(form_type, delta)].append(user_id)
+        now = timezone.now()
+        for (form_type, delta), user_ids in user_ids_by_change.items():
+            # Clamp before adding: count is UNSIGNED on MySQL, so a negative count + delta
+            # raises "out of range" before GREATEST() could clamp it
+            count = F('count') + delta
+            if delta < 0:
+                count = Case(When(count__lt=-delta, then=0), default=count)
+            cls.objects.filter(user_id__in=user_ids, form_type=form_type).update(count=count, updated_at=now)
+
+    @classmethod
+    def recount(cls):
+        """Rebuild every counter from the signatory tables (one grouped query per form type)"""
+        from django.db import transaction
+        from django.db.models import Count
+
+        rows = []
+        now = timezone.now()
+        for form_type, (signatory_model, form_field) in cls.signatory_models().items():
+            counts = signatory_model.objects.filter(
+                status='pending', **{f'{form_field}__status': 'pending'}
+            ).values('signatory_id').annotate(total=Count('id'))
+            rows.extend(
+                cls(user_id=row['signatory_id'], form_type=form_type, count=row['total'], updated_at=now)
+                for row in counts
+            )
+        with transaction.atomic():
+            cls.objects.exclude(count=0).update(count=0, updated_at=now)
+            bulk_upsert(cls, rows, unique_fields=['user', 'form_type'], update_fields=['count', 'updated_at'])
+        return len(rows)
+
+    @classmethod
+    def counts_for(cls, user):
+        return dict(cls.objects.filter(user=user).values_list('form_type', 'count'))
+
+# --------------------
+# STUDENT SEARCH
+# --------------------
+class StudentSearchTerm(models.Model):
+    """
+    Search index behind search_students() (see landing/student_search.py): normalized
+    words of a user's name, student number, program, username, email and contact number.
+    Words of every field but program are stored with every suffix, so a prefix range on
+    `term` finds substrings. Kept current by the User/StudentProfile signals.
+    """
+    FIELDS = [
+        ('name', 'Name'),
+        ('student_number', 'Student Number'),
+        ('program', 'Program'),
+        ('username', 'Username'),
+        ('email', 'Email'),
+        ('contact_number', 'Contact Number'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='search_terms')
+    field = models.CharField(max_length=20, choices=FIELDS)
+    term = models.CharField(max_length=32)
+
+    class Meta:
+        db_table = 'student_search_terms'
+        indexes = [
+            # Covers the whole lookup: range on term, then field, returning user_id
+            models.Index(fields=['term', 'field', 'user'], name='student_search_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.field}: {self.term}"
+
+# --------------------
+# USER EVENTS
+# --------------------
+class UserEvent(models.Model):
+    """
+    Change log behind the per-user event stream (see landing/event_stream.py). A row is
+    for one user, or for every user of an audience (a user type) when user is empty.
+    Clients only ask for rows newer than the last id they saw, so old rows are pruned.
+    """
+    EVENT_TYPES = [
+        ('notification', 'Notification'),
+        ('message', 'Message'),
+        ('dashboard_stale', 'Dashboard Stale'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='events')
+    audience = models.CharField(max_length=20, blank=True, default='')  # user_type of broadcast rows
+    event_type = models.CharField(max_length=20, choices=EVENT_TYPES)
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = 'user_events'
+        indexes = [
+            models.Index(fields=['user', 'id'], name='user_event_user_idx'),
+            models.Index(fields=['audience', 'id'], name='user_event_audience_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.id} for {self.user_id or self.audience}"
+
+# --------------------
+# REQUEST METRICS
+# --------------------
+class SlowRequestLog(models.Model):
+    """
+    A request the metrics middleware flagged as slow or as a suspected N+1 (see
+    landing/request_metrics.py), with the queries it repeated most.
+    """
+    REASONS = [
+        ('slow', 'Slow'),
+        ('n_plus_one', 'Suspected N+1'),
+        ('slow_n_plus_one', 'Slow and suspected N+1'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    reason = models.CharField(max_length=20, choices=REASONS)
+    view_name = models.CharField(max_length=200)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    status_code = models.PositiveSmallIntegerField()
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='slow_requests')
+    duration_ms = models.FloatField()
+    sql_count = models.PositiveIntegerField()
+    sql_ms = models.FloatField()
+    python_ms = models.FloatField()
+    response_bytes = models.PositiveIntegerField(null=True, blank=True)  # None for streamed responses
+    duplicate_queries = models.JSONField(default=list, blank=True)  # [{fingerprint, count, ms}], most repeated first
+
+    class Meta:
+        db_table = 'slow_request_logs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['view_name', 'created_at'], name='slow_request_view_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms, {self.sql_count} queries)"
+
+
+class RequestMetricWindow(models.Model):
+    """
+    Per-view request totals and a latency histogram, collected by one worker process
+    over one window. Percentiles over any period merge the histograms of its windows.
+    """
+    id = models.BigAutoField(primary_key=True)
+    view_name = models.CharField(max_length=200)
+    window_start = models.DateTimeField()
+    requests = models.PositiveIntegerField()
+    errors = models.PositiveIntegerField(default=0)  # status 500 and above
+    flagged = models.PositiveIntegerField(default=0)  # written to SlowRequestLog
+    total_ms = models.FloatField()
+    max_ms = models.FloatField()
+    sql_count = models.PositiveBigIntegerField()
+    sql_ms = models.FloatField()
+    response_bytes = models.PositiveBigIntegerField()
+    histogram = models.JSONField(default=list)  # request counts per LATENCY_BUCKETS_MS bucket
+
+    class Meta:
+        db_table = 'request_metric_windows'
+        indexes = [
+            models.Index(fields=['window_start'], name='request_metric_start_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.view_name} from {self.window_start}: {self.requests} requests"
+
 # --------------------
 # SIGNATORY ACTIVITY LOG
 # --------------------
@@ -1192,7 +1654,7 @@ class SignatoryActivityLog(models.Model):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True, null=True)
     location_data = models.JSONField(blank=True, null=True)  # Store location info if available
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)  # set when built, written in batches
 
     def __str__(self):
         return f"{self.signatory.full_name} - {self.action_type} - {self.form_type}"
@@ -1200,6 +1662,10 @@ class SignatoryActivityLog(models.Model):
     class Meta:
         db_table = 'signatory_activity_logs'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['signatory', 'created_at']),
+        ]
 
 
 class BusinessManagerActivityLog(models.Model):
@@ -1227,7 +1693,7 @@ class BusinessManagerActivityLog(models.Model):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True, null=True)
     location_data = models.JSONField(blank=True, null=True)  # Store location info if available
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)  # set when built, written in batches
 
     def __str__(self):
         return f"{self.business_manager.full_name} - {self.action_type} - {self.form_type}"
@@ -1235,6 +1701,47 @@ class BusinessManagerActivityLog(models.Model):
     class Meta:
         db_table = 'business_manager_activity_logs'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['business_manager', 'created_at']),
+        ]
+
+
+class ActivityRollup(models.Model):
+    """
+    Number of activity/audit log rows per local day, actor, form type and action type.
+    Rebuilt a day at a time from the log tables by `python manage.py rollup_activity`
+    (landing/activity_rollups.py) and read by the weekly reports instead of the raw logs.
+    """
+    SOURCES = [
+        ('signatory', 'Signatory Activity'),
+        ('business_manager', 'Business Manager Activity'),
+        ('audit', 'Audit Log'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    day = models.DateField()
+    source = models.CharField(max_length=20, choices=SOURCES)
+    actor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_rollups')
+    form_type = models.CharField(max_length=20, blank=True, default='')  # empty for audit log rows
+    action_type = models.CharField(max_length=100)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.day} {self.source} {self.actor_id} {self.form_type} {self.action_type}: {self.count}"
+
+    class Meta:
+        db_table = 'activity_rollups'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'source', 'actor', 'form_type', 'action_type'],
+                name='unique_activity_rollup'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['source', 'day']),
+            models.Index(fields=['actor', 'day']),
+        ]
 
 
 # --------------------
@@ -5,16 +5,19 @@ Handles in-app notifications, email notifications, and daily digests
 
 import logging
 from datetime import datetime, timedelta
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import send_mail
 from django.template.loader import render_to_string
+from django.template.defaultfilters import linebreaksbr
 from django.conf import settings
 from django.utils import timezone
 from django.db.models import Q, Count
 from django.contrib.auth import get_user_model
 from typing import List, Dict, Optional, Any
 
+from .email_outbox import EmailOutbox
+from .event_stream import EventStream
 from .models import (
-    Notification, NotificationTemplate, EmailNotificationLog, 
+    Notification, NotificationTemplate,
     NotificationPreference, ClearanceForm, EnrollmentForm, 
     GraduationForm, DocumentRequest, SignatoryProfile, User
 )
@@ -66,7 +69,7 @@ class NotificationService:
     
     @staticmethod
     def send_email_notification(notification: Notification) -> bool:
-        """Send email notification based on user preferences"""
+        """Queue email notification based on user preferences"""
         try:
             user = notification.user
             
@@ -95,48 +98,102 @@ class NotificationService:
             subject = template.email_subject.format(**context)
             html_content = template.email_template.format(**context)
             
-            # Create email log entry
-            email_log = EmailNotificationLog.objects.create(
+            # Queue the email; the outbox worker delivers it and marks the notification as emailed
+            EmailOutbox.enqueue(
                 user=user,
-                notification=notification,
                 email_type=notification.notification_type,
                 recipient_email=user.email,
                 subject=subject,
-                content=html_content
-            )
-            
-            # Send email
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=html_content,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email]
+                content=html_content,
+                notification=notification
             )
-            email.attach_alternative(html_content, "text/html")
-            email.send()
             
-            # Update logs
-            email_log.status = 'sent'
-            email_log.sent_at = timezone.now()
-            email_log.save()
-            
-            notification.email_sent = True
-            notification.email_sent_at = timezone.now()
-            notification.save()
-            
-            logger.info(f"Email sent successfully for notification {notification.id}")
+            logger.info(f"Email queued for notification {notification.id}")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send email for notification {notification.id}: {str(e)}")
-            # Update email log with error
-            if 'email_log' in locals():
-                email_log.status = 'failed'
-                email_log.error_message = str(e)
-                email_log.attempts += 1
-                email_log.save()
+            logger.error(f"Failed to queue email for notification {notification.id}: {str(e)}")
             return False
     
+    @staticmethod
+    def create_notifications_bulk(specs: List[Dict[str, Any]], send_email: bool = True) -> List[Notification]:
+        """
+        Create many notifications with one INSERT and queue their emails as one batch.
+        Each spec takes the create_notification() keyword arguments (except send_email).
+        """
+        notifications = [
+            Notification(**dict(spec, extra_data=spec.get('extra_data') or {}))
+            for spec in specs
+        ]
+        if not notifications:
+            return []
+        Notification.objects.bulk_create(notifications)
+        # bulk_create skips the post_save receiver that publishes single notifications
+        EventStream.publish_notifications(notifications)
+        
+        if send_email:
+            NotificationService.send_email_notifications_bulk(notifications)
+        
+        logger.info(f"Created {len(notifications)} notifications in bulk")
+        return notifications
+    
+    @staticmethod
+    def send_email_notifications_bulk(notifications: List[Notification]) -> int:
+        """Queue emails for many notifications with a fixed number of queries"""
+        try:
+            user_ids = {notification.user_id for notification in notifications}
+            prefs_by_user = {
+                prefs.user_id: prefs
+                for prefs in NotificationPreference.objects.filter(user_id__in=user_ids)
+            }
+            missing_prefs = [
+                NotificationPreference(user_id=user_id, email_daily_digest=True)
+                for user_id in user_ids if user_id not in prefs_by_user
+            ]
+            if missing_prefs:
+                NotificationPreference.objects.bulk_create(missing_prefs, ignore_conflicts=True)
+                for prefs in missing_prefs:
+                    prefs_by_user[prefs.user_id] = prefs
+            
+            templates = {
+                template.template_type: template
+                for template in NotificationTemplate.objects.filter(
+                    template_type__in={notification.notification_type for notification in notifications},
+                    is_active=True
+                )
+            }
+            
+            messages = []
+            missing_templates = set()
+            for notification in notifications:
+                user = notification.user
+                if not user.email or not NotificationService._should_send_email(notification, prefs_by_user[user.id]):
+                    continue
+                template = templates.get(notification.notification_type)
+                if not template:
+                    missing_templates.add(notification.notification_type)
+                    continue
+                context = NotificationService._prepare_email_context(notification)
+                messages.append({
+                    'user': user,
+                    'notification': notification,
+                    'email_type': notification.notification_type,
+                    'recipient_email': user.email,
+                    'subject': template.email_subject.format(**context),
+                    'content': template.email_template.format(**context),
+                })
+            
+            for notification_type in missing_templates:
+                logger.warning(f"No email template found for {notification_type}")
+            
+            EmailOutbox.enqueue_many(messages)
+            logger.info(f"Queued {len(messages)} emails for {len(notifications)} notifications")
+            return len(messages)
+            
+        except Exception as e:
+            logger.error(f"Failed to queue emails for bulk notifications: {str(e)}")
+            return 0
+    
     @staticmethod
     def _should_send_email(notification: Notification, prefs: NotificationPreference) -> bool:
         """Check if email should be sent based on notification type and user preferences"""
@@ -186,296 +243,223 @@ class NotificationService:
             
         return context
     
+    # Form types with a "Pending X Forms" notification, and who sees the document request one
+    PENDING_COUNT_FORM_TYPES = ['clearance', 'enrollment', 'graduation', 'document_request']
+    DOCUMENT_REQUEST_STAFF_TYPES = ['admin', 'registrar', 'business_manager']
+    
+    @staticmethod
+    def _pending_count_signatory_type(user: User) -> str:
+        if user.user_type == 'signatory':
+            profile = getattr(user, 'signatory_profile', None)
+            if profile:
+                return profile.signatory_type
+        if user.user_type == 'business_manager':
+            return 'business_manager'
+        return 'admin'
+    
+    @staticmethod
+    def _apply_pending_count_notification(user: User, form_type: str, pending_count: int, existing: Optional[Notification], signatory_type: str = None):
+        """Create, update or remove one pending count notification; no write if it is already current"""
+        if pending_count <= 0:
+            if existing:
+                existing.delete()
+            return
+        
+        if existing and (existing.extra_data or {}).get('pending_count') == pending_count:
+            return
+        
+        # Handle different form types for better messaging
+        if form_type == 'document_request':
+            title = "Pending Document Requests"
+            if pending_count == 1:
+                message = f"You have {pending_count} newly submitted document request that needs processing."
+            else:
+                message = f"You have {pending_count} newly submitted document requests that need processing."
+        else:
+            title = f"Pending {form_type.title()} Forms"
+            if pending_count == 1:
+                message = f"You have {pending_count} pending {form_type} form that needs your attention."
+            else:
+                message = f"You have {pending_count} pending {form_type} forms that need your attention."
+        
+        extra_data = {
+            'pending_count': pending_count,
+            'form_type': form_type,
+            'signatory_type': signatory_type or NotificationService._pending_count_signatory_type(user)
+        }
+        
+        if existing:
+            existing.title = title
+            existing.message = message
+            existing.form_type = form_type  # Ensure form_type is set
+            existing.extra_data = extra_data
+            existing.save(update_fields=['title', 'message', 'form_type', 'extra_data', 'updated_at'])
+        else:
+            NotificationService.create_notification(
+                user=user,
+                notification_type=f'pending_{form_type}_count',
+                title=title,
+                message=message,
+                priority='medium',
+                form_type=form_type,  # Add this so navigation works
+                form_id=None,  # No specific form ID for count notifications
+                extra_data=extra_data,
+                send_email=False  # Don't send emails for count notifications
+            )
+    
+    @staticmethod
+    def _pending_counts(user: User) -> Dict[str, int]:
+        """Current pending counts for a user, read from the materialized counters"""
+        from .models import PendingCounter
+        
+        counts = PendingCounter.counts_for(user)
+        if user.user_type in NotificationService.DOCUMENT_REQUEST_STAFF_TYPES:
+            counts['document_request'] = DocumentRequest.objects.filter(status='pending').count()
+        return counts
+    
     @staticmethod
     def update_pending_count_notification(user: User, form_type: str, signatory_type: str = None):
         """Create or update a pending count notification for a user"""
-        from .models import ClearanceSignatory, EnrollmentForm, GraduationForm, DocumentRequest
-        
         try:
-            # Calculate pending count based on form type and user role
-            pending_count = 0
-            
-            if form_type == 'clearance':
-                # For both signatories and admins, count pending clearances assigned to them
-                pending_count = ClearanceSignatory.objects.filter(
-                    signatory=user,
-                    status='pending',
-                    clearance__status='pending'
-                ).count()
-            
-            elif form_type in ['enrollment', 'graduation']:
-                # Count pending forms assigned to this specific user
-                if form_type == 'enrollment':
-                    from .models import EnrollmentSignatory
-                    pending_count = EnrollmentSignatory.objects.filter(
-                        signatory=user,
-                        status='pending',
-                        enrollment__status='pending'
-                    ).count()
-                else:
-                    from .models import GraduationSignatory
-                    pending_count = GraduationSignatory.objects.filter(
-                        signatory=user,
-                        status='pending',
-                        graduation__status='pending'
-                    ).count()
-            
-            elif form_type == 'document_request':
-                # Count pending document requests for admin/registrar/business_manager users
-                if user.user_type in ['admin', 'registrar', 'business_manager']:
-                    pending_count = DocumentRequest.objects.filter(
-                        status='pending'
-                    ).count()
-            
-            # Only create/update notification if there are pending forms
-            if pending_count > 0:
-                notification_type = f'pending_{form_type}_count'
-                
-                # Handle different form types for better messaging
-                if form_type == 'document_request':
-                    title = "Pending Document Requests"
-                    if pending_count == 1:
-                        message = f"You have {pending_count} newly submitted document request that needs processing."
-                    else:
-                        message = f"You have {pending_count} newly submitted document requests that need processing."
-                else:
-                    title = f"Pending {form_type.title()} Forms"
-                    if pending_count == 1:
-                        message = f"You have {pending_count} pending {form_type} form that needs your attention."
-                    else:
-                        message = f"You have {pending_count} pending {form_type} forms that need your attention."
-                
-                # Check if a similar notification already exists
-                from .models import Notification
-                existing_notification = Notification.objects.filter(
-                    user=user,
-                    notification_type=notification_type,
-                    is_read=False
-                ).first()
-                
-                if existing_notification:
-                    # Update existing notification
-                    existing_notification.title = title
-                    existing_notification.message = message
-                    existing_notification.form_type = form_type  # Ensure form_type is set
-                    existing_notification.updated_at = timezone.now()
-                    existing_notification.extra_data = {
-                        'pending_count': pending_count,
-                        'form_type': form_type,
-                        'signatory_type': signatory_type or 'admin'
-                    }
-                    existing_notification.save()
-                else:
-                    # Create new notification
-                    NotificationService.create_notification(
-                        user=user,
-                        notification_type=notification_type,
-                        title=title,
-                        message=message,
-                        priority='medium',
-                        form_type=form_type,  # Add this so navigation works
-                        form_id=None,  # No specific form ID for count notifications
-                        extra_data={
-                            'pending_count': pending_count,
-                            'form_type': form_type,
-                            'signatory_type': signatory_type or 'admin'
-                        },
-                        send_email=False  # Don't send emails for count notifications
-                    )
-            else:
-                # Remove any existing pending count notifications if count is 0
-                from .models import Notification
-                Notification.objects.filter(
-                    user=user,
-                    notification_type=f'pending_{form_type}_count',
-                    is_read=False
-                ).delete()
-                
+            pending_count = NotificationService._pending_counts(user).get(form_type, 0)
+            existing = Notification.objects.filter(
+                user=user,
+                notification_type=f'pending_{form_type}_count',
+                is_read=False
+            ).first()
+            NotificationService._apply_pending_count_notification(user, form_type, pending_count, existing, signatory_type)
         except Exception as e:
             logger.error(f"Error updating pending count notification: {str(e)}")
     
     @staticmethod
-    def refresh_all_pending_counts():
-        """Refresh pending count notifications for all relevant users"""
+    def sync_pending_count_notifications(user: User):
+        """
+        Render the user's "Pending X Forms" notifications from the materialized counters.
+        Called when the notification bell is opened; a few queries for this user only,
+        plus writes only for counts that changed since the last sync.
+        """
+        if user.user_type in ['student', 'alumni']:
+            return
         try:
-            # Get all signatory users
-            signatory_users = User.objects.filter(user_type='signatory').select_related('signatory_profile')
-            
-            for user in signatory_users:
-                if hasattr(user, 'signatory_profile'):
-                    signatory_type = user.signatory_profile.signatory_type
-                    NotificationService.update_pending_count_notification(
-                        user=user,
-                        form_type='clearance',
-                        signatory_type=signatory_type
-                    )
-            
-            # Get all admin users
-            admin_users = User.objects.filter(user_type='admin')
-            for user in admin_users:
-                NotificationService.update_pending_count_notification(
-                    user=user,
-                    form_type='clearance',
-                    signatory_type='admin'
-                )
-                
-            # Update for enrollment and graduation forms
-            business_managers = User.objects.filter(user_type='business_manager')
-            for user in business_managers:
-                NotificationService.update_pending_count_notification(
+            counts = NotificationService._pending_counts(user)
+            existing = {
+                notification.notification_type: notification
+                for notification in Notification.objects.filter(
                     user=user,
-                    form_type='enrollment'
+                    notification_type__in=[f'pending_{form_type}_count' for form_type in NotificationService.PENDING_COUNT_FORM_TYPES],
+                    is_read=False
                 )
-                NotificationService.update_pending_count_notification(
-                    user=user,
-                    form_type='graduation'
+            }
+            for form_type in NotificationService.PENDING_COUNT_FORM_TYPES:
+                NotificationService._apply_pending_count_notification(
+                    user, form_type, counts.get(form_type, 0), existing.get(f'pending_{form_type}_count')
                 )
-                
         except Exception as e:
-            logger.error(f"Error refreshing all pending counts: {str(e)}")
+            logger.error(f"Error syncing pending count notifications: {str(e)}")
     
     @staticmethod
-    def notify_form_submission(form_instance, form_type: str):
-        """Update pending form count notifications for relevant signatories"""
+    def refresh_all_pending_counts():
+        """
+        Rebuild the materialized pending counters from the signatory tables.
+        Counters are kept current incrementally, so this is only a repair tool
+        (see the recount_pending_counters management command).
+        """
+        from .models import PendingCounter
+        
         try:
-            if form_type == 'clearance':
-                # Update notifications for all signatory types for clearance
-                signatory_types = [
-                    'dorm_supervisor', 'canteen_concessionaire', 'library_director',
-                    'scholarship_director', 'it_director', 'student_affairs',
-                    'cashier', 'business_manager', 'registrar', 'academic_dean'
-                ]
-                
-                for signatory_type in signatory_types:
-                    signatories = User.objects.filter(
-                        user_type='signatory',
-                        signatory_profile__signatory_type=signatory_type
-                    )
-                    
-                    for signatory in signatories:
-                        NotificationService.update_pending_count_notification(
-                            user=signatory,
-                            form_type=form_type,
-                            signatory_type=signatory_type
-                        )
-                
-                # Also update notifications for admin users (registrars/admin) for clearance forms
-                admin_users = User.objects.filter(user_type='admin')
-                for admin_user in admin_users:
-                    NotificationService.update_pending_count_notification(
-                        user=admin_user,
-                        form_type=form_type,
-                        signatory_type='admin'
-                    )
-            
-            elif form_type in ['enrollment', 'graduation']:
-                # Define required signatory types based on form type
-                if form_type == 'enrollment':
-                    required_signatory_types = ['academic_dean', 'business_manager', 'registrar']
-                else:  # graduation
-                    required_signatory_types = ['academic_dean', 'business_manager', 'registrar', 'president']
-                
-                # Update notifications for each required signatory type
-                for signatory_type in required_signatory_types:
-                    if signatory_type == 'registrar':
-                        # For registrar, notify admin users
-                        users = User.objects.filter(user_type='admin')
-                        for user in users:
-                            NotificationService.update_pending_count_notification(
-                                user=user,
-                                form_type=form_type,
-                                signatory_type='admin'  # Admin users handle registrar role
-                            )
-                    else:
-                        # For other signatory types, find users with that signatory profile
-                        users = User.objects.filter(
-                            user_type='signatory',
-                            signatory_profile__signatory_type=signatory_type
-                        )
-                        for user in users:
-                            NotificationService.update_pending_count_notification(
-                                user=user,
-                                form_type=form_type,
-                                signatory_type=signatory_type
-                            )
-                
-                # Also notify business_manager user type (not just signatory profile)
-                business_manager_users = User.objects.filter(user_type='business_manager')
-                for user in business_manager_users:
-                    NotificationService.update_pending_count_notification(
-                        user=user,
-                        form_type=form_type,
-                        signatory_type='business_manager'
-                    )
-            
-            elif form_type == 'document_request':
-                # Update pending count notifications for admin/registrar/business_manager users
-                target_users = User.objects.filter(
-                    user_type__in=['admin', 'registrar', 'business_manager']
-                )
-                
-                for user in target_users:
-                    NotificationService.update_pending_count_notification(
-                        user=user,
-                        form_type='document_request',
-                        signatory_type='business_manager' if user.user_type == 'business_manager' else 'admin'
-                    )
-                    
+            PendingCounter.recount()
         except Exception as e:
-            logger.error(f"Error notifying form submission: {str(e)}")
+            logger.error(f"Error refreshing all pending counts: {str(e)}")
+    
+    @staticmethod
+    def notify_form_submission(form_instance, form_type: str):
+        """
+        Hook for new form submissions.
+        Signatory pending counts are already incremented as the form's signatory records
+        are created, and document request counts are read on demand, so a submission no
+        longer touches any staff account; each user's pending count notification is
+        rendered by sync_pending_count_notifications() when their bell is opened.
+        """
+        logger.debug(f"{form_type} submission {getattr(form_instance, 'id', None)} recorded in pending counters")
+    
+    @staticmethod
+    def _form_student(form_instance, form_type: str) -> Optional[User]:
+        """The student who owns a form"""
+        if form_type == 'clearance':
+            return form_instance.student
+        elif form_type in ['enrollment', 'graduation']:
+            return form_instance.user
+        elif form_type == 'document_request':
+            return form_instance.requester
+        return None
+    
+    @staticmethod
+    def _signatory_role_label(signatory_user: User) -> str:
+        """Human-readable role of the user who signed a form"""
+        if signatory_user.user_type == 'registrar':
+            return 'Registrar'
+        elif signatory_user.user_type == 'business_manager':
+            return 'Business Manager'
+        elif hasattr(signatory_user, 'signatory_profile') and signatory_user.signatory_profile:
+            return getattr(signatory_user.signatory_profile, 'get_signatory_type_display', lambda: 'Signatory')()
+        return signatory_user.user_type.replace('_', ' ').title()
+    
+    @staticmethod
+    def _form_approval_spec(form_instance, form_type: str, student: User, signatory_name: str, signatory_role: str, remarks: str) -> Dict[str, Any]:
+        message = f"Your {form_type} form has been approved by {signatory_name} ({signatory_role})."
+        if remarks:
+            message += f"\n\nRemarks: {remarks}"
+        
+        return {
+            'user': student,
+            'notification_type': 'form_approved',
+            'title': f"{form_type.title()} Form Approved",
+            'message': message,
+            'priority': 'high',
+            'form_type': form_type,
+            'form_id': str(form_instance.id),
+            'extra_data': {
+                'signatory_name': signatory_name,
+                'signatory_role': signatory_role,
+                'remarks': remarks
+            }
+        }
     
     @staticmethod
     def notify_form_approval(form_instance, form_type: str, signatory_user: User, remarks: str = ""):
         """Notify student about form approval"""
         try:
-            student = None
-            if form_type == 'clearance':
-                student = form_instance.student
-            elif form_type in ['enrollment', 'graduation']:
-                student = form_instance.user
-            elif form_type == 'document_request':
-                student = form_instance.requester
+            student = NotificationService._form_student(form_instance, form_type)
             
             if student:
-                signatory_name = signatory_user.full_name
-                # Get signatory role based on user type
-                if signatory_user.user_type == 'registrar':
-                    signatory_role = 'Registrar'
-                elif signatory_user.user_type == 'business_manager':
-                    signatory_role = 'Business Manager'
-                elif hasattr(signatory_user, 'signatory_profile') and signatory_user.signatory_profile:
-                    signatory_role = getattr(signatory_user.signatory_profile, 'get_signatory_type_display', lambda: 'Signatory')()
-                else:
-                    signatory_role = signatory_user.user_type.replace('_', ' ').title()
-                
-                message = f"Your {form_type} form has been approved by {signatory_name} ({signatory_role})."
-                if remarks:
-                    message += f"\n\nRemarks: {remarks}"
-                
-                NotificationService.create_notification(
-                    user=student,
-                    notification_type='form_approved',
-                    title=f"{form_type.title()} Form Approved",
-                    message=message,
-                    priority='high',
-                    form_type=form_type,
-                    form_id=str(form_instance.id),
-                    extra_data={
-                        'signatory_name': signatory_name,
-                        'signatory_role': signatory_role,
-                        'remarks': remarks
-                    }
-                )
-            
-            # Refresh pending count notifications for all users
-            try:
-                NotificationService.refresh_all_pending_counts()
-            except Exception as e:
-                logger.error(f"Error refreshing pending counts after approval: {str(e)}")
+                NotificationService.create_notification(**NotificationService._form_approval_spec(
+                    form_instance, form_type, student,
+                    signatory_user.full_name,
+                    NotificationService._signatory_role_label(signatory_user),
+                    remarks
+                ))
                 
         except Exception as e:
             logger.error(f"Error notifying form approval: {str(e)}")
     
+    @staticmethod
+    def notify_forms_approved(form_instances, form_type: str, signatory_user: User, remarks: str = ""):
+        """Batched notify_form_approval: one INSERT for all students"""
+        try:
+            signatory_name = signatory_user.full_name
+            signatory_role = NotificationService._signatory_role_label(signatory_user)
+            specs = []
+            for form_instance in form_instances:
+                student = NotificationService._form_student(form_instance, form_type)
+                if student:
+                    specs.append(NotificationService._form_approval_spec(
+                        form_instance, form_type, student, signatory_name, signatory_role, remarks
+                    ))
+            NotificationService.create_notifications_bulk(specs)
+                
+        except Exception as e:
+            logger.error(f"Error notifying bulk form approval: {str(e)}")
+    
     @staticmethod
     def notify_form_disapproval(form_instance, form_type: str, signatory_user: User, remarks: str, settlement_days: int = 7):
         """Notify student about form disapproval with settlement period"""
@@ -660,7 +644,51 @@ class NotificationService:
             logger.error(f"Error notifying graduation completion: {str(e)}")
     
     @staticmethod
-    def notify_admin_form_completed(form_type: str, student_name: str):
+    def notify_forms_completed(form_instances, form_type: str):
+        """
+        Batched completion notices for forms that just got all approvals: one INSERT for
+        the students, and for enrollment/graduation one admin summary update.
+        """
+        try:
+            completion_date = timezone.now().isoformat()
+            specs = []
+            for form_instance in form_instances:
+                student = NotificationService._form_student(form_instance, form_type)
+                if not student:
+                    continue
+                if form_type == 'clearance':
+                    notification_type = 'clearance_completed'
+                    clearance_type = form_instance.clearance_type or 'clearance'
+                    title = f"{clearance_type.title()} Clearance Completed"
+                    message = f"Congratulations! All signatories have approved your {clearance_type} clearance. "
+                    message += "Your clearance is now complete and ready for processing."
+                else:
+                    notification_type = f'{form_type}_completed'
+                    title = f"{form_type.title()} Form Completed"
+                    message = f"Congratulations! All required signatories have approved your {form_type} form. "
+                    message += f"Your {form_type} is now complete and ready for processing."
+                specs.append({
+                    'user': student,
+                    'notification_type': notification_type,
+                    'title': title,
+                    'message': message,
+                    'priority': 'high',
+                    'form_type': form_type,
+                    'form_id': str(form_instance.id),
+                    'extra_data': {'completion_date': completion_date}
+                })
+            NotificationService.create_notifications_bulk(specs)
+            
+            if form_type in ['enrollment', 'graduation'] and specs:
+                NotificationService.notify_admin_form_completed(
+                    form_type, specs[-1]['user'].full_name, count=len(specs)
+                )
+                
+        except Exception as e:
+            logger.error(f"Error notifying bulk {form_type} completion: {str(e)}")
+    
+    @staticmethod
+    def notify_admin_form_completed(form_type: str, student_name: str, count: int = 1):
         """Update bulk completed forms notification instead of individual notifications"""
         try:
             # Get all admin and registrar users
@@ -671,14 +699,15 @@ class NotificationService:
                 NotificationService.update_bulk_completed_notification(
                     user=admin_user,
                     form_type=form_type,
-                    student_name=student_name
+                    student_name=student_name,
+                    count=count
                 )
             
         except Exception as e:
             logger.error(f"Error notifying admin form completion: {str(e)}")
     
     @staticmethod
-    def update_bulk_completed_notification(user: User, form_type: str, student_name: str):
+    def update_bulk_completed_notification(user: User, form_type: str, student_name: str, count: int = 1):
         """Update bulk completed forms notification for admin users"""
         try:
             from datetime import timedelta
@@ -731,7 +760,7 @@ class NotificationService:
                 if existing_notification:
                     # Update the existing notification with the new count
                     current_count = existing_notification.extra_data.get('total_completed', 0)
-                    updated_count = current_count + 1  # Add this new completion
+                    updated_count = current_count + count  # Add the new completions
                     
                     if updated_count == 1:
                         title = f"1 {form_type} form completed"
@@ -752,8 +781,12 @@ class NotificationService:
                     existing_notification.save()
                 else:
                     # Create new bulk notification with proper form_type for redirection
-                    title = f"1 {form_type} form completed"
-                    message = f"1 {form_type} form has been completed and got all required approvals."
+                    if count == 1:
+                        title = f"1 {form_type} form completed"
+                        message = f"1 {form_type} form has been completed and got all required approvals."
+                    else:
+                        title = f"{count} {form_type} forms completed"
+                        message = f"{count} {form_type} forms have been completed and got all required approvals."
                     
                     NotificationService.create_notification(
                         user=user,
@@ -763,7 +796,7 @@ class NotificationService:
                         priority='medium',
                         form_type=form_type,  # Set form_type for proper redirection
                         extra_data={
-                            'total_completed': 1,
+                            'total_completed': count,
                             'latest_student': student_name,
                             'form_type': form_type,  # Store form type for redirection
                             'created_at': timezone.now().isoformat()
@@ -956,12 +989,6 @@ class NotificationService:
                 self._send_disapproval_email(student, form, form_type, disapproval_reasons, settlement_instructions, settlement_period, appointment_date)
             except Exception as e:
                 logger.error(f"Error sending disapproval email: {str(e)}")
-            
-            # Refresh pending count notifications for all users
-            try:
-                NotificationService.refresh_all_pending_counts()
-            except Exception as e:
-                logger.error(f"Error refreshing pending counts after disapproval: {str(e)}")
                 
         except Exception as e:
             logger.error(f"Error handling form disapproval: {str(e)}")
@@ -985,11 +1012,9 @@ class NotificationService:
             'signatory_role': 'Administrator'  # Default signatory role
         }
         
-        # Send simple email notification
+        # Queue simple email notification
         try:
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=f"""
+            body = f"""
 Dear {student.full_name},
 
 Your {form_type} form has been disapproved.
@@ -1005,19 +1030,22 @@ Please log in to your account to view detailed information and resubmit your for
 
 Best regards,
 Educational Institution System
-                """.strip(),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[student.email] if student.email else []
-            )
+                """.strip()
             
             if student.email:
-                email.send()
-                logger.info(f"Disapproval email sent successfully to {student.email}")
+                EmailOutbox.enqueue(
+                    user=student,
+                    email_type='form_disapproved',
+                    recipient_email=student.email,
+                    subject=subject,
+                    content=linebreaksbr(body)
+                )
+                logger.info(f"Disapproval email queued for {student.email}")
             else:
                 logger.warning(f"No email address found for student {student.username}")
                 
         except Exception as email_error:
-            logger.error(f"Failed to send disapproval email: {str(email_error)}")
+            logger.error(f"Failed to queue disapproval email: {str(email_error)}")
     
     @staticmethod
     def send_daily_digest():
@@ -1099,8 +1127,7 @@ Educational Institution System
             subject = template.email_subject.format(**digest_data)
             html_content = template.email_template.format(**digest_data)
             
-            # Create email log
-            email_log = EmailNotificationLog.objects.create(
+            EmailOutbox.enqueue(
                 user=user,
                 email_type='daily_digest',
                 recipient_email=user.email,
@@ -1108,22 +1135,7 @@ Educational Institution System
                 content=html_content
             )
             
-            # Send email
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=html_content,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email]
-            )
-            email.attach_alternative(html_content, "text/html")
-            email.send()
-            
-            # Update log
-            email_log.status = 'sent'
-            email_log.sent_at = timezone.now()
-            email_log.save()
-            
-            logger.info(f"Daily digest sent to {user.email}")
+            logger.info(f"Daily digest queued for {user.email}")
             return True
             
         except Exception as e:
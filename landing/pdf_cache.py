@@ -0,0 +1,243 @@
+"""
+On-disk cache of rendered form PDFs.
+
+A form PDF is a pure function of its template and the data it renders, so the
+rendered file is stored under MEDIA_ROOT keyed by a hash of (template name,
+template mtime, form id, form/signatory timestamps, rendered user fields).
+Any change to those inputs produces a new key, so stale files are never
+served; the previous render of the form is removed when the new one is
+written. The cache is bounded by PDF_RENDER_CACHE_MAX_BYTES with least
+recently used eviction (a hit refreshes the file's mtime).
+
+    path, hit = PdfRenderCache.get_or_render(key, form_type, form.id, render)
+
+Hit/miss/eviction counters are kept in the shared Django cache, so stats() is
+the same whichever process asks.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.template.loader import get_template
+
+from .models import ClearanceSignatory, EnrollmentSignatory, GraduationSignatory
+
+logger = logging.getLogger(__name__)
+
+# Bump when the PDF engine or its options change so old renders are not reused
+RENDER_VERSION = 1
+
+# Every PDF starts with this; the renderer's last-resort fallback returns the HTML instead
+PDF_SIGNATURE = b'%PDF'
+
+# Signatory rows whose changes show up on a form's PDF, by form type
+SIGNATORY_MODELS = {
+    'clearance': (ClearanceSignatory, 'clearance'),
+    'enrollment': (EnrollmentSignatory, 'enrollment'),
+    'graduation': (GraduationSignatory, 'graduation'),
+}
+
+
+class PdfRenderCache:
+    """Content-addressed store of rendered PDFs under MEDIA_ROOT"""
+
+    ROOT = os.path.join(settings.MEDIA_ROOT, getattr(settings, 'PDF_RENDER_CACHE_DIR', 'pdf_cache'))
+    MAX_BYTES = getattr(settings, 'PDF_RENDER_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+    # Eviction trims down to this share of MAX_BYTES so it does not run on every write
+    LOW_WATER = 0.9
+    STATS_PREFIX = 'pdf_render_cache'
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    @staticmethod
+    def make_key(template_name: str, form_type: str, form, user=None) -> str:
+        """Hash of everything the rendered PDF depends on"""
+        template_path = get_template(template_name).origin.name
+        parts = [
+            RENDER_VERSION,
+            template_name,
+            os.path.getmtime(template_path),
+            form_type,
+            form.id,
+            getattr(form, 'updated_at', None),
+            getattr(form, 'status', None),
+            getattr(form, 'finalized_at', None),
+        ]
+        if form_type in SIGNATORY_MODELS:
+            signatory_model, form_field = SIGNATORY_MODELS[form_type]
+            latest = signatory_model.objects.filter(**{form_field: form}).aggregate(
+                count=Count('id'), updated=Max('updated_at')
+            )
+            parts += [latest['count'], latest['updated']]
+        if user is not None:
+            parts += [user.full_name, user.email, user.contact_number]
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    @staticmethod
+    def _form_dir(form_type: str, form_id) -> str:
+        return os.path.join(PdfRenderCache.ROOT, form_type, str(form_id))
+
+    @staticmethod
+    def path_for(key: str, form_type: str, form_id) -> str:
+        return os.path.join(PdfRenderCache._form_dir(form_type, form_id), f'{key}.pdf')
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get(key: str, form_type: str, form_id) -> Optional[str]:
+        """Path of the cached PDF, or None on a miss"""
+        path = PdfRenderCache.path_for(key, form_type, form_id)
+        try:
+            with open(path, 'rb') as f:
+                is_pdf = f.read(len(PDF_SIGNATURE)) == PDF_SIGNATURE
+            if not is_pdf:
+                # A failed render stored before PDFs were checked: render it again
+                PdfRenderCache._remove(path)
+                raise FileNotFoundError(path)
+            # Refresh the mtime: eviction removes the least recently used files first
+            os.utime(path)
+        except FileNotFoundError:
+            PdfRenderCache._count('misses')
+            return None
+        PdfRenderCache._count('hits')
+        return path
+
+    @staticmethod
+    def put(key: str, form_type: str, form_id, content: bytes) -> str:
+        """Store a rendered PDF, replacing older renders of the same form; raises ValueError for anything but a PDF"""
+        if not content.startswith(PDF_SIGNATURE):
+            raise ValueError('PDF rendering failed: the output is not a PDF')
+        form_dir = PdfRenderCache._form_dir(form_type, form_id)
+        os.makedirs(form_dir, exist_ok=True)
+        path = PdfRenderCache.path_for(key, form_type, form_id)
+
+        # Write to a temporary file and rename so readers never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=form_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        for entry in os.scandir(form_dir):
+            if entry.path != path and entry.name.endswith('.pdf'):
+                PdfRenderCache._remove(entry.path)
+
+        PdfRenderCache.evict()
+        return path
+
+    @staticmethod
+    def get_or_render(key: str, form_type: str, form_id, render: Callable[[], bytes]) -> Tuple[str, bool]:
+        """Return (path, hit); on a miss, render() produces the PDF bytes to store"""
+        path = PdfRenderCache.get(key, form_type, form_id)
+        if path:
+            return path, True
+        content = render()
+        if not content:
+            raise ValueError('PDF rendering produced no output')
+        # put() refuses the HTML the renderer returns when every engine failed, so it is never served as a hit
+        return PdfRenderCache.put(key, form_type, form_id, content), False
+
+    # ------------------------------------------------------------------
+    # Invalidation and eviction
+    # ------------------------------------------------------------------
+    @staticmethod
+    def invalidate(form_type: Optional[str] = None, form_id=None):
+        """Drop the cached renders of one form, of one form type, or (no arguments) everything"""
+        if form_id is not None:
+            target = PdfRenderCache._form_dir(form_type, form_id)
+        elif form_type is not None:
+            target = os.path.join(PdfRenderCache.ROOT, form_type)
+        else:
+            target = PdfRenderCache.ROOT
+        shutil.rmtree(target, ignore_errors=True)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _entries():
+        """(mtime, size, path) for every cached PDF"""
+        entries = []
+        for dirpath, _, filenames in os.walk(PdfRenderCache.ROOT):
+            for name in filenames:
+                if not name.endswith('.pdf'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @staticmethod
+    def evict() -> int:
+        """Remove least recently used PDFs while the cache is over MAX_BYTES; returns files removed"""
+        entries = PdfRenderCache._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= PdfRenderCache.MAX_BYTES:
+            return 0
+
+        target = PdfRenderCache.MAX_BYTES * PdfRenderCache.LOW_WATER
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            PdfRenderCache._remove(path)
+            total -= size
+            removed += 1
+        if removed:
+            PdfRenderCache._count('evictions', removed)
+            logger.info(f"PDF render cache evicted {removed} files, {total} bytes left")
+        return removed
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _count(counter: str, amount: int = 1):
+        key = f'{PdfRenderCache.STATS_PREFIX}:{counter}'
+        try:
+            cache.add(key, 0, None)
+            cache.incr(key, amount)
+        except Exception as e:
+            # Stats must never break a download
+            logger.debug(f"Could not update PDF render cache stats: {e}")
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """Hit/miss/eviction counters plus the current size of the cache on disk"""
+        counters = cache.get_many([f'{PdfRenderCache.STATS_PREFIX}:{name}' for name in ('hits', 'misses', 'evictions')])
+        hits = counters.get(f'{PdfRenderCache.STATS_PREFIX}:hits', 0)
+        misses = counters.get(f'{PdfRenderCache.STATS_PREFIX}:misses', 0)
+        entries = PdfRenderCache._entries()
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 3) if hits + misses else None,
+            'evictions': counters.get(f'{PdfRenderCache.STATS_PREFIX}:evictions', 0),
+            'files': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': PdfRenderCache.MAX_BYTES,
+        }
+
+    @staticmethod
+    def reset_stats():
+        cache.delete_many([f'{PdfRenderCache.STATS_PREFIX}:{name}' for name in ('hits', 'misses', 'evictions')])
@@ -0,0 +1,637 @@
+"""
+PDF rendering service.
+
+HTML is converted to PDF by a pool of long-lived worker processes that import
+xhtml2pdf/ReportLab, load fonts and build the ReportLab styles once at start
+(warm), then take jobs from a local queue. Renders therefore run next to the
+web workers instead of on their request threads, scale with the number of
+cores, and each job is bounded by a timeout and a per-process memory limit.
+A worker that times out, runs out of memory or dies is replaced.
+
+    pdf_bytes = render_pdf(html_content)
+
+The pool lives in a standalone service (`python manage.py run_pdf_service`,
+reached over PDF_RENDER_SERVICE_ADDRESS) shared by every web process on the
+machine. Without a service, or while it is down, renders run in the calling
+process, on its own pool only when PDF_RENDER_WORKERS is set explicitly
+(0 renders on the calling thread). A render that finds every worker busy for
+PDF_RENDER_QUEUE_WAIT_SECONDS also runs in-process rather than queue up.
+"""
+
+import atexit
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from functools import lru_cache
+from multiprocessing.connection import Client, Listener
+from typing import Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# None: one worker per core in run_pdf_service and no pool in the web processes
+CONFIGURED_WORKERS = getattr(settings, 'PDF_RENDER_WORKERS', None)
+WORKERS = CONFIGURED_WORKERS if CONFIGURED_WORKERS is not None else (os.cpu_count() or 1)
+TIMEOUT_SECONDS = getattr(settings, 'PDF_RENDER_TIMEOUT_SECONDS', 120)
+MEMORY_LIMIT_MB = getattr(settings, 'PDF_RENDER_MEMORY_LIMIT_MB', 1024)
+# Workers are recycled after this many jobs so slow leaks in the PDF libraries cannot pile up
+MAX_JOBS_PER_WORKER = getattr(settings, 'PDF_RENDER_MAX_JOBS_PER_WORKER', 200)
+# Longest wait for an idle worker before rendering in-process instead
+QUEUE_WAIT_SECONDS = getattr(settings, 'PDF_RENDER_QUEUE_WAIT_SECONDS', 10)
+# 'host:port' or a Unix socket path; None renders in the web processes
+SERVICE_ADDRESS = getattr(settings, 'PDF_RENDER_SERVICE_ADDRESS', None)
+# Interpreter the workers are spawned with; None finds the one this process runs on
+PYTHON_EXECUTABLE = getattr(settings, 'PDF_RENDER_PYTHON_EXECUTABLE', None)
+
+WARM_UP_HTML = '<html><body><p>PDF worker warm-up</p><table><tr><td>1</td></tr></table></body></html>'
+
+
+# ----------------------------------------------------------------------
+# Rendering engine (runs inside the workers)
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _reportlab_styles() -> Dict:
+    """Paragraph styles of the ReportLab fallback, built once per process"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    return {
+        'normal': styles['Normal'],
+        # Professional academic styles
+        'letterhead': ParagraphStyle(
+            'LetterheadTitle',
+            parent=styles['Title'],
+            fontSize=18,
+            spaceAfter=8,
+            alignment=1,  # Center
+            textColor=colors.HexColor('#1a365d'),
+            fontName='Times-Bold',
+            letterSpacing=1
+        ),
+        'institution_subtitle': ParagraphStyle(
+            'InstitutionSubtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            spaceAfter=6,
+            alignment=1,  # Center
+            textColor=colors.HexColor('#2c5aa0'),
+            fontName='Times-Italic'
+        ),
+        'office': ParagraphStyle(
+            'OfficeStyle',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=20,
+            alignment=1,  # Center
+            textColor=colors.HexColor('#666666'),
+            fontName='Times-Roman'
+        ),
+        'title': ParagraphStyle(
+            'DocumentTitle',
+            parent=styles['Title'],
+            fontSize=16,
+            spaceAfter=12,
+            alignment=1,  # Center
+            textColor=colors.HexColor('#1a365d'),
+            fontName='Times-Bold',
+            letterSpacing=0.5
+        ),
+        'metadata_value': ParagraphStyle(
+            'MetadataValue',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=4,
+            textColor=colors.HexColor('#1a1a1a'),
+            fontName='Times-Roman'
+        ),
+        'table_title': ParagraphStyle(
+            'TableTitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            fontName='Times-Bold',
+            textColor=colors.HexColor('#1a365d'),
+            alignment=1,
+            spaceAfter=10
+        ),
+        'no_data': ParagraphStyle(
+            'NoData',
+            parent=styles['Normal'],
+            fontSize=14,
+            alignment=1,
+            textColor=colors.HexColor('#4a5568'),
+            spaceAfter=10
+        ),
+        'signature': ParagraphStyle(
+            'Signature',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#666666'),
+            alignment=2,  # Right align
+            topSpace=5
+        ),
+    }
+
+
+def _render_with_reportlab(html_content: str) -> bytes:
+    """Rebuild the report's letterhead, metadata and data table with ReportLab (limited styling)"""
+    import re
+    from html import unescape
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import HRFlowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    styles = _reportlab_styles()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=20*72/25.4, bottomMargin=25*72/25.4, leftMargin=20*72/25.4, rightMargin=20*72/25.4)
+    story = []
+
+    # Add institutional letterhead
+    story.append(Paragraph("PHILIPPINE THEOLOGICAL SEMINARY", styles['letterhead']))
+    story.append(Paragraph("Academic Excellence in Christian Education", styles['institution_subtitle']))
+    story.append(Paragraph("Office of the Registrar - Student Records Management", styles['office']))
+
+    # Add separator line
+    story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#1a365d')))
+    story.append(Spacer(1, 20))
+
+    # Extract and add document title
+    title_match = re.search(r'<div[^>]*class="document-title"[^>]*>([^<]+)</div>', html_content, re.IGNORECASE)
+    if title_match:
+        story.append(Paragraph(title_match.group(1).strip().upper(), styles['title']))
+    else:
+        story.append(Paragraph("STUDENT RECORDS ACTIVITY REPORT", styles['title']))
+
+    story.append(Paragraph("Official Academic Document", styles['metadata_value']))
+    story.append(Spacer(1, 20))
+
+    # Extract and add metadata in professional format
+    metadata = []
+    for label in ('Generated On:', 'Generated By:', 'Report Period:', 'Total Records:'):
+        match = re.search(label + r'</div>.*?<div[^>]*class="metadata-value"[^>]*>([^<]+)</div>', html_content, re.DOTALL | re.IGNORECASE)
+        if match:
+            metadata.append([label, match.group(1).strip()])
+
+    if metadata:
+        metadata_table = Table(metadata, colWidths=[2*inch, 4*inch])
+        metadata_table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), 'Times-Bold'),
+            ('FONTNAME', (1, 0), (1, -1), 'Times-Roman'),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a365d')),
+            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1a1a1a')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ]))
+        story.append(metadata_table)
+
+    story.append(Spacer(1, 25))
+
+    # Extract table data
+    table_match = re.search(r'<table[^>]*class="data-table"[^>]*>(.*?)</table>', html_content, re.DOTALL | re.IGNORECASE)
+    if table_match:
+        table_html = table_match.group(1)
+
+        # Extract headers
+        header_match = re.search(r'<thead[^>]*>(.*?)</thead>', table_html, re.DOTALL | re.IGNORECASE)
+        if header_match:
+            headers = re.findall(r'<th[^>]*>([^<]+)</th>', header_match.group(1), re.IGNORECASE)
+            headers = [unescape(h.strip()) for h in headers]
+        else:
+            headers = ['Date & Time', 'Reference/ID', 'Requester/Student', 'Program/Dept', 'Status', 'Signatory']
+
+        # Extract rows
+        tbody_match = re.search(r'<tbody[^>]*>(.*?)</tbody>', table_html, re.DOTALL | re.IGNORECASE)
+        if tbody_match:
+            rows = re.findall(r'<tr[^>]*>(.*?)</tr>', tbody_match.group(1), re.DOTALL | re.IGNORECASE)
+
+            table_data = [headers]
+            for row_html in rows:
+                clean_cells = []
+                for cell in re.findall(r'<td[^>]*>(.*?)</td>', row_html, re.DOTALL | re.IGNORECASE):
+                    # Clean cell content
+                    clean_cell = re.sub(r'<span[^>]*class="status-pill[^>]*>([^<]+)</span>', r'\1', cell)
+                    clean_cell = re.sub(r'<[^>]+>', ' ', clean_cell)
+                    clean_cells.append(unescape(clean_cell).strip())
+                if clean_cells:
+                    table_data.append(clean_cells)
+
+            if len(table_data) > 1:  # Has data beyond headers
+                story.append(Paragraph("Student Activity Records", styles['table_title']))
+
+                # Create professional academic table with fixed column widths
+                col_widths = [1.3*inch, 0.9*inch, 1.8*inch, 1.1*inch, 0.9*inch, 1.3*inch]
+                table = Table(table_data, colWidths=col_widths, repeatRows=1)
+                table.setStyle(TableStyle([
+                    # Header styling - Academic blue
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 9),
+                    ('ALIGN', (0, 0), (-1, 0), 'LEFT'),
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+
+                    # Data styling
+                    ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
+                    ('FONTSIZE', (0, 1), (-1, -1), 9),
+
+                    # Grid lines
+                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#d0d7de')),
+                    ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1a365d')),
+
+                    # Alternating row colors
+                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
+
+                    # Professional padding
+                    ('TOPPADDING', (0, 0), (-1, -1), 8),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+                    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+
+                    # Center alignment for specific columns
+                    ('ALIGN', (1, 1), (1, -1), 'CENTER'),  # Reference ID
+                    ('ALIGN', (4, 1), (4, -1), 'CENTER'),  # Status
+                ]))
+                story.append(table)
+            else:
+                # No data message
+                story.append(Paragraph("No records found", styles['no_data']))
+                story.append(Paragraph("No data was found for the specified criteria and date range.", styles['normal']))
+
+    # Add signature section
+    story.append(Spacer(1, 40))
+    signature_line = HRFlowable(width=3.5*inch, thickness=1, color=colors.HexColor('#1a365d'))
+    signature_line.hAlign = 'RIGHT'
+    story.append(signature_line)
+    story.append(Paragraph("Registrar / Authorized Official", styles['signature']))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def render_in_process(html_content: str) -> bytes:
+    """Convert HTML to PDF in this process: xhtml2pdf first, ReportLab fallback, raw HTML as last resort"""
+    # Try xhtml2pdf FIRST - Works reliably on Windows and preserves styling
+    try:
+        from xhtml2pdf import pisa
+
+        pdf_buffer = io.BytesIO()
+        pisa_status = pisa.CreatePDF(html_content, dest=pdf_buffer)
+        if not pisa_status.err:
+            return pdf_buffer.getvalue()
+        raise Exception(f"xhtml2pdf conversion failed with {pisa_status.err} errors")
+
+    except MemoryError:
+        raise
+    except (ImportError, Exception) as e:
+        logger.warning(f"xhtml2pdf failed: {e}, trying ReportLab fallback")
+        try:
+            pdf = _render_with_reportlab(html_content)
+            logger.info("PDF generated using ReportLab with enhanced styling")
+            return pdf
+        except MemoryError:
+            raise
+        except Exception as fallback_error:
+            logger.error(f"ReportLab fallback failed: {fallback_error}")
+            # Final fallback - return HTML as bytes
+            logger.warning("All PDF engines failed, returning HTML content as bytes")
+            return html_content.encode('utf-8')
+
+
+def warm_up():
+    """Load the PDF libraries, fonts and styles so the first real job is as fast as the rest"""
+    try:
+        import xhtml2pdf.pisa  # noqa: F401
+    except ImportError:
+        pass
+    try:
+        _reportlab_styles()
+    except ImportError:
+        pass
+    render_in_process(WARM_UP_HTML)
+
+
+def _worker_main(conn, memory_limit_mb: Optional[int]):
+    """Worker process loop: render each HTML document received on conn and send back the result"""
+    if memory_limit_mb:
+        try:
+            import resource
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            # Not available on this platform (e.g. Windows); the timeout still applies
+            logger.warning(f"PDF worker running without a memory limit: {e}")
+    warm_up()
+    conn.send(('ready', None))
+
+    while True:
+        try:
+            html_content = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if html_content is None:
+            break
+        try:
+            conn.send(('ok', render_in_process(html_content)))
+        except MemoryError:
+            try:
+                conn.send(('memory', f'PDF render exceeded the {memory_limit_mb} MB memory limit'))
+            except (MemoryError, OSError):
+                # Too little memory left even to reply; the pool sees the worker exit instead
+                pass
+            # The heap may be fragmented past the limit; let the pool start a fresh worker
+            break
+        except Exception as e:
+            conn.send(('error', str(e) or e.__class__.__name__))
+
+
+# ----------------------------------------------------------------------
+# Worker pool
+# ----------------------------------------------------------------------
+class PoolBusy(RuntimeError):
+    """No worker became idle within the queue wait"""
+
+
+def _python_executable() -> str:
+    """
+    A Python interpreter to spawn workers with. Under uWSGI (and other embedded
+    interpreters) sys.executable is the server binary, which cannot run a worker.
+    """
+    if PYTHON_EXECUTABLE:
+        return PYTHON_EXECUTABLE
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+    candidates = (
+        os.path.join(sys.exec_prefix, 'bin', f'python{sys.version_info.major}.{sys.version_info.minor}'),
+        os.path.join(sys.exec_prefix, 'bin', 'python3'),
+        os.path.join(sys.exec_prefix, 'bin', 'python'),
+        os.path.join(sys.exec_prefix, 'Scripts', 'python.exe'),
+        os.path.join(sys.exec_prefix, 'python.exe'),
+    )
+    for candidate in candidates:
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    logger.warning(f"No Python interpreter found under {sys.exec_prefix}; spawning PDF workers with {sys.executable}")
+    return sys.executable
+
+
+class _Worker:
+    def __init__(self, context, memory_limit_mb):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, memory_limit_mb), name='pdf-render-worker', daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.ready = False
+
+    def wait_ready(self, timeout):
+        if not self.ready:
+            if not self.conn.poll(timeout):
+                raise TimeoutError('PDF worker did not start in time')
+            self.conn.recv()
+            self.ready = True
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        self.process.join(5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(5)
+        self.conn.close()
+
+
+class PdfWorkerPool:
+    """A fixed number of warm worker processes; render() waits for an idle one"""
+
+    def __init__(
+        self,
+        size: int = WORKERS,
+        timeout: float = TIMEOUT_SECONDS,
+        memory_limit_mb: Optional[int] = MEMORY_LIMIT_MB,
+        max_jobs_per_worker: int = MAX_JOBS_PER_WORKER
+    ):
+        self.size = max(int(size), 1)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_jobs_per_worker = max_jobs_per_worker
+        # spawn, not fork: web servers are multi-threaded and forking them is unsafe
+        self._context = multiprocessing.get_context('spawn')
+        self._context.set_executable(_python_executable())
+        self._idle = queue.Queue()
+        self._closed = False
+        self.stats = {'jobs': 0, 'errors': 0, 'timeouts': 0, 'restarts': 0}
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._context, self.memory_limit_mb)
+
+    def _replace(self, worker: _Worker, kill: bool) -> _Worker:
+        worker.stop(kill=kill)
+        self.stats['restarts'] += 1
+        return self._spawn()
+
+    def render(self, html_content: str, timeout: Optional[float] = None, wait: float = QUEUE_WAIT_SECONDS) -> bytes:
+        """
+        Render on the next idle worker; raises PoolBusy when none is idle within wait
+        seconds, and TimeoutError, MemoryError or RuntimeError when the render fails.
+        """
+        if self._closed:
+            raise RuntimeError('PDF worker pool is closed')
+        timeout = timeout or self.timeout
+        try:
+            worker = self._idle.get(timeout=wait)
+        except queue.Empty:
+            raise PoolBusy(f'No PDF worker became idle within {wait}s')
+        if not worker.process.is_alive():
+            # Died while idle (e.g. OOM killer); start a fresh one before sending work
+            worker = self._replace(worker, kill=True)
+        try:
+            worker.wait_ready(timeout)
+            worker.conn.send(html_content)
+            if not worker.conn.poll(timeout):
+                self.stats['timeouts'] += 1
+                worker = self._replace(worker, kill=True)
+                raise TimeoutError(f'PDF render did not finish within {timeout}s')
+            try:
+                status, payload = worker.conn.recv()
+            except EOFError:
+                worker = self._replace(worker, kill=True)
+                raise RuntimeError('PDF worker exited while rendering')
+
+            self.stats['jobs'] += 1
+            worker.jobs += 1
+            if status == 'memory':
+                worker = self._replace(worker, kill=False)
+                raise MemoryError(payload)
+            if worker.jobs >= self.max_jobs_per_worker:
+                worker = self._replace(worker, kill=False)
+            if status != 'ok':
+                raise RuntimeError(payload)
+            return payload
+        except (TimeoutError, MemoryError, RuntimeError):
+            self.stats['errors'] += 1
+            raise
+        except (OSError, EOFError) as e:
+            # Broken pipe to a dead worker
+            self.stats['errors'] += 1
+            worker = self._replace(worker, kill=True)
+            raise RuntimeError(f'PDF worker failed: {e}')
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+# ----------------------------------------------------------------------
+# Standalone service
+# ----------------------------------------------------------------------
+def _parse_address(address):
+    if isinstance(address, str) and ':' in address and not address.startswith('/'):
+        host, port = address.rsplit(':', 1)
+        return host, int(port)
+    return address
+
+
+def _authkey() -> bytes:
+    return hashlib.sha256(f'pdf-render-service:{settings.SECRET_KEY}'.encode()).digest()
+
+
+class PdfRenderService:
+    """Serves a PdfWorkerPool to every web process on the machine over a local socket"""
+
+    def __init__(self, address=SERVICE_ADDRESS, pool: Optional[PdfWorkerPool] = None):
+        self.address = _parse_address(address)
+        self.pool = pool or PdfWorkerPool()
+
+    def _handle(self, conn):
+        with conn:
+            while True:
+                try:
+                    html_content, timeout = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    result = ('ok', self.pool.render(html_content, timeout))
+                except PoolBusy as e:
+                    result = ('busy', str(e))
+                except TimeoutError as e:
+                    result = ('timeout', str(e))
+                except MemoryError as e:
+                    result = ('memory', str(e))
+                except Exception as e:
+                    result = ('error', str(e))
+                try:
+                    conn.send(result)
+                except OSError:
+                    return
+
+    def serve_forever(self):
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.remove(self.address)
+        with Listener(self.address, authkey=_authkey()) as listener:
+            logger.info(f"PDF render service listening on {self.address} with {self.pool.size} workers")
+            while True:
+                try:
+                    conn = listener.accept()
+                except OSError as e:
+                    # Failed handshake (wrong authkey, client went away); keep serving
+                    logger.warning(f"PDF render service rejected a connection: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+
+# ----------------------------------------------------------------------
+# Client
+# ----------------------------------------------------------------------
+_local_pool: Optional[PdfWorkerPool] = None
+_local_pool_lock = threading.Lock()
+_service_down_logged = False
+
+
+def _get_local_pool() -> PdfWorkerPool:
+    global _local_pool
+    if _local_pool is None:
+        with _local_pool_lock:
+            if _local_pool is None:
+                _local_pool = PdfWorkerPool()
+                atexit.register(_local_pool.close)
+    return _local_pool
+
+
+def _render_via_service(html_content: str, timeout: float) -> Optional[bytes]:
+    """Render on the standalone service; None when it is not reachable"""
+    global _service_down_logged
+    try:
+        conn = Client(_parse_address(SERVICE_ADDRESS), authkey=_authkey())
+    except OSError as e:
+        if not _service_down_logged:
+            logger.warning(f"PDF render service at {SERVICE_ADDRESS} is unreachable ({e}); rendering with a local pool")
+            _service_down_logged = True
+        return None
+    _service_down_logged = False
+    with conn:
+        conn.send((html_content, timeout))
+        status, payload = conn.recv()
+    if status == 'ok':
+        return payload
+    if status == 'busy':
+        raise PoolBusy(payload)
+    if status == 'timeout':
+        raise TimeoutError(payload)
+    if status == 'memory':
+        raise MemoryError(payload)
+    raise RuntimeError(payload)
+
+
+def _uses_local_pool() -> bool:
+    return bool(CONFIGURED_WORKERS and CONFIGURED_WORKERS > 0)
+
+
+def render_pdf(html_content: str, timeout: Optional[float] = None) -> bytes:
+    """Convert HTML to PDF on the warm worker pool, or in-process when there is none or it is busy"""
+    if CONFIGURED_WORKERS is not None and CONFIGURED_WORKERS <= 0:
+        return render_in_process(html_content)
+    timeout = timeout or TIMEOUT_SECONDS
+    try:
+        if SERVICE_ADDRESS:
+            pdf = _render_via_service(html_content, timeout)
+            if pdf is not None:
+                return pdf
+        if _uses_local_pool():
+            return _get_local_pool().render(html_content, timeout)
+    except PoolBusy as e:
+        logger.warning(f"{e}; rendering in-process")
+    return render_in_process(html_content)
+
+
+def concurrency() -> int:
+    """How many renders can usefully be submitted at once"""
+    if SERVICE_ADDRESS or _uses_local_pool():
+        return max(WORKERS, 1)
+    return 1
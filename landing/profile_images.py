@@ -0,0 +1,188 @@
+"""
+Resized profile picture variants.
+
+An upload keeps its original file; a save that changes profile_picture marks the
+profile 'pending' (landing/signals.py) and `python manage.py process_profile_pictures`
+(cron or --loop) or the Celery task writes one square JPEG per PROFILE_PICTURE_VARIANTS
+entry and records their paths and dimensions on the profile:
+
+    profile.profile_picture_thumbnail_url  # 'small', for lists and chat avatars
+    profile.profile_picture_url            # 'medium', for profile pages
+
+Variant paths are derived from the profile and the original file name, so processing
+the same upload twice (two workers, a requeue) rewrites the same files.
+"""
+
+import hashlib
+import logging
+from io import BytesIO
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from .models import (
+    AlumniProfile, BusinessManagerProfile, RegistrarProfile, SignatoryProfile, StudentProfile
+)
+
+logger = logging.getLogger(__name__)
+
+# variant -> edge of the square image in pixels
+VARIANTS = getattr(settings, 'PROFILE_PICTURE_VARIANTS', {'small': 64, 'medium': 256})
+JPEG_QUALITY = getattr(settings, 'PROFILE_PICTURE_JPEG_QUALITY', 85)
+VARIANT_DIR = 'profile_pics/variants'
+
+PROFILE_MODELS = (StudentProfile, AlumniProfile, SignatoryProfile, RegistrarProfile, BusinessManagerProfile)
+
+
+class ProfilePictureService:
+    """Queues and writes the resized variants of profile pictures"""
+
+    # Hand new uploads to Celery as soon as they are saved (otherwise process_profile_pictures picks them up)
+    USE_CELERY = getattr(settings, 'PROFILE_PICTURES_USE_CELERY', False)
+
+    # ------------------------------------------------------------------
+    # Queueing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def queue(profile):
+        """Mark a profile whose picture changed for processing; its old variants are replaced once that is done"""
+        if profile.profile_picture:
+            update = {'profile_picture_status': 'pending'}
+            transaction.on_commit(lambda: ProfilePictureService.dispatch(profile))
+        else:
+            # Picture removed: nothing to process, drop the variants now
+            update = {'profile_picture_status': '', 'profile_picture_variants': {}}
+            old_names = ProfilePictureService._variant_names(profile.profile_picture_variants)
+            storage = profile.profile_picture.storage
+            transaction.on_commit(lambda: ProfilePictureService._delete_files(storage, old_names))
+        type(profile).objects.filter(pk=profile.pk).update(**update)
+        for field, value in update.items():
+            setattr(profile, field, value)
+
+    @staticmethod
+    def dispatch(profile):
+        """Process the picture on Celery when it is enabled; process_profile_pictures picks it up otherwise"""
+        if not ProfilePictureService.USE_CELERY:
+            return
+        try:
+            from .tasks import process_profile_pictures_task
+            process_profile_pictures_task.delay(profile._meta.label, str(profile.pk))
+        except Exception as e:
+            logger.error(f"Could not dispatch profile picture {profile._meta.label} {profile.pk} to Celery: {str(e)}")
+
+    @staticmethod
+    def requeue_all() -> int:
+        """Mark every profile with a picture for processing again, e.g. after changing the variant sizes"""
+        return sum(
+            model.objects.exclude(profile_picture='').exclude(profile_picture__isnull=True)
+            .update(profile_picture_status='pending')
+            for model in PROFILE_MODELS
+        )
+
+    # ------------------------------------------------------------------
+    # Processing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def process_pending(max_items: Optional[int] = None) -> Dict[str, int]:
+        """Process the pending pictures of every profile model; returns {new status: profiles}"""
+        stats = {'ready': 0, 'missing': 0, 'failed': 0}
+        for model in PROFILE_MODELS:
+            pending = model.objects.filter(profile_picture_status='pending').order_by().values_list('pk', flat=True)
+            for pk in list(pending):
+                if max_items is not None and sum(stats.values()) >= max_items:
+                    return stats
+                status = ProfilePictureService.process(model, pk)
+                if status:
+                    stats[status] += 1
+        return stats
+
+    @staticmethod
+    def process(model, pk) -> Optional[str]:
+        """
+        Write the variants of one pending profile picture. Returns the new status, or
+        None when the profile is no longer pending or its picture changed meanwhile.
+        """
+        row = model.objects.filter(pk=pk, profile_picture_status='pending').values(
+            'profile_picture', 'profile_picture_variants'
+        ).first()
+        if row is None:
+            return None
+        name = row['profile_picture']
+        storage = model._meta.get_field('profile_picture').storage
+        old_names = ProfilePictureService._variant_names(row['profile_picture_variants'])
+
+        variants = {}
+        if not name or not storage.exists(name):
+            status = 'missing'
+        else:
+            try:
+                with storage.open(name, 'rb') as source:
+                    contents = ProfilePictureService.render(source)
+            except Exception as e:
+                logger.warning(f"Could not resize profile picture {name} of {model._meta.label} {pk}: {str(e)}")
+                status = 'failed'
+            else:
+                for variant, (content, width, height) in contents.items():
+                    path = ProfilePictureService.variant_path(model, pk, name, variant)
+                    # Same path for the same upload: overwrite rather than let the storage pick a new name
+                    storage.delete(path)
+                    variants[variant] = {'name': storage.save(path, ContentFile(content)), 'width': width, 'height': height}
+                status = 'ready'
+
+        new_names = ProfilePictureService._variant_names(variants)
+        updated = model.objects.filter(pk=pk, profile_picture=name).update(
+            profile_picture_status=status, profile_picture_variants=variants
+        )
+        if not updated:
+            # A new picture was uploaded (or the profile deleted) while this one was resized
+            ProfilePictureService._delete_files(storage, new_names)
+            return None
+        ProfilePictureService._delete_files(storage, old_names - new_names)
+        return status
+
+    @staticmethod
+    def render(source) -> Dict[str, tuple]:
+        """{variant: (jpeg bytes, width, height)} for an image file"""
+        image = Image.open(source)
+        largest = max(VARIANTS.values())
+        # Let the JPEG decoder scale down while decoding, which is much cheaper for camera photos
+        image.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        else:
+            image = image.convert('RGB')
+
+        edge = min(image.size)
+        square = ImageOps.fit(image, (edge, edge), method=Image.Resampling.LANCZOS)
+        contents = {}
+        for variant, size in VARIANTS.items():
+            resized = square.copy()
+            resized.thumbnail((size, size), Image.Resampling.LANCZOS)  # never scaled up
+            buffer = BytesIO()
+            resized.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+            contents[variant] = (buffer.getvalue(), resized.width, resized.height)
+        return contents
+
+    @staticmethod
+    def variant_path(model, pk, name: str, variant: str) -> str:
+        digest = hashlib.sha1(name.encode()).hexdigest()[:12]
+        return f"{VARIANT_DIR}/{model._meta.model_name}/{pk}-{digest}-{variant}.jpg"
+
+    @staticmethod
+    def _variant_names(variants) -> set:
+        return {stored['name'] for stored in (variants or {}).values() if stored.get('name')}
+
+    @staticmethod
+    def _delete_files(storage, names):
+        for name in names:
+            try:
+                storage.delete(name)
+            except Exception as e:
+                logger.warning(f"Could not delete profile picture variant {name}: {str(e)}")
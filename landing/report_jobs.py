@@ -0,0 +1,480 @@
+"""
+Background report generation built on GeneratedReport.
+Request handlers only enqueue a GeneratedReport row with status 'pending' and
+the job's inputs in `parameters`; a worker (the run_report_jobs management
+command or the Celery task) claims it, moves it to 'generating', records
+progress as it goes and finishes it as 'completed' (file attached) or 'failed'.
+Clients poll the progress endpoint and fetch the file from the existing
+download views.
+
+Signatory packs render every signatory's HTML in the worker and hand all the
+documents to the PDF rendering workers (landing/pdf_service.py) at once, so a
+pack takes roughly as long as its slowest signatory instead of the sum of all
+of them.
+"""
+
+import hashlib
+import io
+import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from . import pdf_service
+from .activity_rollups import local_day_range
+from .models import BusinessManagerActivityLog, GeneratedReport, SignatoryActivityLog, User
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('pending', 'generating')
+
+FORM_REPORT_TYPES = ['clearance', 'enrollment', 'graduation', 'document_release']
+
+# Manual report filter -> activity log action_type (see the 'action_type' job parameter)
+ACTION_TYPE_BY_REPORT = {
+    'approved_forms': 'approve',
+    'disapproved_forms': 'disapprove',
+    'pending_forms': 'view',
+}
+
+
+def _parse_date(value: Optional[str]):
+    return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+
+
+class ReportJobQueue:
+    """Queue, run and track background report jobs"""
+
+    # How long a worker may hold a 'generating' job before another worker can pick it up again
+    CLAIM_TIMEOUT_SECONDS = getattr(settings, 'REPORT_JOBS_CLAIM_TIMEOUT_SECONDS', 1800)
+    # Hand new jobs to Celery as soon as they are queued (otherwise run_report_jobs picks them up)
+    USE_CELERY = getattr(settings, 'REPORT_JOBS_USE_CELERY', False)
+
+    # ------------------------------------------------------------------
+    # Queueing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def enqueue(
+        report_type: str,
+        user: User,
+        parameters: Dict[str, Any],
+        period_start=None,
+        period_end=None
+    ) -> GeneratedReport:
+        """
+        Queue a report and return its job row.
+
+        A job that is already queued or running for the same report is returned as is:
+        callers should compare job.parameters with what they asked for. Report types
+        that are unique per period reuse the period's finished row, so regenerating
+        replaces the previous file.
+        """
+        with transaction.atomic():
+            existing = GeneratedReport.objects.select_for_update().filter(
+                report_type=report_type, period_start=period_start, period_end=period_end
+            )
+            per_user = report_type in GeneratedReport.PER_USER_REPORT_TYPES or period_start is None or period_end is None
+            if per_user:
+                existing = existing.filter(generated_by=user, status__in=ACTIVE_STATUSES)
+            jobs = list(existing.order_by('-created_at'))
+
+            for job in jobs:
+                if job.status in ACTIVE_STATUSES and (job.parameters == parameters or not per_user):
+                    return job
+
+            if jobs and not per_user:
+                job = jobs[0]
+                old_file = job.file.name if job.file else None
+                job.generated_by = user
+                job.parameters = parameters
+                job.status = 'pending'
+                job.file = None
+                job.size_bytes = 0
+                job.checksum = None
+                job.notes = None
+                job.error = None
+                job.progress_done = 0
+                job.progress_total = 0
+                job.started_at = None
+                job.finished_at = None
+                job.save()
+                if old_file:
+                    storage = GeneratedReport._meta.get_field('file').storage
+                    transaction.on_commit(lambda: storage.delete(old_file))
+            else:
+                try:
+                    with transaction.atomic():
+                        job = GeneratedReport.objects.create(
+                            report_type=report_type,
+                            generated_by=user,
+                            period_start=period_start,
+                            period_end=period_end,
+                            parameters=parameters,
+                            status='pending'
+                        )
+                except IntegrityError:
+                    # Another request queued this period between our lookup and insert (the
+                    # unique dedup_key); a locking read sees its row even under REPEATABLE READ
+                    return GeneratedReport.objects.select_for_update().get(
+                        dedup_key=GeneratedReport.dedup_key_for(report_type, period_start, period_end)
+                    )
+
+            transaction.on_commit(lambda: ReportJobQueue.dispatch(job))
+        return job
+
+    @staticmethod
+    def dispatch(job: GeneratedReport):
+        """Start the job on Celery when it is enabled; run_report_jobs picks it up otherwise"""
+        if not ReportJobQueue.USE_CELERY:
+            return
+        try:
+            from .tasks import run_report_job_task
+            run_report_job_task.delay(str(job.id))
+        except Exception as e:
+            logger.error(f"Could not dispatch report job {job.id} to Celery, leaving it for run_report_jobs: {str(e)}")
+
+    @staticmethod
+    def progress(job: GeneratedReport) -> Dict[str, Any]:
+        """Status payload for the progress endpoint"""
+        total = job.progress_total
+        return {
+            'job_id': str(job.id),
+            'report_type': job.report_type,
+            'status': job.status,
+            'progress': {
+                'done': job.progress_done,
+                'total': total,
+                'percent': 100 if job.status == 'completed' else (int(job.progress_done * 100 / total) if total else 0),
+            },
+            'error': job.error,
+            'created_at': job.created_at.isoformat() if job.created_at else None,
+            'started_at': job.started_at.isoformat() if job.started_at else None,
+            'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        }
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _claim_job(job_id=None) -> Optional[GeneratedReport]:
+        """Atomically move one due job to 'generating' so concurrent workers do not run it twice"""
+        now = timezone.now()
+        stale = now - timedelta(seconds=ReportJobQueue.CLAIM_TIMEOUT_SECONDS)
+        with transaction.atomic():
+            due = GeneratedReport.objects.select_for_update(skip_locked=True).filter(
+                Q(status='pending') | Q(status='generating', started_at__lt=stale),
+                parameters__isnull=False
+            )
+            if job_id is not None:
+                due = due.filter(id=job_id)
+            job = due.order_by('created_at').first()
+            if job is None:
+                return None
+            GeneratedReport.objects.filter(id=job.id).update(
+                status='generating', started_at=now, progress_done=0, progress_total=0, error=None
+            )
+            job.status = 'generating'
+            job.started_at = now
+        return job
+
+    @staticmethod
+    def _set_progress(job: GeneratedReport, done: int, total: Optional[int] = None):
+        job.progress_done = done
+        update = {'progress_done': done}
+        if total is not None:
+            job.progress_total = update['progress_total'] = total
+        GeneratedReport.objects.filter(id=job.id).update(**update)
+
+    @staticmethod
+    def run_job(job: GeneratedReport) -> bool:
+        """Run a claimed job to completion; returns False when it failed"""
+        handler = ReportJobQueue._handler_for(job.report_type)
+        try:
+            if handler is None:
+                raise ValueError(f"No report job handler for report type '{job.report_type}'")
+            content, filename, notes = handler(job)
+        except Exception as e:
+            logger.error(f"Report job {job.id} ({job.report_type}) failed: {e}", exc_info=True)
+            GeneratedReport.objects.filter(id=job.id).update(
+                status='failed', error=str(e) or e.__class__.__name__, finished_at=timezone.now()
+            )
+            return False
+
+        job.file.save(filename, ContentFile(content), save=False)
+        job.size_bytes = len(content)
+        job.checksum = hashlib.sha256(content).hexdigest()
+        job.notes = notes
+        job.status = 'completed'
+        job.finished_at = timezone.now()
+        job.progress_done = job.progress_total = max(job.progress_total, 1)
+        GeneratedReport.objects.filter(id=job.id).update(
+            file=job.file.name, size_bytes=job.size_bytes, checksum=job.checksum, notes=notes,
+            status='completed', finished_at=job.finished_at, error=None,
+            progress_done=job.progress_done, progress_total=job.progress_total
+        )
+        logger.info(f"Report job {job.id} completed: {job.file.name}, {job.size_bytes} bytes, {notes}")
+
+        if job.report_type == 'manual_activity':
+            try:
+                from .notification_service import NotificationService
+                NotificationService.notify_report_generated(job)
+            except Exception as e:
+                logger.error(f"Error sending report generation notification: {str(e)}")
+        return True
+
+    @staticmethod
+    def run_pending(max_jobs: Optional[int] = None) -> Dict[str, int]:
+        """Claim and run queued jobs one at a time until none are due (or max_jobs is reached)"""
+        stats = {'completed': 0, 'failed': 0}
+        while max_jobs is None or stats['completed'] + stats['failed'] < max_jobs:
+            job = ReportJobQueue._claim_job()
+            if job is None:
+                break
+            stats['completed' if ReportJobQueue.run_job(job) else 'failed'] += 1
+        return stats
+
+    @staticmethod
+    def run_one(job_id) -> Optional[bool]:
+        """Run a specific job if it is still due; None when another worker already has it"""
+        job = ReportJobQueue._claim_job(job_id)
+        if job is None:
+            return None
+        return ReportJobQueue.run_job(job)
+
+    # ------------------------------------------------------------------
+    # PDF conversion
+    # ------------------------------------------------------------------
+    @staticmethod
+    def convert_many(
+        documents: List[Tuple[Any, str]],
+        on_converted: Optional[Callable[[Any, Optional[bytes]], None]] = None
+    ) -> Dict[Any, Optional[bytes]]:
+        """
+        Convert (key, html) documents to PDF, as many at a time as the rendering workers allow.
+        Returns {key: pdf_bytes}, with None for documents that failed to convert.
+        """
+        results: Dict[Any, Optional[bytes]] = {}
+
+        def record(key, pdf):
+            results[key] = pdf
+            if on_converted:
+                on_converted(key, pdf)
+
+        # Threads only wait on the rendering workers, so one per worker keeps them all busy
+        workers = max(min(pdf_service.concurrency(), len(documents)), 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(pdf_service.render_pdf, html): key for key, html in documents}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    pdf = future.result()
+                except Exception as e:
+                    logger.error(f"PDF conversion failed for {key}: {e}")
+                    pdf = None
+                record(key, pdf or None)
+        return results
+
+    # ------------------------------------------------------------------
+    # Handlers: each returns (content, filename, notes)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _handler_for(report_type: str) -> Optional[Callable[[GeneratedReport], Tuple[bytes, str, str]]]:
+        if report_type.endswith('_pack'):
+            return ReportJobQueue._build_signatory_pack
+        return {
+            'manual_activity': ReportJobQueue._build_activity_report,
+            'signatory_activity': ReportJobQueue._build_user_activity_report,
+            'business_manager_activity': ReportJobQueue._build_user_activity_report,
+        }.get(report_type)
+
+    @staticmethod
+    def _build_signatory_pack(job: GeneratedReport) -> Tuple[bytes, str, str]:
+        """ZIP of one professional activity report PDF per signatory active in the period"""
+        from mysite.views import get_activity_data_for_report
+
+        params = job.parameters
+        form_type = params['form_type']
+        from_date, to_date = params['from_date'], params['to_date']
+        from_date_obj, to_date_obj = _parse_date(from_date), _parse_date(to_date)
+        generated_by = job.generated_by.full_name or job.generated_by.username if job.generated_by else 'System'
+
+        signatories = list(
+            User.objects.filter(
+                id__in=ReportJobQueue.pack_activity(form_type, from_date_obj, to_date_obj).values('signatory_id')
+            ).select_related('signatory_profile').order_by('full_name')
+        )
+        if not signatories:
+            raise ValueError('No signatory activity in the selected period')
+        ReportJobQueue._set_progress(job, 0, len(signatories))
+
+        # Templates and queries need the database, so HTML is rendered here and only conversion is parallel
+        documents = []
+        activity_counts = {}
+        for signatory in signatories:
+            activities = get_activity_data_for_report(
+                form_type=form_type,
+                from_date=from_date,
+                to_date=to_date,
+                signatory=signatory
+            )
+            activity_counts[signatory.id] = len(activities)
+            documents.append((signatory.id, render_to_string('pdf/professional-report.html', {
+                'report_title': f'{form_type.title()} Activity Report',
+                'report_id': f'{form_type.upper()}-{signatory.id}-{from_date_obj.strftime("%Y%m%d")}',
+                'generated_by': generated_by,
+                'generated_at': timezone.now(),
+                'period_start': from_date_obj,
+                'period_end': to_date_obj,
+                'signatory': signatory,
+                'activities': activities,
+                'total_count': len(activities),
+                'filters': {
+                    'form_type': form_type,
+                    'signatory': signatory.full_name
+                }
+            })))
+
+        done = [0]
+
+        def converted(key, pdf):
+            done[0] += 1
+            ReportJobQueue._set_progress(job, done[0])
+
+        pdfs = ReportJobQueue.convert_many(documents, converted)
+
+        zip_buffer = io.BytesIO()
+        used_names = set()
+        pdf_count = 0
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for signatory in signatories:
+                pdf = pdfs.get(signatory.id)
+                if not pdf:
+                    logger.error(f"Skipping {signatory.full_name} in {form_type} pack: PDF generation failed")
+                    continue
+                slug = signatory.full_name.replace(' ', '_').replace('.', '').lower()
+                profile = getattr(signatory, 'signatory_profile', None)
+                if profile and profile.signatory_type:
+                    slug = profile.signatory_type.replace(' ', '_').replace('.', '').lower()
+                name = f"{slug}_{from_date_obj.strftime('%Y-%m-%d')}.pdf"
+                suffix = 2
+                while name in used_names:
+                    name = f"{slug}_{suffix}_{from_date_obj.strftime('%Y-%m-%d')}.pdf"
+                    suffix += 1
+                used_names.add(name)
+                zip_file.writestr(name, pdf)
+                pdf_count += 1
+                logger.info(f"Added PDF for {signatory.full_name}: {name}, {activity_counts[signatory.id]} activities")
+
+        if pdf_count == 0:
+            raise ValueError('Failed to generate any PDFs')
+
+        filename = f"{form_type}_signatory_pack_{from_date_obj.strftime('%Y-%m-%d')}.zip"
+        return zip_buffer.getvalue(), filename, f'ZIP pack with {pdf_count} PDFs, generated using the PDF rendering service'
+
+    @staticmethod
+    def pack_activity(form_type: str, from_date, to_date):
+        """Signatory activity logs a pack for form_type over [from_date, to_date] covers"""
+        start, end = local_day_range(from_date, to_date)
+        activity = SignatoryActivityLog.objects.filter(created_at__gte=start, created_at__lt=end)
+        return activity.filter(form_type__icontains='document' if form_type == 'document_release' else form_type)
+
+    @staticmethod
+    def _build_activity_report(job: GeneratedReport) -> Tuple[bytes, str, str]:
+        """Registrar activity report over the filters the registrar had on screen"""
+        from mysite.views import get_activity_data_for_report, get_forms_data_for_report
+        import pytz
+
+        params = job.parameters
+        form_type = params.get('form_type', '')
+        ReportJobQueue._set_progress(job, 0, 1)
+
+        # When a form type is selected, query the forms like the reports table does
+        if form_type in FORM_REPORT_TYPES:
+            activities = get_forms_data_for_report(
+                form_type=form_type,
+                from_date=params.get('from_date'),
+                to_date=params.get('to_date'),
+                form_status=params.get('form_status'),
+                text_search=params.get('text_search')
+            )
+        else:
+            activities = get_activity_data_for_report(
+                form_type=form_type,
+                from_date=params.get('from_date'),
+                to_date=params.get('to_date'),
+                form_status=params.get('form_status'),
+                period_type=params.get('period_type'),
+                role_filter=params.get('role_filter'),
+                text_search=params.get('text_search')
+            )
+
+        now = datetime.now(pytz.timezone('Asia/Manila'))
+        html_content = render_to_string('pdf/professional-report.html', {
+            'report_title': 'Activity Report',
+            'report_id': f'AR-{now.strftime("%Y%m%d%H%M%S")}',
+            'generated_by': job.generated_by.full_name or job.generated_by.username if job.generated_by else 'System',
+            'generated_at': now,
+            'period_start': job.period_start,
+            'period_end': job.period_end,
+            'activities': activities,
+            'total_count': len(activities),
+            'filters': {
+                'form_type': form_type,
+                'form_status': params.get('form_status'),
+                'text_search': params.get('text_search'),
+                'role_filter': params.get('role_filter'),
+                'period_type': params.get('period_type')
+            }
+        })
+        pdf = ReportJobQueue.convert_many([(job.id, html_content)])[job.id]
+        if not pdf:
+            raise ValueError('PDF generation failed')
+
+        filename = f"{form_type or 'activity_report'}_{now.strftime('%Y-%m-%d')}.pdf"
+        return pdf, filename, f'Professional table PDF with {len(activities)} activities'
+
+    @staticmethod
+    def _build_user_activity_report(job: GeneratedReport) -> Tuple[bytes, str, str]:
+        """A signatory's or business manager's own activity over the period, as PDF"""
+        params = job.parameters
+        user = job.generated_by
+        if user is None:
+            raise ValueError('The user who requested this report no longer exists')
+        ReportJobQueue._set_progress(job, 0, 1)
+
+        if job.report_type == 'signatory_activity':
+            activity_logs = SignatoryActivityLog.objects.filter(signatory=user)
+            owner_key = 'signatory'
+        else:
+            activity_logs = BusinessManagerActivityLog.objects.filter(business_manager=user)
+            owner_key = 'business_manager'
+        # Local-day bounds: created_at__date would need CONVERT_TZ (time zone tables) on MySQL
+        period_from, period_to = local_day_range(job.period_start, job.period_end)
+        activity_logs = activity_logs.filter(created_at__gte=period_from, created_at__lt=period_to)
+        if params.get('action_type'):
+            activity_logs = activity_logs.filter(action_type=params['action_type'])
+        activity_logs = list(activity_logs.order_by('-created_at'))
+
+        html_content = render_to_string('pdf/auto-generated-report.html', {
+            owner_key: user,
+            'report_type': params.get('report_type'),
+            'period_type': params.get('period_type'),
+            'start_date': job.period_start,
+            'end_date': job.period_end,
+            'activity_logs': activity_logs,
+            'total_count': len(activity_logs),
+        })
+        pdf = ReportJobQueue.convert_many([(job.id, html_content)])[job.id]
+        if not pdf:
+            raise ValueError('PDF generation failed')
+
+        filename = f"{params.get('report_type') or 'activity'}_manual_{job.period_start}.pdf"
+        return pdf, filename, f'{len(activity_logs)} activities'
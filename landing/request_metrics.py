@@ -0,0 +1,297 @@
+"""
+Opt-in request instrumentation: SQL count and time, repeated queries, Python time
+and response size of every request.
+
+RequestMetricsMiddleware (first in MIDDLEWARE, enabled by REQUEST_METRICS_ENABLED)
+wraps every database connection while the request runs. Each request is added to
+per-view totals and a latency histogram kept in process memory, which every worker
+writes out as RequestMetricWindow rows once per REQUEST_METRICS_WINDOW_SECONDS.
+Requests slower than REQUEST_METRICS_SLOW_MS, or repeating one query at least
+REQUEST_METRICS_N_PLUS_ONE_THRESHOLD times, are also written to the
+'landing.request_metrics' logger (one JSON object per line, a rotating file in
+settings.LOGGING) and to SlowRequestLog, which the admin lists.
+
+    RequestMetrics.summary(since=timezone.now() - timedelta(hours=24))
+    # [{'view_name': 'clearance_data_api', 'requests': 812, 'p50_ms': 41.2, 'p95_ms': 180.0, ...}, ...]
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils import timezone
+
+from .models import RequestMetricWindow, SlowRequestLog
+
+logger = logging.getLogger(__name__)
+
+ENABLED = getattr(settings, 'REQUEST_METRICS_ENABLED', False)
+SLOW_MS = getattr(settings, 'REQUEST_METRICS_SLOW_MS', 1000)
+# A request running one query fingerprint this often is logged as a suspected N+1
+N_PLUS_ONE_THRESHOLD = getattr(settings, 'REQUEST_METRICS_N_PLUS_ONE_THRESHOLD', 10)
+WINDOW_SECONDS = getattr(settings, 'REQUEST_METRICS_WINDOW_SECONDS', 300)
+RETENTION = timedelta(days=getattr(settings, 'REQUEST_METRICS_RETENTION_DAYS', 14))
+IGNORED_PATHS = tuple(getattr(settings, 'REQUEST_METRICS_IGNORED_PATHS', ['/static/', '/media/']))
+
+# Upper bounds of the latency histogram buckets; the last bucket holds everything slower
+LATENCY_BUCKETS_MS = (5, 10, 20, 35, 50, 75, 100, 150, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000, 30000)
+DUPLICATES_KEPT = 5
+
+_IN_LIST = re.compile(r'\bIN \((?:%s, )*%s\)', re.IGNORECASE)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql: str) -> str:
+    """SQL with parameters, literals and IN-list lengths folded, so repeats of one query compare equal"""
+    sql = _LITERALS.sub('%s', _WHITESPACE.sub(' ', sql))
+    return _IN_LIST.sub('IN (...)', sql)[:1000]
+
+
+class QueryRecorder:
+    """connection.execute_wrapper() collecting count, time and repeats of the queries of one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.by_fingerprint: Dict[str, List] = defaultdict(lambda: [0, 0.0])
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.seconds += elapsed
+            entry = self.by_fingerprint[sql]
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """Queries run more than once, most repeated first"""
+        merged: Dict[str, List] = defaultdict(lambda: [0, 0.0])
+        for sql, (count, seconds) in self.by_fingerprint.items():
+            entry = merged[fingerprint(sql)]
+            entry[0] += count
+            entry[1] += seconds
+        repeated = [
+            {'fingerprint': sql, 'count': count, 'ms': round(seconds * 1000, 1)}
+            for sql, (count, seconds) in merged.items() if count > 1
+        ]
+        return sorted(repeated, key=lambda item: -item['count'])
+
+
+class RequestMetricsMiddleware:
+    """Measure every request; see the module docstring"""
+
+    def __init__(self, get_response):
+        if not ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path.startswith(IGNORED_PATHS):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        # Streamed responses (event stream, file downloads) are timed only up to their first byte
+        # and held open on purpose, so they are left out
+        if not response.streaming:
+            try:
+                RequestMetrics.record(request, response, duration, recorder)
+            except Exception as e:
+                logger.error(f"Could not record request metrics for {request.path}: {e}")
+        return response
+
+
+class RequestMetrics:
+    """Per-view aggregates kept in this process and written out once per window"""
+
+    _lock = threading.Lock()
+    _window_start = None
+    _views: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def record(request, response, duration: float, recorder: QueryRecorder):
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else 'unresolved'
+        duration_ms = duration * 1000
+        sql_ms = recorder.seconds * 1000
+        response_bytes = len(response.content)
+
+        duplicates = []
+        n_plus_one = False
+        if recorder.count >= N_PLUS_ONE_THRESHOLD:
+            duplicates = recorder.duplicates()
+            n_plus_one = bool(duplicates) and duplicates[0]['count'] >= N_PLUS_ONE_THRESHOLD
+        slow = duration_ms >= SLOW_MS
+        flagged = slow or n_plus_one
+
+        RequestMetrics._add(view_name, duration_ms, recorder.count, sql_ms, response_bytes, response.status_code, flagged)
+        if flagged:
+            if slow and not duplicates:
+                duplicates = recorder.duplicates()
+            RequestMetrics._log_request(
+                request, response, view_name, 'slow_n_plus_one' if slow and n_plus_one else ('slow' if slow else 'n_plus_one'),
+                duration_ms, recorder.count, sql_ms, response_bytes, duplicates[:DUPLICATES_KEPT],
+            )
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Totals of one view; the fields of RequestMetricWindow"""
+        return {
+            'requests': 0, 'errors': 0, 'flagged': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            'sql_count': 0, 'sql_ms': 0.0, 'response_bytes': 0,
+            'histogram': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        }
+
+    @staticmethod
+    def _add(view_name, duration_ms, sql_count, sql_ms, response_bytes, status_code, flagged):
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if duration_ms <= bound), len(LATENCY_BUCKETS_MS))
+        now = timezone.now()
+        with RequestMetrics._lock:
+            if RequestMetrics._window_start is None:
+                RequestMetrics._window_start = now
+            stats = RequestMetrics._views.get(view_name)
+            if stats is None:
+                stats = RequestMetrics._views[view_name] = RequestMetrics._empty_stats()
+            stats['requests'] += 1
+            stats['errors'] += status_code >= 500
+            stats['flagged'] += flagged
+            stats['total_ms'] += duration_ms
+            stats['max_ms'] = max(stats['max_ms'], duration_ms)
+            stats['sql_count'] += sql_count
+            stats['sql_ms'] += sql_ms
+            stats['response_bytes'] += response_bytes
+            stats['histogram'][bucket] += 1
+
+            if (now - RequestMetrics._window_start).total_seconds() < WINDOW_SECONDS:
+                return
+            window_start, views = RequestMetrics._window_start, RequestMetrics._views
+            RequestMetrics._window_start, RequestMetrics._views = now, {}
+        RequestMetrics._write_window(window_start, views)
+
+    @staticmethod
+    def flush():
+        """Write out the current window now (tests, shutdown hooks)"""
+        with RequestMetrics._lock:
+            window_start, views = RequestMetrics._window_start, RequestMetrics._views
+            RequestMetrics._window_start, RequestMetrics._views = None, {}
+        if views:
+            RequestMetrics._write_window(window_start, views)
+
+    @staticmethod
+    def _write_window(window_start, views: Dict[str, Dict[str, Any]]):
+        RequestMetricWindow.objects.bulk_create([
+            RequestMetricWindow(view_name=view_name[:200], window_start=window_start, **stats)
+            for view_name, stats in views.items()
+        ])
+
+    @staticmethod
+    def _log_request(request, response, view_name, reason, duration_ms, sql_count, sql_ms, response_bytes, duplicates):
+        user = getattr(request, 'user', None)
+        user_id = user.pk if user is not None and user.is_authenticated else None
+        entry = {
+            'reason': reason,
+            'view_name': view_name,
+            'method': request.method,
+            'path': request.path,
+            'status_code': response.status_code,
+            'user_id': str(user_id) if user_id else None,
+            'duration_ms': round(duration_ms, 1),
+            'sql_count': sql_count,
+            'sql_ms': round(sql_ms, 1),
+            'python_ms': round(duration_ms - sql_ms, 1),
+            'response_bytes': response_bytes,
+            'duplicate_queries': duplicates,
+        }
+        logger.warning(json.dumps(entry))
+        SlowRequestLog.objects.create(
+            reason=reason, view_name=view_name[:200], method=request.method, path=request.path[:500],
+            status_code=response.status_code, user_id=user_id, duration_ms=duration_ms, sql_count=sql_count,
+            sql_ms=sql_ms, python_ms=duration_ms - sql_ms, response_bytes=response_bytes, duplicate_queries=duplicates,
+        )
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    @staticmethod
+    def summary(since, view_filter: str = '') -> List[Dict[str, Any]]:
+        """Per-view totals and latency percentiles over the windows started since `since`"""
+        windows = RequestMetricWindow.objects.filter(window_start__gte=since)
+        if view_filter:
+            windows = windows.filter(view_name__icontains=view_filter)
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for window in windows.iterator():
+            stats = merged.get(window.view_name)
+            if stats is None:
+                stats = merged[window.view_name] = RequestMetrics._empty_stats()
+            for field in ('requests', 'errors', 'flagged', 'total_ms', 'sql_count', 'sql_ms', 'response_bytes'):
+                stats[field] += getattr(window, field)
+            stats['max_ms'] = max(stats['max_ms'], window.max_ms)
+            for bucket, count in enumerate(window.histogram):
+                stats['histogram'][bucket] += count
+
+        rows = []
+        for view_name, stats in merged.items():
+            requests = stats['requests'] or 1
+            rows.append({
+                'view_name': view_name,
+                'requests': stats['requests'],
+                'errors': stats['errors'],
+                'flagged': stats['flagged'],
+                'p50_ms': RequestMetrics.percentile(stats['histogram'], 50, stats['max_ms']),
+                'p90_ms': RequestMetrics.percentile(stats['histogram'], 90, stats['max_ms']),
+                'p95_ms': RequestMetrics.percentile(stats['histogram'], 95, stats['max_ms']),
+                'p99_ms': RequestMetrics.percentile(stats['histogram'], 99, stats['max_ms']),
+                'max_ms': round(stats['max_ms'], 1),
+                'mean_ms': round(stats['total_ms'] / requests, 1),
+                'mean_sql_count': round(stats['sql_count'] / requests, 1),
+                'mean_sql_ms': round(stats['sql_ms'] / requests, 1),
+                'mean_python_ms': round((stats['total_ms'] - stats['sql_ms']) / requests, 1),
+                'mean_response_bytes': round(stats['response_bytes'] / requests),
+                'total_ms': round(stats['total_ms']),
+            })
+        return rows
+
+    @staticmethod
+    def percentile(histogram: List[int], p: float, max_ms: float) -> Optional[float]:
+        """Estimate, interpolated linearly inside the histogram bucket it falls in"""
+        total = sum(histogram)
+        if not total:
+            return None
+        rank = total * p / 100
+        seen = 0
+        for bucket, count in enumerate(histogram):
+            if count and seen + count >= rank:
+                lower = LATENCY_BUCKETS_MS[bucket - 1] if bucket else 0
+                upper = LATENCY_BUCKETS_MS[bucket] if bucket < len(LATENCY_BUCKETS_MS) else max(max_ms, lower)
+                return round(min(lower + (upper - lower) * (rank - seen) / count, max_ms), 1)
+            seen += count
+        return round(max_ms, 1)
+
+    @staticmethod
+    def prune(older_than: timedelta = RETENTION) -> int:
+        """Delete windows and slow request entries older than the retention period; returns rows removed"""
+        cutoff = timezone.now() - older_than
+        windows, _ = RequestMetricWindow.objects.filter(window_start__lt=cutoff).delete()
+        slow, _ = SlowRequestLog.objects.filter(created_at__lt=cutoff).delete()
+        return windows + slow
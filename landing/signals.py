@@ -1,8 +1,22 @@
 # landing/signals.py
-from django.db.models.signals import post_migrate
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models.signals import post_init, post_migrate, post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
+from . import cache  # noqa: F401 - connects the cache namespace invalidation receivers
+from .event_stream import EventStream
+from .models import (
+    AlumniProfile, BusinessManagerProfile, ClearanceForm, ClearanceSignatory, ClearanceStatusMatrix,
+    DocumentRequest, EnrollmentForm, EnrollmentSignatory, GraduationForm, GraduationSignatory, Notification,
+    PendingCounter, RegistrarProfile, SignatoryProfile, StudentProfile, User
+)
+from .pdf_cache import PdfRenderCache
+from .profile_images import ProfilePictureService
+from .student_search import StudentSearchIndex
+
 @receiver(post_migrate)
 def create_admin_user(sender, **kwargs):
     User = get_user_model()
@@ -17,3 +31,220 @@ def create_admin_user(sender, **kwargs):
         print("✅ Admin user created")
     else:
         print("ℹ️ Admin user already exists")
+
+@receiver(post_delete, sender=ClearanceSignatory)
+def refresh_clearance_status_matrix(sender, instance, **kwargs):
+    # Only update an existing row: during a cascade delete of the clearance the
+    # matrix row is already scheduled for deletion and must not be recreated.
+    ClearanceStatusMatrix.refresh_for_clearance(instance.clearance_id, create=False)
+
+
+# --------------------
+# PENDING COUNTERS
+# --------------------
+# A signatory record counts towards its signatory's PendingCounter while both the
+# record and its form are 'pending'. Each save/delete applies the +1/-1 that its
+# status change implies; queryset.update()/bulk_create() callers adjust explicitly.
+PENDING_SIGNATORY_MODELS = {
+    ClearanceSignatory: ('clearance', 'clearance', ClearanceForm),
+    EnrollmentSignatory: ('enrollment', 'enrollment', EnrollmentForm),
+    GraduationSignatory: ('graduation', 'graduation', GraduationForm),
+}
+PENDING_FORM_MODELS = {
+    ClearanceForm: ('clearance', ClearanceSignatory, 'clearance'),
+    EnrollmentForm: ('enrollment', EnrollmentSignatory, 'enrollment'),
+    GraduationForm: ('graduation', GraduationSignatory, 'graduation'),
+}
+
+
+@receiver(post_init, sender=ClearanceSignatory)
+@receiver(post_init, sender=EnrollmentSignatory)
+@receiver(post_init, sender=GraduationSignatory)
+@receiver(post_init, sender=ClearanceForm)
+@receiver(post_init, sender=EnrollmentForm)
+@receiver(post_init, sender=GraduationForm)
+def remember_loaded_status(sender, instance, **kwargs):
+    # Deferred status fields are left alone so loading a row never costs an extra query
+    instance._loaded_status = instance._event_status = instance.__dict__.get('status')
+
+
+def _status_change(instance, created):
+    """(was pending, is pending) for the save that just happened"""
+    was_pending = not created and getattr(instance, '_loaded_status', None) == 'pending'
+    is_pending = instance.status == 'pending'
+    instance._loaded_status = instance.status
+    return was_pending, is_pending
+
+
+def _form_is_pending(instance, form_field, form_model):
+    field = instance._meta.get_field(form_field)
+    if field.is_cached(instance):
+        return getattr(instance, form_field).status == 'pending'
+    return form_model.objects.filter(pk=getattr(instance, f'{form_field}_id'), status='pending').exists()
+
+
+@receiver(post_save, sender=ClearanceSignatory)
+@receiver(post_save, sender=EnrollmentSignatory)
+@receiver(post_save, sender=GraduationSignatory)
+def count_signatory_save(sender, instance, created, **kwargs):
+    form_type, form_field, form_model = PENDING_SIGNATORY_MODELS[sender]
+    was_pending, is_pending = _status_change(instance, created)
+    if was_pending != is_pending and _form_is_pending(instance, form_field, form_model):
+        PendingCounter.adjust({(instance.signatory_id, form_type): 1 if is_pending else -1})
+
+
+@receiver(post_delete, sender=ClearanceSignatory)
+@receiver(post_delete, sender=EnrollmentSignatory)
+@receiver(post_delete, sender=GraduationSignatory)
+def count_signatory_delete(sender, instance, **kwargs):
+    form_type, form_field, form_model = PENDING_SIGNATORY_MODELS[sender]
+    if instance.status == 'pending' and _form_is_pending(instance, form_field, form_model):
+        PendingCounter.adjust({(instance.signatory_id, form_type): -1})
+
+
+@receiver(post_save, sender=ClearanceForm)
+@receiver(post_save, sender=EnrollmentForm)
+@receiver(post_save, sender=GraduationForm)
+def count_form_save(sender, instance, created, **kwargs):
+    form_type, signatory_model, form_field = PENDING_FORM_MODELS[sender]
+    was_pending, is_pending = _status_change(instance, created)
+    if created or was_pending == is_pending:
+        # A new form has no signatory records yet; they are counted as they are created
+        return
+    # The form entering or leaving 'pending' moves all of its pending records at once
+    delta = 1 if is_pending else -1
+    deltas = defaultdict(int)
+    for signatory_id in signatory_model.objects.filter(
+        **{form_field: instance}, status='pending'
+    ).values_list('signatory_id', flat=True):
+        deltas[(signatory_id, form_type)] += delta
+    PendingCounter.adjust(deltas)
+
+
+# --------------------
+# EVENT STREAM
+# --------------------
+# Form owners, registrars and business managers see every status change on their
+# dashboards; a signatory sees changes to its own records.
+DASHBOARD_FORM_MODELS = {
+    ClearanceForm: ('clearance', 'student_id'),
+    EnrollmentForm: ('enrollment', 'user_id'),
+    GraduationForm: ('graduation', 'user_id'),
+}
+DASHBOARD_AUDIENCES = ['admin', 'business_manager']
+
+
+@receiver(post_save, sender=Notification)
+def publish_notification_event(sender, instance, created, **kwargs):
+    if created:
+        EventStream.publish_notifications([instance])
+
+
+def _status_changed(instance, created):
+    # count_*_save above already moved _loaded_status on, so compare with what it saw
+    return created or getattr(instance, '_event_status', None) != instance.status
+
+
+@receiver(post_save, sender=ClearanceForm)
+@receiver(post_save, sender=EnrollmentForm)
+@receiver(post_save, sender=GraduationForm)
+def publish_form_status_event(sender, instance, created, **kwargs):
+    if not _status_changed(instance, created):
+        return
+    instance._event_status = instance.status
+    form_type, owner_field = DASHBOARD_FORM_MODELS[sender]
+    EventStream.publish(
+        'dashboard_stale',
+        {'form_type': form_type, 'form_id': str(instance.id), 'status': instance.status},
+        users=[getattr(instance, owner_field)],
+        audiences=DASHBOARD_AUDIENCES,
+    )
+
+
+@receiver(post_save, sender=ClearanceSignatory)
+@receiver(post_save, sender=EnrollmentSignatory)
+@receiver(post_save, sender=GraduationSignatory)
+def publish_signatory_status_event(sender, instance, created, **kwargs):
+    if not _status_changed(instance, created):
+        return
+    instance._event_status = instance.status
+    form_type, form_field, _ = PENDING_SIGNATORY_MODELS[sender]
+    EventStream.publish(
+        'dashboard_stale',
+        {'form_type': form_type, 'form_id': str(getattr(instance, f'{form_field}_id')), 'status': instance.status},
+        users=[instance.signatory_id],
+    )
+
+
+# --------------------
+# PDF RENDER CACHE
+# --------------------
+# Edits change the cache key on their own; deleted forms just free their files
+PDF_CACHE_FORM_TYPES = {
+    ClearanceForm: 'clearance',
+    EnrollmentForm: 'enrollment',
+    GraduationForm: 'graduation',
+    DocumentRequest: 'doc_release',
+}
+
+
+@receiver(post_delete, sender=ClearanceForm)
+@receiver(post_delete, sender=EnrollmentForm)
+@receiver(post_delete, sender=GraduationForm)
+@receiver(post_delete, sender=DocumentRequest)
+def drop_cached_form_pdf(sender, instance, **kwargs):
+    form_type = PDF_CACHE_FORM_TYPES[sender]
+    form_id = instance.id
+    transaction.on_commit(lambda: PdfRenderCache.invalidate(form_type, form_id))
+
+
+# --------------------
+# STUDENT SEARCH
+# --------------------
+# Saves limited to other fields (last_login, status updates) do not touch the index;
+# any other save compares the user's terms with the stored ones and rewrites them if they differ
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=StudentProfile)
+def update_student_search(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw or (update_fields is not None and not StudentSearchIndex.indexes_any(instance, update_fields)):
+        return
+    StudentSearchIndex.update_instance(instance, created=created)
+
+
+@receiver(post_delete, sender=StudentProfile)
+def drop_student_search_profile(sender, instance, **kwargs):
+    # The user's own terms go with the user (CASCADE); re-adding them here would block its delete
+    StudentSearchIndex.remove_profile(instance)
+
+
+# --------------------
+# PROFILE PICTURES
+# --------------------
+# Only a save that puts a different file in profile_picture queues new variants
+def _picture_name(instance):
+    value = instance.__dict__.get('profile_picture')
+    return getattr(value, 'name', value) or ''
+
+
+@receiver(post_init, sender=StudentProfile)
+@receiver(post_init, sender=AlumniProfile)
+@receiver(post_init, sender=SignatoryProfile)
+@receiver(post_init, sender=RegistrarProfile)
+@receiver(post_init, sender=BusinessManagerProfile)
+def remember_profile_picture(sender, instance, **kwargs):
+    instance._profile_picture_name = _picture_name(instance)
+
+
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_save, sender=AlumniProfile)
+@receiver(post_save, sender=SignatoryProfile)
+@receiver(post_save, sender=RegistrarProfile)
+@receiver(post_save, sender=BusinessManagerProfile)
+def queue_profile_picture(sender, instance, created, raw=False, **kwargs):
+    if raw or 'profile_picture' not in instance.__dict__:
+        return
+    name = _picture_name(instance)
+    if name != getattr(instance, '_profile_picture_name', '') or (created and name):
+        ProfilePictureService.queue(instance)
+        instance._profile_picture_name = name
+
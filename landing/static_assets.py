@@ -0,0 +1,222 @@
+"""
+Fingerprinted, precompressed static files.
+
+`python manage.py collectstatic` (run by deploy_to_pythonanywhere.sh) stores every file
+twice under STATIC_ROOT, as collected and under a content-hashed name
+(css/style.3f2a91c0d4e5.css), and writes staticfiles.json mapping one to the other.
+{% static %} and django.templatetags.static.static() return the hashed URL, and url()
+references inside CSS are rewritten the same way. Text assets also get .gz and, when the
+optional `brotli` package is installed, .br siblings.
+
+StaticAssetsMiddleware serves STATIC_URL from STATIC_ROOT in front of the views. It picks
+the smallest encoding the browser accepts and marks hashed files immutable for a year, so
+repeat visits load them from the browser cache without a request. Files requested by
+their collected name (hard-coded /static/ URLs) are revalidated after
+STATIC_ASSETS_MAX_AGE seconds. The file list is read once at startup: reload the web
+app after collectstatic.
+"""
+
+import gzip
+import json
+import logging
+import mimetypes
+import os
+from email.utils import formatdate
+from typing import Dict, NamedTuple, Optional
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpResponseNotModified
+
+try:
+    import brotli
+except ImportError:
+    # Optional: without it only gzip siblings are written
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Serve static files from Django (defaults to production only; runserver serves them in DEBUG)
+SERVE = getattr(settings, 'STATIC_ASSETS_SERVE', not settings.DEBUG)
+# Cache lifetime of files requested by their collected (unhashed) name
+MAX_AGE = getattr(settings, 'STATIC_ASSETS_MAX_AGE', 60)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+COMPRESSIBLE_EXTENSIONS = {
+    '.css', '.js', '.mjs', '.map', '.json', '.svg', '.txt', '.html', '.xml', '.ico', '.ttf', '.otf', '.eot',
+}
+# Keep a compressed sibling only when it saves at least this fraction of the file
+MIN_SAVING = 0.05
+
+# Content-Encoding -> sibling suffix, best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ManifestStaticFilesStorage that also writes .gz/.br siblings of text assets"""
+
+    # Templates may still name files that are not in the manifest (new since the last collectstatic)
+    manifest_strict = False
+    # Set while collectstatic post-processes, to report missing references only then
+    _collecting = False
+
+    def hashed_name(self, name, content=None, filename=None):
+        try:
+            return super().hashed_name(name, content, filename)
+        except ValueError:
+            if content is not None:
+                raise
+            # A reference to a file that does not exist (e.g. url() of a deleted image in a CSS
+            # file, or STATIC_ROOT not collected yet) keeps its name instead of failing
+            # collectstatic or the page
+            if self._collecting:
+                logger.warning(f"Static file '{filename or name}' not found, leaving its URL unhashed")
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        self._collecting = True
+        try:
+            yield from super().post_process(paths, dry_run=dry_run, **options)
+        finally:
+            self._collecting = False
+        if dry_run:
+            return
+        names = set(paths) | set(self.hashed_files.values())
+        written = sum(self.compress(name) for name in sorted(names))
+        logger.info(f"Wrote {written} precompressed static files")
+
+    def compress(self, name: str) -> int:
+        """Write the compressed siblings of one collected file; returns how many were kept"""
+        if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+            return 0
+        path = self.path(name)
+        with open(path, 'rb') as source:
+            data = source.read()
+        compressors = {'.gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressors['.br'] = lambda data: brotli.compress(data, quality=11)
+
+        kept = 0
+        for suffix, compress in compressors.items():
+            compressed = compress(data)
+            if len(compressed) <= len(data) * (1 - MIN_SAVING):
+                with open(path + suffix, 'wb') as sibling:
+                    sibling.write(compressed)
+                kept += 1
+            elif os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        return kept
+
+
+class StaticAsset(NamedTuple):
+    path: str
+    content_type: str
+    last_modified: str
+    etag: str
+    cache_control: str
+    # Content-Encoding -> (path, size) of the precompressed siblings, plus None -> the file itself
+    variants: Dict[Optional[str], tuple]
+
+
+def _accepted_encodings(header: str) -> set:
+    """Content codings an Accept-Encoding header allows (q > 0)"""
+    accepted = set()
+    for part in header.split(','):
+        coding, *params = [item.strip() for item in part.split(';')]
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def scan_static_root(root: str, url_prefix: str) -> Dict[str, StaticAsset]:
+    """URL path -> StaticAsset for every file collected under root"""
+    try:
+        with open(os.path.join(root, 'staticfiles.json')) as manifest:
+            hashed = set(json.load(manifest).get('paths', {}).values())
+    except (OSError, ValueError):
+        hashed = set()
+
+    assets = {}
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    for directory, _, filenames in os.walk(root):
+        present = set(filenames)
+        for filename in filenames:
+            if filename.endswith(suffixes) and os.path.splitext(filename)[0] in present:
+                continue  # a precompressed sibling, served in place of its file
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            stat = os.stat(path)
+            variants = {None: (path, stat.st_size)}
+            for encoding, suffix in ENCODINGS:
+                if filename + suffix in present:
+                    variants[encoding] = (path + suffix, os.path.getsize(path + suffix))
+            content_type, _ = mimetypes.guess_type(filename)
+            if content_type and (content_type.startswith('text/') or content_type in ('application/javascript', 'application/json', 'image/svg+xml')):
+                content_type += '; charset=utf-8'
+            assets[url_prefix + name] = StaticAsset(
+                path=path,
+                content_type=content_type or 'application/octet-stream',
+                last_modified=formatdate(stat.st_mtime, usegmt=True),
+                etag=f'"{int(stat.st_mtime):x}-{stat.st_size:x}"',
+                cache_control=(
+                    f'public, max-age={IMMUTABLE_MAX_AGE}, immutable' if name in hashed
+                    else f'public, max-age={MAX_AGE}'
+                ),
+                variants=variants,
+            )
+    return assets
+
+
+class StaticAssetsMiddleware:
+    """Serve collected static files, precompressed and with far-future caching for hashed names"""
+
+    def __init__(self, get_response):
+        if not SERVE or not settings.STATIC_ROOT:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.prefix = settings.STATIC_URL if settings.STATIC_URL.startswith('/') else '/' + settings.STATIC_URL
+        self.assets = scan_static_root(settings.STATIC_ROOT, self.prefix)
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix):
+            asset = self.assets.get(request.path_info)
+            if asset is not None:
+                return self.serve(request, asset)
+        return self.get_response(request)
+
+    @staticmethod
+    def serve(request, asset: StaticAsset):
+        accepted = _accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        encoding = next((encoding for encoding, _ in ENCODINGS if encoding in asset.variants and encoding in accepted), None)
+        path, size = asset.variants[encoding]
+        etag = asset.etag if encoding is None else f'{asset.etag[:-1]}-{encoding}"'
+
+        headers = {
+            'Cache-Control': asset.cache_control,
+            'ETag': etag,
+            'Last-Modified': asset.last_modified,
+        }
+        if len(asset.variants) > 1:
+            headers['Vary'] = 'Accept-Encoding'
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if (if_none_match and etag in if_none_match) or (
+            not if_none_match and request.META.get('HTTP_IF_MODIFIED_SINCE') == asset.last_modified
+        ):
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(open(path, 'rb'), content_type=asset.content_type)
+            response['Content-Length'] = size
+            if encoding:
+                response['Content-Encoding'] = encoding
+        for header, value in headers.items():
+            response[header] = value
+        return response
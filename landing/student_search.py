@@ -0,0 +1,170 @@
+"""
+Indexed student search.
+
+search_students(query) returns the ids of users matching a search box query, as a
+subquery the grid endpoints intersect with their own querysets:
+
+    forms = forms.filter(student_id__in=search_students(search_query))
+
+Text is folded to lowercase ASCII words ("Peña-Cruz" -> "pena", "cruz"). A query
+matches a user when every one of its words occurs in one of the searched fields:
+anywhere in a name, student number, username, email or contact number word, at
+the start of a program word. Each query word is one index range scan over
+StudentSearchTerm, so no search joins the users, profiles and form tables.
+
+The terms are rewritten from the User/StudentProfile signals (landing/signals.py)
+when a save may have changed an indexed value; rows written without signals
+(bulk_create, queryset.update(), raw loads) need StudentSearchIndex.reindex() or
+`python manage.py rebuild_student_search`.
+"""
+
+import re
+import unicodedata
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+
+from .db_utils import RowWriter
+from .models import StudentProfile, StudentSearchTerm, User
+
+MAX_TERM_LENGTH = StudentSearchTerm._meta.get_field('term').max_length
+
+# Terms only hold these characters, which sort the same under binary and
+# case-insensitive collations, so a prefix is a plain [prefix, next prefix) range
+ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+# What the grids have always searched: student name and student number
+DEFAULT_FIELDS = ('name', 'student_number')
+
+
+def search_words(text) -> List[str]:
+    """Lowercase ASCII words of text, accents removed"""
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+    return [word for word in re.split(r'[^0-9a-z]+', text) if word]
+
+
+def _prefix_end(prefix: str) -> Optional[str]:
+    """Smallest string above every string starting with prefix (None: no upper bound)"""
+    prefix = prefix.rstrip(ALPHABET[-1])
+    if not prefix:
+        return None
+    return prefix[:-1] + ALPHABET[ALPHABET.index(prefix[-1]) + 1]
+
+
+def search_students(query, fields: Iterable[str] = DEFAULT_FIELDS):
+    """
+    Subquery of the ids of users matching every word of query in `fields`. A blank
+    query matches every user, one without any searchable word (e.g. "-") none.
+    """
+    fields = list(fields)
+    words = search_words(query)
+    if not words and str(query or '').strip():
+        return User.objects.none().values('id')
+    users = User.objects.all()
+    for word in dict.fromkeys(words):
+        word = word[:MAX_TERM_LENGTH]
+        terms = StudentSearchTerm.objects.filter(term__gte=word, field__in=fields)
+        end = _prefix_end(word)
+        if end:
+            terms = terms.filter(term__lt=end)
+        # One IN per word keeps every word on the term index (nesting them lets the
+        # planner walk the user_id index of the outer word instead)
+        users = users.filter(id__in=terms.values('user_id'))
+    return users.values('id')
+
+
+class StudentSearchIndex:
+    """Writes the StudentSearchTerm rows of users"""
+
+    # field -> (source attribute, index every suffix of its words)
+    USER_FIELDS = {
+        'name': ('full_name', True),
+        'username': ('username', True),
+        'email': ('email', True),
+        'contact_number': ('contact_number', True),
+    }
+    PROFILE_FIELDS = {
+        'student_number': ('student_number', True),
+        'program': ('program', False),
+    }
+
+    @staticmethod
+    def _fields(instance):
+        return StudentSearchIndex.PROFILE_FIELDS if isinstance(instance, StudentProfile) else StudentSearchIndex.USER_FIELDS
+
+    @staticmethod
+    def indexes_any(instance, field_names: Iterable[str]) -> bool:
+        """Whether saving these fields (save(update_fields=...)) can change the instance's terms"""
+        return any(attname in set(field_names) for attname, _ in StudentSearchIndex._fields(instance).values())
+
+    @staticmethod
+    def terms_for(instance) -> Set[Tuple[str, str]]:
+        """(field, term) pairs a User or StudentProfile contributes"""
+        terms = set()
+        for field, (attname, substrings) in StudentSearchIndex._fields(instance).items():
+            for word in search_words(getattr(instance, attname)):
+                starts = range(len(word)) if substrings else [0]
+                terms.update((field, word[start:start + MAX_TERM_LENGTH]) for start in starts)
+        return terms
+
+    @staticmethod
+    def update_instance(instance, created: bool = False):
+        """Rewrite the terms of a saved User or StudentProfile when they differ from the stored ones"""
+        is_profile = isinstance(instance, StudentProfile)
+        fields = StudentSearchIndex._fields(instance)
+        user_id = instance.user_id if is_profile else instance.pk
+        if any(attname not in instance.__dict__ for attname, _ in fields.values()):
+            # Saved with deferred fields: read the stored values instead
+            StudentSearchIndex.reindex([user_id])
+            return
+        terms = StudentSearchIndex.terms_for(instance)
+        stored = StudentSearchTerm.objects.filter(user_id=user_id, field__in=fields)
+        if not created and set(stored.values_list('field', 'term')) == terms:
+            return
+        rows = [StudentSearchTerm(user_id=user_id, field=field, term=term) for field, term in terms]
+        with transaction.atomic():
+            StudentSearchTerm.objects.filter(user_id=user_id, field__in=fields).delete()
+            StudentSearchTerm.objects.bulk_create(rows)
+
+    @staticmethod
+    def remove_profile(profile):
+        """Drop the student number and program terms of a deleted profile"""
+        StudentSearchTerm.objects.filter(
+            user_id=profile.user_id, field__in=StudentSearchIndex.PROFILE_FIELDS
+        ).delete()
+
+    @staticmethod
+    def reindex(user_ids: Iterable) -> int:
+        """Rewrite the terms of these users; returns the rows written"""
+        user_ids = list(user_ids)
+        users = User.objects.filter(id__in=user_ids).select_related('profile').only(
+            'id', *(attname for attname, _ in StudentSearchIndex.USER_FIELDS.values()),
+            *(f'profile__{attname}' for attname, _ in StudentSearchIndex.PROFILE_FIELDS.values()),
+        )
+        rows = []
+        for user in users:
+            terms = StudentSearchIndex.terms_for(user)
+            profile = getattr(user, 'profile', None)
+            if profile is not None:
+                terms |= StudentSearchIndex.terms_for(profile)
+            rows.extend((term, field, user.id) for field, term in terms)
+        # In index order, so the inserts walk the term index instead of hitting random pages
+        rows.sort()
+        writer = RowWriter(StudentSearchTerm)
+        with transaction.atomic():
+            StudentSearchTerm.objects.filter(user_id__in=user_ids).delete()
+            for term, field, user_id in rows:
+                writer.add(user_id=user_id, field=field, term=term)
+            writer.flush()
+        return writer.count
+
+    @staticmethod
+    def rebuild(users=None, batch_size: int = 1000) -> int:
+        """Reindex every user (or the users of a queryset) in batches; returns the rows written"""
+        users = User.objects.all() if users is None else users
+        user_ids = list(users.order_by('id').values_list('id', flat=True))
+        rows = 0
+        for start in range(0, len(user_ids), batch_size):
+            rows += StudentSearchIndex.reindex(user_ids[start:start + batch_size])
+        return rows
@@ -251,4 +251,80 @@ def cleanup_old_report_packs(retention_weeks=4):
         
     except Exception as e:
         logger.error(f'Failed to cleanup old report packs: {str(e)}', exc_info=True)
-        raise e
\ No newline at end of file
+        raise e
+
+
+@shared_task(bind=True)
+def send_queued_emails_task(self, batch_size=None):
+    """
+    Drain the email outbox (EmailNotificationLog rows with status 'pending')
+    over one reused SMTP connection per batch
+    """
+    try:
+        from landing.email_outbox import EmailOutbox
+        
+        stats = EmailOutbox.deliver_pending(batch_size=batch_size)
+        logger.info(f'Email outbox drained: {stats}')
+        
+        return {
+            'status': 'success',
+            'stats': stats,
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f'Failed to drain email outbox: {str(e)}', exc_info=True)
+        raise self.retry(exc=e, countdown=60, max_retries=3)
+
+@shared_task(bind=True)
+def run_report_job_task(self, job_id=None):
+    """
+    Run a queued report job (GeneratedReport with status 'pending'),
+    or every due job when no job_id is given
+    """
+    try:
+        from landing.report_jobs import ReportJobQueue
+        
+        if job_id:
+            result = ReportJobQueue.run_one(job_id)
+            stats = {'job_id': job_id, 'completed': result is True, 'failed': result is False}
+        else:
+            stats = ReportJobQueue.run_pending()
+        logger.info(f'Report jobs run: {stats}')
+        
+        return {
+            'status': 'success',
+            'stats': stats,
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f'Failed to run report jobs: {str(e)}', exc_info=True)
+        raise self.retry(exc=e, countdown=60, max_retries=3)
+
+@shared_task(bind=True)
+def process_profile_pictures_task(self, model_label=None, profile_id=None):
+    """
+    Write the resized variants of an uploaded profile picture,
+    or of every pending one when no profile is given
+    """
+    try:
+        from django.apps import apps
+        from landing.profile_images import ProfilePictureService
+        
+        if model_label and profile_id:
+            status = ProfilePictureService.process(apps.get_model(model_label), profile_id)
+            stats = {'profile_id': profile_id, 'status': status}
+        else:
+            stats = ProfilePictureService.process_pending()
+        logger.info(f'Profile pictures processed: {stats}')
+        
+        return {
+            'status': 'success',
+            'stats': stats,
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f'Failed to process profile pictures: {str(e)}', exc_info=True)
+        raise self.retry(exc=e, countdown=60, max_retries=3)
@@ -1,3 +1,1085 @@
-from django.test import TestCase
+"""
+Query-budget regression tests for the hot JSON endpoints.
 
-# Create your tests here.
+Every endpoint polled by the dashboards, grids, notification bell and inbox is
+requested against a small and then a larger synthetic dataset. Its query count
+must stay within its budget and must not grow with the data, so a view that
+slips back into per-row queries fails here before it ships. Wall time per
+endpoint is reported on stderr after the run.
+
+The request metrics middleware, the buffered activity log, the activity rollups, the
+student search index, the profile picture variants and the static asset pipeline are
+checked at the end.
+
+Runs offline against SQLite or against the local MySQL database from settings:
+
+    TEST_DB=sqlite python manage.py test landing
+    python manage.py test landing
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.http import JsonResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import cache as landing_cache
+from . import activity_log, activity_rollups, bulk_decisions, csv_export, dashboard_stats, email_outbox, event_stream, pdf_service, profile_images, report_jobs, request_metrics, static_assets, student_search
+from .models import (
+    ActivityRollup, AuditLog, CalendarEvent, EmailNotificationLog, ClearanceForm, ClearanceSignatory, ClearanceStatusMatrix, Conversation,
+    DocumentRequest, EnrollmentForm, EnrollmentSignatory, GeneratedReport, GraduationForm, GraduationSignatory,
+    Message, Notification, PendingCounter, RequestMetricWindow, SignatoryActivityLog, SignatoryProfile, SlowRequestLog, StudentProfile, User,
+)
+from .db_utils import bulk_upsert
+from .pdf_cache import PdfRenderCache
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+# (url name, requesting user, query budget). Budgets include the session and user lookups.
+HOT_ENDPOINTS = [
+    # Registrar
+    ('dashboard_data_api', 'registrar', 18),
+    ('clearance_data_api', 'registrar', 6),
+    ('enrollment_data_api', 'registrar', 6),
+    ('graduation_data_api', 'registrar', 6),
+    ('document_release_data_api', 'registrar', 8),
+    ('user_management_data_api', 'registrar', 5),
+    # Signatories
+    ('signatory_dashboard_data_api', 'signatory', 7),
+    ('signatory_clearance_data_api', 'signatory', 5),
+    ('signatory_enrollment_data_api', 'dean', 9),
+    ('signatory_graduation_data_api', 'president', 7),
+    # Business manager
+    ('business_manager_dashboard_data_api', 'business_manager', 7),
+    ('business_manager_clearance_data_api', 'business_manager', 7),
+    ('business_manager_enrollment_data_api', 'business_manager', 7),
+    ('business_manager_graduation_data_api', 'business_manager', 7),
+    # Notifications, messages and events
+    ('get_notifications_enhanced_api', 'registrar', 20),
+    ('get_notification_stats_api', 'registrar', 9),
+    ('get_conversations', 'registrar', 5),
+    ('get_conversation_messages', 'registrar', 9),
+    ('get_users_for_conversation', 'registrar', 5),
+    ('api_event_poll', 'registrar', 5),
+    # Mobile API
+    ('api_dashboard_stats', 'student', 7),
+    ('api_user_profile', 'student', 5),
+]
+
+# Extra query string per endpoint
+ENDPOINT_PARAMS = {
+    'api_event_poll': {'after': 0, 'timeout': 0},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class HotEndpointQueryBudgetTests(TestCase):
+    """Query counts of the hot endpoints stay constant as the data grows"""
+
+    SMALL_DATASET = 3
+    LARGE_DATASET = 12
+
+    timings = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = {
+            'registrar': cls.create_user('registrar', 'registrar'),
+            'student': cls.create_user('student', 'student'),
+        }
+        StudentProfile.objects.create(
+            user=cls.staff['student'], student_number='2020-0000', program='BSIT', year_level=4
+        )
+        cls.signatories = {}
+        for signatory_type in ClearanceStatusMatrix.SIGNATORY_TYPES + ['dean', 'president']:
+            user = cls.create_user(f'sig_{signatory_type}', 'signatory')
+            SignatoryProfile.objects.create(user=user, signatory_type=signatory_type)
+            cls.signatories[signatory_type] = user
+        cls.staff['signatory'] = cls.signatories['cashier']
+        cls.staff['business_manager'] = cls.signatories['business_manager']
+        cls.staff['dean'] = cls.signatories['dean']
+        cls.staff['president'] = cls.signatories['president']
+
+    def setUp(self):
+        self.seeded = 0
+        self.conversation = None
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if cls.timings:
+            sys.stderr.write('\nHot endpoint wall time (large dataset):\n')
+            for name, seconds in sorted(cls.timings.items(), key=lambda item: -item[1]):
+                sys.stderr.write(f'  {name:<45} {seconds * 1000:8.1f} ms\n')
+
+    @staticmethod
+    def create_user(username, user_type):
+        return User.objects.create(
+            username=username, email=f'{username}@example.com', full_name=username.replace('_', ' ').title(),
+            user_type=user_type, password='!',
+        )
+
+    def seed(self, students):
+        """Add students, each with a full set of forms, signatures, notifications and messages"""
+        registrar = self.staff['registrar']
+        approvers = {
+            'enrollment': ['dean', 'business_manager', 'registrar'],
+            'graduation': ['dean', 'business_manager', 'registrar', 'president'],
+        }
+        # Signals defer counters, inbox state and events to on_commit
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(students):
+                self.seeded += 1
+                n = self.seeded
+                student = self.create_user(f'student_{n}', 'student')
+                StudentProfile.objects.create(
+                    user=student, student_number=f'2020-{n:04d}', program='BSIT', year_level=n % 4 + 1
+                )
+
+                clearance = ClearanceForm.objects.create(student=student, clearance_type='enrollment', semester='1st')
+                for i, signatory_type in enumerate(ClearanceStatusMatrix.SIGNATORY_TYPES):
+                    ClearanceSignatory.objects.create(
+                        clearance=clearance, signatory=self.signatories[signatory_type],
+                        role=signatory_type, status='approved' if (i + n) % 3 else 'pending',
+                    )
+
+                enrollment = EnrollmentForm.objects.create(
+                    user=student, enrollment_date=date.today(), academic_year='2025-2026',
+                    course='BSIT', year=str(n % 4 + 1), section='A',
+                )
+                for role in approvers['enrollment']:
+                    EnrollmentSignatory.objects.create(
+                        enrollment=enrollment, signatory=self.staff.get(role) or registrar,
+                        role=role, status='approved' if n % 2 else 'pending',
+                    )
+
+                graduation = GraduationForm.objects.create(
+                    user=student, grad_date=date.today(), grad_appno=f'GA-{n}', place_of_birth='Manila',
+                )
+                for role in approvers['graduation']:
+                    GraduationSignatory.objects.create(
+                        graduation=graduation, signatory=self.staff.get(role) or registrar,
+                        role=role, status='approved' if n % 2 else 'pending',
+                    )
+
+                DocumentRequest.objects.create(requester=student, document_type='Transcript of Records')
+
+                for user in (registrar, student, self.staff['business_manager']):
+                    Notification.objects.create(user=user, title=f'Update {n}', message='Form updated')
+
+                conversation = Conversation.objects.create(
+                    participant_1=registrar, participant_2=student, initiated_by=student
+                )
+                for i in range(3):
+                    message = Message.objects.create(
+                        conversation=conversation, sender=student if i % 2 else registrar, content=f'Message {i}'
+                    )
+                    conversation.record_message(message)
+                if self.conversation is None:
+                    self.conversation = conversation
+
+                CalendarEvent.objects.create(
+                    title=f'Event {n}', start_date=date.today() + timedelta(days=n), created_by=registrar
+                )
+
+    def url_for(self, name):
+        if name == 'get_conversation_messages':
+            return reverse(name, args=[self.conversation.id])
+        return reverse(name)
+
+    def measure(self, name, user):
+        """(status code, query count, seconds) of one request with a cold cache"""
+        cache.clear()
+        self.client.force_login(user)
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url_for(name), ENDPOINT_PARAMS.get(name, {}))
+        elapsed = time.perf_counter() - started
+        return response.status_code, len(queries), elapsed
+
+    def test_query_counts_do_not_grow_with_data(self):
+        self.seed(self.SMALL_DATASET)
+        small = {name: self.measure(name, self.staff[user]) for name, user, _ in HOT_ENDPOINTS}
+
+        self.seed(self.LARGE_DATASET - self.SMALL_DATASET)
+        large = {name: self.measure(name, self.staff[user]) for name, user, _ in HOT_ENDPOINTS}
+
+        for name, user, budget in HOT_ENDPOINTS:
+            with self.subTest(endpoint=name):
+                status_code, queries, elapsed = large[name]
+                self.timings[name] = elapsed
+                self.assertEqual(status_code, 200, f'{name} answered {status_code}')
+                self.assertLessEqual(
+                    queries, budget, f'{name} ran {queries} queries, budget is {budget}'
+                )
+                self.assertLessEqual(
+                    queries, small[name][1],
+                    f'{name} ran {small[name][1]} queries for {self.SMALL_DATASET} students '
+                    f'and {queries} for {self.LARGE_DATASET}: per-row queries are back'
+                )
+
+    def test_conditional_get_skips_the_view(self):
+        self.seed(self.SMALL_DATASET)
+        self.client.force_login(self.staff['registrar'])
+        url = reverse('clearance_data_api')
+
+        etag = self.client.get(url)['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # Session and user only
+        self.assertLessEqual(len(queries), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ClearanceForm.objects.first().save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_conditional_get_error_has_no_etag(self):
+        self.client.force_login(self.staff['registrar'])
+        url = reverse('dashboard_data_api')
+        with mock.patch.object(dashboard_stats.DashboardStatsService, 'get_institution_stats', side_effect=RuntimeError('down')), \
+                contextlib.redirect_stdout(io.StringIO()):
+            response = self.client.get(url)
+        # The error payload is a 5xx without an ETag, so it can never be revalidated into a 304
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertTrue(self.client.get(url).has_header('ETag'))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class RequestMetricsMiddlewareTests(TestCase):
+    """Requests are measured, flagged requests logged, and percentiles served to staff only"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrar = User.objects.create(
+            username='registrar', email='registrar@example.com', full_name='Registrar', user_type='registrar', password='!',
+        )
+        cls.staff = User.objects.create(
+            username='staff', email='staff@example.com', full_name='Staff', user_type='admin', password='!', is_staff=True,
+        )
+
+    def setUp(self):
+        # Every request counts as slow, and every request closes its window
+        for name, value in {'ENABLED': True, 'SLOW_MS': 0, 'WINDOW_SECONDS': 0}.items():
+            patcher = mock.patch.object(request_metrics, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_fingerprint_folds_parameters_and_in_lists(self):
+        self.assertEqual(
+            request_metrics.fingerprint("SELECT * FROM t WHERE a = 'x' AND b IN (%s, %s, %s) LIMIT 21"),
+            request_metrics.fingerprint('SELECT * FROM t  WHERE a = %s AND b IN (%s) LIMIT 1'),
+        )
+
+    def test_slow_request_is_logged_and_aggregated(self):
+        self.client.force_login(self.registrar)
+        with self.assertLogs('landing.request_metrics', 'WARNING') as logs:
+            self.assertEqual(self.client.get(reverse('clearance_data_api')).status_code, 200)
+            self.assertEqual(self.client.get(reverse('api_request_metrics')).status_code, 403)
+
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry['view_name'], 'clearance_data_api')
+        self.assertGreater(entry['sql_count'], 0)
+        logged = SlowRequestLog.objects.get(view_name='clearance_data_api')
+        self.assertEqual((logged.reason, logged.user_id, logged.sql_count), ('slow', self.registrar.id, entry['sql_count']))
+        self.assertEqual(RequestMetricWindow.objects.get(view_name='clearance_data_api').requests, 1)
+
+        self.client.force_login(self.staff)
+        with self.assertLogs('landing.request_metrics', 'WARNING'):
+            response = self.client.get(reverse('api_request_metrics'), {'view': 'clearance'})
+        views = response.json()['views']
+        self.assertEqual([row['view_name'] for row in views], ['clearance_data_api'])
+        self.assertEqual(views[0]['requests'], 1)
+        self.assertIsNotNone(views[0]['p95_ms'])
+
+
+class ActivityLogBufferTests(TestCase):
+    """record_activity() rows are buffered after commit, journaled, and replayable"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            username='registrar', email='registrar@example.com', full_name='Registrar', user_type='admin', password='!',
+        )
+
+    def setUp(self):
+        journal_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(journal_dir.cleanup)
+        patcher = mock.patch.object(activity_log, 'JOURNAL_DIR', journal_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.journal_dir = journal_dir.name
+
+    def journal_lines(self):
+        with open(activity_log.ActivityLogBuffer._journal_path(os.getpid()), encoding='utf-8') as journal:
+            return [line for line in journal if line.strip()]
+
+    def test_rows_are_written_in_one_flush(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(3):
+                activity_log.record_activity(AuditLog, user=self.user, action_type='clearance_print', description=f'Printed {i}')
+            # Nothing is buffered before the transaction commits
+            self.assertEqual(activity_log.ActivityLogBuffer.pending(), 0)
+
+        self.assertEqual(activity_log.ActivityLogBuffer.pending(), 3)
+        self.assertEqual(len(self.journal_lines()), 3)
+        self.assertFalse(AuditLog.objects.exists())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(activity_log.ActivityLogBuffer.flush(), 3)
+        self.assertEqual(sum('INSERT' in query['sql'] for query in queries.captured_queries), 1)
+        self.assertEqual(AuditLog.objects.count(), 3)
+        self.assertEqual(self.journal_lines(), [])
+
+    def test_replay_writes_journal_rows_once(self):
+        logged = AuditLog(user=self.user, action_type='enrollment_print', description='Printed')
+        lost = AuditLog(user=self.user, action_type='enrollment_print', description='Printed again')
+        logged.save()
+        path = os.path.join(self.journal_dir, 'activity-1-1.failed.jsonl')
+        with open(path, 'w', encoding='utf-8') as journal:
+            for obj in (logged, lost):
+                journal.write(json.dumps(activity_log.serialize_row(obj)) + '\n')
+
+        self.assertEqual(activity_log.replay_journals(), {path: 2})
+        self.assertEqual(AuditLog.objects.count(), 2)
+        self.assertEqual(AuditLog.objects.get(id=lost.id).timestamp, lost.timestamp)
+        self.assertFalse(os.path.exists(path))
+
+    @override_settings(ACTIVITY_LOG_SYNC=True)
+    def test_sync_mode_writes_immediately(self):
+        activity_log.record_activity(AuditLog, user=self.user, action_type='graduation_print', description='Printed')
+        self.assertEqual(AuditLog.objects.count(), 1)
+        self.assertEqual(activity_log.ActivityLogBuffer.pending(), 0)
+
+
+class ActivityRollupTests(TestCase):
+    """Daily rollups match the log rows and pick up rows written after a day was rolled up"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.signatory = User.objects.create(
+            username='librarian', email='librarian@example.com', full_name='Librarian', user_type='signatory', password='!',
+        )
+
+    def log(self, action_type, form_type, when):
+        SignatoryActivityLog.objects.create(
+            signatory=self.signatory, action_type=action_type, form_type=form_type,
+            form_id=uuid.uuid4(), student_name='Student', created_at=when,
+        )
+
+    def test_rollups_match_logs_by_local_day(self):
+        today = timezone.localdate()
+        midnight = timezone.make_aware(datetime.combine(today - timedelta(days=3), datetime.min.time()))
+        self.log('approve', 'clearance', midnight - timedelta(seconds=1))
+        self.log('approve', 'clearance', midnight)
+        self.log('disapprove', 'enrollment', midnight + timedelta(hours=23, minutes=59))
+        AuditLog.objects.create(user=self.signatory, action_type='clearance_print', description='Printed')
+
+        self.assertEqual(activity_rollups.ActivityRollupService.update()['rows'], 4)
+        day = today - timedelta(days=3)
+        counts = activity_rollups.ActivityRollupService.totals(
+            activity_rollups.ActivityRollupService.window(day, day, source='signatory', actor=self.signatory),
+            total=Q(), approve=Q(action_type='approve'), enrollment=Q(form_type='enrollment'),
+        )
+        self.assertEqual(counts, {'total': 2, 'approve': 1, 'enrollment': 1})
+        self.assertEqual(ActivityRollup.objects.get(day=day - timedelta(days=1)).count, 1)
+        self.assertEqual(ActivityRollup.objects.get(source='audit').day, today)
+
+    def test_update_resumes_and_counts_late_rows(self):
+        yesterday = timezone.now() - timedelta(days=1)
+        self.log('approve', 'graduation', yesterday)
+        activity_rollups.ActivityRollupService.update()
+
+        # A row buffered or replayed after the last run, for a day already rolled up
+        self.log('approve', 'graduation', yesterday)
+        with CaptureQueriesContext(connection) as queries:
+            result = activity_rollups.ActivityRollupService.update()
+        self.assertEqual(result['days'], activity_rollups.REOPEN_DAYS + 1)
+        self.assertLess(len(queries.captured_queries), 40)
+        self.assertEqual(ActivityRollup.objects.get().count, 2)
+
+    def test_user_activity_report_covers_local_days(self):
+        day = timezone.localdate() - timedelta(days=3)
+        midnight = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+        self.log('approve', 'clearance', midnight - timedelta(seconds=1))
+        self.log('approve', 'clearance', midnight)
+        self.log('approve', 'clearance', midnight + timedelta(days=1, seconds=-1))
+        self.log('approve', 'clearance', midnight + timedelta(days=1))
+        job = GeneratedReport.objects.create(
+            report_type='signatory_activity', generated_by=self.signatory, period_start=day, period_end=day,
+            parameters={'report_type': 'daily'}, status='generating'
+        )
+
+        with mock.patch.object(report_jobs, 'render_to_string', return_value='<p></p>') as render, \
+                mock.patch.object(report_jobs.ReportJobQueue, 'convert_many', return_value={job.id: b'%PDF'}), \
+                CaptureQueriesContext(connection) as queries:
+            _, _, notes = report_jobs.ReportJobQueue._build_user_activity_report(job)
+        self.assertEqual(notes, '2 activities')
+        self.assertEqual(render.call_args[0][1]['total_count'], 2)
+        self.assertFalse(any('django_datetime_cast_date' in query['sql'] for query in queries.captured_queries))
+
+
+class StudentSearchTests(TestCase):
+    """search_students() finds substrings of the searched fields and follows user and profile edits"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.students = []
+        for i, (name, number) in enumerate([('María Dela Cruz', '2023-00123'), ('Mark Santos', '2023-00456')]):
+            user = User.objects.create(
+                username=f'search{i}', email=f'search{i}@example.com', full_name=name, user_type='student', password='!',
+            )
+            StudentProfile.objects.create(user=user, student_number=number, program='BSIT', year_level=1)
+            cls.students.append(user.id)
+
+    def found(self, query, fields=student_search.DEFAULT_FIELDS):
+        return set(student_search.search_students(query, fields).values_list('id', flat=True))
+
+    def test_substring_and_multi_word_queries(self):
+        maria, mark = self.students
+        self.assertEqual(self.found('ari'), {maria})
+        self.assertEqual(self.found('MAR'), {maria, mark})
+        self.assertEqual(self.found('cruz mar'), {maria})
+        self.assertEqual(self.found('0045'), {mark})
+        self.assertEqual(self.found('bsit'), set())
+        self.assertEqual(self.found('bs', ['program']), {maria, mark})
+        self.assertEqual(len(self.found(' ')), User.objects.count())
+        self.assertEqual(self.found('-'), set())
+
+        # The user management grid matches anywhere in usernames, emails and contact numbers
+        account_fields = ['name', 'email', 'username', 'contact_number']
+        self.assertEqual(self.found('earch1', account_fields), {mark})
+        self.assertEqual(self.found('earch', ['email']), {maria, mark})
+        User.objects.filter(id=maria).update(contact_number='0917-555-0101')
+        student_search.StudentSearchIndex.reindex([maria])
+        self.assertEqual(self.found('555', account_fields), {maria})
+
+    def test_index_follows_saves_and_deletes(self):
+        maria, mark = self.students
+        mark = User.objects.get(id=mark)
+        mark.full_name = 'Marco Polo'
+        mark.save()
+        self.assertEqual(self.found('polo'), {mark.id})
+        self.assertEqual(self.found('santos'), set())
+
+        with CaptureQueriesContext(connection) as queries:
+            mark.last_login = timezone.now()
+            mark.save(update_fields=['last_login'])
+        self.assertEqual(len(queries.captured_queries), 1)
+        # A full save with unchanged indexed values only reads the stored terms
+        with CaptureQueriesContext(connection) as queries:
+            User.objects.get(id=mark.id).save()
+        self.assertFalse(any('student_search' in query['sql'] and 'DELETE' in query['sql'] for query in queries.captured_queries))
+        mark.email = 'marco@travels.example'
+        mark.save(update_fields=['email'])
+        self.assertEqual(self.found('travel', ['email']), {mark.id})
+
+        StudentProfile.objects.get(user_id=maria).delete()
+        self.assertEqual(self.found('00123'), set())
+        self.assertEqual(self.found('cruz'), {maria})
+        User.objects.filter(id=maria).delete()
+        self.assertEqual(self.found('cruz'), set())
+
+
+class ProfilePictureTests(TestCase):
+    """Uploads are resized in the background and their URLs never touch the file system"""
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root.name))
+        user = User.objects.create(username='picture', full_name='Picture Owner', user_type='signatory', password='!')
+        self.profile = SignatoryProfile.objects.create(user=user, signatory_type='cashier')
+
+    def upload(self, size=(800, 600)):
+        from io import BytesIO
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from PIL import Image
+        content = BytesIO()
+        Image.new('RGBA', size, (200, 40, 40, 128)).save(content, 'PNG')
+        self.profile.profile_picture = SimpleUploadedFile('avatar.png', content.getvalue(), 'image/png')
+        self.profile.save()
+
+    def test_upload_is_resized_into_variants(self):
+        self.assertEqual(self.profile.profile_picture_thumbnail_url, '/static/images/default-profile.png')
+        self.upload()
+        self.assertEqual(self.profile.profile_picture_status, 'pending')
+        self.assertEqual(self.profile.profile_picture_url, self.profile.profile_picture.url)
+
+        self.assertEqual(profile_images.ProfilePictureService.process_pending()['ready'], 1)
+        profile = SignatoryProfile.objects.get(id=self.profile.id)
+        self.assertEqual(profile.profile_picture_variants['small']['width'], 64)
+        self.assertEqual(profile.profile_picture_variants['medium']['height'], 256)
+        with mock.patch('os.path.exists') as exists, mock.patch('os.stat') as stat:
+            url = profile.profile_picture_thumbnail_url
+        exists.assert_not_called()
+        stat.assert_not_called()
+        self.assertIn('/profile_pics/variants/signatoryprofile/', url)
+        self.assertTrue(url.endswith('-small.jpg'))
+
+        # A new upload replaces the old variant files
+        old_small = profile.profile_picture_variants['small']['name']
+        self.upload(size=(40, 40))
+        profile_images.ProfilePictureService.process_pending()
+        profile = SignatoryProfile.objects.get(id=self.profile.id)
+        self.assertEqual(profile.profile_picture_variants['medium']['width'], 40)
+        self.assertFalse(profile.profile_picture.storage.exists(old_small))
+
+    def test_missing_original_falls_back_to_default(self):
+        self.upload()
+        self.profile.profile_picture.storage.delete(self.profile.profile_picture.name)
+        self.assertEqual(profile_images.ProfilePictureService.process_pending()['missing'], 1)
+        profile = SignatoryProfile.objects.get(id=self.profile.id)
+        self.assertEqual(profile.profile_picture_url, '/static/images/default-profile.png')
+
+
+class StaticAssetTests(TestCase):
+    """collectstatic writes hashed, precompressed files and the middleware serves them immutable"""
+
+    def setUp(self):
+        source, static_root = tempfile.TemporaryDirectory(), tempfile.TemporaryDirectory()
+        self.addCleanup(source.cleanup)
+        self.addCleanup(static_root.cleanup)
+        os.makedirs(os.path.join(source.name, 'css'))
+        with open(os.path.join(source.name, 'css', 'site.css'), 'w') as css:
+            css.write('body { background: url("../images/gone.png"); }\n' + '.row { margin: 0 auto; }\n' * 200)
+        self.enterContext(override_settings(
+            STATIC_ROOT=static_root.name, STATICFILES_DIRS=[source.name],
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+        ))
+        from django.core.management import call_command
+        with self.assertLogs('landing.static_assets', 'WARNING'):
+            call_command('collectstatic', interactive=False, verbosity=0)
+        self.enterContext(mock.patch.object(static_assets, 'SERVE', True))
+        self.middleware = static_assets.StaticAssetsMiddleware(lambda request: None)
+
+    def get(self, url, **headers):
+        from django.test import RequestFactory
+        return self.middleware(RequestFactory().get(url, **headers))
+
+    def test_hashed_url_is_served_compressed_and_immutable(self):
+        from django.templatetags.static import static
+        url = static('css/site.css')
+        self.assertRegex(url, r'^/static/css/site\.[0-9a-f]{12}\.css$')
+
+        response = self.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertLess(int(response['Content-Length']), 1000)
+        self.assertEqual(self.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+        plain = self.get('/static/css/site.css')
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertEqual(plain['Cache-Control'], f'public, max-age={static_assets.MAX_AGE}')
+        self.assertIsNone(self.get('/static/css/missing.css'))
+
+
+class EmailOutboxTests(TestCase):
+    """Queued emails are claimed once, retried with backoff and given up on after MAX_ATTEMPTS"""
+
+    def setUp(self):
+        from django.core import mail
+        self.outbox = mail.outbox
+        self.user = User.objects.create(username='mailer', email='mailer@example.com', full_name='Mail Er', user_type='student', password='!')
+
+    def enqueue(self, count=1):
+        return email_outbox.EmailOutbox.enqueue_many([
+            {'user': self.user, 'email_type': 'test', 'recipient_email': self.user.email, 'subject': f'Subject {i}', 'content': 'Body'}
+            for i in range(count)
+        ])
+
+    def test_claimed_rows_are_not_claimed_again(self):
+        self.enqueue(3)
+        claimed = email_outbox.EmailOutbox._claim_batch(2)
+        self.assertEqual(len(claimed), 2)
+        self.assertEqual(len(email_outbox.EmailOutbox._claim_batch(10)), 1)
+        self.assertEqual(email_outbox.EmailOutbox._claim_batch(10), [])
+        claim = EmailNotificationLog.objects.get(id=claimed[0].id)
+        self.assertEqual(claim.status, 'sending')
+        self.assertGreater(claim.next_attempt_at, timezone.now() + timedelta(minutes=5))
+        # A claim outlasts a whole batch of sends timing out
+        with override_settings(EMAIL_TIMEOUT=30):
+            self.assertGreater(email_outbox.EmailOutbox.claim_timeout(50), timedelta(seconds=50 * 30))
+
+    def test_each_row_is_marked_sent_as_it_goes(self):
+        first, second = self.enqueue(2)
+        sends = []
+
+        def send_messages(connection, messages):
+            # The first email is already recorded when the second one goes out
+            sends.append(EmailNotificationLog.objects.get(id=first.id).status)
+            if len(sends) == 2:
+                raise OSError('connection dropped')
+            return len(messages)
+
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', send_messages), \
+                self.assertLogs('landing.email_outbox', 'ERROR'):
+            stats = email_outbox.EmailOutbox.deliver_batch()
+        self.assertEqual(sends, ['sending', 'sent'])
+        self.assertEqual((stats['sent'], stats['retrying']), (1, 1))
+        second = EmailNotificationLog.objects.get(id=second.id)
+        self.assertEqual((second.status, second.attempts), ('pending', 1))
+
+    def test_failures_back_off_then_dead_letter(self):
+        log, = self.enqueue()
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError('refused')), \
+                self.assertLogs('landing.email_outbox', 'ERROR'):
+            for attempt in range(1, email_outbox.EmailOutbox.MAX_ATTEMPTS + 1):
+                EmailNotificationLog.objects.filter(id=log.id).update(next_attempt_at=timezone.now())
+                before = timezone.now()
+                email_outbox.EmailOutbox.deliver_batch()
+                row = EmailNotificationLog.objects.get(id=log.id)
+                self.assertEqual(row.attempts, attempt)
+                if attempt < email_outbox.EmailOutbox.MAX_ATTEMPTS:
+                    self.assertEqual(row.status, 'pending')
+                    self.assertGreaterEqual(row.next_attempt_at - before, email_outbox.EmailOutbox.retry_delay(attempt))
+        self.assertEqual((row.status, row.next_attempt_at, row.error_message), ('failed', None, 'refused'))
+        self.assertEqual(email_outbox.EmailOutbox.deliver_batch()['claimed'], 0)
+        self.assertEqual(email_outbox.EmailOutbox.retry_delay(3), 4 * email_outbox.EmailOutbox.retry_delay(1))
+        self.assertEqual(self.outbox, [])
+
+
+class DashboardStatsTests(TestCase):
+    """The 7-day chart buckets are local days, counted without database time zone functions"""
+
+    def test_chart_buckets_follow_local_midnight(self):
+        student = User.objects.create(username='charts', full_name='Chart Student', user_type='student', password='!')
+        today = timezone.localdate()
+        midnight = dashboard_stats.DashboardStatsService._start_of_day(today)
+        for created_at, status in [
+            (midnight - timedelta(minutes=30), 'released'),
+            (midnight + timedelta(minutes=30), 'released'),
+            (midnight + timedelta(minutes=45), 'pending'),
+            (midnight - timedelta(days=8), 'released'),
+        ]:
+            request = DocumentRequest.objects.create(requester=student, document_type='Transcript of Records', status=status)
+            DocumentRequest.objects.filter(id=request.id).update(created_at=created_at)
+
+        with CaptureQueriesContext(connection) as queries:
+            charts = dashboard_stats.DashboardStatsService.build_institution_stats()['charts']
+        self.assertEqual(charts['visitors']['series'][0]['data'][-2:], [1, 2])
+        self.assertEqual(charts['documents']['series'][0]['data'][-2:], [1, 1])
+        self.assertEqual(sum(charts['visitors']['series'][0]['data']), 3)
+        self.assertFalse(any('cast_date' in query['sql'] or 'CONVERT_TZ' in query['sql'] for query in queries.captured_queries))
+
+
+class CsvExportTests(TestCase):
+    """Keyset chunks cover every row once, and a failed stream cannot pass for a complete file"""
+
+    def test_keyset_chunks_and_merge(self):
+        user = User.objects.create(username='csv', full_name='Csv User', user_type='registrar', password='!')
+        now = timezone.now()
+        for i in range(7):
+            Notification.objects.create(user=user, title=f'N{i}', message='m')
+        # Equal timestamps: every chunk boundary is decided by the pk tie-break
+        Notification.objects.update(created_at=now)
+        chunks = list(csv_export.iter_newest_first(Notification.objects.all(), 'created_at', ['title'], chunk_size=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(len({row[1] for row in csv_export.flatten(chunks)}), 7)
+
+        merged = csv_export.merge_newest_first([(3,), (1,)], [(2,), (0,)], key=lambda row: row[0])
+        self.assertEqual([row[0] for row in merged], [3, 2, 1, 0])
+
+    def test_failure_mid_stream_is_marked_and_raised(self):
+        def rows():
+            yield ['a', 1]
+            raise RuntimeError('database went away')
+
+        response = csv_export.streaming_csv_response('export.csv', ['name', 'count'], rows())
+        body = []
+        with self.assertLogs('landing.csv_export', 'ERROR'), self.assertRaises(RuntimeError):
+            for part in response.streaming_content:
+                body.append(part.decode())
+        self.assertEqual(body[0], 'name,count\r\n')
+        self.assertTrue(body[-1].startswith('# EXPORT FAILED'))
+
+
+class ReportJobQueueTests(TestCase):
+    """Jobs move pending -> generating -> completed/failed once, and a period gets one row"""
+
+    def setUp(self):
+        self.user = User.objects.create(username='reports', full_name='Report User', user_type='registrar', password='!')
+        self.period = (date(2026, 1, 5), date(2026, 1, 11))
+
+    def test_concurrent_enqueue_for_a_period_keeps_one_row(self):
+        # The other request inserts the period's row after our lookup ran: it sees no rows
+        other = GeneratedReport.objects.create(
+            report_type='clearance', generated_by=self.user, period_start=self.period[0], period_end=self.period[1],
+            parameters={'other': True}, status='pending'
+        )
+        select_for_update = GeneratedReport.objects.select_for_update
+        lookups = [GeneratedReport.objects.none()]
+
+        def stale_lookup(*args, **kwargs):
+            return lookups.pop() if lookups else select_for_update(*args, **kwargs)
+
+        with mock.patch.object(GeneratedReport.objects, 'select_for_update', side_effect=stale_lookup):
+            job = report_jobs.ReportJobQueue.enqueue('clearance', self.user, {'mine': True}, *self.period)
+        self.assertEqual(job.id, other.id)
+        self.assertEqual(GeneratedReport.objects.filter(report_type='clearance').count(), 1)
+        self.assertEqual(job.parameters, {'other': True})
+        self.assertEqual(job.dedup_key, f'clearance:{self.period[0]}:{self.period[1]}')
+
+        again = report_jobs.ReportJobQueue.enqueue('clearance', self.user, {'mine': True}, *self.period)
+        self.assertEqual(again.id, job.id)
+
+    def test_claim_run_and_fail(self):
+        job = report_jobs.ReportJobQueue.enqueue('clearance', self.user, {'form_type': 'clearance'}, *self.period)
+        self.assertEqual(job.status, 'pending')
+
+        claimed = report_jobs.ReportJobQueue._claim_job()
+        self.assertEqual((claimed.id, claimed.status), (job.id, 'generating'))
+        # A second worker finds nothing due while the claim is fresh
+        self.assertIsNone(report_jobs.ReportJobQueue._claim_job())
+        self.assertIsNone(report_jobs.ReportJobQueue.run_one(job.id))
+
+        with self.assertLogs('landing.report_jobs', 'ERROR'):
+            self.assertFalse(report_jobs.ReportJobQueue.run_job(claimed))
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertIn("No report job handler", job.error)
+        self.assertIsNotNone(job.finished_at)
+
+        # Regenerating the period reuses the failed row
+        requeued = report_jobs.ReportJobQueue.enqueue('clearance', self.user, {'form_type': 'clearance'}, *self.period)
+        self.assertEqual((requeued.id, requeued.status, requeued.error), (job.id, 'pending', None))
+        with mock.patch.object(report_jobs.ReportJobQueue, '_handler_for', return_value=lambda job: (b'pdf', 'report.pdf', '1 page')):
+            self.assertEqual(report_jobs.ReportJobQueue.run_pending(), {'completed': 1, 'failed': 0})
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.size_bytes, job.progress_done), ('completed', 3, 1))
+        job.file.delete(save=False)
+
+
+class PdfServiceTests(TestCase):
+    """Web processes render in-process unless a pool is configured, and never queue on a busy pool"""
+
+    def test_busy_pool_falls_back_to_in_process(self):
+        with mock.patch.object(pdf_service.PdfWorkerPool, '_spawn', return_value=mock.Mock()):
+            pool = pdf_service.PdfWorkerPool(size=1)
+        pool._idle.get_nowait()  # the only worker is rendering
+        with self.assertRaises(pdf_service.PoolBusy):
+            pool.render('<p>x</p>', wait=0.01)
+
+        busy_pool = mock.Mock(render=mock.Mock(side_effect=pdf_service.PoolBusy('No PDF worker became idle')))
+        with mock.patch.object(pdf_service, 'CONFIGURED_WORKERS', 2), \
+                mock.patch.object(pdf_service, '_get_local_pool', return_value=busy_pool), \
+                mock.patch.object(pdf_service, 'render_in_process', return_value=b'%PDF') as in_process, \
+                self.assertLogs('landing.pdf_service', 'WARNING'):
+            self.assertEqual(pdf_service.render_pdf('<p>x</p>'), b'%PDF')
+        in_process.assert_called_once_with('<p>x</p>')
+
+    def test_default_renders_without_a_pool(self):
+        with mock.patch.object(pdf_service, 'CONFIGURED_WORKERS', None), \
+                mock.patch.object(pdf_service, 'SERVICE_ADDRESS', None), \
+                mock.patch.object(pdf_service, '_get_local_pool') as get_pool, \
+                mock.patch.object(pdf_service, 'render_in_process', return_value=b'%PDF'):
+            self.assertEqual(pdf_service.render_pdf('<p>x</p>'), b'%PDF')
+            self.assertEqual(pdf_service.concurrency(), 1)
+        get_pool.assert_not_called()
+
+    def test_workers_are_not_spawned_with_the_uwsgi_binary(self):
+        with mock.patch.object(sys, 'executable', '/usr/local/bin/uwsgi'):
+            executable = pdf_service._python_executable()
+        self.assertTrue(os.path.basename(executable).startswith('python'))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class PdfRenderCacheTests(TestCase):
+    """Keys follow every input of the PDF, and the store stays under its size with LRU eviction"""
+
+    def setUp(self):
+        cache.clear()
+        root = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(mock.patch.object(PdfRenderCache, 'ROOT', root))
+        self.student = User.objects.create(username='pdfs', full_name='Pdf Student', user_type='student', password='!')
+        self.signatory = User.objects.create(username='pdfsig', full_name='Pdf Signatory', user_type='signatory', password='!')
+
+    def test_key_changes_with_form_signatories_and_user(self):
+        clearance = ClearanceForm.objects.create(student=self.student, clearance_type='enrollment', semester='1st')
+        signature = ClearanceSignatory.objects.create(clearance=clearance, signatory=self.signatory, role='cashier')
+
+        def key():
+            return PdfRenderCache.make_key('pdf/pdf-clearance-preview.html', 'clearance', clearance, self.student)
+
+        first = key()
+        self.assertEqual(key(), first)
+        signature.status = 'approved'
+        signature.save()
+        second = key()
+        self.assertNotEqual(second, first)
+        self.student.email = 'new@example.com'
+        self.assertNotEqual(key(), second)
+
+    def test_hits_replace_and_evict(self):
+        renders = []
+
+        def render():
+            renders.append(1)
+            return b'%PDF' + b'x' * 96
+
+        path, hit = PdfRenderCache.get_or_render('a1', 'clearance', 'form-1', render)
+        self.assertEqual((hit, len(renders)), (False, 1))
+        self.assertEqual(PdfRenderCache.get_or_render('a1', 'clearance', 'form-1', render), (path, True))
+        self.assertEqual(len(renders), 1)
+
+        # A new key for the same form replaces its previous render
+        new_path, _ = PdfRenderCache.get_or_render('a2', 'clearance', 'form-1', render)
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(os.path.exists(new_path))
+
+        with mock.patch.object(PdfRenderCache, 'MAX_BYTES', 250):
+            second = PdfRenderCache.put('b1', 'clearance', 'form-2', b'%PDF' + b'y' * 96)
+            os.utime(new_path, (time.time() - 60, time.time() - 60))
+            os.utime(second, (time.time() - 30, time.time() - 30))
+            # A hit makes form-1 the most recently used, so form-2 is evicted first
+            PdfRenderCache.get('a2', 'clearance', 'form-1')
+            third = PdfRenderCache.put('c1', 'clearance', 'form-3', b'%PDF' + b'z' * 96)
+        self.assertTrue(os.path.exists(new_path))
+        self.assertFalse(os.path.exists(second))
+        self.assertTrue(os.path.exists(third))
+        stats = PdfRenderCache.stats()
+        self.assertEqual((stats['hits'], stats['evictions'], stats['files']), (2, 1, 2))
+
+    def test_failed_renders_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            PdfRenderCache.get_or_render('h1', 'clearance', 'form-4', lambda: b'<html>engines failed</html>')
+        self.assertIsNone(PdfRenderCache.get('h1', 'clearance', 'form-4'))
+
+        # One stored before the check is dropped and rendered again
+        path = PdfRenderCache.path_for('h2', 'clearance', 'form-4')
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(b'<html></html>')
+        self.assertEqual(PdfRenderCache.get_or_render('h2', 'clearance', 'form-4', lambda: b'%PDF-1.4'), (path, False))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CacheNamespaceTests(TestCase):
+    """Namespaces are dropped as a whole after the commit of a bound model's change, and ETags follow them"""
+
+    def setUp(self):
+        cache.clear()
+        self.namespace = landing_cache.CacheNamespace(f'test_{uuid.uuid4().hex}', timeout=60)
+        self.addCleanup(landing_cache._namespaces.pop, self.namespace.name)
+        self.user = User.objects.create(username='cached', full_name='Cached User', user_type='registrar', password='!')
+
+    def test_get_or_set_and_invalidate_on_commit(self):
+        self.namespace.invalidate_on(CalendarEvent)
+        for signal, suffix in ((post_save, 'save'), (post_delete, 'delete')):
+            uid = f'landing.cache:{self.namespace.name}:{CalendarEvent._meta.label}:{suffix}'
+            self.addCleanup(signal.disconnect, sender=CalendarEvent, dispatch_uid=uid)
+        builds = []
+        build = lambda: builds.append(1) or len(builds)
+        self.assertEqual(self.namespace.get_or_set(['a', 1], build), 1)
+        self.assertEqual(self.namespace.get_or_set(['a', 1], build), 1)
+        self.assertEqual(self.namespace.get_or_set(['a', 2], build), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CalendarEvent.objects.create(title='Exam', start_date=date.today(), created_by=self.user)
+            # Not before the commit: another process could re-cache the old data
+            self.assertEqual(self.namespace.get(['a', 1]), 1)
+        self.assertIsNone(self.namespace.get(['a', 1]))
+        self.assertEqual(self.namespace.get_or_set(['a', 1], build), 3)
+
+    def test_conditional_get_answers_304_until_invalidated(self):
+        views = []
+
+        @landing_cache.conditional_get(self.namespace)
+        def view(request):
+            views.append(1)
+            return JsonResponse({'ok': True})
+
+        def get(etag=None):
+            request = RequestFactory().get('/data/', HTTP_IF_NONE_MATCH=etag) if etag else RequestFactory().get('/data/')
+            request.user = self.user
+            return view(request)
+
+        etag = get()['ETag']
+        self.assertEqual(get(etag).status_code, 304)
+        self.assertEqual(len(views), 1)
+        self.namespace.invalidate()
+        response = get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class BulkDecisionTests(TestCase):
+    """Bulk approvals upsert one record per form and signatory and complete forms that have every approval"""
+
+    def setUp(self):
+        self.student = User.objects.create(username='bulk', full_name='Bulk Student', user_type='student', password='!')
+        self.cashier = User.objects.create(username='bulkcash', full_name='Bulk Cashier', user_type='signatory', password='!')
+        self.librarian = User.objects.create(username='bulklib', full_name='Bulk Librarian', user_type='signatory', password='!')
+
+    def clearance(self, *statuses):
+        clearance = ClearanceForm.objects.create(student=self.student, clearance_type='enrollment', semester='1st')
+        for signatory, status in zip((self.cashier, self.librarian), statuses):
+            ClearanceSignatory.objects.create(clearance=clearance, signatory=signatory, role=signatory.username, status=status)
+        return clearance
+
+    def test_approve_skips_upserts_and_completes(self):
+        pending, done, new = self.clearance('pending', 'approved'), self.clearance('approved', 'pending'), self.clearance()
+        # No cashier record yet, and the librarian still has to sign
+        ClearanceSignatory.objects.create(clearance=new, signatory=self.librarian, role='bulklib')
+        counters_before = PendingCounter.counts_for(self.cashier)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = bulk_decisions.BulkDecisionService.approve(
+                'clearance', [pending.id, done.id, new.id, 'not-a-uuid'], self.cashier, 'cashier', notify=False
+            )
+        self.assertEqual(result['results'], {
+            str(pending.id): 'completed', str(done.id): 'skipped', str(new.id): 'approved', 'not-a-uuid': 'not_found',
+        })
+        # The existing pending record was updated in place, the missing one inserted
+        self.assertEqual(ClearanceSignatory.objects.filter(clearance__in=[pending, new], signatory=self.cashier).count(), 2)
+        self.assertFalse(ClearanceSignatory.objects.filter(signatory=self.cashier, status='pending').exists())
+        pending.refresh_from_db()
+        new.refresh_from_db()
+        self.assertEqual((pending.status, new.status), ('approved', 'pending'))
+        self.assertEqual(counters_before['clearance'] - 1, PendingCounter.counts_for(self.cashier)['clearance'])
+
+    def test_bulk_upsert_updates_rows_on_conflict(self):
+        clearance = self.clearance('pending')
+        rows = [
+            ClearanceSignatory(clearance=clearance, signatory=signatory, status='approved', role='x', updated_at=timezone.now())
+            for signatory in (self.cashier, self.librarian)
+        ]
+        bulk_upsert(ClearanceSignatory, rows, unique_fields=['clearance', 'signatory'], update_fields=['status', 'updated_at'])
+        self.assertEqual(
+            sorted(ClearanceSignatory.objects.filter(clearance=clearance).values_list('signatory__username', 'status', 'role')),
+            [('bulkcash', 'approved', 'bulkcash'), ('bulklib', 'approved', 'x')],
+        )
+        self.assertEqual(bulk_upsert(ClearanceSignatory, [], ['clearance', 'signatory'], ['status']), [])
+
+
+class PendingCounterTests(TestCase):
+    """The F() deltas applied by the signals always agree with a full recount()"""
+
+    def setUp(self):
+        self.student = User.objects.create(username='counted', full_name='Counted Student', user_type='student', password='!')
+        self.signatories = [
+            User.objects.create(username=f'counter{i}', full_name=f'Counter {i}', user_type='signatory', password='!')
+            for i in range(3)
+        ]
+
+    def assertMatchesRecount(self):
+        counts = lambda: {
+            (user_id, form_type): count
+            for user_id, form_type, count in PendingCounter.objects.values_list('user_id', 'form_type', 'count') if count
+        }
+        maintained = counts()
+        PendingCounter.recount()
+        self.assertEqual(maintained, counts())
+        return maintained
+
+    def test_status_changes_and_deletes(self):
+        first, second, third = self.signatories
+        clearance = ClearanceForm.objects.create(student=self.student, clearance_type='enrollment', semester='1st')
+        records = {
+            signatory: ClearanceSignatory.objects.create(clearance=clearance, signatory=signatory, role=signatory.username)
+            for signatory in self.signatories
+        }
+        enrollment = EnrollmentForm.objects.create(
+            user=self.student, enrollment_date=date.today(), academic_year='2025-2026', course='BSIT', year='1', section='A',
+        )
+        enrollment_record = EnrollmentSignatory.objects.create(enrollment=enrollment, signatory=first, role='dean')
+        self.assertEqual(len(self.assertMatchesRecount()), 4)
+
+        records[first].status = 'approved'
+        records[first].save()
+        records[second].status = 'disapproved'
+        records[second].save()
+        self.assertEqual(set(self.assertMatchesRecount()), {(third.id, 'clearance'), (first.id, 'enrollment')})
+
+        # The form leaving and re-entering 'pending' moves all of its pending records
+        clearance.status = 'approved'
+        clearance.save()
+        self.assertEqual(set(self.assertMatchesRecount()), {(first.id, 'enrollment')})
+        clearance.status = 'pending'
+        clearance.save()
+        records[second].status = 'pending'
+        records[second].save()
+        self.assertEqual(len(self.assertMatchesRecount()), 3)
+
+        records[third].delete()
+        enrollment_record.status = 'approved'
+        enrollment_record.save()
+        self.assertEqual(set(self.assertMatchesRecount()), {(second.id, 'clearance')})
+        # Deleting the form cascades to its records, which are still counted until then
+        clearance.delete()
+        self.assertEqual(self.assertMatchesRecount(), {})
+
+    def test_adjust_never_goes_below_zero(self):
+        user = self.signatories[0]
+        PendingCounter.adjust({(user.id, 'clearance'): 2, (user.id, 'graduation'): 0})
+        with CaptureQueriesContext(connection) as queries:
+            PendingCounter.adjust({(user.id, 'clearance'): -5})
+        self.assertEqual(PendingCounter.counts_for(user), {'clearance': 0})
+        # Clamped before the subtraction: MySQL rejects a negative UNSIGNED intermediate
+        update = next(query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE'))
+        self.assertIn('CASE WHEN', update)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class EventPollTests(TestCase):
+    """Polls never wait on sync workers and unchanged polls are answered from the version counters"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='poller', full_name='Poller', user_type='registrar', password='!')
+        self.client.force_login(self.user)
+        self.url = reverse('api_event_poll')
+
+    def test_unchanged_poll_skips_the_events_query(self):
+        first = self.client.get(self.url).json()
+        self.assertEqual((first['wait'], first['interval']), (0, event_stream.POLL_INTERVAL_SECONDS))
+        params = {'after': first['last_event_id'], 'version': first['version'], 'timeout': 20}
+
+        started = time.monotonic()
+        with CaptureQueriesContext(connection) as queries:
+            unchanged = self.client.get(self.url, params).json()
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(unchanged['events'], [])
+        self.assertFalse(any('user_events' in query['sql'] for query in queries.captured_queries))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event_stream.EventStream.publish('dashboard_stale', {'form_type': 'clearance'}, users=[self.user.id])
+        changed = self.client.get(self.url, params).json()
+        self.assertEqual([event['type'] for event in changed['events']], ['dashboard_stale'])
+        self.assertNotEqual(changed['version'], first['version'])
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class NotificationConditionalGetTests(TestCase):
+    """The notification ETag follows every count the view renders"""
+
+    def test_pending_document_requests_change_the_etag(self):
+        registrar = User.objects.create(username='notified', full_name='Notified', user_type='registrar', password='!')
+        student = User.objects.create(username='requester', full_name='Requester', user_type='student', password='!')
+        request = DocumentRequest.objects.create(requester=student, document_type='Transcript of Records', status='draft')
+        self.client.force_login(registrar)
+        url = reverse('get_notifications_enhanced_api')
+
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # No signals and no notification row involved: only the live document request count moves
+        DocumentRequest.objects.filter(id=request.id).update(status='pending')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -34,10 +34,24 @@ LOGGING = {
         'console': {
             'class': 'logging.StreamHandler',
         },
+        # Slow and N+1-suspect requests, one JSON object per line (see landing/request_metrics.py)
+        'slow_requests_file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': os.path.join(BASE_DIR, 'logs', 'slow_requests.log'),
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5,
+            'delay': True,
+        },
     },
     'loggers': {
+        'landing.request_metrics': {
+            'handlers': ['slow_requests_file'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
 }
+os.makedirs(os.path.join(BASE_DIR, 'logs'), exist_ok=True)
 
 # Detect if we're running on PythonAnywhere
 import socket
@@ -101,6 +115,83 @@ DEFAULT_FROM_EMAIL = 'ptstestsystememail@gmail.com'  # Replace with your Gmail a
 # Email timeout settings
 EMAIL_TIMEOUT = 30  # seconds
 
+# Email outbox - notification emails are queued in EmailNotificationLog and
+# delivered by `python manage.py send_queued_emails` (cron) or the Celery task
+EMAIL_OUTBOX_BATCH_SIZE = 50  # emails sent per SMTP connection
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5  # give up (status 'failed') after this many attempts
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = 60  # backoff: 1, 2, 4, 8 ... minutes between retries
+
+# Report jobs - manual reports and signatory packs are queued as GeneratedReport rows and
+# generated by `python manage.py run_report_jobs --loop` (or the Celery task)
+REPORT_JOBS_USE_CELERY = False  # True: start each job on Celery as soon as it is queued
+
+# Profile pictures - uploads are resized to square JPEG variants (see landing/profile_images.py)
+# by `python manage.py process_profile_pictures --loop` (or the Celery task); list endpoints
+# and chat avatars use 'small', profile pages 'medium'
+PROFILE_PICTURE_VARIANTS = {'small': 64, 'medium': 256}  # variant -> edge in pixels
+PROFILE_PICTURE_JPEG_QUALITY = 85
+PROFILE_PICTURES_USE_CELERY = False  # True: resize each upload on Celery as soon as it is saved
+
+# PDF rendering - HTML is converted by warm worker processes (see landing/pdf_service.py).
+# Run `python manage.py run_pdf_service` and set PDF_RENDER_SERVICE_ADDRESS to share one pool
+# between all web processes; without it they render in-process.
+# None: one worker per core in run_pdf_service; N also gives each web process its own pool (0: render on the request thread)
+PDF_RENDER_WORKERS = int(os.environ['PDF_RENDER_WORKERS']) if os.environ.get('PDF_RENDER_WORKERS') else None
+PDF_RENDER_PYTHON_EXECUTABLE = None  # interpreter for the workers; found under sys.exec_prefix when None (uWSGI)
+PDF_RENDER_QUEUE_WAIT_SECONDS = 10  # render in-process when no worker is idle after this
+PDF_RENDER_TIMEOUT_SECONDS = 120  # a worker still rendering after this is killed and replaced
+PDF_RENDER_MEMORY_LIMIT_MB = 1024  # address space limit per worker (not enforced on Windows)
+PDF_RENDER_MAX_JOBS_PER_WORKER = 200  # recycle workers to contain leaks in the PDF libraries
+PDF_RENDER_SERVICE_ADDRESS = os.environ.get('PDF_RENDER_SERVICE_ADDRESS') or None  # '127.0.0.1:8765' or a socket path
+
+# Rendered form PDFs are cached under MEDIA_ROOT/PDF_RENDER_CACHE_DIR (see landing/pdf_cache.py)
+PDF_RENDER_CACHE_DIR = 'pdf_cache'
+PDF_RENDER_CACHE_MAX_BYTES = 512 * 1024 * 1024  # least recently used files are evicted above this
+
+# Event stream - notifications, messages and dashboard changes are pushed to open pages over
+# Server-Sent Events (api/events/stream/) or polling (api/events/poll/); see landing/event_stream.py.
+# Worker cost: a request that waits holds a web worker for the whole wait. With the defaults a poll
+# answers at once and an open page sends one short request every EVENT_STREAM_POLL_INTERVAL_SECONDS
+# (about 0.1 worker-seconds, usually a cache read with no event query), which suits sync uWSGI
+# workers on PythonAnywhere. Long polling (EVENT_STREAM_LONG_POLL_SECONDS > 0) and SSE keep one
+# worker or thread busy per open tab almost all the time: only use them on threaded or async servers
+# with at least as many spare threads as open staff tabs.
+EVENT_STREAM_SSE_ENABLED = False  # True: pages hold an SSE stream open instead of polling
+EVENT_STREAM_SECONDS = 55  # one SSE response; the browser reconnects and resumes after it
+EVENT_STREAM_LONG_POLL_SECONDS = 0  # longest wait of one poll; 0 answers at once
+EVENT_STREAM_POLL_INTERVAL_SECONDS = 10  # pause between polls when the server does not wait
+EVENT_STREAM_RETENTION_HOURS = 24  # `python manage.py prune_user_events` deletes older events
+
+# Dashboard statistics cache (invalidated on form/signature changes)
+DASHBOARD_STATS_CACHE_TTL = 60  # seconds
+
+# Polled JSON endpoints answer 304 Not Modified while their data is unchanged (landing/cache.py conditional_get).
+# ETags also roll over after this many seconds, for time-based fields such as "days pending".
+CONDITIONAL_GET_MAX_AGE = 600
+
+# Audit and activity logs - record_activity() buffers rows per process and writes them in batches
+# after the response is sent (landing/activity_log.py). Buffered rows are journaled to disk;
+# `python manage.py replay_activity_journal` writes out journals left by dead processes.
+ACTIVITY_LOG_SYNC = False  # True: write each row immediately (tests, debugging)
+ACTIVITY_LOG_BUFFER_SIZE = 200
+ACTIVITY_LOG_FLUSH_SECONDS = 5
+ACTIVITY_LOG_JOURNAL_DIR = os.path.join(BASE_DIR, 'logs', 'activity_journal')
+
+# Activity rollups - per day/actor/form type/action counts read by the weekly reports
+# (landing/activity_rollups.py). Run `python manage.py rollup_activity` from cron (e.g. hourly);
+# each run also rebuilds this many days before its previous run, for log rows written late.
+ACTIVITY_ROLLUP_REOPEN_DAYS = 2
+
+# Request metrics - per-request SQL count/time, repeated queries, Python time and response size
+# (landing/request_metrics.py). Per-view percentiles: api/request-metrics/ (staff only); slow and
+# N+1-suspect requests: logs/slow_requests.log and the Slow request logs admin page.
+# `python manage.py prune_request_metrics` deletes data older than the retention period.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED') == '1'
+REQUEST_METRICS_SLOW_MS = 1000
+REQUEST_METRICS_N_PLUS_ONE_THRESHOLD = 10  # runs of one query (parameters aside) in a single request
+REQUEST_METRICS_WINDOW_SECONDS = 300  # each worker writes its per-view totals this often
+REQUEST_METRICS_RETENTION_DAYS = 14
+
 # For testing without sending actual emails, uncomment this:
 # EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
@@ -120,7 +211,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'landing.request_metrics.RequestMetricsMiddleware',  # first, so the timings cover every other middleware
     'django.middleware.security.SecurityMiddleware',
+    'landing.static_assets.StaticAssetsMiddleware',  # serves /static/ before sessions and auth are touched
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -185,6 +278,40 @@ else:
         }
     }
 
+# Offline test runs use SQLite instead of MySQL: `TEST_DB=sqlite python manage.py test landing`
+if os.environ.get('TEST_DB') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.path.join(BASE_DIR, 'test_db.sqlite3'),
+        }
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# File-based by default so every worker process sees the same entries and the
+# same invalidations (see landing/cache.py). Set REDIS_URL to use Redis instead.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+            'KEY_PREFIX': 'pts',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.path.join(BASE_DIR, '.django_cache'),
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                'MAX_ENTRIES': 5000,
+            },
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -233,6 +360,16 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),  # create a 'static' folder inside your project
 ]
 
+# collectstatic writes content-hashed copies (staticfiles.json maps the names {% static %}
+# resolves) plus .gz/.br siblings; StaticAssetsMiddleware serves them with far-future
+# Cache-Control headers (see landing/static_assets.py)
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'landing.static_assets.CompressedManifestStaticFilesStorage'},
+}
+STATIC_ASSETS_SERVE = not DEBUG  # runserver serves static files itself in DEBUG
+STATIC_ASSETS_MAX_AGE = 60  # seconds browsers may cache files requested by their unhashed name
+
 MEDIA_URL = 'media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
@@ -28,6 +28,9 @@ urlpatterns = [
     path('api/notifications/mark-all-read/', views.mark_all_notifications_read_api, name='mark_all_notifications_read_api'),
     path('api/browser-notifications/', views.api_browser_notifications, name='api_browser_notifications'),
     path('api/mark-browser-notification-shown/', views.api_mark_browser_notification_shown, name='api_mark_browser_notification_shown'),
+    path('api/events/stream/', views.api_event_stream, name='api_event_stream'),
+    path('api/events/poll/', views.api_event_poll, name='api_event_poll'),
+    path('api/request-metrics/', views.api_request_metrics, name='api_request_metrics'),
     path("", views.landing),
     path('verify-otp/', views.verify_otp, name='verify_otp'),
     path('verify-otp-submit/', views.verify_otp_submit, name='verify_otp_submit'),
@@ -135,9 +138,11 @@ urlpatterns = [
     path('registrar/reports/forms/api/list/', views.registrar_forms_list_api, name='registrar_forms_list_api'),
     path('registrar/forms/<str:form_type>/<uuid:form_id>/download/', views.registrar_form_download, name='registrar_form_download'),
     path('registrar/forms/<str:form_type>/<uuid:form_id>/view/', views.registrar_form_view, name='registrar_form_view'),
+    path('registrar/forms/pdf-cache/stats/', views.registrar_pdf_cache_stats, name='registrar_pdf_cache_stats'),
     path('registrar/reports/generate/', views.registrar_generate_manual_report, name='registrar_generate_manual_report'),
     path('registrar/reports/generate-pack/', views.registrar_generate_signatory_pack, name='registrar_generate_signatory_pack'),
     path('registrar/reports/download-report/<uuid:report_id>/', views.registrar_download_report, name='registrar_download_report'),
+    path('reports/jobs/<uuid:job_id>/', views.report_job_status, name='report_job_status'),
     path('registrar/reports/regenerate-weekly/', views.registrar_regenerate_weekly_report, name='registrar_regenerate_weekly_report'),
     path('registrar/user-management/', views.registrar_user_management, name='registrar_user_management'),
     path('registrar/user-management/api/data/', views.user_management_data_api, name='user_management_data_api'),
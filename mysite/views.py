@@ -7,7 +7,19 @@ from django.contrib import messages
 from django.contrib.auth import get_user_model, authenticate, login as auth_login, logout, update_session_auth_hash
 from django.db import IntegrityError, transaction
 from django.contrib.auth.decorators import login_required
-from landing.models import StudentProfile, AlumniProfile, DocumentRequest, ClearanceForm, ClearanceSignatory, EnrollmentForm, GraduationForm, GraduationSignatory, EnrollmentSignatory, AuditLog, SignatoryProfile, SignatoryActivityLog, BusinessManagerActivityLog, AutoGeneratedReport, GeneratedReport, BusinessManagerProfile
+from landing.clearance_grid import ClearanceGridService, InvalidCursor
+from landing.activity_log import record_activity
+from landing.activity_rollups import local_day_range
+from landing.student_search import search_students
+from landing.bulk_decisions import BulkDecisionService
+from landing.cache import CALENDAR, CLEARANCE_DATA, DASHBOARD_STATS, DOCUMENT_DATA, ENROLLMENT_DATA, FILTER_OPTIONS, GRADUATION_DATA, conditional_get
+from landing.csv_export import flatten, iter_newest_first, merge_newest_first, streaming_csv_response
+from landing.curriculum_index import CurriculumIndex
+from landing.form_grid import FormGridService, format_timestamp
+from landing.dashboard_stats import DashboardStatsService
+from landing.pdf_cache import PdfRenderCache
+from landing.report_jobs import ACTION_TYPE_BY_REPORT, ReportJobQueue
+from landing.models import StudentProfile, AlumniProfile, DocumentRequest, ClearanceForm, ClearanceSignatory, EnrollmentForm, GraduationForm, GraduationSignatory, EnrollmentSignatory, AuditLog, SignatoryProfile, SignatoryActivityLog, BusinessManagerActivityLog, AutoGeneratedReport, GeneratedReport, BusinessManagerProfile, ClearanceStatusMatrix
 from django.core.files.storage import default_storage
 import uuid
 from datetime import date, timedelta
@@ -23,6 +35,7 @@ from django.core.files.base import ContentFile
 import os
 from django.conf import settings
 from django.core.files.images import get_image_dimensions
+from django.templatetags.static import static
 
 
 
@@ -122,286 +135,9 @@ def cleanup_duplicate_signatory_records():
     return total_deleted
 
 def convert_html_to_pdf(html_content):
-    """Convert HTML content to PDF using multiple fallback options, preserving styling"""
-    import io
-    from datetime import datetime, timezone as dt_timezone
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Try xhtml2pdf FIRST - Works reliably on Windows and preserves styling
-    try:
-        from xhtml2pdf import pisa
-        
-        logger.info("Using xhtml2pdf for PDF generation (preserves styling)")
-        
-        # Create a PDF buffer
-        pdf_buffer = io.BytesIO()
-        
-        # Convert HTML to PDF
-        pisa_status = pisa.CreatePDF(html_content, dest=pdf_buffer)
-        
-        # Check if conversion was successful
-        if not pisa_status.err:
-            pdf_buffer.seek(0)
-            return pdf_buffer.getvalue()
-        else:
-            logger.warning(f"xhtml2pdf conversion had errors: {pisa_status.err}")
-            raise Exception(f"xhtml2pdf conversion failed with {pisa_status.err} errors")
-            
-    except (ImportError, Exception) as e:
-        logger.warning(f"xhtml2pdf failed: {e}, trying ReportLab fallback")
-        # ReportLab fallback - try to preserve some basic styling
-        try:
-            from reportlab.lib.pagesizes import A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib import colors
-            from reportlab.lib.units import inch
-            from html import unescape
-            import re
-            
-            logger.info("Using ReportLab for PDF generation (limited styling)")
-            
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=20*72/25.4, bottomMargin=25*72/25.4, leftMargin=20*72/25.4, rightMargin=20*72/25.4)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Professional academic styles
-            letterhead_style = ParagraphStyle(
-                'LetterheadTitle',
-                parent=styles['Title'],
-                fontSize=18,
-                spaceAfter=8,
-                alignment=1,  # Center
-                textColor=colors.HexColor('#1a365d'),
-                fontName='Times-Bold',
-                letterSpacing=1
-            )
-            
-            institution_subtitle_style = ParagraphStyle(
-                'InstitutionSubtitle',
-                parent=styles['Normal'],
-                fontSize=12,
-                spaceAfter=6,
-                alignment=1,  # Center
-                textColor=colors.HexColor('#2c5aa0'),
-                fontName='Times-Italic'
-            )
-            
-            office_style = ParagraphStyle(
-                'OfficeStyle',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=20,
-                alignment=1,  # Center
-                textColor=colors.HexColor('#666666'),
-                fontName='Times-Roman'
-            )
-            
-            title_style = ParagraphStyle(
-                'DocumentTitle',
-                parent=styles['Title'],
-                fontSize=16,
-                spaceAfter=12,
-                alignment=1,  # Center
-                textColor=colors.HexColor('#1a365d'),
-                fontName='Times-Bold',
-                letterSpacing=0.5
-            )
-            
-            metadata_label_style = ParagraphStyle(
-                'MetadataLabel',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=4,
-                textColor=colors.HexColor('#1a365d'),
-                fontName='Times-Bold'
-            )
-            
-            metadata_value_style = ParagraphStyle(
-                'MetadataValue',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=4,
-                textColor=colors.HexColor('#1a1a1a'),
-                fontName='Times-Roman'
-            )
-            
-            # Add institutional letterhead
-            story.append(Paragraph("PHILIPPINE THEOLOGICAL SEMINARY", letterhead_style))
-            story.append(Paragraph("Academic Excellence in Christian Education", institution_subtitle_style))
-            story.append(Paragraph("Office of the Registrar - Student Records Management", office_style))
-            
-            # Add separator line
-            from reportlab.platypus import HRFlowable
-            story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#1a365d')))
-            story.append(Spacer(1, 20))
-            
-            # Extract and add document title
-            title_match = re.search(r'<div[^>]*class="document-title"[^>]*>([^<]+)</div>', html_content, re.IGNORECASE)
-            if title_match:
-                story.append(Paragraph(title_match.group(1).strip().upper(), title_style))
-            else:
-                story.append(Paragraph("STUDENT RECORDS ACTIVITY REPORT", title_style))
-            
-            story.append(Paragraph("Official Academic Document", metadata_value_style))
-            story.append(Spacer(1, 20))
-            
-            # Extract and add metadata in professional format
-            gen_date_match = re.search(r'Generated On:</div>.*?<div[^>]*class="metadata-value"[^>]*>([^<]+)</div>', html_content, re.DOTALL | re.IGNORECASE)
-            gen_by_match = re.search(r'Generated By:</div>.*?<div[^>]*class="metadata-value"[^>]*>([^<]+)</div>', html_content, re.DOTALL | re.IGNORECASE)
-            period_match = re.search(r'Report Period:</div>.*?<div[^>]*class="metadata-value"[^>]*>([^<]+)</div>', html_content, re.DOTALL | re.IGNORECASE)
-            total_match = re.search(r'Total Records:</div>.*?<div[^>]*class="metadata-value"[^>]*>([^<]+)</div>', html_content, re.DOTALL | re.IGNORECASE)
-            
-            # Create metadata table
-            metadata = []
-            if gen_date_match:
-                metadata.append(["Generated On:", gen_date_match.group(1).strip()])
-            if gen_by_match:
-                metadata.append(["Generated By:", gen_by_match.group(1).strip()])
-            if period_match:
-                metadata.append(["Report Period:", period_match.group(1).strip()])
-            if total_match:
-                metadata.append(["Total Records:", total_match.group(1).strip()])
-            
-            if metadata:
-                metadata_table = Table(metadata, colWidths=[2*inch, 4*inch])
-                metadata_table.setStyle(TableStyle([
-                    ('FONTNAME', (0, 0), (0, -1), 'Times-Bold'),
-                    ('FONTNAME', (1, 0), (1, -1), 'Times-Roman'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 11),
-                    ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a365d')),
-                    ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1a1a1a')),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-                    ('TOPPADDING', (0, 0), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-                ]))
-                story.append(metadata_table)
-            
-            story.append(Spacer(1, 25))
-            
-            # Extract table data
-            table_match = re.search(r'<table[^>]*class="data-table"[^>]*>(.*?)</table>', html_content, re.DOTALL | re.IGNORECASE)
-            if table_match:
-                table_html = table_match.group(1)
-                
-                # Extract headers
-                header_match = re.search(r'<thead[^>]*>(.*?)</thead>', table_html, re.DOTALL | re.IGNORECASE)
-                if header_match:
-                    header_html = header_match.group(1)
-                    headers = re.findall(r'<th[^>]*>([^<]+)</th>', header_html, re.IGNORECASE)
-                    headers = [unescape(h.strip()) for h in headers]
-                else:
-                    headers = ['Date & Time', 'Reference/ID', 'Requester/Student', 'Program/Dept', 'Status', 'Signatory']
-                
-                # Extract rows
-                tbody_match = re.search(r'<tbody[^>]*>(.*?)</tbody>', table_html, re.DOTALL | re.IGNORECASE)
-                if tbody_match:
-                    tbody_html = tbody_match.group(1)
-                    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', tbody_html, re.DOTALL | re.IGNORECASE)
-                    
-                    table_data = [headers]
-                    for row_html in rows:
-                        cells = re.findall(r'<td[^>]*>(.*?)</td>', row_html, re.DOTALL | re.IGNORECASE)
-                        clean_cells = []
-                        for cell in cells:
-                            # Clean cell content
-                            clean_cell = re.sub(r'<span[^>]*class="status-pill[^>]*>([^<]+)</span>', r'\1', cell)
-                            clean_cell = re.sub(r'<[^>]+>', ' ', clean_cell)
-                            clean_cell = unescape(clean_cell).strip()
-                            clean_cells.append(clean_cell)
-                        
-                        if clean_cells:
-                            table_data.append(clean_cells)
-                    
-                    if len(table_data) > 1:  # Has data beyond headers
-                        # Add table title
-                        table_title_style = ParagraphStyle(
-                            'TableTitle',
-                            parent=styles['Normal'],
-                            fontSize=12,
-                            fontName='Times-Bold',
-                            textColor=colors.HexColor('#1a365d'),
-                            alignment=1,
-                            spaceAfter=10
-                        )
-                        story.append(Paragraph("Student Activity Records", table_title_style))
-                        
-                        # Create professional academic table with fixed column widths
-                        col_widths = [1.3*inch, 0.9*inch, 1.8*inch, 1.1*inch, 0.9*inch, 1.3*inch]
-                        table = Table(table_data, colWidths=col_widths, repeatRows=1)
-                        table.setStyle(TableStyle([
-                            # Header styling - Academic blue
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 9),
-                            ('ALIGN', (0, 0), (-1, 0), 'LEFT'),
-                            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                            
-                            # Data styling
-                            ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
-                            ('FONTSIZE', (0, 1), (-1, -1), 9),
-                            
-                            # Grid lines
-                            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#d0d7de')),
-                            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1a365d')),
-                            
-                            # Alternating row colors
-                            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-                            
-                            # Professional padding
-                            ('TOPPADDING', (0, 0), (-1, -1), 8),
-                            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                            
-                            # Center alignment for specific columns
-                            ('ALIGN', (1, 1), (1, -1), 'CENTER'),  # Reference ID
-                            ('ALIGN', (4, 1), (4, -1), 'CENTER'),  # Status
-                        ]))
-                        story.append(table)
-                    else:
-                        # No data message
-                        no_data_style = ParagraphStyle(
-                            'NoData',
-                            parent=styles['Normal'],
-                            fontSize=14,
-                            alignment=1,
-                            textColor=colors.HexColor('#4a5568'),
-                            spaceAfter=10
-                        )
-                        story.append(Paragraph("No records found", no_data_style))
-                        story.append(Paragraph("No data was found for the specified criteria and date range.", styles['Normal']))
-            
-            # Add signature section
-            story.append(Spacer(1, 40))
-            signature_line = HRFlowable(width=3.5*inch, thickness=1, color=colors.HexColor('#1a365d'))
-            signature_line.hAlign = 'RIGHT'
-            story.append(signature_line)
-            
-            signature_style = ParagraphStyle(
-                'Signature',
-                parent=styles['Normal'],
-                fontSize=10,
-                textColor=colors.HexColor('#666666'),
-                alignment=2,  # Right align
-                topSpace=5
-            )
-            story.append(Paragraph("Registrar / Authorized Official", signature_style))
-            
-            doc.build(story)
-            logger.info("PDF generated using ReportLab with enhanced styling")
-            return buffer.getvalue()
-            
-        except Exception as fallback_error:
-            logger.error(f"ReportLab fallback failed: {fallback_error}")
-            # Final fallback - return HTML as bytes
-            logger.warning("All PDF engines failed, returning HTML content as bytes")
-            return html_content.encode('utf-8')
+    """Convert HTML content to PDF on the warm rendering workers (see landing/pdf_service.py)"""
+    from landing.pdf_service import render_pdf
+    return render_pdf(html_content)
 
 def get_client_ip(request):
     """Get the client's IP address"""
@@ -2333,190 +2069,52 @@ def registrar_clearance(request):
     return render(request, 'REGISTRARCLEARANCE.html', context)
 
 @login_required
+@conditional_get(CLEARANCE_DATA)
 def clearance_data_api(request):
-    """API endpoint to get clearance data for AJAX requests"""
+    """API endpoint to get clearance data for AJAX requests (one keyset-paginated page)"""
     if request.user.user_type not in ['admin', 'registrar']:
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        # Get filter parameters
-        course_filter = request.GET.get('course')
-        year_filter = request.GET.get('year')
-        section_filter = request.GET.get('section')
-        status_filter = request.GET.get('status')
-        search_query = request.GET.get('search')
-        
-        # Build query
-        clearance_forms = ClearanceForm.objects.select_related('student', 'student__profile')
-        
-        if course_filter:
-            clearance_forms = clearance_forms.filter(student__profile__program=course_filter)
-        if year_filter:
-            clearance_forms = clearance_forms.filter(student__profile__year_level=year_filter)
-        if section_filter:
-            # Filter by section from EnrollmentForm
-            clearance_forms = clearance_forms.filter(student__enrollment_forms__section=section_filter).distinct()
-        if status_filter:
-            # Handle the new status logic using ClearanceSignatory model
-            from landing.models import ClearanceSignatory
-            if status_filter == 'completed':
-                # Filter for forms where all 10 signatory types are approved
-                completed_forms = []
-                required_signatory_types = {
-                    'dorm_supervisor', 'canteen_concessionaire', 'library_director',
-                    'scholarship_director', 'it_director', 'student_affairs',
-                    'cashier', 'business_manager', 'registrar', 'academic_dean'
-                }
-                
-                for form in clearance_forms:
-                    all_signatories = ClearanceSignatory.objects.filter(clearance=form)
-                    approved_signatory_types = set()
-                    
-                    for sig in all_signatories:
-                        if sig.status == 'approved':
-                            sig_profile = getattr(sig.signatory, 'signatory_profile', None)
-                            if sig_profile:
-                                approved_signatory_types.add(sig_profile.signatory_type)
-                    
-                    if required_signatory_types.issubset(approved_signatory_types):
-                        completed_forms.append(form.id)
-                clearance_forms = clearance_forms.filter(id__in=completed_forms)
-            elif status_filter == 'pending':
-                # Filter for forms where not all signatories are approved
-                pending_forms = []
-                for form in clearance_forms:
-                    all_signatories = ClearanceSignatory.objects.filter(clearance=form)
-                    if not all_signatories.exists() or not all(s.status == 'approved' for s in all_signatories):
-                        pending_forms.append(form.id)
-                clearance_forms = clearance_forms.filter(id__in=pending_forms)
-        if search_query:
-            clearance_forms = clearance_forms.filter(
-                Q(student__full_name__icontains=search_query) |
-                Q(student__profile__student_number__icontains=search_query)
-            )
-        
-        # Order by submission date (most recent first)
-        clearance_forms = clearance_forms.order_by('-submitted_at')
+        clearance_forms = ClearanceGridService.apply_filters(
+            ClearanceGridService.base_queryset(), request.GET, section_source='enrollment'
+        )
+        page = ClearanceGridService.paginate(clearance_forms, request.GET)
         
         # Prepare data for frontend
+        manila_tz = pytz.timezone('Asia/Manila')
         clearance_data = []
-        for form in clearance_forms:
-            # Get signatory statuses using ClearanceSignatory model
-            from landing.models import ClearanceSignatory
+        for form in page['rows']:
             signatories = {}
-            clearance_signatories = ClearanceSignatory.objects.filter(clearance=form).select_related('signatory', 'signatory__signatory_profile')
-            
-            print(f"Processing clearance {form.id} with {clearance_signatories.count()} signatories")
-            
-            # Group signatories by type to handle duplicates
-            signatory_groups = {}
-            for clearance_signatory in clearance_signatories:
-                # Get signatory type from profile
-                try:
-                    signatory_type = clearance_signatory.signatory.signatory_profile.signatory_type
-                    print(f"  User {clearance_signatory.signatory.username} has signatory_type: {signatory_type}")
-                except:
-                    # Fallback for users without profile
-                    if clearance_signatory.signatory.user_type == 'admin':
-                        signatory_type = 'registrar'
-                        print(f"  User {clearance_signatory.signatory.username} is admin, using signatory_type: {signatory_type}")
-                    else:
-                        signatory_type = 'unknown'
-                        print(f"  User {clearance_signatory.signatory.username} has unknown type")
-                
-                # Group by signatory type
-                if signatory_type not in signatory_groups:
-                    signatory_groups[signatory_type] = []
-                signatory_groups[signatory_type].append(clearance_signatory)
-            
-            # Process each group to select the best signatory
-            for signatory_type, signatory_list in signatory_groups.items():
-                if len(signatory_list) == 1:
-                    # Only one signatory of this type
-                    clearance_signatory = signatory_list[0]
-                    signatories[signatory_type] = {
-                        'status': clearance_signatory.status,
-                        'timestamp': clearance_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if clearance_signatory.updated_at else None,
-                        'comment': clearance_signatory.remarks or clearance_signatory.comment
-                    }
-                    print(f"  Added single signatory data for {signatory_type}: {clearance_signatory.status}")
-                else:
-                    # Multiple signatories of the same type - choose the best one
-                    print(f"  Multiple signatories for {signatory_type}: {len(signatory_list)}")
-                    
-                    # Priority: approved > disapproved > pending
-                    # Also prefer the current user if they're admin/registrar
-                    best_signatory = None
-                    current_user = request.user
-                    
-                    # First, try to find the current user's signatory
-                    for signatory in signatory_list:
-                        if signatory.signatory == current_user:
-                            best_signatory = signatory
-                            print(f"    Found current user's signatory: {signatory.status}")
-                            break
-                    
-                    # If not found, choose by status priority
-                    if not best_signatory:
-                        for signatory in signatory_list:
-                            if signatory.status == 'approved':
-                                best_signatory = signatory
-                                print(f"    Found approved signatory: {signatory.signatory.username}")
-                                break
-                            elif signatory.status == 'disapproved' and (not best_signatory or best_signatory.status == 'pending'):
-                                best_signatory = signatory
-                                print(f"    Found disapproved signatory: {signatory.signatory.username}")
-                    
-                    # If still not found, use the first one
-                    if not best_signatory:
-                        best_signatory = signatory_list[0]
-                        print(f"    Using first signatory: {best_signatory.signatory.username} ({best_signatory.status})")
-                    
+            overall_status = 'pending'
+            status_matrix = getattr(form, 'status_matrix', None)
+            if status_matrix:
+                overall_status = status_matrix.overall_status
+                for signatory_type, signatory_data in status_matrix.get_signatory_statuses().items():
                     signatories[signatory_type] = {
-                        'status': best_signatory.status,
-                        'timestamp': best_signatory.updated_at.strftime('%Y-%m-%d %H:%M') if best_signatory.updated_at else None,
-                        'comment': best_signatory.remarks or best_signatory.comment
+                        'status': signatory_data['status'],
+                        'timestamp': signatory_data['timestamp'].astimezone(manila_tz).strftime('%Y-%m-%d %I:%M %p') if signatory_data['timestamp'] else None,
+                        'comment': signatory_data['comment']
                     }
-                    print(f"  Added best signatory data for {signatory_type}: {best_signatory.status}")
-            
-            print(f"  Final signatories for clearance {form.id}: {signatories}")
-            
-            # Get section from EnrollmentForm
-            enrollment_form = form.student.enrollment_forms.first()
-            section = enrollment_form.section if enrollment_form else ''
-            
-            # Determine overall status based on all 10 signatory types being approved
-            required_signatory_types = {
-                'dorm_supervisor', 'canteen_concessionaire', 'library_director',
-                'scholarship_director', 'it_director', 'student_affairs',
-                'cashier', 'business_manager', 'registrar', 'academic_dean'
-            }
-            
-            approved_signatory_types = set()
-            for signatory_type, signatory_data in signatories.items():
-                if signatory_data.get('status') == 'approved':
-                    approved_signatory_types.add(signatory_type)
-            
-            if required_signatory_types.issubset(approved_signatory_types):
-                overall_status = 'completed'
-            else:
-                overall_status = 'pending'
             
+            profile = getattr(form.student, 'profile', None)
             clearance_data.append({
                 'id': str(form.id),
                 'student_id': str(form.student.id),
                 'student_name': form.student.full_name,
-                'course': form.student.profile.program if hasattr(form.student, 'profile') and form.student.profile else '',
-                'year': form.student.profile.year_level if hasattr(form.student, 'profile') and form.student.profile else '',
-                'section': section,
-                'id_number': form.student.profile.student_number if hasattr(form.student, 'profile') and form.student.profile else '',
-                'date_submitted': form.submitted_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if form.submitted_at else None,
+                'course': profile.program if profile else '',
+                'year': profile.year_level if profile else '',
+                'section': form.enrollment_section or '',
+                'id_number': profile.student_number if profile else '',
+                'date_submitted': form.submitted_at.astimezone(manila_tz).strftime('%Y-%m-%d %I:%M %p') if form.submitted_at else None,
                 'status': overall_status,
                 'signatories': signatories
             })
         
-        return JsonResponse({'clearance_data': clearance_data})
+        return JsonResponse({'clearance_data': clearance_data, 'pagination': page['pagination']})
         
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -2769,7 +2367,8 @@ def print_clearance(request, clearance_id):
         clearance_form = ClearanceForm.objects.select_related('student', 'student__profile').prefetch_related('signatories').get(id=clearance_id)
         
         # Log the print action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='clearance_print',
             description=f'Printed clearance form {clearance_id} for {clearance_form.student.full_name} [IP: {get_client_ip(request)}]'
@@ -2806,7 +2405,8 @@ def bulk_print_clearance(request):
             enrollment_form = clearance_form.student.enrollment_forms.first()
             
             # Log each bulk print action
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='clearance_bulk_print',
                 description=f'Bulk printed clearance form {clearance_id} for {clearance_form.student.full_name} [IP: {get_client_ip(request)}]'
@@ -2939,7 +2539,8 @@ def print_enrollment(request, enrollment_id):
         enrollment_form = EnrollmentForm.objects.select_related('user', 'user__profile').get(id=enrollment_id)
         
         # Log the print action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_print',
             description=f'Printed enrollment form {enrollment_id} for {enrollment_form.user.full_name} [IP: {get_client_ip(request)}]'
@@ -2972,7 +2573,8 @@ def bulk_print_enrollment(request):
             enrollment_form = EnrollmentForm.objects.select_related('user', 'user__profile').get(id=enrollment_id)
             
             # Log each bulk print action
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='enrollment_bulk_print',
                 description=f'Bulk printed enrollment form {enrollment_id} for {enrollment_form.user.full_name} [IP: {get_client_ip(request)}]'
@@ -3045,7 +2647,8 @@ def print_graduation(request, graduation_id):
         graduation_form = GraduationForm.objects.select_related('user', 'user__profile').get(id=graduation_id)
         
         # Log the print action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_print',
             description=f'Printed graduation form {graduation_id} for {graduation_form.user.full_name} [IP: {get_client_ip(request)}]'
@@ -3076,7 +2679,8 @@ def bulk_print_graduation(request):
             graduation_form = GraduationForm.objects.select_related('user', 'user__profile').get(id=graduation_id)
             
             # Log each bulk print action
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='graduation_bulk_print',
                 description=f'Bulk printed graduation form {graduation_id} for {graduation_form.user.full_name} [IP: {get_client_ip(request)}]'
@@ -3151,7 +2755,8 @@ def delete_clearance(request, clearance_id):
             student_name = clearance_form.student.full_name
             
             # Log the deletion action before deleting
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='clearance_deletion',
                 description=f'Deleted clearance form {clearance_id} for {student_name} [IP: {get_client_ip(request)}]'
@@ -3190,7 +2795,8 @@ def bulk_delete_clearance(request):
             
             # Log the bulk deletion action after successful deletion
             if deleted_count > 0:
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='clearance_bulk_deletion',
                     description=f'Registrar bulk deleted {deleted_count} clearance forms for: {", ".join(student_names)} [IP: {get_client_ip(request)}]'
@@ -3254,69 +2860,22 @@ def bulk_approve_clearance(request):
                 signatory_type = 'registrar'
                 role_name = 'Registrar'
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
-            
-            for clearance_form in clearance_forms:
-                from landing.models import ClearanceSignatory
-                
-                # Get or create the clearance signatory record (same pattern as individual approve)
-                registrar_signatory, created = ClearanceSignatory.objects.get_or_create(
-                    clearance=clearance_form,
-                    signatory=request.user,
-                    defaults={
-                        'status': 'pending',
-                        'role': role_name,
-                        'seen_by_signatory': True
-                    }
-                )
-                
-                # Update role if it was created with wrong role
-                registrar_signatory.role = role_name
-                
-                # Update status to approved
-                registrar_signatory.status = 'approved'
-                registrar_signatory.comment = comment if comment else ''
-                registrar_signatory.ip_address = get_client_ip(request)
-                registrar_signatory.seen_by_signatory = True
-                registrar_signatory.save()
-                
-                approved_count += 1
-                student_names.append(clearance_form.student.full_name)
-                
-                # Send individual approval notification to student
-                try:
-                    from landing.notification_service import NotificationService
-                    NotificationService.notify_form_approval(
-                        form_instance=clearance_form,
-                        form_type='clearance',
-                        signatory_user=request.user,
-                        remarks=comment or ''
-                    )
-                except Exception as e:
-                    print(f"Error sending approval notification for clearance {clearance_form.id}: {e}")
-
-                # Check if all signatories approved for this clearance
-                all_signatories = ClearanceSignatory.objects.filter(clearance=clearance_form)
-                all_approved = all_signatories.exists() and all(s.status == 'approved' for s in all_signatories)
-                if all_approved:
-                    clearance_form.status = 'approved'
-                    clearance_form.save()
-
-                    # Send completion notification to student
-                    try:
-                        NotificationService.notify_clearance_completed(
-                            student=clearance_form.student,
-                            form_type='clearance',
-                            form_instance=clearance_form
-                        )
-                    except Exception as e:
-                        print(f"Error sending completion notification: {e}")
+            # Approve all selected forms set-wise in one transaction
+            decision = BulkDecisionService.approve(
+                'clearance',
+                clearance_ids,
+                signatory_user=request.user,
+                role=role_name,
+                remarks=comment or '',
+                ip_address=get_client_ip(request)
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.student.full_name for form in decision['approved']]
             
             # Log the bulk approval action
             if approved_count > 0:
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='clearance_bulk_approval',
                     description=f'Registrar bulk approved {approved_count} clearance forms for: {", ".join(student_names)} [IP: {get_client_ip(request)}]'
@@ -3325,7 +2884,8 @@ def bulk_approve_clearance(request):
             return JsonResponse({
                 'success': True,
                 'message': f'Successfully approved {approved_count} clearance form(s)',
-                'approved_count': approved_count
+                'approved_count': approved_count,
+                'results': decision['results']
             })
             
         except Exception as e:
@@ -3414,7 +2974,8 @@ def bulk_disapprove_clearance(request):
             
             # Log the bulk disapproval action
             if disapproved_count > 0:
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='clearance_bulk_disapproval',
                     description=f'Registrar bulk disapproved {disapproved_count} clearance forms for: {", ".join(student_names)} with reason: {reason} [IP: {get_client_ip(request)}]'
@@ -3448,30 +3009,19 @@ def registrar_enrollment(request):
     return render(request, 'REGISTRARENROLLMENT.html', context)
 
 @login_required
+@conditional_get(ENROLLMENT_DATA)
 def enrollment_data_api(request):
     """API endpoint to get enrollment data for the registrar"""
     if request.user.user_type not in ['admin', 'registrar']:
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        # Get all enrollment forms with related data
-        enrollment_forms = EnrollmentForm.objects.select_related('user').all().order_by('-created_at')
-        
         data = []
-        for form in enrollment_forms:
-            # Get signatory statuses
-            dean_signatory = form.signatories.filter(role='dean').first()
-            business_signatory = form.signatories.filter(role='business_manager').first()
-            registrar_signatory = form.signatories.filter(role='registrar').first()
-            
-            # Determine overall status based on all required signatories
-            all_signatories = form.signatories.all()
-            roles_required = {'dean', 'business_manager', 'registrar'}
-            statuses = {s.role: s.status for s in all_signatories}
-            
-            if roles_required.issubset(statuses.keys()) and all(statuses[role] == 'approved' for role in roles_required):
+        for row in FormGridService.rows('enrollment'):
+            form = row.form
+            if row.all_approved():
                 status = 'approved'
-            elif any(status == 'disapproved' for status in statuses.values()):
+            elif row.any_disapproved():
                 status = 'disapproved'
             else:
                 status = 'pending'
@@ -3482,19 +3032,19 @@ def enrollment_data_api(request):
                 'course': form.course,
                 'year': form.year,
                 'section': form.section,
-                'id_number': form.user.profile.student_number if hasattr(form.user, 'profile') else 'N/A',
+                'id_number': row.profile_value('student_number'),
                 'date_submitted': form.created_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p'),
                 'pdf_file': 'Enrollment_Form.pdf',  # Placeholder
-                'dean_status': dean_signatory.status if dean_signatory else 'pending',
-                'dean_timestamp': dean_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if dean_signatory and dean_signatory.status != 'pending' else '',
-                'business_status': business_signatory.status if business_signatory else 'pending',
-                'business_timestamp': business_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if business_signatory and business_signatory.status != 'pending' else '',
-                'registrar_status': registrar_signatory.status if registrar_signatory else 'pending',
-                'registrar_timestamp': registrar_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if registrar_signatory and registrar_signatory.status != 'pending' else '',
+                'dean_status': row.status('dean'),
+                'dean_timestamp': row.timestamp('dean'),
+                'business_status': row.status('business_manager'),
+                'business_timestamp': row.timestamp('business_manager'),
+                'registrar_status': row.status('registrar'),
+                'registrar_timestamp': row.timestamp('registrar'),
                 'overall_status': status,
-                'dean_remarks': dean_signatory.remarks if dean_signatory else '',
-                'business_remarks': business_signatory.remarks if business_signatory else '',
-                'registrar_remarks': registrar_signatory.remarks if registrar_signatory else '',
+                'dean_remarks': row.remarks('dean'),
+                'business_remarks': row.remarks('business_manager'),
+                'registrar_remarks': row.remarks('registrar'),
             }
             data.append(enrollment_data)
         
@@ -3593,7 +3143,8 @@ def approve_enrollment(request):
             print(f"DEBUG: Not all required signatories approved yet. Missing roles: {missing_roles}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_approval',
             description=f'Approved enrollment form {enrollment_id} for {enrollment.user.full_name} [IP: {get_client_ip(request)}]'
@@ -3677,7 +3228,8 @@ def disapprove_enrollment(request):
             print(f"Error sending enrollment disapproval notification: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_disapproval',
             description=f'Disapproved enrollment form {enrollment_id} for {enrollment.user.full_name}. Reasons: {", ".join(reasons)} [IP: {get_client_ip(request)}]'
@@ -3724,59 +3276,28 @@ def bulk_approve_enrollment(request):
             if not enrollment_forms.exists():
                 return JsonResponse({'error': 'No enrollment forms found'}, status=404)
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
+            # Approve all selected forms set-wise in one transaction
+            decision = BulkDecisionService.approve(
+                'enrollment',
+                enrollment_ids,
+                signatory_user=request.user,
+                role='registrar',
+                remarks=comment,
+                ip_address=get_client_ip(request)
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.user.full_name for form in decision['approved']]
             
-            for enrollment in enrollment_forms:
-                try:
-                    # Create or update registrar signatory
-                    signatory, created = EnrollmentSignatory.objects.get_or_create(
-                        enrollment=enrollment,
-                        signatory=request.user,
-                        role='registrar',
-                        defaults={
-                            'status': 'approved',
-                            'remarks': comment,
-                            'ip_address': get_client_ip(request)
-                        }
-                    )
-                    
-                    if not created:
-                        # Allow editing disapproved enrollments (changing from disapproved to approved)
-                        if signatory.status == 'approved':
-                            continue  # Skip already approved
-                        
-                        signatory.status = 'approved'
-                        signatory.remarks = comment
-                        signatory.ip_address = get_client_ip(request)
-                        signatory.save()
-                    
-                    approved_count += 1
-                    student_names.append(enrollment.user.full_name)
-                    
-                    # Send individual approval notification to student
-                    try:
-                        from landing.notification_service import NotificationService
-                        NotificationService.notify_form_approval(
-                            form_instance=enrollment,
-                            form_type='enrollment',
-                            signatory=request.user,
-                            signatory_role='registrar'
-                        )
-                    except Exception as e:
-                        print(f"Failed to send approval notification for enrollment {enrollment.id}: {str(e)}")
-                    
-                    # Log individual action
-                    AuditLog.objects.create(
+            # Log the bulk action
+            if approved_count > 0:
+                AuditLog.objects.bulk_create([
+                    AuditLog(
                         user=request.user,
                         action_type='enrollment_bulk_approval',
-                        description=f'Bulk approved enrollment form {enrollment.id} for {enrollment.user.full_name} [IP: {get_client_ip(request)}]'
+                        description=f'Bulk approved enrollment form {form.id} for {form.user.full_name} [IP: {get_client_ip(request)}]'
                     )
-                    
-                except Exception as e:
-                    print(f"Error processing enrollment {enrollment.id}: {str(e)}")
-                    continue
+                    for form in decision['approved']
+                ])
             
             if approved_count == 0:
                 return JsonResponse({'error': 'No enrollments were approved'}, status=400)
@@ -3785,7 +3306,8 @@ def bulk_approve_enrollment(request):
                 'success': True,
                 'message': f'Successfully approved {approved_count} enrollment(s)',
                 'approved_count': approved_count,
-                'student_names': student_names
+                'student_names': student_names,
+                'results': decision['results']
             })
             
         except Exception as e:
@@ -3877,7 +3399,8 @@ def bulk_disapprove_enrollment(request):
                         print(f"Failed to send disapproval notification for enrollment {enrollment.id}: {str(e)}")
                     
                     # Log individual action
-                    AuditLog.objects.create(
+                    record_activity(
+                        AuditLog,
                         user=request.user,
                         action_type='enrollment_bulk_disapproval',
                         description=f'Bulk disapproved enrollment form {enrollment.id} for {enrollment.user.full_name}. Reason: {reason} [IP: {get_client_ip(request)}]'
@@ -3912,7 +3435,8 @@ def delete_enrollment_registrar(request, enrollment_id):
         enrollment = EnrollmentForm.objects.get(id=enrollment_id)
         
         # Log the action before deletion
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_deletion',
             description=f'Deleted enrollment form {enrollment_id} for {enrollment.user.full_name} [IP: {get_client_ip(request)}]'
@@ -3952,7 +3476,8 @@ def bulk_delete_enrollment(request):
                 enrollment = EnrollmentForm.objects.get(id=enrollment_id)
                 
                 # Log the action before deletion
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='enrollment_bulk_deletion',
                     description=f'Deleted enrollment form {enrollment_id} for {enrollment.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4025,67 +3550,49 @@ def registrar_graduation(request):
     return render(request, 'REGISTRARGRADUATION.html', context)
 
 @login_required
+@conditional_get(GRADUATION_DATA)
 def graduation_data_api(request):
     """API endpoint to get graduation data for the registrar"""
     if request.user.user_type not in ['admin', 'registrar']:
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        graduation_forms = GraduationForm.objects.select_related('user').all().order_by('-created_at')
-        
         data = []
-        for form in graduation_forms:
-            business_signatory = form.signatories.filter(role='business_manager').first()
-            registrar_signatory = form.signatories.filter(role='registrar').first()
-            dean_signatory = form.signatories.filter(role='dean').first()
-            president_signatory = form.signatories.filter(role='president').first()
-            
-            # Determine overall status based on all required signatories (including president)
-            all_signatories = form.signatories.all()
-            roles_required = {'dean', 'business_manager', 'registrar', 'president'}
-            statuses = {s.role: s.status for s in all_signatories}
-            
+        for row in FormGridService.rows('graduation'):
+            form = row.form
             # Overall status logic: only "pending" or "completed"
-            if roles_required.issubset(statuses.keys()) and all(statuses.get(role, 'pending') == 'approved' for role in roles_required):
+            if row.all_approved():
                 status = 'completed'
                 # Use the latest timestamp among all approvals for completed status
-                timestamps = []
-                for signatory in [dean_signatory, business_signatory, registrar_signatory, president_signatory]:
-                    if signatory and signatory.status == 'approved':
-                        timestamps.append(signatory.updated_at)
-                overall_timestamp = max(timestamps).astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if timestamps else None
+                overall_timestamp = row.approved_at()
             else:
                 status = 'pending'
                 overall_timestamp = None
             
-            # Get section from enrollment forms
-            enrollment_form = EnrollmentForm.objects.filter(user=form.user).first()
-            section = enrollment_form.section if enrollment_form else 'N/A'
-            
             graduation_data = {
                 'id': str(form.id),
                 'student_name': form.user.full_name,
-                'course': form.user.profile.program if hasattr(form.user, 'profile') else 'N/A',
-                'year': form.user.profile.year_level if hasattr(form.user, 'profile') else 'N/A',
-                'section': section,
-                'id_number': form.user.profile.student_number if hasattr(form.user, 'profile') else 'N/A',
+                'course': row.profile_value('program'),
+                'year': row.profile_value('year_level'),
+                'section': row.enrollment_section,
+                'id_number': row.profile_value('student_number'),
                 'grad_appno': form.grad_appno or 'N/A',
                 'date_submitted': form.created_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p'),
                 'pdf_file': 'Graduation_Form.pdf',
-                'dean_status': dean_signatory.status if dean_signatory else 'pending',
-                'dean_timestamp': dean_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if dean_signatory and dean_signatory.status != 'pending' else '',
-                'business_status': business_signatory.status if business_signatory else 'pending',
-                'business_timestamp': business_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if business_signatory and business_signatory.status != 'pending' else '',
-                'registrar_status': registrar_signatory.status if registrar_signatory else 'pending',
-                'registrar_timestamp': registrar_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if registrar_signatory and registrar_signatory.status != 'pending' else '',
-                'president_status': president_signatory.status if president_signatory else 'pending',
-                'president_timestamp': president_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if president_signatory and president_signatory.status != 'pending' else '',
+                'dean_status': row.status('dean'),
+                'dean_timestamp': row.timestamp('dean'),
+                'business_status': row.status('business_manager'),
+                'business_timestamp': row.timestamp('business_manager'),
+                'registrar_status': row.status('registrar'),
+                'registrar_timestamp': row.timestamp('registrar'),
+                'president_status': row.status('president'),
+                'president_timestamp': row.timestamp('president'),
                 'overall_status': status,
                 'overall_timestamp': overall_timestamp,
-                'dean_remarks': dean_signatory.remarks if dean_signatory else '',
-                'business_remarks': business_signatory.remarks if business_signatory else '',
-                'registrar_remarks': registrar_signatory.remarks if registrar_signatory else '',
-                'president_remarks': president_signatory.remarks if president_signatory else '',
+                'dean_remarks': row.remarks('dean'),
+                'business_remarks': row.remarks('business_manager'),
+                'registrar_remarks': row.remarks('registrar'),
+                'president_remarks': row.remarks('president'),
             }
             data.append(graduation_data)
         
@@ -4173,7 +3680,8 @@ def approve_graduation(request):
                 print(f"Error sending graduation completion notifications: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_approval',
             description=f'Approved graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4250,7 +3758,8 @@ def disapprove_graduation(request):
             print(f"Error sending graduation disapproval notification: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_disapproval',
             description=f'Disapproved graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4294,59 +3803,28 @@ def bulk_approve_graduation(request):
             if not graduation_forms.exists():
                 return JsonResponse({'error': 'No graduation forms found'}, status=404)
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
+            # Approve all selected forms set-wise in one transaction
+            decision = BulkDecisionService.approve(
+                'graduation',
+                graduation_ids,
+                signatory_user=request.user,
+                role='registrar',
+                remarks=comment,
+                ip_address=get_client_ip(request)
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.user.full_name for form in decision['approved']]
             
-            for graduation in graduation_forms:
-                try:
-                    # Create or update registrar signatory
-                    signatory, created = GraduationSignatory.objects.get_or_create(
-                        graduation=graduation,
-                        signatory=request.user,
-                        role='registrar',
-                        defaults={
-                            'status': 'approved',
-                            'remarks': comment,
-                            'ip_address': get_client_ip(request)
-                        }
-                    )
-                    
-                    if not created:
-                        # Allow editing disapproved graduations (changing from disapproved to approved)
-                        if signatory.status == 'approved':
-                            continue  # Skip already approved
-                        
-                        signatory.status = 'approved'
-                        signatory.remarks = comment
-                        signatory.ip_address = get_client_ip(request)
-                        signatory.save()
-                    
-                    approved_count += 1
-                    student_names.append(graduation.user.full_name)
-                    
-                    # Send individual approval notification to student
-                    try:
-                        from landing.notification_service import NotificationService
-                        NotificationService.notify_form_approval(
-                            form_instance=graduation,
-                            form_type='graduation',
-                            signatory=request.user,
-                            signatory_role='registrar'
-                        )
-                    except Exception as e:
-                        print(f"Failed to send approval notification for graduation {graduation.id}: {str(e)}")
-                    
-                    # Log individual action
-                    AuditLog.objects.create(
+            # Log the bulk action
+            if approved_count > 0:
+                AuditLog.objects.bulk_create([
+                    AuditLog(
                         user=request.user,
                         action_type='graduation_bulk_approval',
-                        description=f'Bulk approved graduation form {graduation.id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
+                        description=f'Bulk approved graduation form {form.id} for {form.user.full_name} [IP: {get_client_ip(request)}]'
                     )
-                    
-                except Exception as e:
-                    print(f"Error processing graduation {graduation.id}: {str(e)}")
-                    continue
+                    for form in decision['approved']
+                ])
             
             if approved_count == 0:
                 return JsonResponse({'error': 'No graduations were approved'}, status=400)
@@ -4355,7 +3833,8 @@ def bulk_approve_graduation(request):
                 'success': True,
                 'message': f'Successfully approved {approved_count} graduation(s)',
                 'approved_count': approved_count,
-                'student_names': student_names
+                'student_names': student_names,
+                'results': decision['results']
             })
             
         except Exception as e:
@@ -4447,7 +3926,8 @@ def bulk_disapprove_graduation(request):
                         print(f"Failed to send disapproval notification for graduation {graduation.id}: {str(e)}")
                     
                     # Log individual action
-                    AuditLog.objects.create(
+                    record_activity(
+                        AuditLog,
                         user=request.user,
                         action_type='graduation_bulk_disapproval',
                         description=f'Bulk disapproved graduation form {graduation.id} for {graduation.user.full_name}. Reason: {reason} [IP: {get_client_ip(request)}]'
@@ -4485,7 +3965,8 @@ def delete_graduation_registrar(request, graduation_id):
         graduation = GraduationForm.objects.get(id=graduation_id)
         
         # Log the action before deletion
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_deletion',
             description=f'Deleted graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4525,7 +4006,8 @@ def bulk_delete_graduation(request):
                 graduation = GraduationForm.objects.get(id=graduation_id)
                 
                 # Log the action before deletion
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='graduation_bulk_deletion',
                     description=f'Deleted graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4581,7 +4063,8 @@ def print_graduation(request, graduation_id):
         graduation = GraduationForm.objects.get(id=graduation_id)
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_print',
             description=f'Printed graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4622,7 +4105,8 @@ def bulk_print_graduation(request):
                 graduations.append(graduation)
                 
                 # Log the action
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='graduation_bulk_print',
                     description=f'Bulk printed graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -4675,6 +4159,7 @@ def registrar_document_release(request):
     return render(request, 'REGISTRARDOCUMENTRELEASE.html', context)
 
 @login_required
+@conditional_get(DOCUMENT_DATA)
 def document_release_data_api(request):
     """API endpoint to get document release data for AJAX requests"""
     if not (request.user.user_type in ['admin', 'registrar'] or is_business_manager(request.user)):
@@ -4688,8 +4173,12 @@ def document_release_data_api(request):
         status_filter = request.GET.get('status')
         search_query = request.GET.get('search')
         
-        # Build query
-        document_requests = DocumentRequest.objects.select_related('requester', 'requester__profile').all()
+        # Build query; the section of each requester's latest enrollment form comes from a subquery
+        from django.db.models import OuterRef, Subquery
+        latest_section = EnrollmentForm.objects.filter(user=OuterRef('requester')).values('section')[:1]
+        document_requests = DocumentRequest.objects.select_related('requester', 'requester__profile').annotate(
+            enrollment_section=Subquery(latest_section)
+        )
         
         if course_filter:
             document_requests = document_requests.filter(requester__profile__program=course_filter)
@@ -4702,9 +4191,7 @@ def document_release_data_api(request):
             document_requests = document_requests.filter(status=status_filter)
         if search_query:
             document_requests = document_requests.filter(
-                Q(requester__full_name__icontains=search_query) |
-                Q(requester__profile__student_number__icontains=search_query) |
-                Q(requester__profile__program__icontains=search_query)
+                requester_id__in=search_students(search_query, ['name', 'student_number', 'program'])
             )
         
         # Order by submission date (most recent first)
@@ -4713,9 +4200,7 @@ def document_release_data_api(request):
         # Serialize data
         data = []
         for doc_request in document_requests:
-            # Get section from enrollment forms
-            enrollment_form = EnrollmentForm.objects.filter(user=doc_request.requester).first()
-            section = enrollment_form.section if enrollment_form else 'N/A'
+            section = doc_request.enrollment_section if doc_request.enrollment_section is not None else 'N/A'
             
             data.append({
                 'id': str(doc_request.id),
@@ -4771,7 +4256,8 @@ def submit_release_date(request):
         document_request.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='release_date_submitted',
             description=f'Release date {release_date} submitted for {document_request.document_type} - {document_request.requester.full_name}'
@@ -4809,7 +4295,8 @@ def update_release_date(request):
         document_request.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='release_date_updated',
             description=f'Release date updated to {release_date} for {document_request.document_type} - {document_request.requester.full_name}'
@@ -4859,7 +4346,8 @@ def update_document_status(request):
         document_request.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='document_status_updated',
             description=f'Document status updated from {old_status} to {new_status} for {document_request.document_type} - {document_request.requester.full_name}'
@@ -4897,7 +4385,8 @@ def delete_document_release(request, document_request_id):
         document_request.delete()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='document_request_deleted',
             description=f'Document request {document_request.document_type} deleted for {document_request.requester.full_name}'
@@ -4935,7 +4424,8 @@ def bulk_delete_document_release(request):
                 deleted_count += 1
                 
                 # Log the action
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='document_request_deleted',
                     description=f'Document request {document_request.document_type} deleted for {document_request.requester.full_name}'
@@ -5445,129 +4935,18 @@ def registrar_messages(request):
     return render(request, 'REGISTRARMESSAGES.html', context)
 
 @login_required
+@conditional_get(DASHBOARD_STATS, CALENDAR)
 def dashboard_data_api(request):
     """API endpoint to get dashboard data for AJAX refresh"""
     if request.user.user_type not in ['admin', 'registrar']:
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        from datetime import datetime, timezone as dt_timezone, timedelta
-        import json
-        
-        # Get current date and calculate date ranges
-        today = timezone.now().date()
-        last_week = today - timedelta(days=7)
-        
-        # Basic statistics
-        total_clearance_requests = ClearanceForm.objects.count()
-        pending_clearance_requests = ClearanceForm.objects.filter(status='pending').count()
-        total_enrollment_requests = EnrollmentForm.objects.count()
-        pending_enrollment_requests = EnrollmentForm.objects.filter(status='pending').count()
-        total_graduation_requests = GraduationForm.objects.count()
-        pending_graduation_requests = GraduationForm.objects.filter(status='pending').count()
-        total_document_requests = DocumentRequest.objects.count()
-        pending_document_requests = DocumentRequest.objects.filter(status='pending').count()
-        
-        # Pending signatures - Only count signatories that are actually pending for approval
-        pending_signatures_count = ClearanceSignatory.objects.filter(
-            status='pending',
-            clearance__status='pending'  # Only count if the clearance form is still pending
-        ).count()
-        
-        new_signatures_today = ClearanceSignatory.objects.filter(
-            updated_at__date=today,
-            status='pending'
-        ).count()
+        from datetime import timedelta
         
-        # Disapproved forms
-        disapproved_forms_count = (
-            ClearanceForm.objects.filter(status='disapproved').count() +
-            EnrollmentForm.objects.filter(status='rejected').count() +
-            GraduationForm.objects.filter(status='rejected').count() +
-            DocumentRequest.objects.filter(status='rejected').count()
-        )
-        
-        recently_disapproved = (
-            ClearanceForm.objects.filter(status='disapproved', submitted_at__date__gte=last_week).count() +
-            EnrollmentForm.objects.filter(status='rejected', created_at__date__gte=last_week).count() +
-            GraduationForm.objects.filter(status='rejected', created_at__date__gte=last_week).count()
-        )
-        
-        # Chart data for last 7 days
-        chart_dates = []
-        accomplishment_data = []
-        visitors_data = []
-        documents_data = []
-        
-        for i in range(7):
-            date = today - timedelta(days=6-i)
-            chart_dates.append(date.strftime('%b %d'))
-            
-            daily_clearance = ClearanceForm.objects.filter(status='approved', submitted_at__date=date).count()
-            daily_enrollment = EnrollmentForm.objects.filter(status='approved', created_at__date=date).count()
-            daily_graduation = GraduationForm.objects.filter(status='approved', created_at__date=date).count()
-            daily_documents = DocumentRequest.objects.filter(status='released', created_at__date=date).count()
-            accomplishment_data.append(daily_clearance + daily_enrollment + daily_graduation + daily_documents)
-            
-            daily_visitors = (
-                ClearanceForm.objects.filter(submitted_at__date=date).count() +
-                EnrollmentForm.objects.filter(created_at__date=date).count() +
-                GraduationForm.objects.filter(created_at__date=date).count() +
-                DocumentRequest.objects.filter(created_at__date=date).count()
-            )
-            visitors_data.append(daily_visitors)
-            documents_data.append(daily_documents)
-        
-        # Recent activity
-        recent_activity = []
-        
-        # Get recent clearance forms
-        recent_clearance = ClearanceForm.objects.order_by('-submitted_at')[:5]
-        for clearance in recent_clearance:
-            recent_activity.append({
-                'type': 'clearance',
-                'title': f'Clearance Form #{clearance.id}',
-                'status': clearance.status,
-                'date': clearance.submitted_at.strftime('%Y-%m-%d %H:%M'),
-                'user': clearance.student.full_name if clearance.student else 'Unknown'
-            })
-        
-        # Get recent enrollment forms
-        recent_enrollment = EnrollmentForm.objects.order_by('-created_at')[:5]
-        for enrollment in recent_enrollment:
-            recent_activity.append({
-                'type': 'enrollment',
-                'title': f'Enrollment Form #{enrollment.id}',
-                'status': enrollment.status,
-                'date': enrollment.created_at.strftime('%Y-%m-%d %H:%M'),
-                'user': enrollment.user.full_name if enrollment.user else 'Unknown'
-            })
-        
-        # Get recent graduation forms
-        recent_graduation = GraduationForm.objects.order_by('-created_at')[:5]
-        for graduation in recent_graduation:
-            recent_activity.append({
-                'type': 'graduation',
-                'title': f'Graduation Form #{graduation.id}',
-                'status': graduation.status,
-                'date': graduation.created_at.strftime('%Y-%m-%d %H:%M'),
-                'user': graduation.user.full_name if graduation.user else 'Unknown'
-            })
-        
-        # Get recent document requests
-        recent_documents = DocumentRequest.objects.order_by('-created_at')[:5]
-        for document in recent_documents:
-            recent_activity.append({
-                'type': 'document',
-                'title': f'Document Request: {document.document_type}',
-                'status': document.status,
-                'date': document.created_at.strftime('%Y-%m-%d %H:%M'),
-                'user': document.student.full_name if document.student else 'Unknown'
-            })
-        
-        # Sort by date and take top 10
-        recent_activity.sort(key=lambda x: x['date'], reverse=True)
-        recent_activity = recent_activity[:10]
+        # Statistics, 7-day charts and recent activity come from the cached aggregation layer
+        dashboard_stats = DashboardStatsService.get_institution_stats()
+        today = timezone.localdate()
         
         # Get upcoming calendar events from database
         try:
@@ -5593,35 +4972,9 @@ def dashboard_data_api(request):
         
         
         response_data = {
-            'statistics': {
-                'total_clearance_requests': total_clearance_requests,
-                'pending_clearance_requests': pending_clearance_requests,
-                'total_enrollment_requests': total_enrollment_requests,
-                'pending_enrollment_requests': pending_enrollment_requests,
-                'total_graduation_requests': total_graduation_requests,
-                'pending_graduation_requests': pending_graduation_requests,
-                'total_document_requests': total_document_requests,
-                'pending_document_requests': pending_document_requests,
-                'pending_signatures_count': pending_signatures_count,
-                'new_signatures_today': new_signatures_today,
-                'disapproved_forms_count': disapproved_forms_count,
-                'recently_disapproved': recently_disapproved,
-            },
-            'charts': {
-                'accomplishment': {
-                    'categories': chart_dates,
-                    'series': [{'name': 'Accomplishment', 'data': accomplishment_data}]
-                },
-                'visitors': {
-                    'categories': chart_dates,
-                    'series': [{'name': 'Visitors', 'data': visitors_data}]
-                },
-                'documents': {
-                    'categories': chart_dates,
-                    'series': [{'name': 'Documents Released', 'data': documents_data}]
-                }
-            },
-            'recent_activity': recent_activity,
+            'statistics': dashboard_stats['statistics'],
+            'charts': dashboard_stats['charts'],
+            'recent_activity': dashboard_stats['recent_activity'],
             'upcoming_events': upcoming_events
         }
         
@@ -5870,10 +5223,7 @@ def user_management_data_api(request):
                 users = users.filter(is_active=False)
         if search_query:
             users = users.filter(
-                Q(full_name__icontains=search_query) |
-                Q(email__icontains=search_query) |
-                Q(username__icontains=search_query) |
-                Q(contact_number__icontains=search_query)
+                id__in=search_students(search_query, ['name', 'email', 'username', 'contact_number'])
             )
         
         # Prepare user data
@@ -5889,7 +5239,7 @@ def user_management_data_api(request):
                 'status': 'Active' if user.is_active else 'Inactive',
                 'created_at': user.created_at.strftime('%Y-%m-%d %H:%M'),
                 'last_login': user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else 'Never',
-                'profile_picture': '/static/images/default-profile.png',
+                'profile_picture': static('images/default-profile.png'),
                 'course': '',
                 'year': '',
                 'section': '',
@@ -5903,7 +5253,7 @@ def user_management_data_api(request):
             if user.user_type == 'student' and hasattr(user, 'profile'):
                 profile = user.profile
                 user_info.update({
-                    'profile_picture': profile.profile_picture_url,
+                    'profile_picture': profile.profile_picture_thumbnail_url,
                     'course': profile.program,
                     'year': f"{profile.year_level}rd Year" if profile.year_level == 3 else f"{profile.year_level}nd Year" if profile.year_level == 2 else f"{profile.year_level}st Year",
                     'address': profile.address or '',
@@ -5914,7 +5264,7 @@ def user_management_data_api(request):
             elif user.user_type == 'alumni' and hasattr(user, 'alumni_profile'):
                 profile = user.alumni_profile
                 user_info.update({
-                    'profile_picture': profile.profile_picture_url,
+                    'profile_picture': profile.profile_picture_thumbnail_url,
                     'course': profile.course_graduated,
                     'year': profile.year_graduated,
                     'address': profile.address or '',
@@ -5928,7 +5278,7 @@ def user_management_data_api(request):
                     # Business manager signatories
                     profile = user.business_manager_profile
                     user_info.update({
-                        'profile_picture': profile.profile_picture_url,
+                        'profile_picture': profile.profile_picture_thumbnail_url,
                         'course': profile.position or 'Business Manager',
                         'year': profile.department or '',
                         'address': profile.address or '',
@@ -5940,7 +5290,7 @@ def user_management_data_api(request):
                     # Regular signatories
                     profile = user.signatory_profile
                     user_info.update({
-                        'profile_picture': profile.profile_picture_url,
+                        'profile_picture': profile.profile_picture_thumbnail_url,
                         'course': profile.get_signatory_type_display(),
                         'year': profile.department or '',
                         'address': profile.address or '',
@@ -5950,7 +5300,7 @@ def user_management_data_api(request):
                     })
                 else:
                     user_info.update({
-                        'profile_picture': '/static/images/default-profile.png',
+                        'profile_picture': static('images/default-profile.png'),
                         'notes': f"Role: {user.get_user_type_display()}"
                     })
             else:
@@ -5959,7 +5309,7 @@ def user_management_data_api(request):
                     # This is a registrar (admin with registrar profile)
                     profile = user.registrar_profile
                     user_info.update({
-                        'profile_picture': profile.profile_picture_url,
+                        'profile_picture': profile.profile_picture_thumbnail_url,
                         'course': profile.position or '',
                         'year': profile.department or '',
                         'address': profile.address or '',
@@ -5969,7 +5319,7 @@ def user_management_data_api(request):
                     })
                 else:
                     # Regular admin or business manager
-                    user_info['profile_picture'] = '/static/images/default-profile.png'
+                    user_info['profile_picture'] = static('images/default-profile.png')
                     user_info['notes'] = f"Role: {user.get_user_type_display()}"
             
             user_data.append(user_info)
@@ -6111,7 +5461,8 @@ def create_user_api(request):
                     print(f"DEBUG: SignatoryProfile created successfully for user {user.id}")
                     
                     # Log the signatory creation with details
-                    AuditLog.objects.create(
+                    record_activity(
+                        AuditLog,
                         user=request.user,
                         action_type='create_signatory',
                         description=f'Created signatory user: {data["full_name"]} - Type: {data.get("signatory_type", "")} - Department: {data.get("department", "")}'
@@ -6133,7 +5484,8 @@ def create_user_api(request):
         
         # Log the action
         try:
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='create_user',
                 description=f'Created new {data["user_type"]} user: {data["full_name"]}'
@@ -6238,7 +5590,8 @@ def delete_user_api(request, user_id):
         user.delete()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='delete_user',
             description=f'Deleted {user_type} user: {user_name}'
@@ -6274,7 +5627,7 @@ def get_user_details_api(request, user_id):
             'is_active': user.is_active,
             'created_at': user.created_at.strftime('%Y-%m-%d %H:%M'),
             'last_login': user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else 'Never',
-            'profile_picture': '/static/images/default-profile.png',
+            'profile_picture': static('images/default-profile.png'),
             'course': '',
             'year': '',
             'section': '',
@@ -6323,7 +5676,7 @@ def get_user_details_api(request, user_id):
                 })
             else:
                 user_data.update({
-                    'profile_picture': '/static/images/default-profile.png',
+                    'profile_picture': static('images/default-profile.png'),
                     'notes': f"Role: {user.get_user_type_display()}"
                 })
         else:
@@ -6342,7 +5695,7 @@ def get_user_details_api(request, user_id):
                 })
             else:
                 # Regular admin or business manager
-                user_data['profile_picture'] = '/static/images/default-profile.png'
+                user_data['profile_picture'] = static('images/default-profile.png')
                 user_data['notes'] = f"Role: {user.get_user_type_display()}"
         
         return JsonResponse(user_data)
@@ -6445,6 +5798,7 @@ def signatory_enrollment(request):
 
 
 @login_required
+@conditional_get(ENROLLMENT_DATA)
 def signatory_enrollment_data_api(request):
     """API endpoint to get enrollment data for signatory"""
     print(f"Enrollment API called by user: {request.user.full_name}, type: {request.user.user_type}")
@@ -6467,7 +5821,7 @@ def signatory_enrollment_data_api(request):
         
         print(f"Filters: course={course_filter}, year={year_filter}, section={section_filter}, status={status_filter}, search={search_query}")
         
-        enrollment_forms = EnrollmentForm.objects.all().select_related('user__profile')
+        enrollment_forms = FormGridService.base_queryset('enrollment')
         print(f"Total enrollment forms found: {enrollment_forms.count()}")
         
         if course_filter:
@@ -6478,69 +5832,24 @@ def signatory_enrollment_data_api(request):
             enrollment_forms = enrollment_forms.filter(section__icontains=section_filter)
         if search_query:
             enrollment_forms = enrollment_forms.filter(
-                Q(user__full_name__icontains=search_query) |
-                Q(user__profile__student_number__icontains=search_query) |
+                Q(user_id__in=search_students(search_query)) |
                 Q(course__icontains=search_query)
             )
         
         print(f"Enrollment forms after filtering: {enrollment_forms.count()}")
         
         enrollment_data = []
-        for enrollment in enrollment_forms:
+        for row in FormGridService.rows('enrollment', enrollment_forms):
+            enrollment = row.form
             try:
                 student = enrollment.user
-                student_profile = getattr(student, 'profile', None)
-                
-                all_signatories = EnrollmentSignatory.objects.filter(
-                    enrollment=enrollment
-                ).select_related('signatory')
-
-                # Defaults
-                dean_status = 'pending'
-                dean_timestamp = None
-                business_manager_status = 'pending'
-                business_manager_timestamp = None
-                registrar_status = 'pending'
-                registrar_timestamp = None
-
-                for signatory in all_signatories:
-                    # Convert to Philippines timezone for display
-                    from django.utils import timezone
-                    import pytz
-                    
-                    if signatory.status != 'pending' and signatory.updated_at:
-                        # Convert UTC to Philippines timezone
-                        ph_tz = pytz.timezone('Asia/Manila')
-                        if timezone.is_aware(signatory.updated_at):
-                            ph_time = signatory.updated_at.astimezone(ph_tz)
-                        else:
-                            ph_time = timezone.make_aware(signatory.updated_at, timezone.utc).astimezone(ph_tz)
-                        ts = ph_time.strftime('%Y-%m-%d %I:%M %p')
-                    else:
-                        ts = None
-                        
-                    if signatory.role == 'dean':
-                        dean_status = signatory.status
-                        dean_timestamp = ts
-                    elif signatory.role == 'business_manager':
-                        business_manager_status = signatory.status
-                        business_manager_timestamp = ts
-                    elif signatory.role == 'registrar':
-                        registrar_status = signatory.status
-                        registrar_timestamp = ts
-
-                roles_required = {'dean', 'business_manager', 'registrar'}
-                statuses = {s.role: s.status for s in all_signatories}
-
-                # Determine overall status and timestamp
+                dean_status = row.status('dean')
+
                 # Only two statuses: "pending" or "completed"
-                overall_timestamp = None
-                
-                if roles_required.issubset(statuses.keys()) and all(statuses.get(role, 'pending') == 'approved' for role in roles_required):
+                if row.all_approved():
                     # All required signatories have approved
                     overall_status = 'completed'
-                    timestamps = [ts for ts in [dean_timestamp, business_manager_timestamp, registrar_timestamp] if ts]
-                    overall_timestamp = max(timestamps) if timestamps else None
+                    overall_timestamp = row.approved_at()
                 else:
                     # Still pending - not all required signatories have approved yet
                     overall_status = 'pending'
@@ -6558,17 +5867,17 @@ def signatory_enrollment_data_api(request):
                     'id': str(enrollment.id),
                     'enrollment_id': str(enrollment.id),
                     'student_name': student.full_name,
-                    'student_number': student_profile.student_number if student_profile else 'N/A',
+                    'student_number': row.profile_value('student_number'),
                     'course': enrollment.course,
                     'year': enrollment.year,
                     'section': enrollment.section or 'N/A',
                     'date_submitted': enrollment.created_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%B %d, %Y'),
                     'dean_status': dean_status,
-                    'dean_timestamp': dean_timestamp,
-                    'business_manager_status': business_manager_status,
-                    'business_manager_timestamp': business_manager_timestamp,
-                    'registrar_status': registrar_status,
-                    'registrar_timestamp': registrar_timestamp,
+                    'dean_timestamp': row.timestamp('dean') or None,
+                    'business_manager_status': row.status('business_manager'),
+                    'business_manager_timestamp': row.timestamp('business_manager') or None,
+                    'registrar_status': row.status('registrar'),
+                    'registrar_timestamp': row.timestamp('registrar') or None,
                     'overall_status': overall_status,
                     'overall_timestamp': overall_timestamp,
                     'can_approve': dean_status == 'pending',
@@ -6732,7 +6041,8 @@ def signatory_approve_enrollment(request):
             print(f"DEBUG: Not all required signatories approved yet. Missing roles: {missing_roles}")
         
         # Log activity
-        SignatoryActivityLog.objects.create(
+        record_activity(
+            SignatoryActivityLog,
             signatory=request.user,
             action_type='approve',
             form_type='enrollment',
@@ -6810,7 +6120,8 @@ def signatory_disapprove_enrollment(request):
         enrollment_signatory.save()
         
         # Log activity
-        SignatoryActivityLog.objects.create(
+        record_activity(
+            SignatoryActivityLog,
             signatory=request.user,
             action_type='disapprove',
             form_type='enrollment',
@@ -6852,7 +6163,8 @@ def signatory_print_enrollment(request, enrollment_id):
         }
         
         # Log activity
-        SignatoryActivityLog.objects.create(
+        record_activity(
+            SignatoryActivityLog,
             signatory=request.user,
             action_type='print',
             form_type='enrollment',
@@ -6900,7 +6212,8 @@ def signatory_bulk_print_enrollment(request):
                 })
                 
                 # Log activity
-                SignatoryActivityLog.objects.create(
+                record_activity(
+                    SignatoryActivityLog,
                     signatory=request.user,
                     action_type='print',
                     form_type='enrollment',
@@ -7003,7 +6316,8 @@ def signatory_delete_enrollment(request, enrollment_id):
         student_name = enrollment.user.full_name
         
         # Log activity before deletion
-        SignatoryActivityLog.objects.create(
+        record_activity(
+            SignatoryActivityLog,
             signatory=request.user,
             action_type='delete',
             form_type='enrollment',
@@ -7050,7 +6364,8 @@ def signatory_bulk_delete_enrollment(request):
                 student_name = enrollment.user.full_name
                 
                 # Log activity before deletion
-                SignatoryActivityLog.objects.create(
+                record_activity(
+                    SignatoryActivityLog,
                     signatory=request.user,
                     action_type='delete',
                     form_type='enrollment',
@@ -7104,72 +6419,30 @@ def signatory_bulk_approve_enrollment(request):
         if not enrollment_ids:
             return JsonResponse({'error': 'No enrollment forms selected'}, status=400)
         
-        processed_count = 0
+        # Approve all selected forms set-wise in one transaction
+        decision = BulkDecisionService.approve(
+            'enrollment',
+            enrollment_ids,
+            signatory_user=request.user,
+            role='dean',
+            remarks=comment,
+            ip_address=get_client_ip(request),
+            skip_statuses=('approved', 'disapproved')
+        )
+        processed_count = decision['approved_count']
         
-        for enrollment_id in enrollment_ids:
-            try:
-                # Get or create enrollment signatory record
-                enrollment = EnrollmentForm.objects.get(id=enrollment_id)
-                enrollment_signatory, created = EnrollmentSignatory.objects.get_or_create(
-                    enrollment=enrollment,
-                    signatory=request.user,
-                    defaults={
-                        'status': 'pending',
-                        'role': 'dean'
-                    }
-                )
-                
-                # Only process if still pending
-                if enrollment_signatory.status == 'pending':
-                    enrollment_signatory.status = 'approved'
-                    enrollment_signatory.remarks = comment
-                    enrollment_signatory.ip_address = get_client_ip(request)
-                    enrollment_signatory.save()
-                    
-                    processed_count += 1
-                    
-                    # Check if all required signatories approved and update enrollment status
-                    required_roles = ['business_manager', 'registrar', 'dean']
-                    all_signatories = EnrollmentSignatory.objects.filter(enrollment=enrollment)
-                    
-                    # Check if we have all required roles and all are approved
-                    signatory_roles = set(sig.role for sig in all_signatories)
-                    required_roles_set = set(required_roles)
-                    
-                    if (signatory_roles >= required_roles_set and
-                        all_signatories.count() >= 3 and
-                        all(s.status == 'approved' for s in all_signatories)):
-                        enrollment.status = 'approved'
-                        enrollment.save()
-
-                        # Send completion notification to student
-                        try:
-                            from landing.notification_service import NotificationService
-                            NotificationService.notify_enrollment_completed(enrollment.user, enrollment)
-                            NotificationService.notify_admin_form_completed('enrollment', enrollment.user.full_name)
-                        except Exception as e:
-                            print(f"Error sending enrollment completion notifications: {e}")
-                    
-                    # Create audit log
-                    AuditLog.objects.create(
-                        user=request.user,
-                        action='Bulk Approved Enrollment Form',
-                        model_name='EnrollmentForm',
-                        object_id=enrollment_id,
-                        changes=f"Enrollment form approved via bulk action. Remarks: {comment}" if comment else "Enrollment form approved via bulk action",
-                        ip_address=get_client_ip(request)
-                    )
-                    
-            except EnrollmentForm.DoesNotExist:
-                continue
-            except Exception as e:
-                print(f"Error processing enrollment {enrollment_id}: {e}")
-                continue
+        # Log activity
+        BulkDecisionService.log_activity(
+            SignatoryActivityLog, 'signatory', request.user, 'enrollment', decision['approved'],
+            ip_address=get_client_ip(request),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')
+        )
         
         return JsonResponse({
             'success': True,
             'processed_count': processed_count,
-            'message': f'{processed_count} enrollment(s) approved successfully'
+            'message': f'{processed_count} enrollment(s) approved successfully',
+            'results': decision['results']
         })
         
     except Exception as e:
@@ -7239,7 +6512,8 @@ def signatory_bulk_disapprove_enrollment(request):
                     enrollment.save()
                     
                     # Create audit log
-                    AuditLog.objects.create(
+                    record_activity(
+                        AuditLog,
                         user=request.user,
                         action='Bulk Disapproved Enrollment Form',
                         model_name='EnrollmentForm',
@@ -7286,6 +6560,7 @@ def signatory_graduation(request):
 
 
 @login_required
+@conditional_get(GRADUATION_DATA)
 def signatory_graduation_data_api(request):
     """API endpoint to get graduation data for signatory (President only)."""
     if request.user.user_type != 'signatory':
@@ -7305,7 +6580,7 @@ def signatory_graduation_data_api(request):
         section_filter = request.GET.get('section', '')
         
         # Base query
-        graduation_forms = GraduationForm.objects.select_related('user').prefetch_related('signatories')
+        graduation_forms = FormGridService.base_queryset('graduation')
         
         # Apply course filter (ignore placeholder values)
         if course_filter and not course_filter.startswith('Filter by'):
@@ -7325,27 +6600,18 @@ def signatory_graduation_data_api(request):
         # Apply search if provided
         if search_query:
             graduation_forms = graduation_forms.filter(
-                Q(user__full_name__icontains=search_query) |
-                Q(user__profile__student_number__icontains=search_query) |
-                Q(user__profile__program__icontains=search_query) |
+                Q(user_id__in=search_students(search_query, ['name', 'student_number', 'program'])) |
                 Q(grad_appno__icontains=search_query)
             )
         
         graduation_data = []
         
-        for graduation in graduation_forms:
-            # Determine the current user's role in the graduation workflow
-            user_role = 'dean' if signatory_profile.signatory_type == 'academic_dean' else 'president'
-            
-            # Get all signatory statuses for this graduation
-            current_user_signatory = graduation.signatories.filter(
-                role=user_role, 
-                signatory=request.user
-            ).first()
-            dean_signatory = graduation.signatories.filter(role='dean').first()
-            business_manager_signatory = graduation.signatories.filter(role='business_manager').first()
-            registrar_signatory = graduation.signatories.filter(role='registrar').first()
-            president_signatory = graduation.signatories.filter(role='president').first()
+        # Determine the current user's role in the graduation workflow
+        user_role = 'dean' if signatory_profile.signatory_type == 'academic_dean' else 'president'
+        
+        for row in FormGridService.rows('graduation', graduation_forms):
+            graduation = row.form
+            current_user_signatory = row.signatory_for(user_role, request.user)
             
             # Determine current user's status (for their respective column)
             current_user_status = current_user_signatory.status if current_user_signatory else 'pending'
@@ -7353,48 +6619,36 @@ def signatory_graduation_data_api(request):
             current_user_remarks = ''
             
             if current_user_signatory and current_user_signatory.updated_at:
-                manila_tz = pytz.timezone('Asia/Manila')
-                current_user_timestamp = current_user_signatory.updated_at.astimezone(manila_tz).strftime('%Y-%m-%d %I:%M %p')
+                current_user_timestamp = format_timestamp(current_user_signatory.updated_at)
             
             if current_user_signatory:
                 current_user_remarks = current_user_signatory.remarks or ''
             
             # Determine overall status - only 'pending' or 'completed'
-            roles_required = ['dean', 'business_manager', 'registrar', 'president']
-            all_approved = all([
-                dean_signatory and dean_signatory.status == 'approved',
-                business_manager_signatory and business_manager_signatory.status == 'approved', 
-                registrar_signatory and registrar_signatory.status == 'approved',
-                president_signatory and president_signatory.status == 'approved'
-            ])
-            overall_status = 'completed' if all_approved else 'pending'
+            overall_status = 'completed' if row.all_approved() else 'pending'
             
             # Apply status filter after determining overall status
             if filter_status and filter_status != overall_status:
                 continue
             
-            # Get section from enrollment forms
-            enrollment_form = EnrollmentForm.objects.filter(user=graduation.user).first()
-            section = enrollment_form.section if enrollment_form else 'N/A'
-            
             graduation_entry = {
                 'id': str(graduation.id),
                 'student_name': graduation.user.full_name,
-                'student_number': graduation.user.profile.student_number if hasattr(graduation.user, 'profile') else 'N/A',
-                'course': graduation.user.profile.program if hasattr(graduation.user, 'profile') else 'N/A',
-                'year': graduation.user.profile.year_level if hasattr(graduation.user, 'profile') else 'N/A',
-                'section': section,
+                'student_number': row.profile_value('student_number'),
+                'course': row.profile_value('program'),
+                'year': row.profile_value('year_level'),
+                'section': row.enrollment_section,
                 'grad_appno': graduation.grad_appno or 'N/A',
                 'email': graduation.user.email,
                 'date_submitted': graduation.created_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p'),
-                'dean_status': dean_signatory.status if dean_signatory else 'pending',
-                'dean_timestamp': dean_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if dean_signatory and dean_signatory.updated_at else '',
-                'business_status': business_manager_signatory.status if business_manager_signatory else 'pending', 
-                'business_timestamp': business_manager_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if business_manager_signatory and business_manager_signatory.updated_at else '',
-                'registrar_status': registrar_signatory.status if registrar_signatory else 'pending',
-                'registrar_timestamp': registrar_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if registrar_signatory and registrar_signatory.updated_at else '',
-                'president_status': president_signatory.status if president_signatory else 'pending',
-                'president_timestamp': president_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if president_signatory and president_signatory.updated_at else '',
+                'dean_status': row.status('dean'),
+                'dean_timestamp': row.timestamp('dean', decided_only=False),
+                'business_status': row.status('business_manager'),
+                'business_timestamp': row.timestamp('business_manager', decided_only=False),
+                'registrar_status': row.status('registrar'),
+                'registrar_timestamp': row.timestamp('registrar', decided_only=False),
+                'president_status': row.status('president'),
+                'president_timestamp': row.timestamp('president', decided_only=False),
                 'overall_status': overall_status,
                 # Fields for current user's column
                 'user_role': user_role,
@@ -7552,7 +6806,8 @@ def signatory_approve_graduation(request):
                 print(f"Error sending graduation completion notifications: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_approval',
             description=f'President approved graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -7640,7 +6895,8 @@ def signatory_disapprove_graduation(request):
             print(f"Error sending president graduation disapproval notification: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_disapproval',
             description=f'President disapproved graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -7688,69 +6944,30 @@ def signatory_bulk_approve_graduation(request):
         
         # Determine the correct role based on user's signatory type
         user_role = 'dean' if signatory_profile.signatory_type == 'academic_dean' else 'president'
-        processed_count = 0
         
-        for graduation_id in graduation_ids:
-            try:
-                # Get or create signatory record with correct role
-                graduation = GraduationForm.objects.get(id=graduation_id)
-                signatory_record, created = GraduationSignatory.objects.get_or_create(
-                    graduation=graduation,
-                    signatory=request.user,
-                    role=user_role,
-                    defaults={'status': 'pending'}
-                )
-                
-                # Only process if not already approved
-                if signatory_record.status != 'approved':
-                    signatory_record.status = 'approved'
-                    signatory_record.remarks = comment
-                    signatory_record.ip_address = get_client_ip(request)
-                    signatory_record.save()
-                    
-                    processed_count += 1
-                    
-                    # Check if all required signatories approved and update graduation status
-                    required_roles = ['dean', 'business_manager', 'registrar', 'president']
-                    all_signatories = GraduationSignatory.objects.filter(graduation=graduation)
-                    
-                    signatory_roles = set(sig.role for sig in all_signatories)
-                    required_roles_set = set(required_roles)
-                    
-                    if (signatory_roles >= required_roles_set and
-                        all_signatories.count() >= 4 and
-                        all(s.status == 'approved' for s in all_signatories)):
-                        graduation.status = 'approved'
-                        graduation.save()
-
-                        # Send completion notification to student
-                        try:
-                            from landing.notification_service import NotificationService
-                            NotificationService.notify_graduation_completed(graduation.user, graduation)
-                            NotificationService.notify_admin_form_completed('graduation', graduation.user.full_name)
-                        except Exception as e:
-                            print(f"Error sending graduation completion notifications: {e}")
-                    
-                    # Create audit log
-                    AuditLog.objects.create(
-                        user=request.user,
-                        action='Bulk Approved Graduation Form',
-                        model_name='GraduationForm',
-                        object_id=graduation_id,
-                        changes=f"Graduation form approved via bulk action. Comments: {comment}" if comment else "Graduation form approved via bulk action",
-                        ip_address=get_client_ip(request)
-                    )
-                    
-            except GraduationForm.DoesNotExist:
-                continue
-            except Exception as e:
-                print(f"Error processing graduation {graduation_id}: {e}")
-                continue
+        # Approve all selected forms set-wise in one transaction
+        decision = BulkDecisionService.approve(
+            'graduation',
+            graduation_ids,
+            signatory_user=request.user,
+            role=user_role,
+            remarks=comment,
+            ip_address=get_client_ip(request)
+        )
+        processed_count = decision['approved_count']
+        
+        # Log activity
+        BulkDecisionService.log_activity(
+            SignatoryActivityLog, 'signatory', request.user, 'graduation', decision['approved'],
+            ip_address=get_client_ip(request),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')
+        )
         
         return JsonResponse({
             'success': True,
             'processed_count': processed_count,
-            'message': f'{processed_count} graduation(s) approved successfully'
+            'message': f'{processed_count} graduation(s) approved successfully',
+            'results': decision['results']
         })
         
     except Exception as e:
@@ -7822,7 +7039,8 @@ def signatory_bulk_disapprove_graduation(request):
                     processed_count += 1
                     
                     # Create audit log
-                    AuditLog.objects.create(
+                    record_activity(
+                        AuditLog,
                         user=request.user,
                         action='Bulk Disapproved Graduation Form',
                         model_name='GraduationForm',
@@ -8096,8 +7314,9 @@ def registrar_reports_data_api(request):
 
         # Apply date filters with timezone-safe handling
         if from_date_obj:
-            sig_qs = sig_qs.filter(created_at__date__gte=from_date_obj)
-            aud_qs = aud_qs.filter(timestamp__date__gte=from_date_obj)
+            from_start, _ = local_day_range(from_date_obj, from_date_obj)
+            sig_qs = sig_qs.filter(created_at__gte=from_start)
+            aud_qs = aud_qs.filter(timestamp__gte=from_start)
 
         if to_date_obj:
             # Include full day up to 23:59:59 in server timezone
@@ -8116,18 +7335,19 @@ def registrar_reports_data_api(request):
 
         # Apply period filters
         if period_type:
-            today = timezone.now().date()
+            today = timezone.localdate()
             if period_type == 'day':
-                sig_qs = sig_qs.filter(created_at__date=today)
-                aud_qs = aud_qs.filter(timestamp__date=today)
+                period_start, period_end = local_day_range(today, today)
+                sig_qs = sig_qs.filter(created_at__gte=period_start, created_at__lt=period_end)
+                aud_qs = aud_qs.filter(timestamp__gte=period_start, timestamp__lt=period_end)
             elif period_type == 'week':
-                week_ago = today - timedelta(days=7)
-                sig_qs = sig_qs.filter(created_at__date__gte=week_ago)
-                aud_qs = aud_qs.filter(timestamp__date__gte=week_ago)
+                period_start, _ = local_day_range(today - timedelta(days=7), today)
+                sig_qs = sig_qs.filter(created_at__gte=period_start)
+                aud_qs = aud_qs.filter(timestamp__gte=period_start)
             elif period_type == 'month':
-                month_ago = today - timedelta(days=30)
-                sig_qs = sig_qs.filter(created_at__date__gte=month_ago)
-                aud_qs = aud_qs.filter(timestamp__date__gte=month_ago)
+                period_start, _ = local_day_range(today - timedelta(days=30), today)
+                sig_qs = sig_qs.filter(created_at__gte=period_start)
+                aud_qs = aud_qs.filter(timestamp__gte=period_start)
 
         # Apply action type filter
         if form_status in {'approve', 'disapprove', 'view', 'print', 'delete'}:
@@ -8257,28 +7477,31 @@ def registrar_reports_data_api(request):
             if from_date:
                 try:
                     from_date_obj = datetime.strptime(from_date, '%Y-%m-%d').date()
-                    doc_qs = doc_qs.filter(created_at__date__gte=from_date_obj)
+                    from_start, _ = local_day_range(from_date_obj, from_date_obj)
+                    doc_qs = doc_qs.filter(created_at__gte=from_start)
                 except ValueError:
                     pass
             
             if to_date:
                 try:
                     to_date_obj = datetime.strptime(to_date, '%Y-%m-%d').date()
-                    doc_qs = doc_qs.filter(created_at__date__lte=to_date_obj)
+                    _, to_end = local_day_range(to_date_obj, to_date_obj)
+                    doc_qs = doc_qs.filter(created_at__lt=to_end)
                 except ValueError:
                     pass
             
             # Apply period filters
             if period_type:
-                today = timezone.now().date()
+                today = timezone.localdate()
                 if period_type == 'day':
-                    doc_qs = doc_qs.filter(created_at__date=today)
+                    period_start, period_end = local_day_range(today, today)
+                    doc_qs = doc_qs.filter(created_at__gte=period_start, created_at__lt=period_end)
                 elif period_type == 'week':
-                    week_ago = today - timedelta(days=7)
-                    doc_qs = doc_qs.filter(created_at__date__gte=week_ago)
+                    period_start, _ = local_day_range(today - timedelta(days=7), today)
+                    doc_qs = doc_qs.filter(created_at__gte=period_start)
                 elif period_type == 'month':
-                    month_ago = today - timedelta(days=30)
-                    doc_qs = doc_qs.filter(created_at__date__gte=month_ago)
+                    period_start, _ = local_day_range(today - timedelta(days=30), today)
+                    doc_qs = doc_qs.filter(created_at__gte=period_start)
             
             # Apply text search
             if text_search:
@@ -8398,8 +7621,6 @@ def registrar_reports_csv_export(request):
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        import csv
-        from django.http import HttpResponse
         from datetime import datetime, timezone as dt_timezone, timedelta
         from django.db.models import Q
         
@@ -8411,39 +7632,42 @@ def registrar_reports_csv_export(request):
         role_filter = request.GET.get('role', '')
         text_search = request.GET.get('q', '').strip() or request.GET.get('search', '').strip()
 
-        sig_qs = SignatoryActivityLog.objects.select_related('signatory')
-        aud_qs = AuditLog.objects.select_related('user')
+        sig_qs = SignatoryActivityLog.objects.all()
+        aud_qs = AuditLog.objects.all()
 
         # Apply same filters as main API
         if from_date:
             try:
                 from_date_obj = datetime.strptime(from_date, '%Y-%m-%d').date()
-                sig_qs = sig_qs.filter(created_at__date__gte=from_date_obj)
-                aud_qs = aud_qs.filter(timestamp__date__gte=from_date_obj)
+                from_start, _ = local_day_range(from_date_obj, from_date_obj)
+                sig_qs = sig_qs.filter(created_at__gte=from_start)
+                aud_qs = aud_qs.filter(timestamp__gte=from_start)
             except ValueError:
                 pass
 
         if to_date:
             try:
                 to_date_obj = datetime.strptime(to_date, '%Y-%m-%d').date()
-                sig_qs = sig_qs.filter(created_at__date__lte=to_date_obj)
-                aud_qs = aud_qs.filter(timestamp__date__lte=to_date_obj)
+                _, to_end = local_day_range(to_date_obj, to_date_obj)
+                sig_qs = sig_qs.filter(created_at__lt=to_end)
+                aud_qs = aud_qs.filter(timestamp__lt=to_end)
             except ValueError:
                 pass
 
         if period_type:
-            today = timezone.now().date()
+            today = timezone.localdate()
             if period_type == 'day':
-                sig_qs = sig_qs.filter(created_at__date=today)
-                aud_qs = aud_qs.filter(timestamp__date=today)
+                period_start, period_end = local_day_range(today, today)
+                sig_qs = sig_qs.filter(created_at__gte=period_start, created_at__lt=period_end)
+                aud_qs = aud_qs.filter(timestamp__gte=period_start, timestamp__lt=period_end)
             elif period_type == 'week':
-                week_ago = today - timedelta(days=7)
-                sig_qs = sig_qs.filter(created_at__date__gte=week_ago)
-                aud_qs = aud_qs.filter(timestamp__date__gte=week_ago)
+                period_start, _ = local_day_range(today - timedelta(days=7), today)
+                sig_qs = sig_qs.filter(created_at__gte=period_start)
+                aud_qs = aud_qs.filter(timestamp__gte=period_start)
             elif period_type == 'month':
-                month_ago = today - timedelta(days=30)
-                sig_qs = sig_qs.filter(created_at__date__gte=month_ago)
-                aud_qs = aud_qs.filter(timestamp__date__gte=month_ago)
+                period_start, _ = local_day_range(today - timedelta(days=30), today)
+                sig_qs = sig_qs.filter(created_at__gte=period_start)
+                aud_qs = aud_qs.filter(timestamp__gte=period_start)
 
         if form_status in {'approve', 'disapprove', 'view', 'print', 'delete'}:
             sig_qs = sig_qs.filter(action_type=form_status)
@@ -8480,79 +7704,71 @@ def registrar_reports_csv_export(request):
             )
             aud_qs = aud_qs.filter(aud_q)
 
-        # Build unified feed for CSV export
-        feed = []
+        # Stream both logs newest first, merged by timestamp, one chunk per feed in memory
+        action_labels = dict(SignatoryActivityLog.ACTION_TYPES)
+        form_labels = dict(SignatoryActivityLog.FORM_TYPES)
+        
+        def activity_rows():
+            for chunk in iter_newest_first(
+                sig_qs, 'created_at',
+                ['signatory__full_name', 'signatory__user_type', 'action_type', 'form_type', 'student_name', 'ip_address']
+            ):
+                # Student course lookup for this chunk only
+                names = {row[6] for row in chunk if row[6]}
+                student_course_map = dict(
+                    StudentProfile.objects.filter(user__full_name__in=names).values_list('user__full_name', 'program')
+                ) if names else {}
+                for created_at, _, full_name, user_type, action_type, form_type, student_name, ip_address in chunk:
+                    yield (
+                        created_at,
+                        full_name or 'Unknown',
+                        user_type or 'signatory',
+                        action_type,
+                        student_name,
+                        student_course_map.get(student_name, '') if student_name else '',
+                        f"{action_labels.get(action_type, action_type)} {form_labels.get(form_type, form_type)}",
+                        ip_address or '',
+                        'activity_log',
+                    )
         
-        # Get student course lookup for CSV export
-        student_names = [log.student_name for log in sig_qs if log.student_name]
-        student_course_map = {}
-        if student_names:
-            from landing.models import User, StudentProfile
-            student_profiles = StudentProfile.objects.select_related('user').filter(
-                user__full_name__in=student_names
-            )
-            student_course_map = {
-                profile.user.full_name: profile.program 
-                for profile in student_profiles
-            }
+        def audit_rows():
+            for timestamp, _, full_name, user_type, action_type, description in flatten(iter_newest_first(
+                aud_qs, 'timestamp', ['user__full_name', 'user__user_type', 'action_type', 'description']
+            )):
+                yield (
+                    timestamp,
+                    full_name or 'System',
+                    user_type or 'system',
+                    action_type,
+                    '',
+                    '',
+                    description or '',
+                    extract_ip_from_description(description) or '',
+                    'audit_log',
+                )
+        
+        def csv_rows():
+            for row in merge_newest_first(activity_rows(), audit_rows(), key=lambda row: row[0]):
+                timestamp, user_display, role, action_type, student_name, course, details, ip_address, source = row
+                yield [
+                    timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                    user_display,
+                    role,
+                    action_type,
+                    student_name,  # Student name
+                    course,  # Course
+                    details[:200],  # Requested form (truncated)
+                    ip_address,
+                    source
+                ]
         
-        for log in sig_qs:
-            student_course = student_course_map.get(log.student_name, '') if log.student_name else ''
-            feed.append({
-                'timestamp': log.created_at,
-                'user_display': getattr(log.signatory, 'full_name', 'Unknown'),
-                'role': getattr(log.signatory, 'user_type', 'signatory'),
-                'action_type': log.action_type,
-                'entity_type': log.form_type,
-                'entity_ref': log.student_name,
-                'student_course': student_course,
-                'ip_address': log.ip_address or '',
-                'source': 'activity_log',
-                'details': f"{log.get_action_type_display()} {log.get_form_type_display()}"
-            })
-
-        for log in aud_qs:
-            feed.append({
-                'timestamp': log.timestamp,
-                'user_display': getattr(log.user, 'full_name', 'System') if log.user else 'System',
-                'role': getattr(log.user, 'user_type', 'system') if log.user else 'system',
-                'action_type': log.action_type,
-                'entity_type': 'system',
-                'entity_ref': '',
-                'student_course': '',
-                'ip_address': extract_ip_from_description(log.description) or '',
-                'source': 'audit_log',
-                'details': log.description or ''
-            })
-
-        # Sort by timestamp (most recent first)
-        feed.sort(key=lambda x: x['timestamp'], reverse=True)
-
-        # Generate CSV response
-        response = HttpResponse(content_type='text/csv')
         timestamp_str = timezone.now().strftime('%Y%m%d_%H%M%S')
-        response['Content-Disposition'] = f'attachment; filename="activity_report_{timestamp_str}.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow([
-            'Timestamp', 'User', 'Role', 'Action', 'Student Name', 
-            'Course', 'Requested Form', 'IP Address', 'Source'
-        ])
-
-        for item in feed:
-            writer.writerow([
-                item['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                item['user_display'],
-                item['role'],
-                item['action_type'],
-                item['entity_ref'],  # Student name
-                item['student_course'],  # Course
-                item['details'][:200],  # Requested form (truncated)
-                item['ip_address'],
-                item['source']
-            ])
-
-        return response
+        return streaming_csv_response(
+            f'activity_report_{timestamp_str}.csv',
+            ['Timestamp', 'User', 'Role', 'Action', 'Student Name',
+             'Course', 'Requested Form', 'IP Address', 'Source'],
+            csv_rows()
+        )
 
     except Exception as e:
         import traceback
@@ -8682,7 +7898,7 @@ def registrar_form_download(request, form_type, form_id):
     
     try:
         from django.template.loader import render_to_string
-        from django.http import HttpResponse
+        from django.http import FileResponse
         import logging
         logger = logging.getLogger(__name__)
 
@@ -8711,30 +7927,35 @@ def registrar_form_download(request, form_type, form_id):
             template_name = 'pdf/document-request.html'  # Keep this for now as there may not be a pdf-document template
             filename_prefix = "document_request"
 
-        # Prepare context for template
-        context = {
-            'form': form_obj,
-            'user': form_obj.student if hasattr(form_obj, 'student') else (
-                form_obj.user if hasattr(form_obj, 'user') else form_obj.requester),
-            'generated_at': timezone.now(),
-            'generated_by': request.user.full_name
-        }
+        form_user = form_obj.student if hasattr(form_obj, 'student') else (
+            form_obj.user if hasattr(form_obj, 'user') else form_obj.requester)
+
+        def render_pdf():
+            # Prepare context for template
+            context = {
+                'form': form_obj,
+                'user': form_user,
+                'generated_at': timezone.now(),
+                'generated_by': request.user.full_name
+            }
 
-        # Render HTML content
-        html_content = render_to_string(template_name, context, request=request)
+            # Render HTML content and convert to PDF
+            html_content = render_to_string(template_name, context, request=request)
+            return convert_html_to_pdf(html_content)
 
-        # Convert to PDF
-        pdf_content = convert_html_to_pdf(html_content)
+        # Repeat downloads of an unchanged form are served from the render cache
+        cache_key = PdfRenderCache.make_key(template_name, form_type, form_obj, form_user)
+        pdf_path, cache_hit = PdfRenderCache.get_or_render(cache_key, form_type, form_obj.id, render_pdf)
 
         # Create filename
         date_str = timezone.now().strftime('%Y-%m-%d')
         filename = f"{filename_prefix}_{form_id}_{date_str}.pdf"
 
         # Return PDF response
-        response = HttpResponse(pdf_content, content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response = FileResponse(open(pdf_path, 'rb'), as_attachment=True, filename=filename, content_type='application/pdf')
+        response['X-PDF-Cache'] = 'hit' if cache_hit else 'miss'
 
-        logger.info(f"Form downloaded as PDF: {form_type} {form_id} by {request.user.username}")
+        logger.info(f"Form downloaded as PDF: {form_type} {form_id} by {request.user.username} (cache {'hit' if cache_hit else 'miss'})")
         return response
 
     except (ClearanceForm.DoesNotExist, EnrollmentForm.DoesNotExist, 
@@ -8814,6 +8035,15 @@ def registrar_form_view(request, form_type, form_id):
         return JsonResponse({'error': 'Internal server error'}, status=500)
 
 
+@login_required
+def registrar_pdf_cache_stats(request):
+    """Hit/miss counters and disk usage of the form PDF render cache"""
+    if request.user.user_type not in ['admin', 'registrar']:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    return JsonResponse({'success': True, 'stats': PdfRenderCache.stats()})
+
+
 @login_required
 def registrar_reports_list_api(request):
     """API endpoint to list generated report files from unified GeneratedReport model"""
@@ -9071,8 +8301,9 @@ def get_activity_data_for_report(form_type=None, from_date=None, to_date=None, f
     if from_date:
         try:
             from_date_obj = datetime.strptime(from_date, '%Y-%m-%d').date()
-            sig_qs = sig_qs.filter(created_at__date__gte=from_date_obj)
-            aud_qs = aud_qs.filter(timestamp__date__gte=from_date_obj)
+            from_start, _ = local_day_range(from_date_obj, from_date_obj)
+            sig_qs = sig_qs.filter(created_at__gte=from_start)
+            aud_qs = aud_qs.filter(timestamp__gte=from_start)
         except ValueError:
             pass
     
@@ -9098,14 +8329,15 @@ def get_activity_data_for_report(form_type=None, from_date=None, to_date=None, f
     
     # Apply period filters
     if period_type:
-        today = timezone.now().date()
+        today = timezone.localdate()
         if period_type == 'day':
-            sig_qs = sig_qs.filter(created_at__date=today)
-            aud_qs = aud_qs.filter(timestamp__date=today)
+            period_start, period_end = local_day_range(today, today)
+            sig_qs = sig_qs.filter(created_at__gte=period_start, created_at__lt=period_end)
+            aud_qs = aud_qs.filter(timestamp__gte=period_start, timestamp__lt=period_end)
         elif period_type == 'week':
-            week_ago = today - timedelta(days=7)
-            sig_qs = sig_qs.filter(created_at__date__gte=week_ago)
-            aud_qs = aud_qs.filter(timestamp__date__gte=week_ago)
+            period_start, _ = local_day_range(today - timedelta(days=7), today)
+            sig_qs = sig_qs.filter(created_at__gte=period_start)
+            aud_qs = aud_qs.filter(timestamp__gte=period_start)
     
     # Apply action type filter
     if form_status in {'approve', 'disapprove', 'view', 'print', 'delete'}:
@@ -9202,15 +8434,58 @@ def get_activity_data_for_report(form_type=None, from_date=None, to_date=None, f
     return activities
 
 
+def report_job_accepted_response(job, download_url_name, message='Report queued for generation'):
+    """202 response for a queued report job: where to poll for progress and where the file will be"""
+    from django.urls import reverse
+    return JsonResponse({
+        'success': True,
+        'message': message,
+        'job_id': str(job.id),
+        'report_id': str(job.id),
+        'status': job.status,
+        'progress_url': reverse('report_job_status', args=[job.id]),
+        'download_url': reverse(download_url_name, args=[job.id]),
+    }, status=202)
+
+
+# Download view for finished report jobs, by the role of the user polling
+REPORT_JOB_DOWNLOAD_URL_NAMES = {
+    'admin': 'registrar_download_report',
+    'registrar': 'registrar_download_report',
+    'signatory': 'signatory_download_report',
+    'business_manager': 'business_manager_download_report',
+}
+
+
+@login_required
+def report_job_status(request, job_id):
+    """Progress of a queued report job; download_url is set once the file is ready"""
+    from django.urls import reverse
+
+    try:
+        job = GeneratedReport.objects.get(id=job_id)
+    except GeneratedReport.DoesNotExist:
+        return JsonResponse({'error': 'Report job not found'}, status=404)
+
+    # Registrars see every report (as in their report list); everyone else only their own
+    if request.user.user_type not in ['admin', 'registrar'] and job.generated_by_id != request.user.id:
+        return JsonResponse({'error': 'Report job not found'}, status=404)
+
+    payload = ReportJobQueue.progress(job)
+    payload['success'] = True
+    url_name = REPORT_JOB_DOWNLOAD_URL_NAMES.get(request.user.user_type)
+    payload['download_url'] = reverse(url_name, args=[job.id]) if job.status == 'completed' and url_name else None
+    return JsonResponse(payload)
+
+
 @login_required
 def registrar_generate_manual_report(request):
-    """Generate manual report for registrar/admin using current filters"""
+    """Queue a manual PDF report for registrar/admin using current filters; returns 202 with the job to poll"""
     if request.user.user_type not in ['admin', 'registrar']:
         return JsonResponse({'error': 'Access denied'}, status=403)
 
     try:
         from datetime import datetime, timezone as dt_timezone, timedelta
-        from django.template.loader import render_to_string
         import pytz
         import logging
         logger = logging.getLogger(__name__)
@@ -9244,7 +8519,7 @@ def registrar_generate_manual_report(request):
         # Default to last week if no dates provided
         if not start_date and not end_date:
             ph_tz = pytz.timezone('Asia/Manila')
-            now = timezone.now(ph_tz)
+            now = datetime.now(ph_tz)
             end_date = now.date()
             start_date = end_date - timedelta(days=7)
 
@@ -9261,102 +8536,27 @@ def registrar_generate_manual_report(request):
         # Log parameters for diagnostics
         logger.info(f"Manual report params: form_type={form_type}, dates={from_date} to {to_date}, status={form_status}")
 
-        # Use unified query that matches table logic exactly
-        if form_type and form_type in ['clearance', 'enrollment', 'graduation', 'document_release']:
-            # When form type is selected, query actual forms like the table does
-            activities = get_forms_data_for_report(
-                form_type=form_type,
-                from_date=from_date,
-                to_date=to_date,
-                form_status=form_status,
-                text_search=text_search
-            )
-        else:
-            # Default to activity logs when no form type selected
-            activities = get_activity_data_for_report(
-                form_type=form_type,
-                from_date=from_date,
-                to_date=to_date,
-                form_status=form_status,
-                period_type=period_type,
-                role_filter=role_filter,
-                text_search=text_search
-            )
-
-        # Log diagnostic info for row count matching
-        data_source = "forms" if form_type and form_type in ['clearance', 'enrollment', 'graduation', 'document_release'] else "activities"
-        logger.info(f"Manual report query result: {data_source} data, {len(activities)} rows found")
-
-        # Prepare context for professional PDF template
-        ph_tz = pytz.timezone('Asia/Manila')
-        now = datetime.now(ph_tz)
-        
-        context = {
-            'report_title': 'Activity Report',
-            'report_id': f'AR-{now.strftime("%Y%m%d%H%M%S")}',
-            'generated_by': request.user.full_name or request.user.username,
-            'generated_at': now,
-            'period_start': start_date,
-            'period_end': end_date,
-            'activities': activities,
-            'total_count': len(activities),
-            'filters': {
-                'form_type': form_type,
-                'form_status': form_status,
-                'text_search': text_search,
-                'role_filter': role_filter,
-                'period_type': period_type
-            }
+        # The PDF is built by the report job worker; the client polls the job and downloads the file
+        parameters = {
+            'form_type': form_type,
+            'from_date': from_date,
+            'to_date': to_date,
+            'form_status': form_status,
+            'period_type': period_type,
+            'role_filter': role_filter,
+            'text_search': text_search,
         }
-
-        # Generate HTML using professional template
-        html_content = render_to_string('pdf/professional-report.html', context)
-        
-        # Convert HTML to PDF
-        pdf_bytes = convert_html_to_pdf(html_content)
-        if not pdf_bytes:
-            return JsonResponse({'error': 'PDF generation failed'}, status=500)
-        
-        # Calculate checksum
-        import hashlib
-        checksum = hashlib.sha256(pdf_bytes).hexdigest()
-        
-        # Create filename: {form_type}_{YYYY-MM-DD}.pdf
-        date_str = now.strftime('%Y-%m-%d')
-        if form_type:
-            filename = f"{form_type}_{date_str}.pdf"
-        else:
-            filename = f"activity_report_{date_str}.pdf"
-        
-        # Create database record
-        from django.core.files.base import ContentFile
-        generated_report = GeneratedReport.objects.create(
-            report_type='manual_activity',
-            generated_by=request.user,
-            period_start=start_date,
-            period_end=end_date,
-            file=ContentFile(pdf_bytes, name=filename),
-            size_bytes=len(pdf_bytes),
-            checksum=checksum,
-            status='completed',
-            notes=f'Professional table PDF with {len(activities)} activities'
+        job = ReportJobQueue.enqueue(
+            'manual_activity', request.user, parameters, period_start=start_date, period_end=end_date
         )
-        
-        # Send notification about new report generation
-        try:
-            from landing.notification_service import NotificationService
-            NotificationService.notify_report_generated(generated_report)
-        except Exception as e:
-            logger.error(f"Error sending report generation notification: {str(e)}")
+        if job.parameters != parameters:
+            return JsonResponse({
+                'error': 'Another activity report for this period is still being generated. Try again when it finishes.',
+                'job_id': str(job.id)
+            }, status=409)
 
-        # Return PDF with proper headers
-        from django.http import HttpResponse
-        response = HttpResponse(pdf_bytes, content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        response['Content-Length'] = len(pdf_bytes)
-        
-        logger.info(f"Professional PDF generated: {filename}, {len(activities)} rows, record ID: {generated_report.id}")
-        return response
+        logger.info(f"Manual report queued: job {job.id}")
+        return report_job_accepted_response(job, 'registrar_download_report')
 
     except Exception as e:
         import traceback
@@ -9367,7 +8567,7 @@ def registrar_generate_manual_report(request):
 
 @login_required
 def registrar_generate_signatory_pack(request):
-    """Generate PDF pack for signatory reports - POST only"""
+    """Queue a ZIP pack of per-signatory PDF reports - POST only; returns 202 with the job to poll"""
     if request.user.user_type not in ['admin', 'registrar']:
         return JsonResponse({'error': 'Access denied'}, status=403)
     
@@ -9380,8 +8580,6 @@ def registrar_generate_signatory_pack(request):
     try:
         import json
         from datetime import datetime, timezone as dt_timezone
-        from django.http import HttpResponse
-        from django.template.loader import render_to_string
         
         # Parse and validate request data
         try:
@@ -9418,168 +8616,24 @@ def registrar_generate_signatory_pack(request):
         if from_date_obj > to_date_obj:
             return JsonResponse({'error': 'from_date cannot be after to_date'}, status=400)
         
-        # Get all signatories that have activities for this form type and date range
-        # Use timezone-safe date filtering
-        import pytz
-        from django.conf import settings
-        
-        to_date_end = datetime.combine(to_date_obj, datetime.max.time().replace(microsecond=0))
-        
-        # Make timezone-aware if USE_TZ is enabled
-        if getattr(settings, 'USE_TZ', False):
-            tz = pytz.timezone(getattr(settings, 'TIME_ZONE', 'UTC'))
-            to_date_end = tz.localize(to_date_end)
-            
-        sig_qs = SignatoryActivityLog.objects.select_related('signatory').filter(
-            created_at__date__gte=from_date_obj,
-            created_at__lte=to_date_end
-        )
-        
-        # Apply form type filter
-        if form_type == 'clearance':
-            sig_qs = sig_qs.filter(form_type__icontains='clearance')
-        elif form_type == 'enrollment':
-            sig_qs = sig_qs.filter(form_type__icontains='enrollment')
-        elif form_type == 'graduation':
-            sig_qs = sig_qs.filter(form_type__icontains='graduation')
-        elif form_type == 'document_release':
-            sig_qs = sig_qs.filter(form_type__icontains='document')
-        
-        # Get unique signatories who have activities
-        unique_signatories = set()
-        for activity in sig_qs:
-            if activity.signatory:
-                unique_signatories.add(activity.signatory)
-        
-        if not unique_signatories:
+        # Answer "nothing to pack" right away instead of queueing an empty job
+        if not ReportJobQueue.pack_activity(form_type, from_date_obj, to_date_obj).exists():
             logger.info(f"No signatories found for {form_type} pack in date range {from_date} to {to_date}")
             return JsonResponse({'message': 'No items to include'}, status=204)
-        
-        logger.info(f"Found {len(unique_signatories)} signatories for {form_type} pack: {[s.full_name for s in unique_signatories]}")
-        
-        # Create ZIP of PDFs - one PDF per signatory
-        import time
-        import zipfile
-        import io
-        zip_start_time = time.time()
-        
-        # Helper function to generate professional PDF for a signatory
-        def generate_signatory_pdf(signatory):
-            # Query activities for this specific signatory using unified function
-            signatory_activities = get_activity_data_for_report(
-                form_type=form_type,
-                from_date=from_date,
-                to_date=to_date,
-                signatory=signatory
-            )
-            
-            # Prepare context for professional template
-            context = {
-                'report_title': f'{form_type.title()} Activity Report',
-                'report_id': f'{form_type.upper()}-{signatory.id}-{from_date_obj.strftime("%Y%m%d")}',
-                'generated_by': request.user.full_name or request.user.username,
-                'generated_at': timezone.now(),
-                'period_start': from_date_obj,
-                'period_end': to_date_obj,
-                'signatory': signatory,
-                'activities': signatory_activities,
-                'total_count': len(signatory_activities),
-                'filters': {
-                    'form_type': form_type,
-                    'signatory': signatory.full_name
-                }
-            }
-            
-            # Render HTML using professional template
-            try:
-                html_content = render_to_string('pdf/professional-report.html', context)
-            except Exception as template_error:
-                logger.error(f"Template rendering failed for {signatory.full_name}: {template_error}")
-                raise template_error
-            
-            # Convert HTML to PDF using existing function
-            pdf_content = convert_html_to_pdf(html_content)
-            if not pdf_content:
-                raise Exception(f"PDF generation failed for {signatory.full_name}")
-                
-            return pdf_content
-        
-        # Create in-memory ZIP file
-        zip_buffer = io.BytesIO()
-        pdf_count = 0
-        total_pdf_size = 0
-        engine_used = "convert_html_to_pdf"
-        
-        try:
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                for signatory in unique_signatories:
-                    try:
-                        # Generate professional PDF for this signatory
-                        pdf_content = generate_signatory_pdf(signatory)
-                        
-                        # Create filename: {signatory_code_or_slug}_{YYYY-MM-DD}.pdf
-                        signatory_slug = signatory.full_name.replace(' ', '_').replace('.', '').lower()
-                        if hasattr(signatory, 'signatory_profile') and signatory.signatory_profile:
-                            signatory_type = getattr(signatory.signatory_profile, 'signatory_type', '')
-                            if signatory_type:
-                                signatory_slug = signatory_type.replace(' ', '_').replace('.', '').lower()
-                        
-                        pdf_filename = f"{signatory_slug}_{from_date_obj.strftime('%Y-%m-%d')}.pdf"
-                        
-                        # Add PDF to ZIP
-                        zip_file.writestr(pdf_filename, pdf_content)
-                        pdf_count += 1
-                        total_pdf_size += len(pdf_content)
-                        
-                        logger.info(f"Added PDF for {signatory.full_name}: {pdf_filename}, {len(get_activity_data_for_report(form_type=form_type, from_date=from_date, to_date=to_date, signatory=signatory))} activities")
-                        
-                    except Exception as pdf_error:
-                        logger.error(f"Failed to generate PDF for {signatory}: {pdf_error}")
-                        # Continue with other signatories
-                        continue
-            
-            if pdf_count == 0:
-                logger.error("No PDFs were successfully generated")
-                return JsonResponse({'error': 'Failed to generate any PDFs'}, status=500)
-            
-            # Get ZIP content
-            zip_content = zip_buffer.getvalue()
-            
-            # Create filename: {form_type}_signatory_pack_{YYYY-MM-DD}.zip
-            filename = f"{form_type}_signatory_pack_{from_date_obj.strftime('%Y-%m-%d')}.zip"
-            
-            # Save to database record before sending response
-            from django.core.files.base import ContentFile
-            import hashlib
-            
-            # Calculate checksum
-            checksum = hashlib.sha256(zip_content).hexdigest()
-            
-            # Create GeneratedReport record for the pack
-            generated_report = GeneratedReport.objects.create(
-                report_type=f'{form_type}_pack',
-                generated_by=request.user,
-                period_start=from_date_obj,
-                period_end=to_date_obj,
-                file=ContentFile(zip_content, name=filename),
-                size_bytes=len(zip_content),
-                checksum=checksum,
-                status='completed',
-                notes=f'ZIP pack with {pdf_count} PDFs, generated using {engine_used}'
-            )
-            
-            # Create response with proper headers
-            response = HttpResponse(zip_content, content_type='application/zip')
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            response['Content-Length'] = len(zip_content)
-            
-            render_duration = time.time() - zip_start_time
-            logger.info(f"ZIP pack generated successfully with {engine_used}: {filename}, {pdf_count} PDFs, total PDF size: {total_pdf_size} bytes, ZIP size: {len(zip_content)} bytes, duration: {render_duration:.2f}s, record ID: {generated_report.id}")
-            return response
-            
-        except Exception as zip_error:
-            logger.error(f"ZIP creation failed: {zip_error}", exc_info=True)
-            return JsonResponse({'error': 'ZIP pack generation failed'}, status=500)
+
+        # One PDF per signatory is rendered by the report job worker; the client polls the job
+        parameters = {'form_type': form_type, 'from_date': from_date, 'to_date': to_date}
+        job = ReportJobQueue.enqueue(
+            f'{form_type}_pack', request.user, parameters, period_start=from_date_obj, period_end=to_date_obj
+        )
+        if job.parameters != parameters:
+            return JsonResponse({
+                'error': 'A pack for this period is still being generated. Try again when it finishes.',
+                'job_id': str(job.id)
+            }, status=409)
+
+        logger.info(f"{form_type} signatory pack queued: job {job.id}")
+        return report_job_accepted_response(job, 'registrar_download_report')
     
     except Exception as e:
         logger.error(f"Unexpected error in registrar_generate_signatory_pack: {e}", exc_info=True)
@@ -9757,6 +8811,7 @@ def signatory_reports(request):
 # ========================================
 
 @login_required
+@conditional_get(DASHBOARD_STATS, CLEARANCE_DATA)
 def signatory_dashboard_data_api(request):
     """API endpoint to get new clearance forms data for signatory dashboard"""
     if request.user.user_type != 'signatory':
@@ -9784,8 +8839,6 @@ def signatory_dashboard_data_api(request):
             'clearance'
         )
         
-        print(f"Found {new_clearances.count()} pending clearances for user {request.user.username}")
-        
         # Apply filters
         if purpose_filter:
             new_clearances = new_clearances.filter(clearance__clearance_type=purpose_filter.lower())
@@ -9801,9 +8854,7 @@ def signatory_dashboard_data_api(request):
         
         if search_query:
             new_clearances = new_clearances.filter(
-                Q(clearance__student__full_name__icontains=search_query) |
-                Q(clearance__student__profile__student_number__icontains=search_query) |
-                Q(clearance__student__profile__program__icontains=search_query)
+                clearance__student_id__in=search_students(search_query, ['name', 'student_number', 'program'])
             )
         
         # Prepare data for response
@@ -9830,13 +8881,17 @@ def signatory_dashboard_data_api(request):
                 print(f"Error processing clearance {clearance_signatory.id}: {e}")
                 continue
         
-        # Get count of new clearances
-        new_clearances_count = new_clearances.count()
+        # The rows are already loaded, so count them instead of issuing another COUNT query
+        new_clearances_count = len(clearance_data)
+        
+        signatory_profile = getattr(request.user, 'signatory_profile', None)
+        statistics = DashboardStatsService.get_signatory_stats(signatory_profile.signatory_type) if signatory_profile else {}
         
         return JsonResponse({
             'success': True,
             'data': clearance_data,
             'count': new_clearances_count,
+            'statistics': statistics,
             'message': f'There are {new_clearances_count} new clearance form{"s" if new_clearances_count != 1 else ""} waiting for approval'
         })
         
@@ -10010,6 +9065,8 @@ def signatory_mark_clearance_seen(request):
                     signatory=request.user,
                     seen_by_signatory=False
                 ).update(seen_by_signatory=True)
+                # .update() skips the signals that invalidate the clearance ETags
+                transaction.on_commit(CLEARANCE_DATA.invalidate)
                 
                 return JsonResponse({
                     'success': True,
@@ -10165,7 +9222,7 @@ def signatory_filter_options_api(request):
     if request.user.user_type != 'signatory':
         return JsonResponse({'error': 'Unauthorized'}, status=403)
     
-    try:
+    def build_options():
         # Get all clearance forms assigned to this signatory
         clearance_signatories = ClearanceSignatory.objects.filter(
             signatory=request.user,
@@ -10197,11 +9254,19 @@ def signatory_filter_options_api(request):
             clearance__section=''
         ).order_by('clearance__section')
         
-        return JsonResponse({
-            'success': True,
+        return {
             'courses': list(courses),
             'years': list(years),
             'sections': list(sections)
+        }
+    
+    try:
+        # Options change only when clearance data does, so cache them per signatory
+        options = FILTER_OPTIONS.get_or_set(['signatory', request.user.id], build_options)
+        
+        return JsonResponse({
+            'success': True,
+            **options
         })
         
     except Exception as e:
@@ -10215,8 +9280,9 @@ def signatory_filter_options_api(request):
 # ========================================
 
 @login_required
+@conditional_get(CLEARANCE_DATA)
 def signatory_clearance_data_api(request):
-    """API endpoint to get clearance data for signatory"""
+    """API endpoint to get clearance data for signatory (one keyset-paginated page)"""
     if request.user.user_type != 'signatory':
         return JsonResponse({'error': 'Unauthorized'}, status=403)
     
@@ -10235,224 +9301,39 @@ def signatory_clearance_data_api(request):
         
         signatory_type = signatory_profile.signatory_type
         
-        # Get all clearance forms - every signatory should see all clearances
-        # but they can only approve/disapprove in their own column
-        clearances = ClearanceForm.objects.all().select_related('student', 'student__profile')
-        
-        # Apply filters
-        course_filter = request.GET.get('course')
-        year_filter = request.GET.get('year')
-        section_filter = request.GET.get('section')
-        status_filter = request.GET.get('status')
-        search_query = request.GET.get('search')
-        
-        if course_filter and course_filter != 'Filter by Course':
-            clearances = clearances.filter(
-                student__profile__program__icontains=course_filter
-            )
-        
-        if year_filter and year_filter != 'Filter by Year':
-            clearances = clearances.filter(
-                student__profile__year_level=int(year_filter)
-            )
-        
-        if section_filter and section_filter != 'Filter by Section':
-            clearances = clearances.filter(
-                section__icontains=section_filter
-            )
+        # Every signatory sees all clearances but can only act in their own column
+        clearances = ClearanceGridService.apply_filters(ClearanceGridService.base_queryset(), request.GET)
+        page = ClearanceGridService.paginate(clearances, request.GET)
         
-        if search_query:
-            clearances = clearances.filter(
-                Q(student__full_name__icontains=search_query) |
-                Q(student__profile__student_number__icontains=search_query)
-            )
-        
-        # Apply status filter
-        if status_filter and status_filter != 'Filter by Status':
-            if status_filter == 'completed':
-                # Filter for clearances where all 10 signatory types have approved
-                completed_clearance_ids = []
-                required_signatory_types = {
-                    'dorm_supervisor', 'canteen_concessionaire', 'library_director',
-                    'scholarship_director', 'it_director', 'student_affairs',
-                    'cashier', 'business_manager', 'registrar', 'academic_dean'
-                }
-                
-                for clearance in ClearanceForm.objects.all():
-                    all_signatories = ClearanceSignatory.objects.filter(clearance=clearance)
-                    approved_signatory_types = set()
-                    
-                    for sig in all_signatories:
-                        if sig.status == 'approved':
-                            sig_profile = getattr(sig.signatory, 'signatory_profile', None)
-                            if sig_profile:
-                                approved_signatory_types.add(sig_profile.signatory_type)
-                    
-                    if required_signatory_types.issubset(approved_signatory_types):
-                        completed_clearance_ids.append(clearance.id)
-                clearances = clearances.filter(id__in=completed_clearance_ids)
-            elif status_filter == 'pending':
-                # Filter for clearances where not all signatories have approved
-                pending_clearance_ids = []
-                for clearance in ClearanceForm.objects.all():
-                    all_signatories = ClearanceSignatory.objects.filter(clearance=clearance)
-                    if not all_signatories.exists() or all_signatories.filter(status='approved').count() < all_signatories.count():
-                        pending_clearance_ids.append(clearance.id)
-                clearances = clearances.filter(id__in=pending_clearance_ids)
-        
-        # Order by submission date (most recent first)
-        clearances = clearances.order_by('-submitted_at')
+        # The current signatory's own records for this page, in one query
+        own_statuses = dict(
+            ClearanceSignatory.objects.filter(
+                clearance_id__in=[clearance.id for clearance in page['rows']],
+                signatory=request.user
+            ).values_list('clearance_id', 'status')
+        )
         
+        manila_tz = pytz.timezone('Asia/Manila')
         data = []
-        for clearance in clearances:
+        for clearance in page['rows']:
             student = clearance.student
             profile = getattr(student, 'profile', None)
+            status_matrix = getattr(clearance, 'status_matrix', None)
+            recorded = status_matrix.get_signatory_statuses() if status_matrix else {}
             
-            # Get all signatories for this clearance (lazy loading)
-            all_signatories = ClearanceSignatory.objects.filter(clearance=clearance)
+            # All 10 signatory columns, pending where no record exists yet
             signatory_data = {}
+            for signatory_type_key in ClearanceStatusMatrix.SIGNATORY_TYPES:
+                record = recorded.get(signatory_type_key)
+                signatory_data[signatory_type_key] = {
+                    'status': record['status'] if record else 'pending',
+                    'timestamp': record['timestamp'].astimezone(manila_tz).strftime('%Y-%m-%d %I:%M %p') if record and record['timestamp'] else None,
+                    'remarks': record['comment'] if record else None
+                }
             
-            # Define all possible signatory types
-            all_signatory_types = {
-                'dorm_supervisor': 'Dorm Supervisor',
-                'canteen_concessionaire': 'Canteen Concessionaire',
-                'library_director': 'Library Director',
-                'scholarship_director': 'Scholarship Director',
-                'it_director': 'IT Director',
-                'student_affairs': 'Student Affairs',
-                'cashier': 'Cashier',
-                'business_manager': 'Business Manager',
-                'registrar': 'Registrar',
-                'academic_dean': 'Academic Dean'
-            }
-            
-            # Process existing signatory records
-            # Group signatories by type to handle duplicates
-            signatory_groups = {}
-            for signatory in all_signatories:
-                signatory_profile = getattr(signatory.signatory, 'signatory_profile', None)
-                if signatory_profile:
-                    role_key = signatory_profile.signatory_type
-                    if role_key not in signatory_groups:
-                        signatory_groups[role_key] = []
-                    signatory_groups[role_key].append(signatory)
-            
-            # Process each group to select the best signatory
-            for role_key, signatory_list in signatory_groups.items():
-                if len(signatory_list) == 1:
-                    # Only one signatory of this type
-                    signatory = signatory_list[0]
-                    signatory_data[role_key] = {
-                        'status': signatory.status,
-                        'timestamp': signatory.updated_at.strftime('%Y-%m-%d %H:%M') if signatory.updated_at else None,
-                        'remarks': signatory.remarks,
-                        'ip_address': signatory.ip_address
-                    }
-                else:
-                    # Multiple signatories of the same type - choose the best one
-                    # Priority: approved > disapproved > pending
-                    # Also prefer the current user if they're a signatory
-                    best_signatory = None
-                    current_user = request.user
-                    
-                    # First, try to find the current user's signatory
-                    for signatory in signatory_list:
-                        if signatory.signatory == current_user:
-                            best_signatory = signatory
-                            break
-                    
-                    # If not found, choose by status priority
-                    if not best_signatory:
-                        for signatory in signatory_list:
-                            if signatory.status == 'approved':
-                                best_signatory = signatory
-                                break
-                            elif signatory.status == 'disapproved' and (not best_signatory or best_signatory.status == 'pending'):
-                                best_signatory = signatory
-                    
-                    # If still not found, use the first one
-                    if not best_signatory:
-                        best_signatory = signatory_list[0]
-                    
-                    signatory_data[role_key] = {
-                        'status': best_signatory.status,
-                        'timestamp': best_signatory.updated_at.strftime('%Y-%m-%d %H:%M') if best_signatory.updated_at else None,
-                        'remarks': best_signatory.remarks,
-                        'ip_address': best_signatory.ip_address
-                    }
-            
-            # Create missing signatory records on-demand (lazy loading)
-            for signatory_type_key, role_name in all_signatory_types.items():
-                if signatory_type_key not in signatory_data:
-                    # Find a signatory of this type
-                    signatory_user = User.objects.filter(
-                        user_type='signatory',
-                        signatory_profile__signatory_type=signatory_type_key
-                    ).first()
-                    
-                    if signatory_user:
-                        # Create the missing record
-                        clearance_signatory, created = ClearanceSignatory.objects.get_or_create(
-                            clearance=clearance,
-                            signatory=signatory_user,
-                            defaults={
-                                'status': 'pending',
-                                'role': role_name,
-                                'seen_by_signatory': False
-                            }
-                        )
-                        
-                        if created:
-                            # Add to signatory_data for this response
-                            signatory_data[signatory_type_key] = {
-                                'status': 'pending',
-                                'timestamp': None,
-                                'remarks': None,
-                                'ip_address': None
-                            }
-                        else:
-                            # Record already exists, get its data
-                            signatory_data[signatory_type_key] = {
-                                'status': clearance_signatory.status,
-                                'timestamp': clearance_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if clearance_signatory.updated_at else None,
-                                'remarks': clearance_signatory.remarks,
-                                'ip_address': clearance_signatory.ip_address
-                            }
-                    else:
-                        # No signatory of this type exists, show as pending
-                        signatory_data[signatory_type_key] = {
-                            'status': 'pending',
-                            'timestamp': None,
-                            'remarks': None,
-                            'ip_address': None
-                        }
-            
-            # Check if current signatory can approve this clearance
-            current_signatory_record = all_signatories.filter(signatory=request.user).first()
-            can_approve = current_signatory_record and current_signatory_record.status == 'pending'
-            
-            # Get current signatory's status for this clearance
-            current_signatory_status = 'pending'
-            if current_signatory_record:
-                current_signatory_status = current_signatory_record.status
-            
-            # Determine overall clearance status
-            # Check if all 10 signatory types have approved
-            required_signatory_types = set(all_signatory_types.keys())  # All 10 types
-            approved_signatory_types = set()
-            
-            for sig in all_signatories:
-                if sig.status == 'approved':
-                    sig_profile = getattr(sig.signatory, 'signatory_profile', None)
-                    if sig_profile:
-                        approved_signatory_types.add(sig_profile.signatory_type)
-            
-            if required_signatory_types.issubset(approved_signatory_types):
-                overall_status = 'completed'
-            else:
-                overall_status = 'pending'
+            current_signatory_status = own_statuses.get(clearance.id, 'pending')
             
-            clearance_data = {
+            data.append({
                 'id': str(clearance.id),
                 'student_id': str(student.id),
                 'student_name': student.full_name,
@@ -10460,37 +9341,19 @@ def signatory_clearance_data_api(request):
                 'course': profile.program if profile else 'N/A',
                 'year': profile.year_level if profile else 'N/A',
                 'section': clearance.section or 'N/A',
-                'date_submitted': clearance.submitted_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p'),
+                'date_submitted': clearance.submitted_at.astimezone(manila_tz).strftime('%Y-%m-%d %I:%M %p'),
                 'clearance_type': clearance.clearance_type,
-                'status': overall_status,
+                'status': status_matrix.overall_status if status_matrix else 'pending',
                 'signatory_type': signatory_type,
                 'signatories': signatory_data,
-                'can_approve': can_approve,
+                'can_approve': clearance.id in own_statuses and current_signatory_status == 'pending',
                 'current_signatory_status': current_signatory_status
-            }
-            data.append(clearance_data)
-        
-        # Add pagination for large datasets
-        page = int(request.GET.get('page', 1))
-        page_size = int(request.GET.get('page_size', 50))
-        
-        # Simple pagination
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_data = data[start:end]
+            })
         
-        return JsonResponse({
-            'data': paginated_data,
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total': len(data),
-                'total_pages': (len(data) + page_size - 1) // page_size,
-                'has_next': end < len(data),
-                'has_previous': page > 1
-            }
-        })
+        return JsonResponse({'data': data, 'pagination': page['pagination']})
         
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
     except Exception as e:
         print(f"Error in signatory_clearance_data_api: {e}")
         return JsonResponse({'error': str(e)}, status=500)
@@ -10542,7 +9405,8 @@ def signatory_approve_clearance(request):
         clearance_signatory.save()
         
         # Log activity in both SignatoryActivityLog and AuditLog
-        SignatoryActivityLog.objects.create(
+        record_activity(
+            SignatoryActivityLog,
             signatory=request.user,
             action_type='approve',
             form_type='clearance',
@@ -10553,7 +9417,8 @@ def signatory_approve_clearance(request):
         )
         
         # Also log in AuditLog for admin/registrar reporting (IP in description)
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='clearance_approval',
             description=f'Approved clearance form {clearance_id} for {clearance_signatory.clearance.student.full_name} [IP: {get_client_ip(request)}]'
@@ -10665,7 +9530,8 @@ def signatory_disapprove_clearance(request):
         clearance_signatory.save()
         
         # Log activity in both SignatoryActivityLog and AuditLog
-        SignatoryActivityLog.objects.create(
+        record_activity(
+            SignatoryActivityLog,
             signatory=request.user,
             action_type='disapprove',
             form_type='clearance',
@@ -10676,7 +9542,8 @@ def signatory_disapprove_clearance(request):
         )
         
         # Also log in AuditLog for admin/registrar reporting (IP in description)
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='clearance_disapproval',
             description=f'Disapproved clearance form {clearance_id} for {clearance_signatory.clearance.student.full_name}. Reasons: {", ".join(reasons)} [IP: {get_client_ip(request)}]'
@@ -10768,87 +9635,29 @@ def signatory_bulk_approve_clearance(request):
             if not clearance_forms.exists():
                 return JsonResponse({'error': 'No clearance forms found'}, status=404)
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
-            
-            for clearance in clearance_forms:
-                try:
-                    # Get or create the clearance signatory record
-                    clearance_signatory, created = ClearanceSignatory.objects.get_or_create(
-                        clearance=clearance,
-                        signatory=request.user,
-                        defaults={
-                            'status': 'approved',
-                            'role': signatory_profile.get_signatory_type_display(),
-                            'remarks': comment,
-                            'ip_address': get_client_ip(request),
-                            'seen_by_signatory': True
-                        }
-                    )
-                    
-                    # Only count if this is a new approval or update from pending
-                    was_updated = False
-                    if created:
-                        was_updated = True
-                    elif not created and clearance_signatory.status == 'pending':
-                        clearance_signatory.status = 'approved'
-                        clearance_signatory.remarks = comment
-                        clearance_signatory.ip_address = get_client_ip(request)
-                        clearance_signatory.save()
-                        was_updated = True
-                    
-                    # Only increment count and add name if actually updated
-                    if was_updated:
-                        approved_count += 1
-                        student_names.append(clearance.student.get_full_name())
-
-                        # Log activity only for actually updated records
-                        SignatoryActivityLog.objects.create(
-                            signatory=request.user,
-                            action_type='approve',
-                            form_type='clearance',
-                            form_id=clearance.id,
-                            student_name=clearance.student.full_name,
-                            ip_address=get_client_ip(request),
-                            user_agent=request.META.get('HTTP_USER_AGENT', '')
-                        )
-
-                        # Send individual approval notification to student
-                        try:
-                            from landing.notification_service import NotificationService
-                            NotificationService.notify_form_approval(
-                                form_instance=clearance,
-                                form_type='clearance',
-                                signatory_user=request.user,
-                                remarks=comment or ''
-                            )
-                        except Exception as e:
-                            print(f"Error sending approval notification for clearance {clearance.id}: {e}")
-
-                        # Check if all signatories approved for this clearance
-                        all_signatories = ClearanceSignatory.objects.filter(clearance=clearance)
-                        all_approved = all_signatories.exists() and all(s.status == 'approved' for s in all_signatories)
-                        if all_approved:
-                            clearance.status = 'approved'
-                            clearance.save()
-
-                            # Send completion notification to student
-                            try:
-                                NotificationService.notify_clearance_completed(
-                                    student=clearance.student,
-                                    form_type='clearance',
-                                    form_instance=clearance
-                                )
-                            except Exception as e:
-                                print(f"Error sending completion notification: {e}")
-                    
-                except Exception as e:
-                    print(f"Error approving clearance {clearance.id}: {e}")
-                    continue
+            # Approve all selected forms set-wise; only new or still-pending records change
+            decision = BulkDecisionService.approve(
+                'clearance',
+                clearance_ids,
+                signatory_user=request.user,
+                role=signatory_profile.get_signatory_type_display(),
+                remarks=comment,
+                ip_address=get_client_ip(request),
+                skip_statuses=('approved', 'disapproved')
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.student.full_name for form in decision['approved']]
+            
+            # Log activity for the records that actually changed
+            BulkDecisionService.log_activity(
+                SignatoryActivityLog, 'signatory', request.user, 'clearance', decision['approved'],
+                ip_address=get_client_ip(request),
+                user_agent=request.META.get('HTTP_USER_AGENT', '')
+            )
             
             # Log bulk action in AuditLog
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='bulk_clearance_approval',
                 description=f'Bulk approved {approved_count} clearance forms for students: {", ".join(student_names[:5])}{"..." if len(student_names) > 5 else ""} [IP: {get_client_ip(request)}]'
@@ -10857,7 +9666,8 @@ def signatory_bulk_approve_clearance(request):
             return JsonResponse({
                 'success': True, 
                 'message': f'Successfully approved {approved_count} clearance forms',
-                'approved_count': approved_count
+                'approved_count': approved_count,
+                'results': decision['results']
             })
             
         except json.JSONDecodeError:
@@ -10946,7 +9756,8 @@ def signatory_bulk_disapprove_clearance(request):
                         student_names.append(clearance.student.get_full_name())
                         
                         # Log activity only for actually updated records
-                        SignatoryActivityLog.objects.create(
+                        record_activity(
+                            SignatoryActivityLog,
                             signatory=request.user,
                             action_type='disapprove',
                             form_type='clearance',
@@ -10966,7 +9777,8 @@ def signatory_bulk_disapprove_clearance(request):
                     continue
             
             # Log bulk action in AuditLog
-            AuditLog.objects.create(
+            record_activity(
+                AuditLog,
                 user=request.user,
                 action_type='bulk_clearance_disapproval',
                 description=f'Bulk disapproved {disapproved_count} clearance forms for students: {", ".join(student_names[:5])}{"..." if len(student_names) > 5 else ""} [IP: {get_client_ip(request)}]'
@@ -11286,7 +10098,7 @@ def signatory_generate_auto_report(request):
 
 @login_required
 def signatory_generate_manual_report(request):
-    """Manually generate report using UI filters"""
+    """Queue a PDF report of the signatory's activity using UI filters; returns 202 with the job to poll"""
     if request.user.user_type != 'signatory':
         return JsonResponse({'error': 'Access denied'}, status=403)
 
@@ -11300,58 +10112,29 @@ def signatory_generate_manual_report(request):
         ph_tz = pytz.timezone('Asia/Manila')
         now = datetime.now(ph_tz)
         if from_date and to_date:
-            start_date = datetime.strptime(from_date, '%Y-%m-%d').date()
-            end_date = datetime.strptime(to_date, '%Y-%m-%d').date()
+            try:
+                start_date = datetime.strptime(from_date, '%Y-%m-%d').date()
+                end_date = datetime.strptime(to_date, '%Y-%m-%d').date()
+            except ValueError:
+                return JsonResponse({'error': 'Invalid date format. Use YYYY-MM-DD'}, status=400)
         else:
             days_since_monday = now.weekday()
             start_date = now.date() - timedelta(days=days_since_monday)
             end_date = start_date + timedelta(days=6)
 
-        activity_logs = SignatoryActivityLog.objects.filter(
-            signatory=request.user,
-            created_at__date__range=[start_date, end_date]
-        )
-
-        if report_type == 'approved_forms':
-            activity_logs = activity_logs.filter(action_type='approve')
-        elif report_type == 'disapproved_forms':
-            activity_logs = activity_logs.filter(action_type='disapprove')
-        elif report_type == 'pending_forms':
-            activity_logs = activity_logs.filter(action_type='view')
-
-        context = {
-            'signatory': request.user,
-            'report_type': report_type,
-            'period_type': period_type,
-            'start_date': start_date,
-            'end_date': end_date,
-            'activity_logs': activity_logs,
-            'total_count': activity_logs.count(),
-        }
-
-        html_content = render_to_string('pdf/auto-generated-report.html', context)
-        filename = f"{report_type}_manual_{start_date}.html"
-        file_path = os.path.join('reports', filename)
-        full_path = os.path.join(settings.MEDIA_ROOT, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        auto_report = AutoGeneratedReport.objects.create(
-            report_type=report_type,
-            period_type=period_type,
-            start_date=start_date,
-            end_date=end_date,
-            file_path=file_path,
-            created_by=request.user
+        job = ReportJobQueue.enqueue(
+            'signatory_activity',
+            request.user,
+            {
+                'report_type': report_type,
+                'period_type': period_type,
+                'action_type': ACTION_TYPE_BY_REPORT.get(report_type, ''),
+            },
+            period_start=start_date,
+            period_end=end_date
         )
 
-        return JsonResponse({
-            'success': True,
-            'message': 'Report generated successfully',
-            'report_id': str(auto_report.id),
-            'file_path': file_path
-        })
+        return report_job_accepted_response(job, 'signatory_download_report', message='Report queued for generation')
 
     except Exception as e:
         print(f"Error generating manual report: {e}")
@@ -11380,6 +10163,8 @@ def signatory_download_report(request, report_id):
                 id=report_id,
                 generated_by=request.user
             )
+            if report.status != 'completed':
+                return JsonResponse({'error': 'Report is not ready yet', 'status': report.status}, status=409)
             file_path = report.file.name if hasattr(report, 'file') and report.file else None
             is_auto_report = False
         
@@ -11425,9 +10210,7 @@ def signatory_reports_csv_export(request):
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        import csv
-        from django.http import HttpResponse
-        from datetime import datetime, timezone as dt_timezone, timedelta
+        from datetime import datetime, timedelta
         
         # Get same parameters as the main API
         from_date = request.GET.get('from_date', '')
@@ -11436,32 +10219,42 @@ def signatory_reports_csv_export(request):
         period_type = request.GET.get('period_type', '')
         search = request.GET.get('search', '').strip()
         
-        # Get activity logs with same filtering as main API
-        activity_logs = UserActivityLog.objects.filter(user_type='signatory')
+        # This signatory's own activity logs, as in signatory_reports_data_api
+        activity_logs = SignatoryActivityLog.objects.filter(signatory=request.user)
         
         # Apply date filter
         if from_date:
             try:
                 from_date_parsed = datetime.strptime(from_date, '%Y-%m-%d').date()
-                activity_logs = activity_logs.filter(timestamp__date__gte=from_date_parsed)
+                activity_logs = activity_logs.filter(created_at__date__gte=from_date_parsed)
             except ValueError:
                 pass
                 
         if to_date:
             try:
                 to_date_parsed = datetime.strptime(to_date, '%Y-%m-%d').date()
-                activity_logs = activity_logs.filter(timestamp__date__lte=to_date_parsed)
+                activity_logs = activity_logs.filter(created_at__date__lte=to_date_parsed)
             except ValueError:
                 pass
         
-        # Apply form status filter
-        if form_status and form_status != 'all_forms':
-            if form_status == 'approved_forms':
-                activity_logs = activity_logs.filter(action_type='approve')
-            elif form_status == 'disapproved_forms':
-                activity_logs = activity_logs.filter(action_type='disapprove')
-            elif form_status == 'pending_forms':
-                activity_logs = activity_logs.filter(action_type='view')
+        # Apply period filter
+        if period_type:
+            today = timezone.now().date()
+            if period_type == 'day':
+                activity_logs = activity_logs.filter(created_at__date=today)
+            elif period_type == 'week':
+                activity_logs = activity_logs.filter(created_at__date__gte=today - timedelta(days=7))
+            elif period_type == 'month':
+                activity_logs = activity_logs.filter(created_at__date__gte=today - timedelta(days=30))
+        
+        # Apply form status filter (accepts both the export and the data API values)
+        form_status = {
+            'approved_forms': 'approve',
+            'disapproved_forms': 'disapprove',
+            'pending_forms': 'view',
+        }.get(form_status, form_status)
+        if form_status in ['approve', 'disapprove', 'view']:
+            activity_logs = activity_logs.filter(action_type=form_status)
         
         # Apply search filter
         if search:
@@ -11469,28 +10262,29 @@ def signatory_reports_csv_export(request):
                 Q(student_name__icontains=search) |
                 Q(form_type__icontains=search) |
                 Q(action_type__icontains=search) |
-                Q(signatory__icontains=search)
+                Q(signatory__full_name__icontains=search)
             )
         
-        # Create CSV response
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="signatory_reports.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Student Name', 'Form Type', 'Action Type', 'Signatory', 'Date', 'Time', 'IP Address'])
-        
-        for log in activity_logs.order_by('-timestamp'):
-            writer.writerow([
-                log.student_name or '',
-                log.form_type or '',
-                log.action_type or '',
-                log.signatory or '',
-                log.timestamp.strftime('%Y-%m-%d') if log.timestamp else '',
-                log.timestamp.strftime('%H:%M:%S') if log.timestamp else '',
-                log.ip_address or ''
-            ])
+        def csv_rows():
+            for created_at, _, student_name, form_type, action_type, signatory_name, ip_address in flatten(iter_newest_first(
+                activity_logs, 'created_at',
+                ['student_name', 'form_type', 'action_type', 'signatory__full_name', 'ip_address']
+            )):
+                yield [
+                    student_name or '',
+                    form_type or '',
+                    action_type or '',
+                    signatory_name or '',
+                    created_at.strftime('%Y-%m-%d'),
+                    created_at.strftime('%H:%M:%S'),
+                    ip_address or ''
+                ]
         
-        return response
+        return streaming_csv_response(
+            'signatory_reports.csv',
+            ['Student Name', 'Form Type', 'Action Type', 'Signatory', 'Date', 'Time', 'IP Address'],
+            csv_rows()
+        )
         
     except Exception as e:
         logger.error(f"Error exporting signatory reports to CSV: {e}", exc_info=True)
@@ -11521,6 +10315,8 @@ def registrar_download_report(request, report_id):
                 is_auto_report = False
             except GeneratedReport.DoesNotExist:
                 return JsonResponse({'error': 'Report not found'}, status=404)
+            if report.status != 'completed':
+                return JsonResponse({'error': 'Report is not ready yet', 'status': report.status}, status=409)
         
         if not file_path:
             return JsonResponse({'error': 'Report file path not found'}, status=404)
@@ -11543,9 +10339,15 @@ def registrar_download_report(request, report_id):
             with open(full_file_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
         else:
-            # GeneratedReport files are already PDFs, serve them directly
+            # GeneratedReport files are already PDFs (or ZIPs for signatory packs), serve them directly
             with open(full_file_path, 'rb') as f:
-                pdf_content = f.read()
+                file_content = f.read()
+            
+            from django.http import HttpResponse
+            if full_file_path.endswith('.zip'):
+                response = HttpResponse(file_content, content_type='application/zip')
+                response['Content-Disposition'] = f'attachment; filename="{report.filename}"'
+                return response
             
             # Create PDF filename for direct PDF files
             report_type = getattr(report, 'report_type', 'report')
@@ -11553,8 +10355,7 @@ def registrar_download_report(request, report_id):
             pdf_filename = f"{report_type}_{report.id}_{date_str}.pdf"
             
             # Return PDF response directly
-            from django.http import HttpResponse
-            response = HttpResponse(pdf_content, content_type='application/pdf')
+            response = HttpResponse(file_content, content_type='application/pdf')
             response['Content-Disposition'] = f'inline; filename="{pdf_filename}"'
             return response
         
@@ -12103,56 +10904,30 @@ def business_manager_bulk_approve_graduation(request):
             if not graduation_forms.exists():
                 return JsonResponse({'error': 'No graduation forms found'}, status=404)
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
-            
-            for graduation in graduation_forms:
-                try:
-                    # Create or update business manager signatory (same as individual approval)
-                    business_signatory, created = GraduationSignatory.objects.get_or_create(
-                        graduation=graduation,
-                        signatory=request.user,
-                        role='business_manager',
-                        defaults={'status': 'pending'}
-                    )
-                    
-                    if business_signatory.status == 'approved':
-                        continue  # Skip if already approved
-                    
-                    # Update status
-                    business_signatory.status = 'approved'
-                    business_signatory.remarks = comment
-                    business_signatory.ip_address = get_client_ip(request)
-                    business_signatory.save()
-                    
-                    approved_count += 1
-                    student_names.append(graduation.user.get_full_name())
-                    
-                    # Create individual notification for the student
-                    Notification.objects.create(
-                        recipient=graduation.user,
-                        message=f"Your graduation form has been approved by Business Manager with remarks: {comment}" if comment else "Your graduation form has been approved by Business Manager",
-                        notification_type='graduation_approved',
-                        priority='normal'
-                    )
-                    
-                    # Log activity
-                    ActivityLog.objects.create(
-                        user=request.user,
-                        action=f'Approved graduation form for {graduation.user.get_full_name()}',
-                        model_affected='GraduationForm',
-                        record_id=str(graduation.id),
-                        ip_address=get_client_ip(request)
-                    )
-                    
-                except Exception as e:
-                    print(f"Error approving graduation {graduation.id}: {str(e)}")
-                    continue
+            # Approve all selected forms set-wise in one transaction
+            decision = BulkDecisionService.approve(
+                'graduation',
+                graduation_ids,
+                signatory_user=request.user,
+                role='business_manager',
+                remarks=comment,
+                ip_address=get_client_ip(request)
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.user.full_name for form in decision['approved']]
+            
+            # Log activity
+            BulkDecisionService.log_activity(
+                BusinessManagerActivityLog, 'business_manager', request.user, 'graduation', decision['approved'],
+                ip_address=get_client_ip(request),
+                user_agent=request.META.get('HTTP_USER_AGENT', '')
+            )
             
             return JsonResponse({
                 'success': True,
-                'message': f'Successfully approved {approved_count} graduation form(s): {", ".join(student_names)}'
+                'message': f'Successfully approved {approved_count} graduation form(s): {", ".join(student_names)}',
+                'approved_count': approved_count,
+                'results': decision['results']
             })
             
         except json.JSONDecodeError:
@@ -12274,59 +11049,39 @@ def business_manager_graduation_data_api(request):
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        # Get all graduation forms with related data
-        graduation_forms = GraduationForm.objects.select_related('user').all().order_by('-created_at')
-        
         data = []
-        for form in graduation_forms:
-            business_signatory = form.signatories.filter(role='business_manager').first()
-            registrar_signatory = form.signatories.filter(role='registrar').first()
-            dean_signatory = form.signatories.filter(role='dean').first()
-            president_signatory = form.signatories.filter(role='president').first()
-            
-            # Determine overall status based on all required signatories (including president)
-            all_signatories = form.signatories.all()
-            roles_required = {'dean', 'business_manager', 'registrar', 'president'}
-            statuses = {s.role: s.status for s in all_signatories}
-            
+        for row in FormGridService.rows('graduation'):
+            form = row.form
             # Overall status logic: only "pending" or "completed"
-            if roles_required.issubset(statuses.keys()) and all(statuses.get(role, 'pending') == 'approved' for role in roles_required):
+            if row.all_approved():
                 status = 'completed'
                 # Use the latest timestamp among all approvals for completed status
-                timestamps = []
-                for signatory in [dean_signatory, business_signatory, registrar_signatory, president_signatory]:
-                    if signatory and signatory.status == 'approved':
-                        timestamps.append(signatory.updated_at)
-                overall_timestamp = max(timestamps).astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if timestamps else None
+                overall_timestamp = row.approved_at()
             else:
                 status = 'pending'
                 overall_timestamp = None
             
-            # Get section from enrollment forms
-            enrollment_form = EnrollmentForm.objects.filter(user=form.user).first()
-            section = enrollment_form.section if enrollment_form else 'N/A'
-            
             graduation_data = {
                 'id': str(form.id),
                 'student_name': form.user.full_name,
-                'course': form.user.profile.program if hasattr(form.user, 'profile') else 'N/A',
-                'year': form.user.profile.year_level if hasattr(form.user, 'profile') else 'N/A',
-                'section': section,
-                'id_number': form.user.profile.student_number if hasattr(form.user, 'profile') else 'N/A',
+                'course': row.profile_value('program'),
+                'year': row.profile_value('year_level'),
+                'section': row.enrollment_section,
+                'id_number': row.profile_value('student_number'),
                 'grad_appno': form.grad_appno or 'N/A',
                 'date_submitted': form.created_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p'),
                 'pdf_file': 'Graduation_Form.pdf',
-                'dean_status': dean_signatory.status if dean_signatory else 'pending',
-                'dean_timestamp': dean_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if dean_signatory and dean_signatory.status != 'pending' else '',
-                'business_status': business_signatory.status if business_signatory else 'pending',
-                'business_timestamp': business_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if business_signatory and business_signatory.status != 'pending' else '',
-                'business_remarks': business_signatory.remarks if business_signatory else '',
-                'registrar_status': registrar_signatory.status if registrar_signatory else 'pending',
-                'registrar_timestamp': registrar_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if registrar_signatory and registrar_signatory.status != 'pending' else '',
-                'registrar_remarks': registrar_signatory.remarks if registrar_signatory else '',
-                'president_status': president_signatory.status if president_signatory else 'pending',
-                'president_timestamp': president_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if president_signatory and president_signatory.status != 'pending' else '',
-                'president_remarks': president_signatory.remarks if president_signatory else '',
+                'dean_status': row.status('dean'),
+                'dean_timestamp': row.timestamp('dean'),
+                'business_status': row.status('business_manager'),
+                'business_timestamp': row.timestamp('business_manager'),
+                'business_remarks': row.remarks('business_manager'),
+                'registrar_status': row.status('registrar'),
+                'registrar_timestamp': row.timestamp('registrar'),
+                'registrar_remarks': row.remarks('registrar'),
+                'president_status': row.status('president'),
+                'president_timestamp': row.timestamp('president'),
+                'president_remarks': row.remarks('president'),
                 'overall_status': status,
                 'overall_timestamp': overall_timestamp,
             }
@@ -12414,7 +11169,8 @@ def business_manager_graduation_approve(request):
                 print(f"Error sending graduation completion notifications: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_approval',
             description=f'Business Manager approved graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -12489,7 +11245,8 @@ def business_manager_graduation_disapprove(request):
             print(f"Error sending business manager graduation disapproval notification: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_disapproval',
             description=f'Business Manager disapproved graduation form {graduation_id} for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -12522,7 +11279,8 @@ def business_manager_graduation_delete(request, graduation_id):
         graduation.delete()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_deletion',
             description=f'Business Manager deleted graduation form {graduation_id} for {student_name} [IP: {get_client_ip(request)}]'
@@ -12563,7 +11321,8 @@ def business_manager_graduation_bulk_delete(request):
         graduations.delete()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_bulk_deletion',
             description=f'Business Manager bulk deleted {deleted_count} graduation forms for: {", ".join(student_names)} [IP: {get_client_ip(request)}]'
@@ -12618,7 +11377,8 @@ def business_manager_graduation_edit_status(request):
         business_signatory.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='graduation_status_edit',
             description=f'Business Manager changed graduation form {graduation_id} status from disapproved to approved for {graduation.user.full_name} [IP: {get_client_ip(request)}]'
@@ -12954,14 +11714,16 @@ def business_manager_approve_credential(request):
         doc_request.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='credential_approve',
             description=f'Business Manager approved credential request {credential_id} for {doc_request.requester.full_name} [IP: {get_client_ip(request)}]'
         )
         
         # Log activity for reports
-        BusinessManagerActivityLog.objects.create(
+        record_activity(
+            BusinessManagerActivityLog,
             business_manager=request.user,
             action_type='approve',
             form_type='credential',
@@ -13022,14 +11784,16 @@ def business_manager_disapprove_credential(request):
         doc_request.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='credential_disapproval',
             description=f'Business Manager disapproved credential request {credential_id} for {doc_request.requester.full_name} [IP: {get_client_ip(request)}]'
         )
         
         # Log activity for reports
-        BusinessManagerActivityLog.objects.create(
+        record_activity(
+            BusinessManagerActivityLog,
             business_manager=request.user,
             action_type='disapprove',
             form_type='credential',
@@ -13086,14 +11850,16 @@ def business_manager_edit_credential_status(request):
         doc_request.save()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='credential_edit_status',
             description=f'Business Manager changed credential status from disapproved to approved for {doc_request.requester.full_name} [IP: {get_client_ip(request)}]'
         )
         
         # Log activity for reports
-        BusinessManagerActivityLog.objects.create(
+        record_activity(
+            BusinessManagerActivityLog,
             business_manager=request.user,
             action_type='approve',
             form_type='credential',
@@ -13168,7 +11934,8 @@ def business_manager_delete_credential(request, credential_id):
         doc_request.delete()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='credential_delete',
             description=f'Business Manager deleted credential request for {requester_name} [IP: {get_client_ip(request)}]'
@@ -13208,7 +11975,8 @@ def business_manager_bulk_delete_credential(request):
                 deleted_count += 1
                 
                 # Log the action
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='credential_delete',
                     description=f'Business Manager bulk deleted credential request for {requester_name} [IP: {get_client_ip(request)}]'
@@ -13578,7 +12346,7 @@ def business_manager_generate_auto_report(request):
 
 @login_required
 def business_manager_generate_manual_report(request):
-    """Generate manual report for business manager"""
+    """Queue a PDF report of the business manager's activity; returns 202 with the job to poll"""
     if not is_business_manager(request.user):
         return JsonResponse({'error': 'Access denied'}, status=403)
     
@@ -13591,34 +12359,6 @@ def business_manager_generate_manual_report(request):
         from_date = request.POST.get('from_date', '')
         to_date = request.POST.get('to_date', '')
         
-        # Generate the report based on current filtered data
-        activity_logs = BusinessManagerActivityLog.objects.filter(
-            business_manager=request.user
-        )
-        
-        # Apply filters
-        if from_date:
-            from datetime import datetime, timezone as dt_timezone
-            start_date = datetime.strptime(from_date, '%Y-%m-%d').date()
-            activity_logs = activity_logs.filter(created_at__date__gte=start_date)
-        
-        if to_date:
-            from datetime import datetime, timezone as dt_timezone
-            end_date = datetime.strptime(to_date, '%Y-%m-%d').date()
-            activity_logs = activity_logs.filter(created_at__date__lte=end_date)
-        
-        if report_type:
-            if report_type == 'approved_forms':
-                activity_logs = activity_logs.filter(action_type='approve')
-            elif report_type == 'disapproved_forms':
-                activity_logs = activity_logs.filter(action_type='disapprove')
-            elif report_type == 'pending_forms':
-                activity_logs = activity_logs.filter(action_type='view')
-        
-        # Create the report record
-        from datetime import datetime, timezone as dt_timezone
-        from django.utils import timezone
-        
         # Map report types to match model choices
         mapped_report_type = 'approved_forms' if report_type == 'approved_forms' else \
                            'disapproved_forms' if report_type == 'disapproved_forms' else \
@@ -13630,54 +12370,25 @@ def business_manager_generate_manual_report(request):
                            'monthly' if period_type == 'month' else 'weekly'
         
         # Set default dates if not provided
-        default_start = datetime.strptime(from_date, '%Y-%m-%d').date() if from_date else timezone.now().date()
-        default_end = datetime.strptime(to_date, '%Y-%m-%d').date() if to_date else timezone.now().date()
-        
-        # Create context for template rendering (same as signatory)
-        context = {
-            'business_manager': request.user,
-            'report_type': mapped_report_type,
-            'period_type': mapped_period_type,
-            'start_date': default_start,
-            'end_date': default_end,
-            'activity_logs': activity_logs,
-            'total_count': activity_logs.count(),
-        }
-        
-        # Generate HTML report content using same template as signatory
-        from django.template.loader import render_to_string
-        report_html = render_to_string('pdf/auto-generated-report.html', context)
-        
-        # Save to file
-        import os
-        from django.conf import settings
-        
-        timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
-        report_dir = os.path.join(settings.MEDIA_ROOT, 'business_manager_reports', str(request.user.id))
-        os.makedirs(report_dir, exist_ok=True)
-        
-        report_filename = f"{timestamp}.html"
-        report_file_path = os.path.join(report_dir, report_filename)
-        
-        with open(report_file_path, 'w', encoding='utf-8') as f:
-            f.write(report_html)
-        
-        # Create report record with relative path
-        relative_path = f"business_manager_reports/{request.user.id}/{report_filename}"
-        
-        report = AutoGeneratedReport.objects.create(
-            created_by=request.user,
-            report_type=mapped_report_type,
-            period_type=mapped_period_type,
-            start_date=default_start,
-            end_date=default_end,
-            file_path=relative_path
+        try:
+            default_start = datetime.strptime(from_date, '%Y-%m-%d').date() if from_date else timezone.now().date()
+            default_end = datetime.strptime(to_date, '%Y-%m-%d').date() if to_date else timezone.now().date()
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'Invalid date format. Use YYYY-MM-DD'}, status=400)
+        
+        job = ReportJobQueue.enqueue(
+            'business_manager_activity',
+            request.user,
+            {
+                'report_type': mapped_report_type,
+                'period_type': mapped_period_type,
+                'action_type': ACTION_TYPE_BY_REPORT.get(report_type, ''),
+            },
+            period_start=default_start,
+            period_end=default_end
         )
         
-        return JsonResponse({
-            'success': True,
-            'message': f'Report generated successfully with {activity_logs.count()} records'
-        })
+        return report_job_accepted_response(job, 'business_manager_download_report', message='Report queued for generation')
     
     except Exception as e:
         return JsonResponse({
@@ -13706,6 +12417,8 @@ def business_manager_download_report(request, report_id):
                 id=report_id,
                 generated_by=request.user
             )
+            if report.status != 'completed':
+                return HttpResponse("Report is not ready yet", status=409)
             file_path = report.file.name if hasattr(report, 'file') and report.file else None
             is_auto_report = False
         
@@ -13817,8 +12530,6 @@ def business_manager_reports_csv_export(request):
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        import csv
-        from django.http import HttpResponse
         from datetime import datetime, timezone as dt_timezone, timedelta
         
         # Get same parameters as the main API
@@ -13831,7 +12542,7 @@ def business_manager_reports_csv_export(request):
         # Get activity logs with same filtering as main API
         activity_logs = BusinessManagerActivityLog.objects.filter(
             business_manager=request.user
-        ).order_by('-created_at')
+        )
         
         # Apply date filters
         if from_date:
@@ -13877,32 +12588,23 @@ def business_manager_reports_csv_export(request):
                 Q(student_name__icontains=search)
             )
         
-        # Create CSV response
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="business_manager_reports_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        
-        # Write header
-        writer.writerow([
-            'Date',
-            'Time', 
-            'Action',
-            'Student Name',
-            'IP Address'
-        ])
-        
-        # Write data
-        for log in activity_logs:
-            writer.writerow([
-                log.created_at.strftime('%Y-%m-%d'),
-                log.created_at.strftime('%H:%M:%S'),
-                log.action_type or 'N/A',
-                log.student_name or 'N/A',
-                log.ip_address or 'N/A'
-            ])
+        def csv_rows():
+            for created_at, _, action_type, student_name, ip_address in flatten(iter_newest_first(
+                activity_logs, 'created_at', ['action_type', 'student_name', 'ip_address']
+            )):
+                yield [
+                    created_at.strftime('%Y-%m-%d'),
+                    created_at.strftime('%H:%M:%S'),
+                    action_type or 'N/A',
+                    student_name or 'N/A',
+                    ip_address or 'N/A'
+                ]
         
-        return response
+        return streaming_csv_response(
+            f'business_manager_reports_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv',
+            ['Date', 'Time', 'Action', 'Student Name', 'IP Address'],
+            csv_rows()
+        )
         
     except Exception as e:
         print(f"Error in CSV export: {e}")
@@ -14133,6 +12835,7 @@ def business_manager_messages(request):
     return render(request, 'BUSINESSMMESSAGES.html')
 
 @login_required
+@conditional_get(DASHBOARD_STATS, CLEARANCE_DATA)
 def business_manager_dashboard_data_api(request):
     """API endpoint to get new clearance forms data for business manager dashboard"""
     if not is_business_manager(request.user):
@@ -14160,8 +12863,6 @@ def business_manager_dashboard_data_api(request):
             'clearance'
         )
         
-        print(f"Found {new_clearances.count()} pending clearances for business manager")
-        
         # Apply filters
         if purpose_filter:
             new_clearances = new_clearances.filter(clearance__clearance_type=purpose_filter.lower())
@@ -14177,9 +12878,7 @@ def business_manager_dashboard_data_api(request):
         
         if search_query:
             new_clearances = new_clearances.filter(
-                Q(clearance__student__full_name__icontains=search_query) |
-                Q(clearance__student__profile__student_number__icontains=search_query) |
-                Q(clearance__student__profile__program__icontains=search_query)
+                clearance__student_id__in=search_students(search_query, ['name', 'student_number', 'program'])
             )
         
         # Prepare data for response
@@ -14195,165 +12894,82 @@ def business_manager_dashboard_data_api(request):
                 'student_name': student.full_name,
                 'student_number': student_profile.student_number if student_profile else 'N/A',
                 'course': student_profile.program if student_profile else 'N/A',
-                'year': student_profile.year_level if student_profile else 'N/A',
-                'section': clearance_signatory.clearance.section or 'N/A',
-                'purpose': clearance_signatory.clearance.clearance_type.title(),
-                'date_submitted': clearance_signatory.clearance.submitted_at.strftime('%B %d, %Y'),
-                'semester': clearance_signatory.clearance.semester,
-                'academic_year': clearance_signatory.clearance.academic_year or 'N/A',
-            })
-            except Exception as e:
-                print(f"Error processing clearance {clearance_signatory.id}: {e}")
-                continue
-        
-        # Get count of new clearances
-        new_clearances_count = new_clearances.count()
-        
-        return JsonResponse({
-            'success': True,
-            'data': clearance_data,
-            'count': new_clearances_count,
-            'message': f'There are {new_clearances_count} new clearance form{"s" if new_clearances_count != 1 else ""} waiting for approval'
-        })
-        
-    except Exception as e:
-        print(f"Error in business_manager_dashboard_data_api: {e}")
-        return JsonResponse({'error': 'Internal server error'}, status=500)
-
-@login_required
-def business_manager_clearance_data_api(request):
-    """API endpoint to get clearance data for business manager (mirrors registrar functionality)"""
-    if not is_business_manager(request.user):
-        return JsonResponse({'error': 'Unauthorized'}, status=403)
-    
-    try:
-        # Get all clearance forms - business manager should see all clearances (same as registrar)
-        clearances = ClearanceForm.objects.all().select_related(
-            'student__profile'
-        ).prefetch_related('signatories')
-        
-        # Get query parameters for filtering and sorting
-        course_filter = request.GET.get('course', '')
-        year_filter = request.GET.get('year', '')
-        section_filter = request.GET.get('section', '')
-        status_filter = request.GET.get('status', '')
-        search_query = request.GET.get('search', '')
-        sort_by = request.GET.get('sort', 'created_at')
-        sort_order = request.GET.get('order', 'desc')
-        
-        # Apply filters (same as registrar)
-        if course_filter and course_filter not in ['Filter by Course', '']:
-            clearances = clearances.filter(student__profile__program__icontains=course_filter)
-        
-        if year_filter and year_filter not in ['Filter by Year', '']:
-            clearances = clearances.filter(student__profile__year_level=year_filter)
-        
-        if section_filter and section_filter not in ['Filter by Section', '']:
-            clearances = clearances.filter(section__icontains=section_filter)
-        
-        if search_query:
-            clearances = clearances.filter(
-                Q(student__full_name__icontains=search_query) |
-                Q(student__profile__student_number__icontains=search_query) |
-                Q(student__profile__program__icontains=search_query)
-            )
-        
-        # Dynamic sorting
-        valid_sort_fields = {
-            'created_at': 'submitted_at',  # Map created_at to submitted_at since created_at doesn't exist
-            'submitted_at': 'submitted_at',
-            'student_name': 'student__full_name',
-            'student_number': 'student__profile__student_number',
-            'program': 'student__profile__program',
-            'year_level': 'student__profile__year_level',
-            'status': 'status'
-        }
-        
-        # Default to submitted_at if invalid sort field
-        sort_field = valid_sort_fields.get(sort_by, 'submitted_at')
-        
-        # Apply sorting direction
-        if sort_order.lower() == 'asc':
-            clearances = clearances.order_by(sort_field)
-        else:
-            clearances = clearances.order_by(f'-{sort_field}')
-        
-        # Prepare data for response (same format as registrar)
-        clearance_data = []
-        for clearance in clearances:
-            try:
-                student = clearance.student
-                student_profile = getattr(student, 'profile', None)
-                
-                # Get ALL signatory statuses for this clearance (same as registrar)
-                signatory_statuses = {}
-                for signatory_record in clearance.signatories.all():
-                    try:
-                        if hasattr(signatory_record.signatory, 'signatory_profile') and signatory_record.signatory.signatory_profile:
-                            signatory_type = signatory_record.signatory.signatory_profile.signatory_type
-                        else:
-                            # Handle admin/registrar users
-                            if signatory_record.signatory.user_type in ['admin', 'registrar']:
-                                signatory_type = 'registrar'
-                            else:
-                                continue
-                        
-                        status_info = {
-                            'status': signatory_record.status,
-                            'timestamp': signatory_record.updated_at.strftime('%B %d, %Y %I:%M %p') if signatory_record.updated_at else None,
-                            'comment': signatory_record.comment or ''
-                        }
-                        
-                        signatory_statuses[signatory_type] = status_info
-                    except Exception as e:
-                        print(f"Error processing signatory record: {e}")
-                        continue
-                
-                # Calculate overall clearance status based on signatory approvals
-                # Check if all signatories have approved
-                all_approved = True
-                required_signatories = ['dorm_supervisor', 'canteen_concessionaire', 'library_director', 
-                                      'scholarship_director', 'it_director', 'student_affairs', 
-                                      'cashier', 'business_manager', 'registrar', 'academic_dean']
-                
-                for req_type in required_signatories:
-                    if req_type not in signatory_statuses or signatory_statuses[req_type]['status'] != 'approved':
-                        all_approved = False
-                        break
-                
-                overall_status = 'completed' if all_approved else 'pending'
-                
-                # Apply status filter if specified
-                if status_filter and status_filter not in ['Filter by Status', '']:
-                    if status_filter.lower() == 'cleared' and overall_status != 'completed':
-                        continue
-                    elif status_filter.lower() == 'pending' and overall_status != 'pending':
-                        continue
-                    elif status_filter.lower() == 'disapproved' and not any(
-                        status.get('status') == 'disapproved' for status in signatory_statuses.values()
-                    ):
-                        continue
-                
-                clearance_data.append({
-                    'id': str(clearance.id),
-                    'student_name': student.full_name,
-                    'student_number': student_profile.student_number if student_profile else 'N/A',
-                    'course': student_profile.program if student_profile else 'N/A',
-                    'year': student_profile.year_level if student_profile else 'N/A',
-                    'section': clearance.section or 'N/A',
-                    'date_submitted': clearance.submitted_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%B %d, %Y'),
-                    'signatory_statuses': signatory_statuses,
-                    'overall_status': overall_status
-                })
+                'year': student_profile.year_level if student_profile else 'N/A',
+                'section': clearance_signatory.clearance.section or 'N/A',
+                'purpose': clearance_signatory.clearance.clearance_type.title(),
+                'date_submitted': clearance_signatory.clearance.submitted_at.strftime('%B %d, %Y'),
+                'semester': clearance_signatory.clearance.semester,
+                'academic_year': clearance_signatory.clearance.academic_year or 'N/A',
+            })
             except Exception as e:
-                print(f"Error processing clearance {clearance.id}: {e}")
+                print(f"Error processing clearance {clearance_signatory.id}: {e}")
                 continue
         
+        # The rows are already loaded, so count them instead of issuing another COUNT query
+        new_clearances_count = len(clearance_data)
+        
+        return JsonResponse({
+            'success': True,
+            'data': clearance_data,
+            'count': new_clearances_count,
+            'statistics': DashboardStatsService.get_signatory_stats('business_manager'),
+            'message': f'There are {new_clearances_count} new clearance form{"s" if new_clearances_count != 1 else ""} waiting for approval'
+        })
+        
+    except Exception as e:
+        print(f"Error in business_manager_dashboard_data_api: {e}")
+        return JsonResponse({'error': 'Internal server error'}, status=500)
+
+@login_required
+@conditional_get(CLEARANCE_DATA)
+def business_manager_clearance_data_api(request):
+    """API endpoint to get clearance data for business manager (one keyset-paginated page)"""
+    if not is_business_manager(request.user):
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    try:
+        # Business manager sees all clearances (same as registrar)
+        clearances = ClearanceGridService.apply_filters(
+            ClearanceGridService.base_queryset(), request.GET, search_program=True
+        )
+        page = ClearanceGridService.paginate(clearances, request.GET)
+        
+        manila_tz = pytz.timezone('Asia/Manila')
+        clearance_data = []
+        for clearance in page['rows']:
+            student = clearance.student
+            student_profile = getattr(student, 'profile', None)
+            status_matrix = getattr(clearance, 'status_matrix', None)
+            
+            signatory_statuses = {}
+            if status_matrix:
+                for signatory_type, signatory_data in status_matrix.get_signatory_statuses().items():
+                    signatory_statuses[signatory_type] = {
+                        'status': signatory_data['status'],
+                        'timestamp': signatory_data['timestamp'].astimezone(manila_tz).strftime('%B %d, %Y %I:%M %p') if signatory_data['timestamp'] else None,
+                        'comment': signatory_data['comment'] or ''
+                    }
+            
+            clearance_data.append({
+                'id': str(clearance.id),
+                'student_name': student.full_name,
+                'student_number': student_profile.student_number if student_profile else 'N/A',
+                'course': student_profile.program if student_profile else 'N/A',
+                'year': student_profile.year_level if student_profile else 'N/A',
+                'section': clearance.section or 'N/A',
+                'date_submitted': clearance.submitted_at.astimezone(manila_tz).strftime('%B %d, %Y'),
+                'signatory_statuses': signatory_statuses,
+                'overall_status': status_matrix.overall_status if status_matrix else 'pending'
+            })
+        
         return JsonResponse({
             'success': True,
-            'data': clearance_data
+            'data': clearance_data,
+            'pagination': page['pagination']
         })
         
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
     except Exception as e:
         print(f"Error in business_manager_clearance_data_api: {e}")
         return JsonResponse({'error': str(e)}, status=500)
@@ -14406,6 +13022,8 @@ def business_manager_mark_clearance_seen(request):
                     id__in=clearance_signatory_ids,
                     signatory__signatory_profile__signatory_type='business_manager'
                 ).update(seen_by_signatory=True)
+                # .update() skips the signals that invalidate the clearance ETags
+                transaction.on_commit(CLEARANCE_DATA.invalidate)
                 
                 return JsonResponse({
                     'success': True,
@@ -14705,7 +13323,8 @@ def business_manager_approve_clearance(request):
                 print(f"Error sending completion notification: {e}")
         
         # Log activity
-        BusinessManagerActivityLog.objects.create(
+        record_activity(
+            BusinessManagerActivityLog,
             business_manager=request.user,
             action_type='approve',
             form_type='clearance',
@@ -14794,7 +13413,8 @@ def business_manager_disapprove_clearance(request):
             print(f"Full traceback: {traceback.format_exc()}")
         
         # Log activity
-        BusinessManagerActivityLog.objects.create(
+        record_activity(
+            BusinessManagerActivityLog,
             business_manager=request.user,
             action_type='disapprove',
             form_type='clearance',
@@ -14879,79 +13499,31 @@ def business_manager_bulk_approve_clearance(request):
             if not clearance_forms.exists():
                 return JsonResponse({'error': 'No clearance forms found'}, status=404)
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
-            
-            for clearance in clearance_forms:
-                try:
-                    # Create or update business manager signatory
-                    signatory, created = ClearanceSignatory.objects.get_or_create(
-                        clearance=clearance,
-                        signatory=request.user,
-                        role='business_manager',
-                        defaults={
-                            'status': 'approved',
-                            'remarks': comment,
-                            'ip_address': get_client_ip(request)
-                        }
-                    )
-                    
-                    if not created:
-                        signatory.status = 'approved'
-                        signatory.remarks = comment
-                        signatory.ip_address = get_client_ip(request)
-                        signatory.save()
-                    
-                    approved_count += 1
-                    student_names.append(clearance.student.get_full_name())
-
-                    # Send individual approval notification to student
-                    try:
-                        from landing.notification_service import NotificationService
-                        NotificationService.notify_form_approval(
-                            form_instance=clearance,
-                            form_type='clearance',
-                            signatory_user=request.user,
-                            remarks=comment or ''
-                        )
-                    except Exception as e:
-                        print(f"Error sending approval notification for clearance {clearance.id}: {e}")
-
-                    # Check if all signatories approved for this clearance
-                    all_signatories = ClearanceSignatory.objects.filter(clearance=clearance)
-                    all_approved = all_signatories.exists() and all(s.status == 'approved' for s in all_signatories)
-                    if all_approved:
-                        clearance.status = 'approved'
-                        clearance.save()
-
-                        # Send completion notification to student
-                        try:
-                            NotificationService.notify_clearance_completed(
-                                student=clearance.student,
-                                form_type='clearance',
-                                form_instance=clearance
-                            )
-                        except Exception as e:
-                            print(f"Error sending completion notification: {e}")
-                    
-                    # Log activity
-                    ActivityLog.objects.create(
-                        user=request.user,
-                        action='BULK_APPROVE_CLEARANCE',
-                        description=f'Bulk approved clearance for {clearance.student.get_full_name()}',
-                        ip_address=get_client_ip(request)
-                    )
-                    
-                except Exception as e:
-                    print(f"Error approving clearance {clearance.id}: {e}")
-                    continue
+            # Approve all selected forms set-wise in one transaction
+            decision = BulkDecisionService.approve(
+                'clearance',
+                clearance_ids,
+                signatory_user=request.user,
+                role='business_manager',
+                remarks=comment,
+                ip_address=get_client_ip(request)
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.student.full_name for form in decision['approved']]
+            
+            # Log activity
+            BulkDecisionService.log_activity(
+                BusinessManagerActivityLog, 'business_manager', request.user, 'clearance', decision['approved'],
+                ip_address=get_client_ip(request),
+                user_agent=request.META.get('HTTP_USER_AGENT', '')
+            )
             
             return JsonResponse({
                 'success': True,
                 'message': f'Successfully approved {approved_count} clearance(s)',
                 'approved_count': approved_count,
-                'student_names': student_names
+                'student_names': student_names,
+                'results': decision['results']
             })
             
         except json.JSONDecodeError:
@@ -15419,53 +13991,30 @@ def business_manager_bulk_approve_enrollment(request):
             if not enrollment_forms.exists():
                 return JsonResponse({'error': 'No enrollment forms found'}, status=404)
             
-            # Process bulk approval
-            approved_count = 0
-            student_names = []
-            
-            for enrollment in enrollment_forms:
-                try:
-                    # Create or update business manager signatory record
-                    business_signatory, created = EnrollmentSignatory.objects.get_or_create(
-                        enrollment=enrollment,
-                        signatory=request.user,
-                        role='business_manager',
-                        defaults={'status': 'approved', 'remarks': comment, 'ip_address': get_client_ip(request)}
-                    )
-                    
-                    if not created:
-                        business_signatory.status = 'approved'
-                        business_signatory.remarks = comment
-                        business_signatory.ip_address = get_client_ip(request)
-                        business_signatory.save()
-                    
-                    approved_count += 1
-                    student_names.append(enrollment.user.get_full_name())
-                    
-                    # Create individual notification for the student
-                    Notification.objects.create(
-                        recipient=enrollment.user,
-                        message=f"Your enrollment form has been approved by Business Manager with remarks: {comment}" if comment else "Your enrollment form has been approved by Business Manager",
-                        notification_type='enrollment_approved',
-                        priority='normal'
-                    )
-                    
-                    # Log activity
-                    ActivityLog.objects.create(
-                        user=request.user,
-                        action=f'Approved enrollment form for {enrollment.user.get_full_name()}',
-                        model_affected='EnrollmentForm',
-                        record_id=str(enrollment.id),
-                        ip_address=get_client_ip(request)
-                    )
-                    
-                except Exception as e:
-                    print(f"Error approving enrollment {enrollment.id}: {str(e)}")
-                    continue
+            # Approve all selected forms set-wise in one transaction
+            decision = BulkDecisionService.approve(
+                'enrollment',
+                enrollment_ids,
+                signatory_user=request.user,
+                role='business_manager',
+                remarks=comment,
+                ip_address=get_client_ip(request)
+            )
+            approved_count = decision['approved_count']
+            student_names = [form.user.full_name for form in decision['approved']]
+            
+            # Log activity
+            BulkDecisionService.log_activity(
+                BusinessManagerActivityLog, 'business_manager', request.user, 'enrollment', decision['approved'],
+                ip_address=get_client_ip(request),
+                user_agent=request.META.get('HTTP_USER_AGENT', '')
+            )
             
             return JsonResponse({
                 'success': True,
-                'message': f'Successfully approved {approved_count} enrollment form(s): {", ".join(student_names)}'
+                'message': f'Successfully approved {approved_count} enrollment form(s): {", ".join(student_names)}',
+                'approved_count': approved_count,
+                'results': decision['results']
             })
             
         except json.JSONDecodeError:
@@ -15584,28 +14133,12 @@ def business_manager_enrollment_data_api(request):
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     try:
-        # Get all enrollment forms with related data
-        enrollment_forms = EnrollmentForm.objects.select_related('user').all().order_by('-created_at')
-        
         data = []
-        for form in enrollment_forms:
-            # Get signatory statuses - check both signatory records and direct form fields
-            dean_signatory = form.signatories.filter(role='dean').first()
-            business_signatory = form.signatories.filter(role='business_manager').first()
-            registrar_signatory = form.signatories.filter(role='registrar').first()
-            
-            # Get business manager status from signatory record
-            business_status = business_signatory.status if business_signatory else 'pending'
-            business_timestamp = business_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if business_signatory and business_signatory.status != 'pending' else ''
-            
-            # Determine overall status based on all required signatories
-            all_signatories = form.signatories.all()
-            roles_required = {'dean', 'business_manager', 'registrar'}
-            statuses = {s.role: s.status for s in all_signatories}
-            
-            if roles_required.issubset(statuses.keys()) and all(statuses[role] == 'approved' for role in roles_required):
+        for row in FormGridService.rows('enrollment'):
+            form = row.form
+            if row.all_approved():
                 status = 'approved'
-            elif any(status == 'disapproved' for status in statuses.values()):
+            elif row.any_disapproved():
                 status = 'disapproved'
             else:
                 status = 'pending'
@@ -15616,19 +14149,19 @@ def business_manager_enrollment_data_api(request):
                 'course': form.course,
                 'year': form.year,
                 'section': form.section,
-                'id_number': form.user.profile.student_number if hasattr(form.user, 'profile') else 'N/A',
+                'id_number': row.profile_value('student_number'),
                 'date_submitted': form.created_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p'),
                 'pdf_file': 'Enrollment_Form.pdf',  # Placeholder
-                'dean_status': dean_signatory.status if dean_signatory else 'pending',
-                'dean_timestamp': dean_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if dean_signatory and dean_signatory.status != 'pending' else '',
-                'business_status': business_status,
-                'business_timestamp': business_timestamp,
-                'registrar_status': registrar_signatory.status if registrar_signatory else 'pending',
-                'registrar_timestamp': registrar_signatory.updated_at.astimezone(pytz.timezone('Asia/Manila')).strftime('%Y-%m-%d %I:%M %p') if registrar_signatory and registrar_signatory.status != 'pending' else '',
+                'dean_status': row.status('dean'),
+                'dean_timestamp': row.timestamp('dean'),
+                'business_status': row.status('business_manager'),
+                'business_timestamp': row.timestamp('business_manager'),
+                'registrar_status': row.status('registrar'),
+                'registrar_timestamp': row.timestamp('registrar'),
                 'overall_status': status,
-                'dean_remarks': dean_signatory.remarks if dean_signatory else '',
-                'business_remarks': business_signatory.remarks if business_signatory else '',
-                'registrar_remarks': registrar_signatory.remarks if registrar_signatory else '',
+                'dean_remarks': row.remarks('dean'),
+                'business_remarks': row.remarks('business_manager'),
+                'registrar_remarks': row.remarks('registrar'),
             }
             data.append(enrollment_data)
         
@@ -15716,7 +14249,8 @@ def business_manager_approve_enrollment(request):
                 print(f"Error sending completion notification: {notif_error}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_approve',
             description=f'Business Manager approved enrollment form {enrollment_id} for {enrollment_form.user.full_name} [IP: {get_client_ip(request)}]'
@@ -15791,7 +14325,8 @@ def business_manager_disapprove_enrollment(request):
             print(f"Error sending business manager enrollment disapproval notification: {e}")
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_disapprove',
             description=f'Business Manager disapproved enrollment form {enrollment_id} for {enrollment_form.user.full_name} [IP: {get_client_ip(request)}]'
@@ -15822,7 +14357,8 @@ def business_manager_delete_enrollment(request, enrollment_id):
         enrollment_form.delete()
         
         # Log the action
-        AuditLog.objects.create(
+        record_activity(
+            AuditLog,
             user=request.user,
             action_type='enrollment_delete',
             description=f'Business Manager deleted enrollment form {enrollment_id} for {student_name} [IP: {get_client_ip(request)}]'
@@ -15864,7 +14400,8 @@ def business_manager_bulk_delete_enrollment(request):
                 deleted_count += 1
                 
                 # Log the action
-                AuditLog.objects.create(
+                record_activity(
+                    AuditLog,
                     user=request.user,
                     action_type='enrollment_bulk_delete',
                     description=f'Business Manager bulk deleted enrollment form {enrollment_id} for {student_name} [IP: {get_client_ip(request)}]'
@@ -16305,26 +14842,34 @@ def complete_profile(request):
 # MESSAGING SYSTEM
 # --------------------
 
+# Profile relations read by get_user_profile_picture, joined in whenever participants are loaded
+PROFILE_PICTURE_RELATIONS = ['profile', 'alumni_profile', 'signatory_profile', 'business_manager_profile']
+MESSAGE_PAGE_SIZE = 50
+MAX_MESSAGE_PAGE_SIZE = 200
+
 @login_required
 def get_conversations(request):
     """Get all conversations for the current user"""
     from landing.models import Conversation
     
     user = request.user
+    # One query: participants, their profiles (for the picture) and the last message are joined in;
+    # unread counts are the denormalized counters kept by Conversation.record_message/mark_read
     conversations = Conversation.objects.filter(
         Q(participant_1=user) | Q(participant_2=user)
+    ).select_related(
+        'last_message',
+        *[f'{participant}__{relation}' for participant in ('participant_1', 'participant_2') for relation in PROFILE_PICTURE_RELATIONS]
     ).order_by('-updated_at')
     
     conversations_data = []
     for conv in conversations:
         other_user = conv.get_other_participant(user)
-        last_message = conv.get_last_message()
-        
-        # Count unread messages
-        unread_count = conv.messages.filter(
-            sender=other_user,
-            is_read=False
-        ).count()
+        last_message = conv.last_message
+        unread_count = conv.unread_count_for(user)
+        if last_message:
+            # The sender is one of the participants, which are already loaded
+            last_sender = user if last_message.sender_id == user.id else other_user
         
         conversations_data.append({
             'id': str(conv.id),
@@ -16337,8 +14882,8 @@ def get_conversations(request):
             'last_message': {
                 'content': last_message.content if last_message else '',
                 'sent_at': last_message.sent_at.isoformat() if last_message else '',
-                'sender_name': last_message.sender.full_name if last_message else '',
-                'is_own_message': last_message.sender == user if last_message else False,
+                'sender_name': last_sender.full_name if last_message else '',
+                'is_own_message': last_message.sender_id == user.id if last_message else False,
                 'message_type': last_message.message_type if last_message else 'text',
             } if last_message else None,
             'unread_count': unread_count,
@@ -16350,33 +14895,79 @@ def get_conversations(request):
         'conversations': conversations_data
     })
 
+def encode_message_cursor(message):
+    """Opaque 'load older' cursor for the (sent_at, id) position of a message"""
+    import base64
+    raw = f"{message.sent_at.isoformat()}|{message.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_message_cursor(cursor):
+    """(sent_at, id) from encode_message_cursor; raises ValueError for a malformed cursor"""
+    import base64
+    import uuid
+    from datetime import datetime
+    try:
+        sent_at, message_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(sent_at), uuid.UUID(message_id)
+    except Exception:
+        raise ValueError('Invalid cursor')
+
 @login_required 
 def get_conversation_messages(request, conversation_id):
-    """Get messages for a specific conversation"""
-    from landing.models import Conversation, Message
+    """
+    Get messages for a specific conversation, newest page first.
+    ?limit= sets the page size; ?before=<next_cursor> loads the page of older messages.
+    Messages in a page are in chronological order.
+    """
+    from landing.models import Conversation
     
     try:
         conversation = Conversation.objects.filter(
             id=conversation_id
         ).filter(
             Q(participant_1=request.user) | Q(participant_2=request.user)
+        ).select_related(
+            *[f'{participant}__{relation}' for participant in ('participant_1', 'participant_2') for relation in PROFILE_PICTURE_RELATIONS]
         ).get()
     except Conversation.DoesNotExist:
         return JsonResponse({'success': False, 'message': 'Conversation not found'})
     
-    # Mark messages as read
-    unread_messages = conversation.messages.filter(
-        is_read=False
-    ).exclude(sender=request.user)
+    try:
+        limit = min(max(int(request.GET.get('limit', MESSAGE_PAGE_SIZE)), 1), MAX_MESSAGE_PAGE_SIZE)
+    except ValueError:
+        limit = MESSAGE_PAGE_SIZE
+    before = request.GET.get('before')
     
-    for message in unread_messages:
-        message.mark_as_read()
+    messages = conversation.messages.order_by('-sent_at', '-id')
+    if before:
+        try:
+            sent_at, message_id = decode_message_cursor(before)
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid cursor'}, status=400)
+        messages = messages.filter(Q(sent_at__lt=sent_at) | Q(sent_at=sent_at, id__lt=message_id))
+    else:
+        # Mark messages as read (one UPDATE) when the newest page is opened
+        conversation.mark_read(request.user)
+    
+    # One row more than the page tells whether there is anything older
+    page = list(messages[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit][::-1]
+    
+    # Every sender is a participant, and both are already loaded with their profiles
+    other_user = conversation.get_other_participant(request.user)
+    participants = {conversation.participant_1_id: conversation.participant_1, conversation.participant_2_id: conversation.participant_2}
+    senders = {
+        user_id: {
+            'id': str(user_id),
+            'name': participant.full_name,
+            'profile_picture': get_user_profile_picture(participant),
+        }
+        for user_id, participant in participants.items()
+    }
     
-    # Get messages
-    messages = conversation.messages.order_by('sent_at')
     messages_data = []
-    
-    for msg in messages:
+    for msg in page:
         messages_data.append({
             'id': str(msg.id),
             'content': msg.content,
@@ -16384,12 +14975,8 @@ def get_conversation_messages(request, conversation_id):
             'file_attachment': msg.file_attachment.url if msg.file_attachment else None,
             'file_name': msg.file_name,
             'file_size_formatted': msg.file_size_formatted,
-            'sender': {
-                'id': str(msg.sender.id),
-                'name': msg.sender.full_name,
-                'profile_picture': get_user_profile_picture(msg.sender),
-            },
-            'is_own_message': msg.sender == request.user,
+            'sender': senders[msg.sender_id],
+            'is_own_message': msg.sender_id == request.user.id,
             'sent_at': msg.sent_at.isoformat(),
             'is_read': msg.is_read,
             'read_at': msg.read_at.isoformat() if msg.read_at else None,
@@ -16398,13 +14985,18 @@ def get_conversation_messages(request, conversation_id):
     return JsonResponse({
         'success': True,
         'messages': messages_data,
+        'pagination': {
+            'limit': limit,
+            'has_more': has_more,
+            'next_cursor': encode_message_cursor(page[0]) if has_more else None,
+        },
         'conversation': {
             'id': str(conversation.id),
             'other_user': {
-                'id': str(conversation.get_other_participant(request.user).id),
-                'name': conversation.get_other_participant(request.user).full_name,
-                'user_type': conversation.get_other_participant(request.user).get_user_type_display(),
-                'profile_picture': get_user_profile_picture(conversation.get_other_participant(request.user)),
+                'id': str(other_user.id),
+                'name': other_user.full_name,
+                'user_type': other_user.get_user_type_display(),
+                'profile_picture': senders[other_user.id]['profile_picture'],
             }
         }
     })
@@ -16449,19 +15041,19 @@ def send_message(request):
         else:
             message_type = 'file'
     
-    # Create message
-    message = Message.objects.create(
-        conversation=conversation,
-        sender=request.user,
-        message_type=message_type,
-        content=content,
-        file_attachment=file_attachment,
-        file_name=file_name,
-        file_size=file_size
-    )
-    
-    # Update conversation timestamp
-    conversation.save()  # This triggers updated_at
+    # Create message and update the conversation's last message, unread counter and timestamp
+    with transaction.atomic():
+        message = Message.objects.create(
+            conversation=conversation,
+            sender=request.user,
+            message_type=message_type,
+            content=content,
+            file_attachment=file_attachment,
+            file_name=file_name,
+            file_size=file_size
+        )
+        conversation.record_message(message)
+        publish_message_event(conversation, message)
     
     return JsonResponse({
         'success': True,
@@ -16497,8 +15089,8 @@ def get_users_for_new_conversation(request):
             'message': 'You do not have permission to start new conversations'
         })
     
-    # Get all users except self
-    users = User.objects.exclude(id=user.id).order_by('full_name')
+    # Get all users except self, with the profiles get_user_profile_picture reads
+    users = User.objects.exclude(id=user.id).select_related(*PROFILE_PICTURE_RELATIONS).order_by('full_name')
     
     users_data = []
     for u in users:
@@ -16569,11 +15161,14 @@ def start_conversation(request):
     # Send initial message if provided
     if initial_message:
         from landing.models import Message
-        Message.objects.create(
-            conversation=conversation,
-            sender=user,
-            content=initial_message
-        )
+        with transaction.atomic():
+            message = Message.objects.create(
+                conversation=conversation,
+                sender=user,
+                content=initial_message
+            )
+            conversation.record_message(message)
+            publish_message_event(conversation, message)
     
     return JsonResponse({
         'success': True,
@@ -16581,20 +15176,33 @@ def start_conversation(request):
         'message': 'Conversation started successfully'
     })
 
+def publish_message_event(conversation, message):
+    """Tell both participants' open pages about a new message (the sender may have other tabs)"""
+    from landing.event_stream import EventStream
+    EventStream.publish('message', {
+        'conversation_id': str(conversation.id),
+        'message_id': str(message.id),
+        'sender_id': str(message.sender_id),
+        'sender_name': message.sender.full_name,
+        'message_type': message.message_type,
+        'preview': (message.content or message.file_name or '')[:100],
+        'sent_at': message.sent_at.isoformat(),
+    }, users=[conversation.participant_1_id, conversation.participant_2_id])
+
 def get_user_profile_picture(user):
-    """Helper function to get user profile picture URL"""
+    """Avatar (small variant) URL of a user's profile picture"""
     try:
         if user.user_type == 'student' and hasattr(user, 'profile'):
-            return user.profile.profile_picture_url
+            return user.profile.profile_picture_thumbnail_url
         elif user.user_type == 'alumni' and hasattr(user, 'alumni_profile'):
-            return user.alumni_profile.profile_picture_url
+            return user.alumni_profile.profile_picture_thumbnail_url
         elif user.user_type == 'signatory' and hasattr(user, 'signatory_profile'):
-            return user.signatory_profile.profile_picture_url if user.signatory_profile.profile_picture else '/static/images/default-profile.png'
+            return user.signatory_profile.profile_picture_thumbnail_url
         elif user.user_type == 'business_manager' and hasattr(user, 'business_manager_profile'):
-            return user.business_manager_profile.profile_picture_url if user.business_manager_profile.profile_picture else '/static/images/default-profile.png'
+            return user.business_manager_profile.profile_picture_thumbnail_url
     except:
         pass
-    return '/static/images/default-profile.png'
+    return static('images/default-profile.png')
 
 # ==============================================================================
 # NOTIFICATION SYSTEM UTILITIES
@@ -16639,6 +15247,8 @@ def mark_all_notifications_as_read(user):
 @login_required
 def get_notifications_api(request):
     """API endpoint to get user notifications"""
+    from landing.notification_service import NotificationService
+    NotificationService.sync_pending_count_notifications(request.user)
     notifications = get_user_notifications(request.user)
     notification_data = []
     
@@ -16694,11 +15304,32 @@ def time_since(datetime_obj):
 # ENHANCED NOTIFICATION SYSTEM
 # ============================================================================
 
+def notifications_etag_validator(request):
+    """Cheap stand-in for get_notifications_enhanced_api's data: indexed aggregates"""
+    from django.db.models import Count, Max
+    from landing.models import DocumentRequest, Notification, PendingCounter
+    from landing.notification_service import NotificationService
+    notifications = Notification.objects.filter(user=request.user).aggregate(
+        total=Count('id'), unread=Count('id', filter=Q(is_read=False)), updated=Max('updated_at')
+    )
+    # The view renders "Pending X Forms" notifications from the counters before reading
+    counters = PendingCounter.objects.filter(user=request.user).aggregate(updated=Max('updated_at'))
+    validator = (notifications['total'], notifications['unread'], notifications['updated'], counters['updated'])
+    if request.user.user_type in NotificationService.DOCUMENT_REQUEST_STAFF_TYPES:
+        # ...and, for staff, the pending document request count read live from DocumentRequest
+        documents = DocumentRequest.objects.filter(status='pending').aggregate(total=Count('id'), updated=Max('updated_at'))
+        validator += (documents['total'], documents['updated'])
+    return validator
+
 @login_required
+@conditional_get(validator=notifications_etag_validator)
 def get_notifications_enhanced_api(request):
     """Enhanced API endpoint to get user notifications with filtering and pagination"""
     try:
-        from landing.notification_service import NotificationUtils
+        from landing.notification_service import NotificationService, NotificationUtils
+        
+        # Render "Pending X Forms" notifications from the pending counters
+        NotificationService.sync_pending_count_notifications(request.user)
         
         # Get query parameters
         page = int(request.GET.get('page', 1))
@@ -16898,14 +15529,11 @@ def create_enhanced_notification(user, notification_type, title, message, **kwar
 
 
 def send_notification_email(user, subject, message, template_data=None):
-    """Send standalone notification email"""
+    """Queue standalone notification email for the outbox worker"""
     try:
-        from django.core.mail import EmailMultiAlternatives
-        from django.template.loader import render_to_string
-        from landing.models import EmailNotificationLog
+        from landing.email_outbox import EmailOutbox
         
-        # Create email log
-        email_log = EmailNotificationLog.objects.create(
+        EmailOutbox.enqueue(
             user=user,
             email_type='standalone',
             recipient_email=user.email,
@@ -16913,25 +15541,10 @@ def send_notification_email(user, subject, message, template_data=None):
             content=message
         )
         
-        # Send email
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.email]
-        )
-        email.attach_alternative(message, "text/html")
-        email.send()
-        
-        # Update log
-        email_log.status = 'sent'
-        email_log.sent_at = timezone.now()
-        email_log.save()
-        
         return True
         
     except Exception as e:
-        logger.error(f"Error sending notification email: {str(e)}")
+        logger.error(f"Error queueing notification email: {str(e)}")
         return False
 
 # ==============================================================================
@@ -16995,6 +15608,101 @@ def api_mark_browser_notification_shown(request):
         logger.error(f"Error marking browser notification as shown: {str(e)}")
         return JsonResponse({'success': False, 'error': str(e)})
 
+@login_required
+def api_event_stream(request):
+    """Server-Sent Events feed of the user's new notifications, messages and dashboard changes"""
+    from django.http import HttpResponse, StreamingHttpResponse
+    from landing.event_stream import SSE_ENABLED, EventStream
+    
+    if not SSE_ENABLED:
+        # EventSource stops reconnecting on 204; the page falls back to api_event_poll
+        return HttpResponse(status=204)
+    
+    # EventSource sends Last-Event-ID when it reconnects
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+    
+    response = StreamingHttpResponse(
+        EventStream.sse_stream(request.user, last_event_id),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx: pass events through unbuffered
+    return response
+
+@login_required
+def api_event_poll(request):
+    """
+    Polling fallback of api_event_stream: events after ?after=, waiting up to ?timeout= seconds
+    (at most EVENT_STREAM_LONG_POLL_SECONDS, 0 by default). ?version= is the token of the previous
+    answer; while it still matches, the answer comes from the cache without querying the events.
+    Without ?after= it answers at once with the id to start from. `wait` and `interval` tell the
+    page how long to ask the server to wait and how long to pause before the next poll.
+    """
+    from landing.event_stream import LONG_POLL_SECONDS, POLL_INTERVAL_SECONDS, EventStream
+    
+    timing = {
+        'wait': LONG_POLL_SECONDS,
+        'interval': 0 if LONG_POLL_SECONDS > 0 else POLL_INTERVAL_SECONDS,
+    }
+    after = request.GET.get('after')
+    if not after:
+        # Token first: an event published in between then changes it, so the next poll queries
+        version = EventStream.version_token(request.user)
+        return JsonResponse({
+            'success': True, 'events': [], 'last_event_id': EventStream.latest_id(), 'version': version, **timing,
+        })
+    try:
+        after = int(after)
+        timeout = min(max(float(request.GET.get('timeout', LONG_POLL_SECONDS)), 0), LONG_POLL_SECONDS)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid after or timeout'}, status=400)
+    
+    events, version = EventStream.poll(request.user, after, timeout, request.GET.get('version'))
+    return JsonResponse({
+        'success': True,
+        'events': [EventStream.serialize(event) for event in events],
+        'last_event_id': events[-1].id if events else after,
+        'version': version,
+        **timing,
+    })
+
+REQUEST_METRICS_SORT_FIELDS = ['p50_ms', 'p90_ms', 'p95_ms', 'p99_ms', 'max_ms', 'mean_ms', 'total_ms', 'requests', 'mean_sql_count', 'flagged']
+
+@login_required
+def api_request_metrics(request):
+    """
+    Per-view latency percentiles, SQL and response size over the last ?hours= (default 24),
+    slowest first by ?sort= (default p95_ms); ?view= filters by view name. Staff only.
+    """
+    from datetime import timedelta
+    from landing.request_metrics import ENABLED, RequestMetrics
+
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    try:
+        hours = min(max(float(request.GET.get('hours', 24)), 0), 24 * 30)
+        limit = min(max(int(request.GET.get('limit', 50)), 1), 500)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid hours or limit'}, status=400)
+    sort = request.GET.get('sort', 'p95_ms')
+    if sort not in REQUEST_METRICS_SORT_FIELDS:
+        return JsonResponse({'success': False, 'error': f'sort must be one of {", ".join(REQUEST_METRICS_SORT_FIELDS)}'}, status=400)
+
+    since = timezone.now() - timedelta(hours=hours)
+    views = RequestMetrics.summary(since, view_filter=request.GET.get('view', '').strip())
+    views.sort(key=lambda row: row[sort] or 0, reverse=True)
+    return JsonResponse({
+        'success': True,
+        'enabled': ENABLED,
+        'since': since.isoformat(),
+        'views': views[:limit],
+        'view_count': len(views),
+    })
+
 # OTP Verification Views for Signup
 def verify_otp(request):
     """Display OTP verification page"""
@@ -17839,8 +16547,6 @@ def courses_api(request):
         return JsonResponse({'success': False, 'error': 'Access denied'}, status=403)
     
     try:
-        from landing.models import AcademicProgram, AcademicYearLevel, AcademicSemester
-        from django.db.models import Q, Count
         from datetime import datetime
         
         # Get filter parameters
@@ -17848,23 +16554,22 @@ def courses_api(request):
         program_filter = request.GET.get('program', '')
         year_filter = request.GET.get('year', '')
         
-        # Base query - get all programs
-        programs = AcademicProgram.objects.all().order_by('program_type', 'code')
+        # Programs come from the in-process curriculum index (already ordered by type and code)
+        programs = CurriculumIndex.current().programs.values()
         
         # Apply program filter
-        if program_filter:
-            if program_filter == 'undergraduate':
-                programs = programs.filter(program_type='undergraduate')
-            elif program_filter == 'graduate':
-                programs = programs.filter(program_type='graduate')
+        if program_filter in ('undergraduate', 'graduate'):
+            programs = [program for program in programs if program['program_type'] == program_filter]
         
         # Apply search filter
         if search:
-            programs = programs.filter(
-                Q(code__icontains=search) | 
-                Q(name__icontains=search) |
-                Q(description__icontains=search)
-            )
+            needle = search.lower()
+            programs = [
+                program for program in programs
+                if needle in program['code'].lower()
+                or needle in program['name'].lower()
+                or needle in program['description'].lower()
+            ]
         
         courses_data = []
         current_year = datetime.now().year
@@ -17877,19 +16582,19 @@ def courses_api(request):
                 academic_year = f"{current_year}-{current_year + 1}"
             
             # Get display name for program type
-            program_type_display = 'Graduate Program' if program.program_type == 'graduate' else 'Undergraduate Program'
+            program_type_display = 'Graduate Program' if program['program_type'] == 'graduate' else 'Undergraduate Program'
             
             course_data = {
-                'id': str(program.id),
+                'id': program['id'],
                 'program': program_type_display,
-                'code': program.code,
-                'name': program.name,
+                'code': program['code'],
+                'name': program['name'],
                 'academic_year': academic_year,
-                'created_at': program.created_at.strftime('%b %d, %Y'),
-                'description': program.description,
-                'duration_years': program.duration_years,
-                'year_levels_count': program.year_levels.count(),
-                'total_semesters': program.year_levels.count() * 2  # Simple calculation instead of complex query
+                'created_at': program['created_at'].strftime('%b %d, %Y'),
+                'description': program['description'],
+                'duration_years': program['duration_years'],
+                'year_levels_count': program['year_levels_count'],
+                'total_semesters': program['year_levels_count'] * 2  # Simple calculation instead of complex query
             }
             courses_data.append(course_data)
         
@@ -18051,6 +16756,9 @@ def create_course_api(request):
                             order=order
                         )
         
+        # Rebuild the enrollment curriculum index in every process
+        CurriculumIndex.invalidate()
+        
         return JsonResponse({
             'success': True,
             'message': 'Course created successfully',
@@ -18121,6 +16829,9 @@ def update_course_api(request, course_id):
                             order=order
                         )
         
+        # Rebuild the enrollment curriculum index in every process
+        CurriculumIndex.invalidate()
+        
         return JsonResponse({
             'success': True,
             'message': 'Course updated successfully'
@@ -18170,8 +16881,6 @@ def enrollment_subjects_api(request):
         return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
     
     try:
-        from landing.models import AcademicProgram, AcademicYearLevel, AcademicSemester, AcademicSubject
-        
         program_code = request.GET.get('program')
         year_level = request.GET.get('year_level')
         semester = request.GET.get('semester')
@@ -18179,40 +16888,18 @@ def enrollment_subjects_api(request):
         if not all([program_code, year_level, semester]):
             return JsonResponse({'success': False, 'error': 'Missing required parameters: program, year_level, semester'})
         
-        # Get the program
-        try:
-            program = AcademicProgram.objects.get(code=program_code)
-        except AcademicProgram.DoesNotExist:
-            return JsonResponse({'success': False, 'error': 'Program not found'})
-        
-        # Get the year level
         try:
-            year_obj = AcademicYearLevel.objects.get(program=program, year_number=int(year_level))
-        except (AcademicYearLevel.DoesNotExist, ValueError):
+            year_number, semester_number = int(year_level), int(semester)
+        except ValueError:
             return JsonResponse({'success': False, 'error': 'Year level not found'})
         
-        # Get the semester
-        try:
-            semester_obj = AcademicSemester.objects.get(year_level=year_obj, semester_number=int(semester))
-        except (AcademicSemester.DoesNotExist, ValueError):
-            return JsonResponse({'success': False, 'error': 'Semester not found'})
-        
-        # Get subjects for this semester
-        subjects = AcademicSubject.objects.filter(semester=semester_obj).order_by('order', 'code')
+        # Served from the in-process curriculum index as pre-serialized JSON
+        curriculum = CurriculumIndex.current()
+        body = curriculum.get_subjects_json(program_code, year_number, semester_number)
+        if body is None:
+            return JsonResponse({'success': False, 'error': curriculum.lookup_error(program_code, year_number, semester_number)})
         
-        subjects_data = []
-        for subject in subjects:
-            subjects_data.append({
-                'code': subject.code,
-                'name': subject.name,
-                'professor': subject.professor,
-                'units': subject.units
-            })
-        
-        return JsonResponse({
-            'success': True,
-            'subjects': subjects_data
-        })
+        return HttpResponse(body, content_type='application/json')
         
     except Exception as e:
         print(f"Error fetching subjects for enrollment: {e}")
@@ -18225,23 +16912,8 @@ def enrollment_programs_api(request):
         return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
     
     try:
-        from landing.models import AcademicProgram
-        
-        # Get all programs with basic information
-        programs = AcademicProgram.objects.all().order_by('program_type', 'name')
-        
-        programs_data = []
-        for program in programs:
-            programs_data.append({
-                'code': program.code,
-                'name': program.name,
-                'program_type': program.program_type
-            })
-        
-        return JsonResponse({
-            'success': True,
-            'programs': programs_data
-        })
+        # Served from the in-process curriculum index as pre-serialized JSON
+        return HttpResponse(CurriculumIndex.current().programs_json, content_type='application/json')
         
     except Exception as e:
         print(f"Error fetching programs for enrollment: {e}")
@@ -18254,31 +16926,16 @@ def enrollment_year_levels_api(request):
         return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
     
     try:
-        from landing.models import AcademicProgram, AcademicYearLevel
-        
         program_code = request.GET.get('program')
         if not program_code:
             return JsonResponse({'success': False, 'error': 'Program code is required'})
         
-        try:
-            program = AcademicProgram.objects.get(code=program_code)
-        except AcademicProgram.DoesNotExist:
+        # Served from the in-process curriculum index as pre-serialized JSON
+        body = CurriculumIndex.current().get_year_levels_json(program_code)
+        if body is None:
             return JsonResponse({'success': False, 'error': 'Program not found'})
         
-        # Get year levels for this program
-        year_levels = AcademicYearLevel.objects.filter(program=program).order_by('year_number')
-        
-        year_levels_data = []
-        for year in year_levels:
-            year_levels_data.append({
-                'year_number': year.year_number,
-                'year_name': year.year_name
-            })
-        
-        return JsonResponse({
-            'success': True,
-            'year_levels': year_levels_data
-        })
+        return HttpResponse(body, content_type='application/json')
         
     except Exception as e:
         print(f"Error fetching year levels: {e}")
@@ -5,6 +5,10 @@ console.log('BMCLEARANCE.js: Script loading started');
 let currentSortField = 'created_at';
 let currentSortOrder = 'desc';
 
+// Rows loaded so far and the cursor for the next page (server-side keyset pagination)
+let clearanceRows = [];
+let clearanceNextCursor = null;
+
 document.addEventListener('DOMContentLoaded', function() {
     // Set current date
     const today = new Date();
@@ -31,8 +35,20 @@ document.addEventListener('DOMContentLoaded', function() {
     // Initialize table sorting
     initializeTableSorting();
     
-    // Set up periodic refresh for real-time updates (every 30 seconds)
-    setInterval(loadClearanceData, 30000);
+    // Reload shortly after a clearance changes status (pushed by event_stream.js); bursts collapse into one reload
+    let staleTimeout;
+    document.addEventListener('app:dashboard_stale', (e) => {
+        if (e.detail.form_type && e.detail.form_type !== 'clearance') return;
+        clearTimeout(staleTimeout);
+        staleTimeout = setTimeout(loadClearanceData, 2000);
+    });
+    
+    // Periodic refresh every 30 seconds while the event stream is not connected
+    setInterval(() => {
+        if (!(window.AppEvents && window.AppEvents.connected)) {
+            loadClearanceData();
+        }
+    }, 30000);
 });
 
 // Sidebar toggle functionality
@@ -138,8 +154,10 @@ function initializeFilters() {
     }
 }
 
-function loadClearanceData() {
+function loadClearanceData(append) {
     console.log('Loading business manager clearance data...');
+    // Only an explicit `true` appends; event listeners pass an Event object here
+    const appendPage = append === true && clearanceNextCursor;
     
     // Get filter values
     const courseFilter = document.getElementById('bm_clearance_filter_course').value;
@@ -159,6 +177,7 @@ function loadClearanceData() {
     // Add sorting parameters
     params.append('sort', currentSortField);
     params.append('order', currentSortOrder);
+    if (appendPage) params.append('cursor', clearanceNextCursor);
     
     console.log('Loading clearance data with params:', params.toString());
     
@@ -172,7 +191,10 @@ function loadClearanceData() {
             if (data.error) {
                 throw new Error(data.error);
             }
-            renderClearanceTable(data.data || []);
+            clearanceRows = appendPage ? clearanceRows.concat(data.data || []) : (data.data || []);
+            clearanceNextCursor = data.pagination && data.pagination.has_next ? data.pagination.next_cursor : null;
+            renderClearanceTable(clearanceRows);
+            appendLoadMoreRow(data.pagination);
             loadFilterOptions();
         })
         .catch(error => {
@@ -202,6 +224,21 @@ function getSignatoryStatus(signatory) {
     }
 }
 
+function appendLoadMoreRow(pagination) {
+    const tbody = document.querySelector('.bm_clearance_table tbody');
+    if (!tbody || !clearanceNextCursor) return;
+    
+    const row = document.createElement('tr');
+    row.innerHTML = `
+        <td colspan="10" class="text-center py-3">
+            <button type="button" class="btn btn-outline-secondary btn-sm">
+                Load more (${clearanceRows.length} of ${pagination.total})
+            </button>
+        </td>`;
+    row.querySelector('button').addEventListener('click', () => loadClearanceData(true));
+    tbody.appendChild(row);
+}
+
 function renderClearanceTable(clearanceData) {
     const tbody = document.querySelector('.bm_clearance_table tbody');
     
@@ -29,6 +29,9 @@ document.addEventListener('DOMContentLoaded', function() {
         // Only refresh if page is visible and no sidebar is open
         if (!document.hidden && !document.querySelector('.registrar_clearance_otp-sidebar.show')) {
             refreshInterval = setInterval(() => {
+                if (window.AppEvents && window.AppEvents.connected) {
+                    return; // Changes arrive as 'app:dashboard_stale' events
+                }
                 if (!document.hidden && !document.querySelector('.registrar_clearance_otp-sidebar.show')) {
                     loadClearanceData();
                 }
@@ -36,6 +39,18 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
+    // Reload shortly after a clearance changes status; bursts collapse into one reload
+    let staleTimeout;
+    document.addEventListener('app:dashboard_stale', (e) => {
+        if (e.detail.form_type && e.detail.form_type !== 'clearance') return;
+        clearTimeout(staleTimeout);
+        staleTimeout = setTimeout(() => {
+            if (!document.hidden && !document.querySelector('.registrar_clearance_otp-sidebar.show')) {
+                loadClearanceData();
+            }
+        }, 2000);
+    });
+    
     function stopAutoRefresh() {
         if (refreshInterval) {
             clearInterval(refreshInterval);
@@ -155,10 +170,17 @@ function initializeFilters() {
     }
 }
 
-function loadClearanceData() {
+// Rows loaded so far and the cursor for the next page (server-side keyset pagination)
+let clearanceRows = [];
+let clearanceNextCursor = null;
+
+function loadClearanceData(append) {
+    // Only an explicit `true` appends; event listeners pass an Event object here
+    const appendPage = append === true && clearanceNextCursor;
+    
     // Show loading state
     const tbody = document.querySelector('.registrar_clearance_table tbody');
-    if (tbody) {
+    if (tbody && !appendPage) {
         tbody.innerHTML = `
             <tr>
                 <td colspan="19" class="text-center text-muted py-4">
@@ -183,8 +205,7 @@ function loadClearanceData() {
     if (section && section !== 'Filter by Section') params.append('section', section);
     if (status && status !== 'Filter by Status') params.append('status', status);
     if (search) params.append('search', search);
-    
-
+    if (appendPage) params.append('cursor', clearanceNextCursor);
     
     // Fetch data
     fetch(`/registrar/clearance/api/data/?${params.toString()}`)
@@ -201,7 +222,11 @@ function loadClearanceData() {
                 return;
             }
 
-            updateClearanceTable(data.clearance_data || []);
+            const pageRows = data.clearance_data || [];
+            clearanceRows = appendPage ? clearanceRows.concat(pageRows) : pageRows;
+            clearanceNextCursor = data.pagination && data.pagination.has_next ? data.pagination.next_cursor : null;
+            updateClearanceTable(clearanceRows);
+            appendLoadMoreRow(data.pagination);
         })
         .catch(error => {
             console.error('Error loading clearance data:', error);
@@ -209,6 +234,22 @@ function loadClearanceData() {
         });
 }
 
+function appendLoadMoreRow(pagination) {
+    const tbody = document.querySelector('.registrar_clearance_table tbody');
+    if (!tbody || !clearanceNextCursor) return;
+    
+    const row = document.createElement('tr');
+    row.innerHTML = `
+        <td colspan="19" class="text-center py-3">
+            <button type="button" class="btn btn-outline-secondary btn-sm">
+                Load more (${clearanceRows.length} of ${pagination.total})
+            </button>
+        </td>
+    `;
+    row.querySelector('button').addEventListener('click', () => loadClearanceData(true));
+    tbody.appendChild(row);
+}
+
 function updateClearanceTable(clearanceData) {
     const tbody = document.querySelector('.registrar_clearance_table tbody');
     if (!tbody) return;
@@ -356,6 +356,11 @@ function initializeCharts() {
 
 function initializeAutoRefresh() {
     setInterval(refreshDashboardData, 300000); // 5 minutes
+    // Refresh soon after a form changes status (pushed by event_stream.js); bursts collapse into one refresh
+    document.addEventListener('app:dashboard_stale', function() {
+        clearTimeout(refreshTimeout);
+        refreshTimeout = setTimeout(refreshDashboardData, 2000);
+    });
     document.addEventListener('visibilitychange', function() {
         if (!document.hidden) {
             clearTimeout(refreshTimeout);
@@ -269,25 +269,28 @@ function regenerateSignatoryPack(packType, weekStart, reportId) {
     })
   })
   .then(response => {
-    if (response.ok && response.headers.get('content-type')?.includes('application/zip')) {
-      // Successfully regenerated ZIP - just show success, don't auto-download
-      showPackGenerationFeedback(`✅ ${packType} pack regenerated successfully!`, 'success');
-      loadGeneratedReportsList(); // Refresh list to show updated entry
-    } else if (response.status === 204) {
+    if (response.status === 204) {
       showPackGenerationFeedback(`⚠️ No data found for ${packType} pack regeneration`, 'warning');
       loadGeneratedReportsList(); // Still refresh in case entry needs updating
-    } else {
-      return response.text().then(text => {
-        let errorMsg = 'Regeneration failed';
-        try {
-          const data = JSON.parse(text);
-          errorMsg = data.error || errorMsg;
-        } catch (e) {
-          errorMsg = `${errorMsg} (${response.status})`;
-        }
-        showPackGenerationFeedback(`❌ Error regenerating pack: ${errorMsg}`, 'danger');
-      });
+      return;
     }
+    return response.json().then(data => {
+      if (!response.ok) {
+        showPackGenerationFeedback(`❌ Error regenerating pack: ${data.error || 'Regeneration failed'}`, 'danger');
+        return;
+      }
+      loadGeneratedReportsList(); // Show the entry as generating
+      return pollReportJob(data.progress_url).then(() => {
+        // Successfully regenerated ZIP - just show success, don't auto-download
+        showPackGenerationFeedback(`✅ ${packType} pack regenerated successfully!`, 'success');
+        loadGeneratedReportsList(); // Refresh list to show updated entry
+      }, error => {
+        showPackGenerationFeedback(`❌ Error regenerating pack: ${error.message}`, 'danger');
+        loadGeneratedReportsList();
+      });
+    }, () => {
+      showPackGenerationFeedback(`❌ Error regenerating pack: Regeneration failed (${response.status})`, 'danger');
+    });
   })
   .catch(error => {
     console.error('Regeneration error:', error);
@@ -379,76 +382,34 @@ function generateSignatoryPack() {
     })
   })
   .then(response => {
-    const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
-    
-    if (response.ok) {
-      const contentType = response.headers.get('content-type') || '';
-      
-      if (contentType.includes('application/zip')) {
-        // Handle ZIP response
-        return response.blob().then(blob => {
-          // Create download link
-          const url = window.URL.createObjectURL(blob);
-          const a = document.createElement('a');
-          a.style.display = 'none';
-          a.href = url;
-          
-          // Generate ZIP filename
-          const formattedDate = weekStart.replace(/-/g, '');
-          let filename = `${packType}_pack_${formattedDate}.zip`;
-          
-          // Try to extract filename from content-disposition header
-          const contentDisposition = response.headers.get('content-disposition');
-          if (contentDisposition) {
-            const filenameMatch = contentDisposition.match(/filename="(.+)"/);
-            if (filenameMatch) {
-              filename = filenameMatch[1];
-            }
-          }
-          
-          a.download = filename;
-          
-          document.body.appendChild(a);
-          a.click();
-          window.URL.revokeObjectURL(url);
-          document.body.removeChild(a);
-          
-          showPackGenerationFeedback(`✅ ZIP pack generated and downloaded in ${elapsedTime}s!`, 'success');
-          
-          // Refresh the reports list after successful generation
-          if (document.getElementById('registrar_generate_report_generatedPanel').classList.contains('show')) {
-            loadGeneratedReportsList();
-          }
-          
-          return { success: true };
-        });
-      } else if (response.status === 204) {
-        // No content - empty pack
-        showPackGenerationFeedback('⚠️ No signatory activities found for the selected period', 'warning');
-        return { success: false, reason: 'no_content' };
-      } else {
-        // Unexpected content type
-        return Promise.reject(new Error(`Unexpected response format: ${contentType}`));
-      }
-    } else {
-      // Handle error responses
-      if (response.status === 503) {
-        return Promise.reject(new Error('Service temporarily unavailable. PDF engine may not be installed.'));
-      } else {
-        // Try to parse error message
-        return response.text().then(text => {
-          let errorMsg = `Generation failed (${response.status})`;
-          try {
-            const data = JSON.parse(text);
-            errorMsg = data.error || errorMsg;
-          } catch (e) {
-            // Use status text if JSON parsing fails
-            errorMsg = response.statusText || errorMsg;
-          }
-          return Promise.reject(new Error(errorMsg));
-        });
-      }
+    if (response.status === 204) {
+      // No content - empty pack
+      showPackGenerationFeedback('⚠️ No signatory activities found for the selected period', 'warning');
+      return { success: false, reason: 'no_content' };
     }
+    return response.json().then(data => {
+      if (!response.ok) {
+        return Promise.reject(new Error(data.error || `Generation failed (${response.status})`));
+      }
+      
+      // The pack is built in the background - follow the job until the ZIP is ready
+      return pollReportJob(data.progress_url, job => {
+        const progress = job.progress.total ? ` (${job.progress.done}/${job.progress.total} signatories)` : '';
+        showPackGenerationFeedback(`Generating ${packType} signatory pack (ZIP)...${progress}`, 'info');
+      }).then(job => {
+        const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
+        const formattedDate = weekStart.replace(/-/g, '');
+        downloadReportFile(job.download_url, `${packType}_pack_${formattedDate}.zip`);
+        showPackGenerationFeedback(`✅ ZIP pack generated and downloaded in ${elapsedTime}s!`, 'success');
+        
+        // Refresh the reports list after successful generation
+        if (document.getElementById('registrar_generate_report_generatedPanel').classList.contains('show')) {
+          loadGeneratedReportsList();
+        }
+        
+        return { success: true };
+      });
+    }, () => Promise.reject(new Error(`Generation failed (${response.status})`)));
   })
   .then(result => {
     if (result && result.success) {
@@ -485,6 +446,28 @@ function generateSignatoryPack() {
   });
 }
 
+// Follow a queued report job until it finishes; resolves with the final job status
+function pollReportJob(progressUrl, onProgress, interval = 2000) {
+  return new Promise((resolve, reject) => {
+    const check = () => {
+      fetch(progressUrl, { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(response => response.json())
+        .then(job => {
+          if (job.status === 'completed') {
+            resolve(job);
+          } else if (job.status === 'failed' || !job.status) {
+            reject(new Error(job.error || 'Report generation failed'));
+          } else {
+            if (onProgress) onProgress(job);
+            setTimeout(check, interval);
+          }
+        })
+        .catch(reject);
+    };
+    check();
+  });
+}
+
 // Enhanced feedback system for pack generation
 function showPackGenerationFeedback(message, type = 'info') {
   // Remove existing feedback
@@ -929,63 +912,29 @@ function registrarGenerateReport() {
     }
   })
   .then(response => {
-    if (response.ok) {
-      const contentType = response.headers.get('content-type') || '';
-      
-      if (contentType.includes('application/pdf')) {
-        // Handle PDF response - trigger download
-        return response.blob().then(blob => {
-          const url = window.URL.createObjectURL(blob);
-          const a = document.createElement('a');
-          a.style.display = 'none';
-          a.href = url;
-          
-          // Get filename from Content-Disposition header or generate one
-          const contentDisposition = response.headers.get('content-disposition');
-          let filename = 'manual_report.pdf';
-          if (contentDisposition) {
-            const filenameMatch = contentDisposition.match(/filename="(.+)"/);
-            if (filenameMatch) {
-              filename = filenameMatch[1];
-            }
-          }
-          
-          a.download = filename;
-          document.body.appendChild(a);
-          a.click();
-          window.URL.revokeObjectURL(url);
-          document.body.removeChild(a);
-          
-          showNotification('Report generated and downloaded successfully!', 'success');
-          
-          // Refresh the reports list
-          if (document.getElementById('registrar_generate_report_generatedPanel').classList.contains('show')) {
-            loadGeneratedReportsList();
-          }
-          
-          return { success: true };
-        });
-      } else {
-        // Try to parse as JSON for error messages
-        return response.text().then(text => {
-          try {
-            const data = JSON.parse(text);
-            throw new Error(data.error || 'Unknown error');
-          } catch (e) {
-            throw new Error(`Unexpected response format: ${text}`);
-          }
-        });
+    return response.json().then(data => {
+      if (!response.ok) {
+        throw new Error(data.error || `Request failed (${response.status})`);
       }
-    } else {
-      // Handle error responses
-      return response.text().then(text => {
-        try {
-          const data = JSON.parse(text);
-          throw new Error(data.error || `Request failed (${response.status})`);
-        } catch (e) {
-          throw new Error(`Request failed (${response.status}): ${response.statusText}`);
-        }
-      });
+      return data;
+    }, () => {
+      throw new Error(`Request failed (${response.status}): ${response.statusText}`);
+    });
+  })
+  .then(data => {
+    // The PDF is generated in the background - follow the job until it is ready
+    if (generateBtn) {
+      generateBtn.innerHTML = '<div class="spinner-border spinner-border-sm me-2" role="status"></div>Generating PDF...';
+    }
+    return pollReportJob(data.progress_url);
+  })
+  .then(job => {
+    downloadReportFile(job.download_url, 'manual_report.pdf');
+    showNotification('Report generated and downloaded successfully!', 'success');
+    
+    // Refresh the reports list
+    if (document.getElementById('registrar_generate_report_generatedPanel').classList.contains('show')) {
+      loadGeneratedReportsList();
     }
   })
   .catch(error => {
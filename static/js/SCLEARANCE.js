@@ -95,7 +95,12 @@ function setupEventListeners() {
 
 
 
-function loadClearanceData() {
+// Cursor for the next page of clearances (server-side keyset pagination)
+let clearanceNextCursor = null;
+
+function loadClearanceData(append) {
+    // Only an explicit `true` appends; event listeners pass an Event object here
+    const appendPage = append === true && clearanceNextCursor;
     const courseFilter = document.getElementById('signatory_clearance_filter_course').value;
     const yearFilter = document.getElementById('signatory_clearance_filter_year').value;
     const sectionFilter = document.getElementById('signatory_clearance_filter_section').value;
@@ -108,6 +113,7 @@ function loadClearanceData() {
     if (sectionFilter && sectionFilter !== 'Filter by Section') params.append('section', sectionFilter);
     if (statusFilter && statusFilter !== 'Filter by Status') params.append('status', statusFilter);
     if (searchQuery) params.append('search', searchQuery);
+    if (appendPage) params.append('cursor', clearanceNextCursor);
     
     console.log('Loading clearance data with params:', params.toString());
     
@@ -121,11 +127,13 @@ function loadClearanceData() {
             if (data.error) {
                 throw new Error(data.error);
             }
-            clearanceData = data.data || [];
-            signatoryType = data.data && data.data.length > 0 ? data.data[0].signatory_type : null;
+            clearanceData = appendPage ? clearanceData.concat(data.data || []) : (data.data || []);
+            clearanceNextCursor = data.pagination && data.pagination.has_next ? data.pagination.next_cursor : null;
+            signatoryType = clearanceData.length > 0 ? clearanceData[0].signatory_type : null;
             console.log('Current signatory type:', signatoryType);
             updateSignatoryHeader();
-            renderTable(data.data || []);
+            renderTable(clearanceData);
+            appendLoadMoreRow(data.pagination);
             updateFilterOptions();
         })
         .catch(error => {
@@ -139,6 +147,19 @@ function loadClearanceData() {
         });
 }
 
+function appendLoadMoreRow(pagination) {
+    const tbody = document.getElementById('signatory_clearance_table_body');
+    if (!tbody || !clearanceNextCursor) return;
+    
+    const row = document.createElement('tr');
+    row.innerHTML = '<td colspan="10" class="text-center py-3">' +
+        '<button type="button" class="btn btn-outline-secondary btn-sm">' +
+        `Load more (${clearanceData.length} of ${pagination.total})` +
+        '</button></td>';
+    row.querySelector('button').addEventListener('click', () => loadClearanceData(true));
+    tbody.appendChild(row);
+}
+
 function renderTable(data) {
     const tbody = document.getElementById('signatory_clearance_table_body');
     
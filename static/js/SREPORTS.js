@@ -192,16 +192,42 @@ function generateReport() {
     })
     .then(response => response.json())
     .then(data => {
-        if (data.success) {
-            showSuccess('Report generated successfully!');
-            loadGeneratedReportsList();
-        } else {
+        if (!data.success) {
             showError(data.error || 'Failed to generate report');
+            return;
         }
+        // The report is generated in the background; the list shows it as generating until it is ready
+        loadGeneratedReportsList();
+        return pollReportJob(data.progress_url).then(() => {
+            showSuccess('Report generated successfully!');
+            loadGeneratedReportsList();
+        });
     })
     .catch(error => {
         console.error('Error generating report:', error);
-        showError('Error generating report');
+        showError(error.message || 'Error generating report');
+        loadGeneratedReportsList();
+    });
+}
+
+// Follow a queued report job until it finishes; resolves with the final job status
+function pollReportJob(progressUrl, interval = 2000) {
+    return new Promise((resolve, reject) => {
+        const check = () => {
+            fetch(progressUrl)
+                .then(response => response.json())
+                .then(job => {
+                    if (job.status === 'completed') {
+                        resolve(job);
+                    } else if (job.status === 'failed' || !job.status) {
+                        reject(new Error(job.error || 'Report generation failed'));
+                    } else {
+                        setTimeout(check, interval);
+                    }
+                })
+                .catch(reject);
+        };
+        check();
     });
 }
 
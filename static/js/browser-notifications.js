@@ -46,9 +46,12 @@ class BrowserNotificationManager {
         // Check immediately
         this.checkForBrowserNotifications();
         
-        // Set up periodic checking
+        // Check as soon as the event stream reports a notification; poll only while it is down
+        document.addEventListener('app:notification', () => this.checkForBrowserNotifications());
         setInterval(() => {
-            this.checkForBrowserNotifications();
+            if (!(window.AppEvents && window.AppEvents.connected)) {
+                this.checkForBrowserNotifications();
+            }
         }, this.checkInterval);
     }
 
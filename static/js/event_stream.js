@@ -0,0 +1,128 @@
+/**
+ * Live updates pushed by the server
+ * Listens on /api/events/stream/ (Server-Sent Events) and falls back to polling
+ * /api/events/poll/ when EventSource is unavailable or the server turns SSE off (the
+ * default). The poll answer says how long the server may wait and how long to pause
+ * before the next poll; by default polls return at once, so no request holds a worker.
+ * Every event is re-dispatched on document as 'app:<type>' with its data as detail:
+ *   app:notification, app:message, app:dashboard_stale
+ * Pages keep their polling timers as a safety net but skip them while AppEvents.connected.
+ */
+(function () {
+    if (window.AppEvents) {
+        return; // Already started by another include on this page
+    }
+
+    const EVENT_TYPES = ['notification', 'message', 'dashboard_stale'];
+    const MAX_RETRY_DELAY = 30000;
+    // Shortest time between two polls, so a server answering at once cannot make the page spin
+    const MIN_POLL_INTERVAL = 1000;
+    // Until the server says otherwise
+    const DEFAULT_POLL_INTERVAL = 10000;
+    // Polls normally send back the version token so unchanged answers come from the cache;
+    // one poll this often skips it, in case a version counter was lost
+    const FULL_CHECK_INTERVAL = 30000;
+
+    const AppEvents = {
+        connected: false,
+        mode: null,
+        lastEventId: null,
+        on(type, handler) {
+            document.addEventListener('app:' + type, (e) => handler(e.detail));
+        }
+    };
+    window.AppEvents = AppEvents;
+
+    function dispatch(type, data) {
+        document.dispatchEvent(new CustomEvent('app:' + type, { detail: data || {} }));
+    }
+
+    function startStream() {
+        if (!window.EventSource) {
+            startPolling();
+            return;
+        }
+
+        AppEvents.mode = 'sse';
+        const source = new EventSource('/api/events/stream/');
+
+        source.onopen = () => {
+            AppEvents.connected = true;
+        };
+        source.addEventListener('ready', (e) => {
+            AppEvents.lastEventId = e.lastEventId;
+        });
+        EVENT_TYPES.forEach((type) => {
+            source.addEventListener(type, (e) => {
+                AppEvents.lastEventId = e.lastEventId;
+                dispatch(type, JSON.parse(e.data).data);
+            });
+        });
+        source.onerror = () => {
+            AppEvents.connected = false;
+            if (source.readyState === EventSource.CLOSED) {
+                // Refused (204 when SSE is disabled) rather than dropped: switch to long polling
+                source.close();
+                startPolling();
+            }
+            // Otherwise the browser reconnects by itself and resumes from Last-Event-ID
+        };
+    }
+
+    function sleep(ms) {
+        return new Promise((resolve) => setTimeout(resolve, ms));
+    }
+
+    async function startPolling() {
+        AppEvents.mode = 'poll';
+        let failures = 0;
+        let wait = 0;
+        let interval = DEFAULT_POLL_INTERVAL;
+        let version = null;
+        let lastFullCheck = 0;
+
+        while (true) {
+            const startedAt = Date.now();
+            try {
+                // Event id 0 is a valid cursor: only a missing one means "from now"
+                const after = AppEvents.lastEventId;
+                const hasCursor = after !== null && after !== undefined && after !== '';
+                const params = new URLSearchParams();
+                if (hasCursor) {
+                    params.set('after', after);
+                    params.set('timeout', wait);
+                    if (version && startedAt - lastFullCheck < FULL_CHECK_INTERVAL) {
+                        params.set('version', version);
+                    } else {
+                        lastFullCheck = startedAt;
+                    }
+                }
+                const query = params.toString();
+                const url = query ? `/api/events/poll/?${query}` : '/api/events/poll/';
+                const response = await fetch(url, {
+                    headers: { 'X-Requested-With': 'XMLHttpRequest' }
+                });
+                if (!response.ok) {
+                    throw new Error(`Event poll failed with status ${response.status}`);
+                }
+                const data = await response.json();
+
+                AppEvents.connected = true;
+                failures = 0;
+                data.events.forEach((event) => dispatch(event.type, event.data));
+                AppEvents.lastEventId = data.last_event_id;
+                version = data.version || null;
+                wait = data.wait || 0;
+                interval = data.interval !== undefined ? data.interval * 1000 : DEFAULT_POLL_INTERVAL;
+                await sleep(Math.max(interval, MIN_POLL_INTERVAL) - (Date.now() - startedAt));
+            } catch (error) {
+                AppEvents.connected = false;
+                failures += 1;
+                console.log('Event poll error, retrying:', error);
+                await sleep(Math.min(MAX_RETRY_DELAY, 1000 * 2 ** failures));
+            }
+        }
+    }
+
+    startStream();
+})();
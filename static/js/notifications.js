@@ -39,9 +39,13 @@ class NotificationManager {
         this.setupEnhancedEvents();
         this.loadPreferences();
         
-        // Auto-refresh notification count every 30 seconds
+        // New notifications are pushed by the event stream (event_stream.js);
+        // poll the count every 30 seconds only while it is not connected
+        document.addEventListener('app:notification', () => this.loadNotificationCount());
         setInterval(() => {
-            this.loadNotificationCount();
+            if (!(window.AppEvents && window.AppEvents.connected)) {
+                this.loadNotificationCount();
+            }
         }, 30000);
     }
     